@@ -4,9 +4,13 @@ Invokable Module for CLI
 python -m samcli
 """
 
+import multiprocessing  # pragma: no cover
+
 from samcli.cli.main import cli  # pragma: no cover
 
 if __name__ == "__main__":  # pragma: no cover
+    # worker processes of the frozen binary, like the ones of parallel builds, run the binary again
+    multiprocessing.freeze_support()
     # NOTE(TheSriram): prog_name is always set to "sam". This way when the CLI is invoked as a module,
     # the help text that is generated still says "sam" instead of "__main__".
     cli(prog_name="sam")
@@ -11,7 +11,13 @@ from samcli import __version__
 from samcli.cli.command import BaseCommand
 from samcli.cli.context import Context
 from samcli.cli.global_config import GlobalConfig
-from samcli.cli.options import debug_option, profile_option, region_option
+from samcli.cli.options import (
+    debug_option,
+    profile_option,
+    profile_output_option,
+    region_option,
+    trace_file_option,
+)
 from samcli.commands._utils.experimental import experimental, get_all_experimental_env_vars
 from samcli.lib.utils.sam_logging import (
     LAMBDA_BULDERS_LOGGER_NAME,
@@ -35,6 +41,8 @@ def common_options(f):
     :return: Callback function
     """
     f = debug_option(f)
+    f = trace_file_option(f)
+    f = profile_output_option(f)
     f = experimental(f)
     return f
 
@@ -3,10 +3,17 @@ This file contains common CLI options common to all commands. As we add more com
 become a repository of options that other commands could use when needed.
 """
 
+import logging
+
 import click
 
+from samcli.lib.telemetry.profiling import COLLAPSED_STACKS_EXTENSION, CommandProfiler
+from samcli.lib.telemetry.tracing import start_tracing, stop_tracing
+
 from .context import Context
 
+LOG = logging.getLogger(__name__)
+
 
 def debug_option(f):
     """
@@ -31,6 +38,89 @@ def debug_option(f):
     )(f)
 
 
+def trace_file_option(f):
+    """
+    Configures --trace-file option for CLI
+
+    :param f: Callback Function to be passed to Click
+    """
+
+    def callback(ctx, param, value):
+        if not value or ctx.resilient_parsing:
+            return value
+
+        start_tracing()
+
+        def write_trace():
+            tracer = stop_tracing()
+            if not tracer:
+                return
+            try:
+                tracer.write_chrome_trace(value)
+                LOG.info("Trace of the command written to %s", value)
+            except OSError as ex:
+                LOG.warning("Failed to write the trace of the command to %s: %s", value, ex)
+
+        ctx.call_on_close(write_trace)
+        return value
+
+    return click.option(
+        "--trace-file",
+        type=click.Path(),
+        expose_value=False,
+        is_eager=True,
+        envvar="SAM_CLI_TRACE_FILE",
+        help="Write the time spent in each phase of the command to this file, as a Chrome trace "
+        "which can be opened with chrome://tracing or https://ui.perfetto.dev.",
+        callback=callback,
+    )(f)
+
+
+def profile_output_option(f):
+    """
+    Configures --profile-output option for CLI
+
+    :param f: Callback Function to be passed to Click
+    """
+
+    def callback(ctx, param, value):
+        if not value or ctx.resilient_parsing:
+            return value
+
+        profiler = CommandProfiler()
+        profiler.start()
+
+        def write_profile():
+            profiler.stop()
+            try:
+                report = profiler.write(value)
+            except OSError as ex:
+                LOG.warning("Failed to write the profile of the command to %s: %s", value, ex)
+                return
+            # the report goes to stderr, to keep the output of the command parsable
+            click.echo(report, err=True)
+            click.echo(
+                f"Profile of the command written to {value}, "
+                f"and its sampled stacks to {value}{COLLAPSED_STACKS_EXTENSION}",
+                err=True,
+            )
+
+        ctx.call_on_close(write_profile)
+        return value
+
+    return click.option(
+        "--profile-output",
+        type=click.Path(),
+        expose_value=False,
+        is_eager=True,
+        envvar="SAM_CLI_PROFILE_OUTPUT",
+        help="Profile the command and write its stats to this file, which can be read with pstats or snakeviz. "
+        f"Sampled stacks of its threads are written next to it with the {COLLAPSED_STACKS_EXTENSION} extension, "
+        "for flamegraph.pl or speedscope.",
+        callback=callback,
+    )(f)
+
+
 def region_option(f):
     """
     Configures --region option for CLI
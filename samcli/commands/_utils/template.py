@@ -12,6 +12,7 @@ from botocore.utils import set_value_from_jmespath
 
 from samcli.commands.exceptions import UserException
 from samcli.lib.samlib.resource_metadata_normalizer import ASSET_PATH_METADATA_KEY, ResourceMetadataNormalizer
+from samcli.lib.telemetry.tracing import traced
 from samcli.lib.utils import graphql_api
 from samcli.lib.utils.packagetype import IMAGE, ZIP
 from samcli.lib.utils.resources import (
@@ -33,6 +34,7 @@ class TemplateFailedParsingException(UserException):
     pass
 
 
+@traced("get_template_data")
 def get_template_data(template_file):
     """
     Read the template file, parse it as JSON/YAML and return the template as a dictionary.
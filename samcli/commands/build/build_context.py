@@ -41,6 +41,7 @@ from samcli.lib.providers.sam_layer_provider import SamLayerProvider
 from samcli.lib.providers.sam_stack_provider import SamLocalStackProvider
 from samcli.lib.telemetry.event import EventName, EventTracker, UsedFeature
 from samcli.lib.utils.osutils import BUILD_DIR_PERMISSIONS
+from samcli.local.docker.lambda_build_container_pool import LambdaBuildContainerPool
 from samcli.local.docker.manager import ContainerManager
 from samcli.local.lambdafn.exceptions import (
     FunctionNotFound,
@@ -241,6 +242,7 @@ class BuildContext:
         self._stacks = self._handle_build_pre_processing()
 
         caught_exception: Optional[Exception] = None
+        build_container_pool: Optional[LambdaBuildContainerPool] = None
 
         try:
             # boolean value indicates if mount with write or not, defaults to READ ONLY
@@ -256,6 +258,10 @@ class BuildContext:
                         self.base_dir,
                     )
 
+            if self._use_container and self._container_manager and not mount_with_write:
+                # reuse build containers across the functions and layers, instead of a new container per build
+                build_container_pool = LambdaBuildContainerPool(self._container_manager, self.base_dir)
+
             builder = ApplicationBuilder(
                 self.get_resources_to_build(),
                 self.build_dir,
@@ -273,6 +279,7 @@ class BuildContext:
                 combine_dependencies=not self._create_auto_dependency_layer,
                 build_in_source=self._build_in_source,
                 mount_with_write=mount_with_write,
+                build_container_pool=build_container_pool,
             )
 
             self._check_exclude_warning()
@@ -332,6 +339,8 @@ class BuildContext:
             wrapped_from = deep_wrap if deep_wrap else ex.__class__.__name__
             raise UserException(str(ex), wrapped_from=wrapped_from) from ex
         finally:
+            if build_container_pool:
+                build_container_pool.shutdown()
             if self.build_in_source:
                 exception_name = type(caught_exception).__name__ if caught_exception else None
                 EventTracker.track_event(
@@ -509,6 +518,22 @@ Commands you can use next
     def use_container(self) -> bool:
         return self._use_container
 
+    @property
+    def parameter_overrides(self) -> Optional[Dict]:
+        return self._parameter_overrides
+
+    @property
+    def build_images(self) -> Optional[Dict]:
+        return self._build_images
+
+    @property
+    def container_env_var(self) -> Optional[Dict]:
+        return self._container_env_var
+
+    @property
+    def container_env_var_file(self) -> Optional[str]:
+        return self._container_env_var_file
+
     @property
     def stacks(self) -> List[Stack]:
         return self._stacks
@@ -35,6 +35,7 @@ from samcli.lib.intrinsic_resolver.intrinsics_symbol_table import IntrinsicsSymb
 from samcli.lib.package.s3_uploader import S3Uploader
 from samcli.lib.providers.sam_stack_provider import SamLocalStackProvider
 from samcli.lib.utils.boto_utils import get_boto_config_with_user_agent
+from samcli.lib.utils.cloudformation import clear_stack_resources_cache
 from samcli.yamlhelper import yaml_parse
 
 LOG = logging.getLogger(__name__)
@@ -165,22 +166,26 @@ class DeployContext:
             self.use_changeset,
             self.disable_rollback,
         )
-        return self.deploy(
-            self.stack_name,
-            template_str,
-            parameters,
-            self.capabilities,
-            self.no_execute_changeset,
-            self.role_arn,
-            self.notification_arns,
-            self.s3_uploader,
-            [{"Key": key, "Value": value} for key, value in self.tags.items()] if self.tags else [],
-            region,
-            self.fail_on_empty_changeset,
-            self.confirm_changeset,
-            self.use_changeset,
-            self.disable_rollback,
-        )
+        try:
+            return self.deploy(
+                self.stack_name,
+                template_str,
+                parameters,
+                self.capabilities,
+                self.no_execute_changeset,
+                self.role_arn,
+                self.notification_arns,
+                self.s3_uploader,
+                [{"Key": key, "Value": value} for key, value in self.tags.items()] if self.tags else [],
+                region,
+                self.fail_on_empty_changeset,
+                self.confirm_changeset,
+                self.use_changeset,
+                self.disable_rollback,
+            )
+        finally:
+            # the resources of the stacks may have changed, they are fetched from CloudFormation by the next commands
+            clear_stack_resources_cache()
 
     def deploy(
         self,
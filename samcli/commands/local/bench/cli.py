@@ -0,0 +1,304 @@
+"""
+CLI command for "local bench" command
+"""
+
+import json
+import logging
+
+import click
+
+from samcli.cli.cli_config_file import ConfigProvider, configuration_option, save_params_option
+from samcli.cli.main import aws_creds_options, pass_context, print_cmdline_args
+from samcli.cli.main import common_options as cli_framework_options
+from samcli.commands._utils.option_value_processor import process_image_options
+from samcli.commands.local.bench.core.command import LocalBenchCommand
+from samcli.commands.local.cli_common.options import (
+    invoke_common_options,
+    local_common_options,
+    warm_containers_common_options,
+)
+from samcli.commands.local.lib.exceptions import InvalidIntermediateImageError
+from samcli.lib.telemetry.metric import track_command
+from samcli.lib.utils.version_checker import check_newer_version
+from samcli.local.docker.exceptions import ContainerNotStartableException
+
+LOG = logging.getLogger(__name__)
+
+HELP_TEXT = """
+Measure the latency of functions and APIs emulated locally.
+"""
+
+DESCRIPTION = """
+  Replay events against a function, like start-lambda does, or against the APIs of the template,
+  like start-api does, and report the p50, p95 and p99 latencies of the requests and of their phases:
+  routing, event construction, container wait, round-trip to the Lambda runtime interface emulator
+  and response parsing. Events are read from a single JSON file, like the output of generate-event,
+  or from JSON lines of recorded events, which are API Gateway proxy events when the APIs are targeted.
+  The utilization of the containers shows whether more warm containers would help.\n
+"""
+
+
+@click.command(
+    "bench",
+    cls=LocalBenchCommand,
+    help=HELP_TEXT,
+    short_help=HELP_TEXT,
+    description=DESCRIPTION,
+    requires_credentials=False,
+    context_settings={"max_content_width": 120},
+)
+@configuration_option(provider=ConfigProvider(section="parameters"))
+@click.option(
+    "--function-name",
+    "-f",
+    help="Logical ID of the function to invoke. If this option is not specified, the APIs of the template are "
+    "called with the events instead.",
+)
+@click.option(
+    "--event",
+    "-e",
+    type=click.Path(),
+    help="File containing a JSON event, or JSON lines of events, to replay. "
+    "If this option is not specified, an empty event is sent.",
+)
+@click.option(
+    "--requests",
+    "-n",
+    type=click.IntRange(min=1),
+    default=100,
+    show_default=True,
+    help="Number of requests to send, cycling through the events.",
+)
+@click.option(
+    "--concurrency",
+    "-c",
+    type=click.IntRange(min=1),
+    default=1,
+    show_default=True,
+    help="Max number of requests in flight at the same time.",
+)
+@click.option(
+    "--rate",
+    type=click.FloatRange(min=0, min_open=True),
+    help="Number of requests to start per second. "
+    "If this option is not specified, each request starts as soon as a previous one completes.",
+)
+@click.option(
+    "--disable-authorizer",
+    is_flag=True,
+    default=False,
+    help="Disable custom Lambda Authorizers from being parsed and invoked.",
+)
+@click.option(
+    "--output",
+    type=click.Choice(["text", "json"]),
+    default="text",
+    show_default=True,
+    help="Format of the report.",
+)
+@invoke_common_options
+@warm_containers_common_options
+@local_common_options
+@cli_framework_options
+@aws_creds_options
+@save_params_option
+@pass_context
+@track_command
+@check_newer_version
+@print_cmdline_args
+def cli(
+    ctx,  # pylint: disable=R0914
+    # bench Specific Options
+    function_name,
+    event,
+    requests,
+    concurrency,
+    rate,
+    disable_authorizer,
+    output,
+    # Common Options for Lambda Invoke
+    template_file,
+    env_vars,
+    debug_port,
+    debug_args,
+    debugger_path,
+    container_env_vars,
+    docker_volume_basedir,
+    docker_network,
+    log_file,
+    layer_cache_basedir,
+    skip_pull_image,
+    force_image_build,
+    parameter_overrides,
+    save_params,
+    config_file,
+    config_env,
+    warm_containers,
+    shutdown,
+    debug_function,
+    container_host,
+    container_host_interface,
+    add_host,
+    invoke_image,
+):
+    """
+    `sam local bench` command entry point
+    """
+    # All logic must be implemented in the ``do_cli`` method. This helps with easy unit testing
+
+    do_cli(
+        ctx,
+        function_name,
+        event,
+        requests,
+        concurrency,
+        rate,
+        disable_authorizer,
+        output,
+        template_file,
+        env_vars,
+        debug_port,
+        debug_args,
+        debugger_path,
+        container_env_vars,
+        docker_volume_basedir,
+        docker_network,
+        log_file,
+        layer_cache_basedir,
+        skip_pull_image,
+        force_image_build,
+        parameter_overrides,
+        warm_containers,
+        shutdown,
+        debug_function,
+        container_host,
+        container_host_interface,
+        add_host,
+        invoke_image,
+    )  # pragma: no cover
+
+
+def do_cli(  # pylint: disable=R0914
+    ctx,
+    function_name,
+    event,
+    requests,
+    concurrency,
+    rate,
+    disable_authorizer,
+    output,
+    template,
+    env_vars,
+    debug_port,
+    debug_args,
+    debugger_path,
+    container_env_vars,
+    docker_volume_basedir,
+    docker_network,
+    log_file,
+    layer_cache_basedir,
+    skip_pull_image,
+    force_image_build,
+    parameter_overrides,
+    warm_containers,
+    shutdown,
+    debug_function,
+    container_host,
+    container_host_interface,
+    add_host,
+    invoke_image,
+):
+    """
+    Implementation of the ``cli`` method, just separated out for unit testing purposes
+    """
+
+    from samcli.commands.local.cli_common.invoke_context import InvokeContext
+    from samcli.commands.local.cli_common.user_exceptions import UserException
+    from samcli.commands.local.lib.exceptions import NoApisDefined, OverridesNotWellDefinedError
+    from samcli.commands.local.lib.local_bench import (
+        ApiBenchRequest,
+        ApiEventSender,
+        LambdaEventSender,
+        format_bench_result,
+        read_bench_events,
+        run_bench,
+    )
+    from samcli.commands.validate.lib.exceptions import InvalidSamDocumentException
+    from samcli.lib.providers.api_provider import ApiProvider
+    from samcli.lib.providers.exceptions import InvalidLayerReference
+    from samcli.local.apigw.local_apigw_service import LocalApigwService
+    from samcli.local.docker.lambda_debug_settings import DebuggingNotSupported
+    from samcli.local.lambda_service.local_lambda_invoke_service import LocalLambdaInvokeService
+
+    LOG.debug("local bench command is called")
+
+    events = read_bench_events(event)
+    processed_invoke_images = process_image_options(invoke_image)
+
+    try:
+        with InvokeContext(
+            template_file=template,
+            function_identifier=None,  # Don't scope to one particular function
+            env_vars_file=env_vars,
+            docker_volume_basedir=docker_volume_basedir,
+            docker_network=docker_network,
+            log_file=log_file,
+            skip_pull_image=skip_pull_image,
+            debug_ports=debug_port,
+            debug_args=debug_args,
+            debugger_path=debugger_path,
+            container_env_vars_file=container_env_vars,
+            parameter_overrides=parameter_overrides,
+            layer_cache_basedir=layer_cache_basedir,
+            force_image_build=force_image_build,
+            aws_region=ctx.region,
+            aws_profile=ctx.profile,
+            warm_container_initialization_mode=warm_containers,
+            debug_function=debug_function,
+            shutdown=shutdown,
+            container_host=container_host,
+            container_host_interface=container_host_interface,
+            add_host=add_host,
+            invoke_images=processed_invoke_images,
+        ) as invoke_context:
+            # the services are driven in process, so only their handling of the requests is measured
+            if function_name:
+                service = LocalLambdaInvokeService(
+                    lambda_runner=invoke_context.local_lambda_runner,
+                    port=None,
+                    host=None,
+                    stderr=invoke_context.stderr,
+                )
+                send = LambdaEventSender(service, function_name)
+            else:
+                api_provider = ApiProvider(
+                    invoke_context.stacks, cwd=invoke_context.get_cwd(), disable_authorizer=disable_authorizer
+                )
+                if not api_provider.api.routes:
+                    raise NoApisDefined("No APIs available in template, specify a function with --function-name")
+                events = [ApiBenchRequest.from_event(api_event) for api_event in events]
+                service = LocalApigwService(
+                    api=api_provider.api, lambda_runner=invoke_context.local_lambda_runner, stderr=invoke_context.stderr
+                )
+                send = ApiEventSender(service)
+
+            service.create()
+            result = run_bench(send, events, requests, concurrency=concurrency, rate=rate)
+
+    except (
+        InvalidSamDocumentException,
+        OverridesNotWellDefinedError,
+        InvalidLayerReference,
+        InvalidIntermediateImageError,
+        DebuggingNotSupported,
+        NoApisDefined,
+    ) as ex:
+        raise UserException(str(ex), wrapped_from=ex.__class__.__name__) from ex
+    except ContainerNotStartableException as ex:
+        raise UserException(str(ex), wrapped_from=ex.__class__.__name__) from ex
+
+    summary = result.to_dict()
+    if output == "json":
+        click.echo(json.dumps(summary, indent=2))
+    else:
+        click.echo(format_bench_result(summary))
@@ -0,0 +1,57 @@
+"""
+Local Bench Command Class.
+"""
+
+from click import Context, style
+
+from samcli.cli.core.command import CoreCommand
+from samcli.cli.row_modifiers import RowDefinition, ShowcaseRowModifier
+from samcli.commands.local.bench.core.formatters import LocalBenchCommandHelpTextFormatter
+from samcli.commands.local.bench.core.options import OPTIONS_INFO
+
+
+class LocalBenchCommand(CoreCommand):
+    class CustomFormatterContext(Context):
+        formatter_class = LocalBenchCommandHelpTextFormatter
+
+    context_class = CustomFormatterContext
+
+    @staticmethod
+    def format_examples(ctx: Context, formatter: LocalBenchCommandHelpTextFormatter):
+        with formatter.indented_section(name="Examples", extra_indents=1):
+            formatter.write_rd(
+                [
+                    RowDefinition(
+                        text="\n",
+                    ),
+                    RowDefinition(
+                        name="Invoke a function 200 times, 8 invokes at a time, with warm containers.",
+                    ),
+                    RowDefinition(
+                        name=style(
+                            f"${ctx.command_path} --function-name HelloWorldFunction --event event.json "
+                            "--requests 200 --concurrency 8 --warm-containers EAGER"
+                        ),
+                        extra_row_modifiers=[ShowcaseRowModifier()],
+                    ),
+                    RowDefinition(
+                        name="Replay recorded API Gateway events against the API at 20 requests per second.",
+                    ),
+                    RowDefinition(
+                        name=style(f"${ctx.command_path} --event api-events.jsonl --rate 20 --concurrency 4"),
+                        extra_row_modifiers=[ShowcaseRowModifier()],
+                    ),
+                ]
+            )
+
+    def format_options(self, ctx: Context, formatter: LocalBenchCommandHelpTextFormatter) -> None:  # type:ignore
+        # `ignore` is put in place here for mypy even though it is the correct behavior,
+        # as the `formatter_class` can be set in subclass of Command. If ignore is not set,
+        # mypy raises argument needs to be HelpFormatter as super class defines it.
+
+        self.format_description(formatter)
+        LocalBenchCommand.format_examples(ctx, formatter)
+
+        CoreCommand._format_options(
+            ctx=ctx, params=self.get_params(ctx), formatter=formatter, formatting_options=OPTIONS_INFO
+        )
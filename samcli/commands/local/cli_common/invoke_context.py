@@ -305,31 +305,56 @@ class InvokeContext:
 
         if self._containers_mode == ContainersMode.WARM:
             self._clean_running_containers_and_related_resources()
+        elif self._lambda_runtimes:
+            self.lambda_runtime.clean_decompressed_code_dirs()
 
     def _initialize_all_functions_containers(self) -> None:
         """
-        Create and run a container for each available lambda function
+        Create and run a container for each available lambda function.
+
+        Containers are initialized concurrently, and each one is reported as soon as it is ready. A function whose
+        container fails to initialize does not stop the others, its container will be created lazily on its first
+        invoke instead.
         """
         LOG.info("Initializing the lambda functions containers.")
 
-        def initialize_function_container(function: Function) -> None:
-            function_config = self.local_lambda_runner.get_invoke_config(function)
-            self.lambda_runtime.run(
-                container=None,
-                function_config=function_config,
-                debug_context=self._debug_context,
-                container_host=self._container_host,
-                container_host_interface=self._container_host_interface,
-                extra_hosts=self._extra_hosts,
-            )
+        def initialize_function_container(function: Function) -> Optional[str]:
+            try:
+                function_config = self.local_lambda_runner.get_invoke_config(function)
+                self.lambda_runtime.run(
+                    container=None,
+                    function_config=function_config,
+                    debug_context=self._debug_context,
+                    container_host=self._container_host,
+                    container_host_interface=self._container_host_interface,
+                    extra_hosts=self._extra_hosts,
+                )
+            except PortAlreadyInUse:
+                raise
+            except Exception as ex:
+                LOG.warning("Failed to initialize the container of the lambda function %s: %s", function.full_path, ex)
+                # return the failed function instead of the exception, as the async context raises returned exceptions
+                return function.full_path
+
+            LOG.info("Container of the lambda function %s is ready.", function.full_path)
+            return None
 
         try:
             async_context = AsyncContext()
-            for function in self._function_provider.get_all():
+            functions = list(self._function_provider.get_all())
+            for function in functions:
                 async_context.add_async_task(initialize_function_container, function)
 
-            async_context.run_async(default_executor=False)
-            LOG.info("Containers Initialization is done.")
+            failed_functions = [path for path in async_context.run_async(default_executor=False) if path]
+            if failed_functions and len(failed_functions) == len(functions):
+                raise ContainersInitializationException("None of the lambda functions containers could be initialized")
+            if failed_functions:
+                LOG.info(
+                    "Containers Initialization is done. The containers of %s will be created on their first invoke.",
+                    ", ".join(failed_functions),
+                )
+            else:
+                LOG.info("Containers Initialization is done.")
         except KeyboardInterrupt:
             LOG.debug("Ctrl+C was pressed. Aborting containers initialization")
             self._clean_running_containers_and_related_resources()
@@ -473,6 +498,16 @@ class InvokeContext:
         """
         return self._function_provider.stacks
 
+    @property
+    def reloads_templates(self) -> bool:
+        """
+        Returns whether the stacks and functions are reloaded when their templates change, which is done with warm
+        containers
+
+        :return bool: True if the templates are reloaded
+        """
+        return self._containers_mode == ContainersMode.WARM
+
     def get_cwd(self) -> str:
         """
         Get the working directory. This is usually relative to the directory that contains the template. If a Docker
@@ -46,3 +46,9 @@ class InvalidHandlerPathError(UserException):
     """
     Raises when the handler is in an unexpected format and can't be parsed
     """
+
+
+class InvalidBenchEventError(UserException):
+    """
+    Raised when an event replayed by sam local bench can't be read or sent
+    """
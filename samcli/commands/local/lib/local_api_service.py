@@ -4,9 +4,14 @@ Connects the CLI with Local API Gateway service.
 
 import logging
 import os
+import threading
+from typing import List
 
+from samcli.commands.exceptions import UserException
 from samcli.commands.local.lib.exceptions import NoApisDefined
 from samcli.lib.providers.api_provider import ApiProvider
+from samcli.lib.providers.provider import Stack
+from samcli.lib.utils.file_observer import FileObserver, FileObserverException
 from samcli.local.apigw.local_apigw_service import LocalApigwService
 
 LOG = logging.getLogger(__name__)
@@ -39,11 +44,14 @@ class LocalApiService:
 
         self.cwd = lambda_invoke_context.get_cwd()
         self.disable_authorizer = disable_authorizer
+        self.lambda_invoke_context = lambda_invoke_context
         self.api_provider = ApiProvider(
             lambda_invoke_context.stacks, cwd=self.cwd, disable_authorizer=disable_authorizer
         )
         self.lambda_runner = lambda_invoke_context.local_lambda_runner
         self.stderr_stream = lambda_invoke_context.stderr
+        # stacks whose templates are watched for changes
+        self._watched_stacks: List[Stack] = []
 
     def start(self):
         """
@@ -75,6 +83,12 @@ class LocalApiService:
 
         service.create()
 
+        # The functions are reloaded when their templates change with warm containers, the routes follow them
+        if self.lambda_invoke_context.reloads_templates:
+            observer = FileObserver(lambda paths: self._on_templates_change(service, observer, paths))
+            observer.start()
+            self._watch_stack_templates(observer, self.api_provider.stacks)
+
         # Print out the list of routes that will be mounted
         self._print_routes(self.api_provider.api.routes, self.host, self.port, bool(self.ssl_context))
         LOG.info(
@@ -87,6 +101,48 @@ class LocalApiService:
 
         service.run()
 
+    def _watch_stack_templates(self, observer: FileObserver, stacks: List[Stack]) -> None:
+        """
+        Watches the templates of the given stacks, the missing ones are skipped
+
+        :param FileObserver observer: Observer notifying the changes of the templates
+        :param list(Stack) stacks: Stacks whose templates are watched
+        """
+        self._watched_stacks = stacks
+        for stack in stacks:
+            try:
+                observer.watch(stack.location)
+            except FileObserverException:
+                LOG.debug("Can't watch the missing template %s", stack.location)
+
+    def _on_templates_change(self, service: LocalApigwService, observer: FileObserver, paths: List[str]) -> None:
+        """
+        Updates the routes of the running service in another thread, since the templates can't be watched again while
+        the observer notifies their change
+        """
+        LOG.info("A change got detected in the templates %s. The routes will be updated", ", ".join(paths))
+        for stack in self._watched_stacks:
+            observer.unwatch(stack.location)
+        threading.Thread(target=self._update_routes, args=(service, observer), daemon=True).start()
+
+    def _update_routes(self, service: LocalApigwService, observer: FileObserver) -> None:
+        """
+        Reloads the stacks, and updates the running service with the routes which changed
+
+        :param LocalApigwService service: Running service whose routes are updated
+        :param FileObserver observer: Observer notifying the changes of the templates
+        """
+        try:
+            api = self.api_provider.refresh(self.lambda_invoke_context.stacks)
+        except UserException as ex:
+            LOG.warning("The routes were not updated, the templates can't be loaded: %s", ex)
+            self._watch_stack_templates(observer, self._watched_stacks)
+            return
+
+        service.update_api(api)
+        self._print_routes(api.routes, self.host, self.port, bool(self.ssl_context))
+        self._watch_stack_templates(observer, self.api_provider.stacks)
+
     @staticmethod
     def _print_routes(routes, host, port, ssl_enabled=False):
         """
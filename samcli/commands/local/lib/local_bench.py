@@ -0,0 +1,346 @@
+"""
+Replays events against the local services and measures how long they take to handle them
+"""
+
+import base64
+import json
+import logging
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from http import HTTPStatus
+from typing import Any, Callable, Dict, List, NamedTuple, Optional, Union
+
+from samcli.commands.local.lib.exceptions import InvalidBenchEventError
+from samcli.lib.utils.phase_timer import EmulationPhase, PhaseRecorder
+from samcli.local.services.base_local_service import BaseLocalService
+
+LOG = logging.getLogger(__name__)
+
+LAMBDA_INVOKE_PATH = "/2015-03-31/functions/{function_name}/invocations"
+
+PERCENTILES = [50, 95, 99]
+
+# sends an event to a local service, and returns whether it was handled successfully
+EventSender = Callable[[Any], bool]
+
+
+class BenchSample(NamedTuple):
+    latency: float
+    succeeded: bool
+    # total duration of each phase of the request
+    phases: Dict[str, float]
+    # how long the request kept each container busy
+    container_busy_times: Dict[str, float]
+
+
+class BenchResult:
+    """
+    Samples of a bench run, and the statistics computed from them
+    """
+
+    def __init__(self, samples: List[BenchSample], duration: float, concurrency: int) -> None:
+        """
+        Parameters
+        ----------
+        samples: List[BenchSample]
+            Sample of each request which was sent
+        duration: float
+            Wall time of the whole run, in seconds
+        concurrency: int
+            Max number of requests which were in flight at the same time
+        """
+        self.samples = samples
+        self.duration = duration
+        self.concurrency = concurrency
+
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        Returns the statistics of the run, latencies are in milliseconds
+        """
+        phases = {}
+        for phase in EmulationPhase.ALL:
+            durations = [sample.phases[phase] for sample in self.samples if phase in sample.phases]
+            if durations:
+                phases[phase] = _get_latency_stats(durations)
+
+        container_busy_times: Dict[str, float] = {}
+        for sample in self.samples:
+            for container_id, busy_time in sample.container_busy_times.items():
+                container_busy_times[container_id] = container_busy_times.get(container_id, 0.0) + busy_time
+        utilization = (
+            sum(container_busy_times.values()) / (self.duration * len(container_busy_times))
+            if container_busy_times and self.duration
+            else 0.0
+        )
+
+        return {
+            "requests": len(self.samples),
+            "failed": sum(1 for sample in self.samples if not sample.succeeded),
+            "concurrency": self.concurrency,
+            "duration": round(self.duration, 3),
+            "throughput": round(len(self.samples) / self.duration, 2) if self.duration else 0.0,
+            "latency": _get_latency_stats([sample.latency for sample in self.samples]),
+            "phases": phases,
+            "containers": {"count": len(container_busy_times), "utilization": round(utilization, 4)},
+        }
+
+
+class ApiBenchRequest(NamedTuple):
+    """
+    HTTP request replaying an API Gateway event
+    """
+
+    method: str
+    path: str
+    query_string: Union[str, Dict[str, Any]]
+    headers: Dict[str, str]
+    body: Union[str, bytes]
+
+    @staticmethod
+    def from_event(event: Any) -> "ApiBenchRequest":
+        """
+        Creates the request of an API Gateway proxy event, of payload format version 1.0 or 2.0, like the ones of
+        ``sam local generate-event apigateway``
+
+        Raises
+        ------
+        InvalidBenchEventError
+            if the event is not an API Gateway proxy event
+        """
+        if not isinstance(event, dict):
+            raise InvalidBenchEventError("Events sent to an API must be API Gateway proxy events")
+
+        http_context = (event.get("requestContext") or {}).get("http") or {}
+        method = event.get("httpMethod") or http_context.get("method")
+        path = event.get("path") or event.get("rawPath")
+        if not method or not path:
+            raise InvalidBenchEventError(
+                "Events sent to an API must be API Gateway proxy events with an HTTP method and a path"
+            )
+
+        query_string = (
+            event.get("rawQueryString")
+            or event.get("multiValueQueryStringParameters")
+            or event.get("queryStringParameters")
+            or {}
+        )
+        # the length of the body is computed again when the request is sent
+        headers = {
+            name: value for name, value in (event.get("headers") or {}).items() if name.lower() != "content-length"
+        }
+        body = event.get("body") or ""
+        if event.get("isBase64Encoded"):
+            body = base64.b64decode(body)
+
+        return ApiBenchRequest(method, path, query_string, headers, body)
+
+
+class LambdaEventSender:
+    """
+    Sends events as invokes of a function to the local Lambda service
+    """
+
+    def __init__(self, service: BaseLocalService, function_name: str) -> None:
+        self._service = service
+        self._path = LAMBDA_INVOKE_PATH.format(function_name=function_name)
+
+    def __call__(self, event: Any) -> bool:
+        response = self._service.test_client().post(self._path, data=json.dumps(event))
+        response.get_data()
+        return response.status_code == HTTPStatus.OK and "X-Amz-Function-Error" not in response.headers
+
+
+class ApiEventSender:
+    """
+    Sends ApiBenchRequests to the local API Gateway service, responses of status code 5xx are failures
+    """
+
+    def __init__(self, service: BaseLocalService) -> None:
+        self._service = service
+
+    def __call__(self, event: ApiBenchRequest) -> bool:
+        response = self._service.test_client().open(
+            event.path, method=event.method, query_string=event.query_string, headers=event.headers, data=event.body
+        )
+        response.get_data()
+        return bool(response.status_code < HTTPStatus.INTERNAL_SERVER_ERROR)
+
+
+def read_bench_events(event_file: Optional[str]) -> List[Any]:
+    """
+    Reads the events of a file, which is either a single JSON document, like the output of
+    ``sam local generate-event``, or JSON lines of recorded events. Without file, a single empty event is sent.
+
+    Raises
+    ------
+    InvalidBenchEventError
+        if the file can't be read or it holds no event
+    """
+    if not event_file:
+        return [{}]
+
+    try:
+        with open(event_file, "r", encoding="utf-8") as file:
+            content = file.read()
+    except OSError as ex:
+        raise InvalidBenchEventError(f"Failed to read events from {event_file}: {ex}") from ex
+
+    try:
+        return [json.loads(content)]
+    except ValueError:
+        pass
+
+    events = []
+    for line_number, line in enumerate(content.splitlines(), start=1):
+        if not line.strip():
+            continue
+        try:
+            events.append(json.loads(line))
+        except ValueError as ex:
+            raise InvalidBenchEventError(f"Line {line_number} of {event_file} is not a valid JSON event") from ex
+
+    if not events:
+        raise InvalidBenchEventError(f"No events found in {event_file}")
+    return events
+
+
+def run_bench(
+    send: EventSender, events: List[Any], request_count: int, concurrency: int = 1, rate: Optional[float] = None
+) -> BenchResult:
+    """
+    Sends the given number of requests, cycling through the events, with at most ``concurrency`` of them in flight.
+    If a rate is given, requests are started at that rate, otherwise each one starts as soon as a previous one
+    completes.
+
+    Parameters
+    ----------
+    send: EventSender
+        Sends an event, exceptions it raises are counted as failures, except InvalidBenchEventErrors
+    events: List[Any]
+        Events to send
+    request_count: int
+        Number of requests to send
+    concurrency: int
+        Max number of requests in flight at the same time
+    rate: Optional[float]
+        Number of requests to start per second
+
+    Returns
+    -------
+    BenchResult
+        Samples of the requests
+    """
+    if not events:
+        raise ValueError("At least one event is required")
+
+    samples: List[Optional[BenchSample]] = [None] * request_count
+    lock = threading.Lock()
+    stop_event = threading.Event()
+    next_index = [0]
+
+    def _send_requests() -> None:
+        while not stop_event.is_set():
+            with lock:
+                index = next_index[0]
+                next_index[0] += 1
+            if index >= request_count:
+                return
+            if rate:
+                delay = start + index / rate - time.perf_counter()
+                if delay > 0 and stop_event.wait(delay):
+                    return
+            samples[index] = _send_event(send, events[index % len(events)])
+
+    start = time.perf_counter()
+    executor = ThreadPoolExecutor(max_workers=concurrency, thread_name_prefix="BenchWorker")
+    try:
+        futures = [executor.submit(_send_requests) for _ in range(concurrency)]
+        for future in futures:
+            future.result()
+    finally:
+        # on Ctrl+C or a failure, the requests in flight complete but no more are sent
+        stop_event.set()
+        executor.shutdown(wait=True)
+    duration = time.perf_counter() - start
+
+    return BenchResult([sample for sample in samples if sample], duration, concurrency)
+
+
+def format_bench_result(summary: Dict[str, Any]) -> str:
+    """
+    Formats the statistics returned by ``BenchResult.to_dict`` as a table
+    """
+    lines = [
+        f"Requests: {summary['requests']} ({summary['failed']} failed) in {summary['duration']}s, "
+        f"{summary['throughput']} requests/s, concurrency {summary['concurrency']}",
+        "",
+    ]
+
+    header = ["", "count"] + [f"p{percent} (ms)" for percent in PERCENTILES] + ["mean (ms)", "max (ms)"]
+    rows = [header, _format_stats_row("total", summary["latency"])]
+    rows.extend(_format_stats_row(phase, stats) for phase, stats in summary["phases"].items())
+    widths = [max(len(row[column]) for row in rows) for column in range(len(header))]
+    for row in rows:
+        lines.append(
+            "  ".join([row[0].ljust(widths[0])] + [cell.rjust(width) for cell, width in zip(row[1:], widths[1:])])
+        )
+
+    containers = summary["containers"]
+    lines.append("")
+    lines.append(f"Containers: {containers['count']}, utilization {containers['utilization'] * 100:.1f}%")
+    return "\n".join(lines)
+
+
+def percentile(values: List[float], percent: float) -> float:
+    """
+    Returns the given percentile of the values, interpolated between the two closest ranks
+    """
+    if not values:
+        raise ValueError("At least one value is required")
+
+    sorted_values = sorted(values)
+    rank = (len(sorted_values) - 1) * percent / 100
+    lower_index = int(rank)
+    upper_index = min(lower_index + 1, len(sorted_values) - 1)
+    fraction = rank - lower_index
+    return sorted_values[lower_index] + (sorted_values[upper_index] - sorted_values[lower_index]) * fraction
+
+
+def _send_event(send: EventSender, event: Any) -> BenchSample:
+    recorder = PhaseRecorder()
+    with recorder.activate():
+        start = time.perf_counter()
+        try:
+            succeeded = send(event)
+        except InvalidBenchEventError:
+            raise
+        except Exception as ex:  # pylint: disable=broad-except
+            LOG.debug("Failed to send a bench request", exc_info=ex)
+            succeeded = False
+        latency = time.perf_counter() - start
+
+    return BenchSample(
+        latency, succeeded, recorder.get_durations(), recorder.get_busy_times(EmulationPhase.RIE_ROUND_TRIP)
+    )
+
+
+def _get_latency_stats(durations: List[float]) -> Dict[str, Any]:
+    stats: Dict[str, Any] = {"count": len(durations)}
+    for percent in PERCENTILES:
+        stats[f"p{percent}"] = _to_milliseconds(percentile(durations, percent))
+    stats["mean"] = _to_milliseconds(sum(durations) / len(durations))
+    stats["max"] = _to_milliseconds(max(durations))
+    return stats
+
+
+def _format_stats_row(name: str, stats: Dict[str, Any]) -> List[str]:
+    return (
+        [name, str(stats["count"])]
+        + [f"{stats[f'p{percent}']:.2f}" for percent in PERCENTILES]
+        + [f"{stats['mean']:.2f}", f"{stats['max']:.2f}"]
+    )
+
+
+def _to_milliseconds(duration: float) -> float:
+    return round(duration * 1000, 3)
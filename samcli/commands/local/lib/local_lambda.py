@@ -5,7 +5,8 @@ Implementation of Local Lambda runner
 import logging
 import os
 import platform
-from typing import Any, Dict, Optional, cast
+import threading
+from typing import Any, Dict, Optional, Tuple, cast
 
 import boto3
 import click
@@ -93,6 +94,11 @@ class LocalLambdaRunner:
         self.container_host = container_host
         self.container_host_interface = container_host_interface
         self.extra_hosts = extra_hosts
+        # Memoized invoke configurations keyed by function full path. Each entry keeps the Function and the credentials
+        # it was generated from, so that a template reload (which produces new Function objects) or refreshed
+        # credentials invalidate the cached configuration
+        self._function_configs: Dict[str, Tuple[Function, Dict[str, str], FunctionConfig]] = {}
+        self._function_configs_lock = threading.Lock()
 
     def invoke(
         self,
@@ -206,13 +212,41 @@ class LocalLambdaRunner:
 
     def get_invoke_config(self, function: Function) -> FunctionConfig:
         """
-        Returns invoke configuration to pass to Lambda Runtime to invoke the given function
+        Returns invoke configuration to pass to Lambda Runtime to invoke the given function.
+
+        The configuration is generated once per function and reused for the next invokes, as long as the function
+        provider returns the same Function object and the AWS credentials didn't change. Refreshable providers create
+        new Function objects when the templates change, and session credentials are refreshed when they expire, both
+        invalidate the memoized configuration.
 
         :param samcli.commands.local.lib.provider.Function function: Lambda function to generate the configuration for
         :return samcli.local.lambdafn.config.FunctionConfig: Function configuration to pass to Lambda runtime
         """
+        # credentials are read on every invoke, since temporary ones like STS or SSO session credentials expire
+        aws_creds = self.get_aws_creds()
+
+        cached = self._function_configs.get(function.full_path)
+        if cached and cached[0] is function and cached[1] == aws_creds:
+            return cached[2]
 
-        env_vars = self._make_env_vars(function)
+        with self._function_configs_lock:
+            cached = self._function_configs.get(function.full_path)
+            if cached and cached[0] is function and cached[1] == aws_creds:
+                return cached[2]
+
+            config = self._make_invoke_config(function, aws_creds)
+            self._function_configs[function.full_path] = (function, aws_creds, config)
+            return config
+
+    def _make_invoke_config(self, function: Function, aws_creds: Dict[str, str]) -> FunctionConfig:
+        """
+        Generates a new invoke configuration for the given function
+
+        :param samcli.commands.local.lib.provider.Function function: Lambda function to generate the configuration for
+        :param dict aws_creds: AWS credentials passed to the function
+        :return samcli.local.lambdafn.config.FunctionConfig: Function configuration to pass to Lambda runtime
+        """
+        env_vars = self._make_env_vars(function, aws_creds)
         code_abs_path = None
         code_real_path = None
         if function.packagetype == ZIP:
@@ -247,7 +281,7 @@ class LocalLambdaRunner:
             code_real_path=code_real_path,
         )
 
-    def _make_env_vars(self, function: Function) -> EnvironmentVariables:
+    def _make_env_vars(self, function: Function, aws_creds: Optional[Dict[str, str]] = None) -> EnvironmentVariables:
         """Returns the environment variables configuration for this function
 
         Priority order for environment variables (high to low):
@@ -258,6 +292,8 @@ class LocalLambdaRunner:
         ----------
         function : samcli.commands.local.lib.provider.Function
             Lambda function to generate the configuration for
+        aws_creds : Optional[Dict[str, str]]
+            AWS credentials passed to the function, read from the shell environment or profile when not given
 
         Returns
         -------
@@ -316,7 +352,8 @@ class LocalLambdaRunner:
             overrides.update(fn_file_env_vars)
 
         shell_env = os.environ
-        aws_creds = self.get_aws_creds()
+        if aws_creds is None:
+            aws_creds = self.get_aws_creds()
 
         return EnvironmentVariables(
             function.name,
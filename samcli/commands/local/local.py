@@ -5,6 +5,7 @@ setting up stdin/stdout etc
 
 import click
 
+from .bench.cli import cli as bench_cli
 from .generate_event.cli import cli as generate_event_cli
 from .invoke.cli import cli as invoke_cli
 from .start_api.cli import cli as start_api_cli
@@ -23,3 +24,4 @@ cli.add_command(invoke_cli)
 cli.add_command(start_api_cli)
 cli.add_command(generate_event_cli)
 cli.add_command(start_lambda_cli)
+cli.add_command(bench_cli)
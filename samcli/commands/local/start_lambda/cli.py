@@ -39,7 +39,9 @@ DESCRIPTION = """
   Programmatically invoke your Lambda function locally using the AWS CLI or SDKs.
   Start a local endpoint that emulates the AWS Lambda service, and one can run their automated
   tests against this local Lambda endpoint. Invokes to this endpoint can be sent using the AWS CLI or
-  SDK and they will in turn locally execute the Lambda function specified in the request.\n
+  SDK and they will in turn locally execute the Lambda function specified in the request.
+  Batches of events can be POSTed to /2015-03-31/batch-invocations as JSON lines of
+  {"FunctionName": ..., "Payload": ...} objects, their results are streamed back in order.\n
 """
 
 
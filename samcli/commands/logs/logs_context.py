@@ -144,6 +144,7 @@ class ResourcePhysicalIdResolver:
             self._boto_client_provider,
             self._stack_name,
             ResourcePhysicalIdResolver.DEFAULT_SUPPORTED_RESOURCES,
+            use_cache=True,
         )
 
         if selected_resource_names:
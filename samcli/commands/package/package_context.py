@@ -141,7 +141,9 @@ class PackageContext:
         self.code_signer = CodeSigner(code_signer_client, self.signing_profiles)
 
         try:
-            exported_str = self._export(self.template_file, self.use_json)
+            # images are pushed concurrently while the rest of the template is being exported
+            with ecr_uploader.parallel_pushes():
+                exported_str = self._export(self.template_file, self.use_json)
 
             self.write_output(self.output_template_file, exported_str)
 
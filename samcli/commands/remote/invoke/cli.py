@@ -2,6 +2,7 @@
 
 import logging
 from io import TextIOWrapper
+from typing import Optional
 
 import click
 
@@ -16,7 +17,7 @@ from samcli.lib.cli_validation.remote_invoke_options_validations import (
     event_and_event_file_options_validation,
     stack_name_or_resource_id_atleast_one_option_validation,
 )
-from samcli.lib.remote_invoke.remote_invoke_executors import RemoteInvokeOutputFormat
+from samcli.lib.remote_invoke.remote_invoke_executors import DEFAULT_BATCH_CONCURRENCY, RemoteInvokeOutputFormat
 from samcli.lib.telemetry.event import EventTracker
 from samcli.lib.telemetry.metric import track_command
 from samcli.lib.utils.resources import AWS_LAMBDA_FUNCTION
@@ -31,7 +32,8 @@ SHORT_HELP = "Invoke a deployed resource in the cloud"
 
 DESCRIPTION = """
   Invoke or send an event to resources in the cloud.
-  An event body can be passed using either -e (--event) or --event-file parameter.
+  An event body can be passed using either -e (--event) or --event-file parameter. Many events can be sent
+  at once, one per line, with --batch-event-file.
   
   This command can be used to invoke a Lambda Function and get the output payload, start a State Machine execution
   and wait for the output of the final step, send a message to SQS Queue, or put a data record to
@@ -70,6 +72,24 @@ DESCRIPTION = """
     "--test-event-name",
     help="Name of the remote test event to send to the resource",
 )
+@click.option(
+    "--batch-event-file",
+    type=click.File("r", encoding="utf-8"),
+    help="The file that contains one event per line, in JSON lines format. The resource is invoked once per event, "
+    "concurrently, and the responses are written in the order of the events.",
+)
+@click.option(
+    "--batch-concurrency",
+    type=click.IntRange(min=1),
+    default=DEFAULT_BATCH_CONCURRENCY,
+    show_default=True,
+    help="Max number of events of --batch-event-file which are invoked at the same time.",
+)
+@click.option(
+    "--batch-rate",
+    type=click.FloatRange(min=0, min_open=True),
+    help="Max number of events of --batch-event-file which are invoked per second. Unlimited by default.",
+)
 @click.option(
     "--output",
     help="Output the results from the command in a given output format. "
@@ -96,6 +116,9 @@ def cli(
     event_file: TextIOWrapper,
     output: RemoteInvokeOutputFormat,
     test_event_name: str,
+    batch_event_file: TextIOWrapper,
+    batch_concurrency: int,
+    batch_rate: float,
     parameter: dict,
     save_params: bool,
     config_file: str,
@@ -117,6 +140,9 @@ def cli(
         ctx.profile,
         config_file,
         config_env,
+        batch_event_file,
+        batch_concurrency,
+        batch_rate,
     )
 
 
@@ -132,6 +158,9 @@ def do_cli(
     profile: str,
     config_file: str,
     config_env: str,
+    batch_event_file: Optional[TextIOWrapper] = None,
+    batch_concurrency: int = DEFAULT_BATCH_CONCURRENCY,
+    batch_rate: Optional[float] = None,
 ) -> None:
     """
     Implementation of the ``cli`` method
@@ -161,6 +190,13 @@ def do_cli(
             stack_name=stack_name,
             resource_id=resource_id,
         ) as remote_invoke_context:
+            if batch_event_file:
+                EventTracker.track_event("RemoteInvokeEventType", RemoteInvokeEventType.FILE.value)
+                remote_invoke_context.run_batch(
+                    batch_event_file, parameter, output, max_concurrency=batch_concurrency, max_rate=batch_rate
+                )
+                return
+
             if (
                 test_event_name
                 and remote_invoke_context.resource_summary
@@ -12,7 +12,14 @@ from samcli.cli.row_modifiers import RowDefinition
 
 INFRASTRUCTURE_OPTION_NAMES: List[str] = ["stack_name"]
 
-INPUT_EVENT_OPTIONS: List[str] = ["event", "event_file", "test_event_name"]
+INPUT_EVENT_OPTIONS: List[str] = [
+    "event",
+    "event_file",
+    "test_event_name",
+    "batch_event_file",
+    "batch_concurrency",
+    "batch_rate",
+]
 
 ADDITIONAL_OPTIONS: List[str] = ["parameter", "output"]
 
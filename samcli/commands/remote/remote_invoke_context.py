@@ -4,7 +4,8 @@ Context object used by `sam remote invoke` command
 
 import logging
 from dataclasses import dataclass
-from typing import Optional, cast
+from io import TextIOWrapper
+from typing import Iterator, Optional, cast
 
 from botocore.exceptions import ClientError
 
@@ -19,9 +20,12 @@ from samcli.commands.remote.exceptions import (
 from samcli.lib.remote_invoke.exceptions import ErrorBotoApiCallException
 from samcli.lib.remote_invoke.remote_invoke_executor_factory import RemoteInvokeExecutorFactory
 from samcli.lib.remote_invoke.remote_invoke_executors import (
+    DEFAULT_BATCH_CONCURRENCY,
     RemoteInvokeConsumer,
     RemoteInvokeExecutionInfo,
+    RemoteInvokeExecutor,
     RemoteInvokeLogOutput,
+    RemoteInvokeOutputFormat,
     RemoteInvokeResponse,
 )
 from samcli.lib.remote_invoke.sqs_invoke_executors import get_queue_url_from_arn
@@ -95,13 +99,54 @@ class RemoteInvokeContext:
             RemoteInvokeExecutionInfo which contains the payload and other information that will be required during
             the invocation
         """
+        remote_invoke_executor = self._create_remote_invoke_executor(remote_invoke_input.output_format)
+        remote_invoke_executor.execute(remote_invoke_input)
+
+    def run_batch(
+        self,
+        batch_event_file: TextIOWrapper,
+        parameters: dict,
+        output_format: RemoteInvokeOutputFormat,
+        max_concurrency: int = DEFAULT_BATCH_CONCURRENCY,
+        max_rate: Optional[float] = None,
+    ) -> None:
+        """
+        Invokes the resource once per line of the given JSON lines file, concurrently. Lines are read as they are
+        invoked, so the file is never fully loaded in memory. Responses are written in the order of the lines.
+
+        Parameters
+        ----------
+        batch_event_file: TextIOWrapper
+            File which contains one event per line, empty lines are skipped
+        parameters: dict
+            Boto parameters which are used for all the events
+        output_format: RemoteInvokeOutputFormat
+            Output format of the responses
+        max_concurrency: int
+            Max number of events which are invoked at the same time
+        max_rate: Optional[float]
+            Max number of events which are invoked per second, unlimited if not provided
+        """
+        remote_invoke_executor = self._create_remote_invoke_executor(output_format)
+
+        def remote_invoke_inputs() -> Iterator[RemoteInvokeExecutionInfo]:
+            for line in batch_event_file:
+                event = line.strip()
+                if event:
+                    yield RemoteInvokeExecutionInfo(
+                        payload=event, payload_file=None, parameters=dict(parameters), output_format=output_format
+                    )
+
+        remote_invoke_executor.execute_batch(remote_invoke_inputs(), max_concurrency, max_rate)
+
+    def _create_remote_invoke_executor(self, output_format: RemoteInvokeOutputFormat) -> RemoteInvokeExecutor:
         if not self.resource_summary:
             raise self.missing_resource_exception()
 
         remote_invoke_executor_factory = RemoteInvokeExecutorFactory(self._boto_client_provider)
         remote_invoke_executor = remote_invoke_executor_factory.create_remote_invoke_executor(
             self.resource_summary,
-            remote_invoke_input.output_format,
+            output_format,
             DefaultRemoteInvokeResponseConsumer(self.stdout),
             DefaultRemoteInvokeLogConsumer(self.stderr),
         )
@@ -109,8 +154,7 @@ class RemoteInvokeContext:
             raise ResourceNotSupportedForRemoteInvoke(
                 f"Resource type {self.resource_summary.resource_type} is not supported for remote invoke."
             )
-
-        remote_invoke_executor.execute(remote_invoke_input)
+        return remote_invoke_executor
 
     @property
     def resource_summary(self):
@@ -184,6 +228,7 @@ class RemoteInvokeContext:
             self._boto_client_provider,
             cast(str, self._stack_name),
             set(RESOURCES_PRIORITY_ORDER),
+            use_cache=True,
         )
 
         if len(resource_summaries) == 1:
@@ -7,26 +7,30 @@ import threading
 from dataclasses import dataclass
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, Optional, cast
+from typing import Any, Dict, Optional
 
 import tomlkit
-from tomlkit.items import Item
-from tomlkit.toml_document import TOMLDocument
 
 from samcli.lib.build.build_graph import DEFAULT_DEPENDENCIES_DIR
+from samcli.lib.utils.journal_store import JournalStore, Tables
 from samcli.lib.utils.osutils import rmtree_if_exists
 
 LOG = logging.getLogger(__name__)
 
 
-DEFAULT_SYNC_STATE_FILE_NAME = "sync.toml"
+DEFAULT_SYNC_STATE_FILE_NAME = "sync.json"
+SYNC_STATE_FILE_KIND = "sync-state"
+# file of the sync state written by previous versions, it is migrated on the first read
+LEGACY_SYNC_STATE_FILE_NAME = "sync.toml"
 
 SYNC_STATE = "sync_state"
 RESOURCE_SYNC_STATES = "resource_sync_states"
 HASH = "hash"
 SYNC_TIME = "sync_time"
+FINGERPRINT = "fingerprint"
 DEPENDENCY_LAYER = "dependency_layer"
 LATEST_INFRA_SYNC_TIME = "latest_infra_sync_time"
+INFRA_SYNC_FINGERPRINT = "infra_sync_fingerprint"
 
 # global lock for writing to file
 _lock = threading.Lock()
@@ -36,6 +40,8 @@ _lock = threading.Lock()
 class ResourceSyncState:
     hash_value: str
     sync_time: datetime
+    # fingerprint of the local inputs which produced hash_value, known before building them
+    fingerprint: Optional[str] = None
 
 
 @dataclass
@@ -43,11 +49,12 @@ class SyncState:
     dependency_layer: bool
     resource_sync_states: Dict[str, ResourceSyncState]
     latest_infra_sync_time: Optional[datetime]
+    infra_sync_fingerprint: Optional[str] = None
 
-    def update_resource_sync_state(self, resource_id: str, hash_value: str) -> None:
+    def update_resource_sync_state(self, resource_id: str, hash_value: str, fingerprint: Optional[str] = None) -> None:
         """
         Updates the sync_state information for the provided resource_id
-        to be stored in the TOML file.
+        to be stored in the sync state file.
 
         Parameters
         -------
@@ -55,107 +62,154 @@ class SyncState:
             The resource identifier of the resource
         hash_value: str
             The logical ID identifier of the resource
+        fingerprint: Optional[str]
+            The fingerprint of the local inputs of the resource which produced the hash
         """
-        self.resource_sync_states[resource_id] = ResourceSyncState(hash_value, datetime.utcnow())
+        self.resource_sync_states[resource_id] = ResourceSyncState(hash_value, datetime.utcnow(), fingerprint)
+        # deployed code doesn't match the one of the last infra sync anymore
+        self.infra_sync_fingerprint = None
+
+    def update_resource_sync_fingerprint(self, resource_id: str, fingerprint: str) -> None:
+        """
+        Updates the fingerprint of the local inputs of the provided resource_id, whose stored hash is
+        known to match them, to be stored in the sync state file.
+
+        Parameters
+        -------
+        resource_id: str
+            The resource identifier of the resource
+        fingerprint: str
+            The fingerprint of the local inputs of the resource
+        """
+        resource_sync_state = self.resource_sync_states.get(resource_id)
+        if resource_sync_state:
+            resource_sync_state.fingerprint = fingerprint
 
     def update_infra_sync_time(self) -> None:
         """
-        Updates the last infra sync time to be stored in the TOML file.
+        Updates the last infra sync time to be stored in the sync state file.
         """
         self.latest_infra_sync_time = datetime.utcnow()
 
+    def update_infra_sync_fingerprint(self, fingerprint: str) -> None:
+        """
+        Updates the fingerprint of the local project and the deployed stack of the last infra sync
+        to be stored in the sync state file.
+
+        Parameters
+        -------
+        fingerprint: str
+            Fingerprint of the local project and the deployed stack
+        """
+        self.infra_sync_fingerprint = fingerprint
+
 
-def _sync_state_to_toml_document(sync_state: SyncState) -> TOMLDocument:
+def _sync_state_to_document(sync_state: SyncState) -> Tables:
     """
-    Writes the sync state information to the TOML file.
+    Converts the sync state information into the tables of the sync state file.
 
     Parameters
     -------
     sync_state: SyncState
-        The SyncState to cache the information in the TOML file
+        The SyncState to cache the information in the sync state file
 
     Returns
     -------
-    TOMLDocument
-        Object which will be dumped to the TOML file
+    Tables
+        Tables which will be saved into the sync state file
     """
-    sync_state_toml_table = tomlkit.table()
-    sync_state_toml_table[DEPENDENCY_LAYER] = sync_state.dependency_layer
+    sync_state_table: Dict[str, Any] = {DEPENDENCY_LAYER: sync_state.dependency_layer}
     if sync_state.latest_infra_sync_time:
-        sync_state_toml_table[LATEST_INFRA_SYNC_TIME] = sync_state.latest_infra_sync_time.isoformat()
-
-    resource_sync_states_toml_table = tomlkit.table()
-    for resource_id in sync_state.resource_sync_states:
-        resource_sync_state = sync_state.resource_sync_states[resource_id]
-
-        resource_sync_state_toml_table = tomlkit.table()
-
-        resource_sync_state_toml_table[HASH] = resource_sync_state.hash_value
-        resource_sync_state_toml_table[SYNC_TIME] = resource_sync_state.sync_time.isoformat()
-
-        # For Nested stack resources, replace "/" with "-"
-        resource_id_toml = resource_id.replace("/", "-")
-        resource_sync_states_toml_table[resource_id_toml] = resource_sync_state_toml_table
+        sync_state_table[LATEST_INFRA_SYNC_TIME] = sync_state.latest_infra_sync_time.isoformat()
+    if sync_state.infra_sync_fingerprint:
+        sync_state_table[INFRA_SYNC_FINGERPRINT] = sync_state.infra_sync_fingerprint
 
-    toml_document = tomlkit.document()
-    toml_document.add((tomlkit.comment("This file is auto generated by SAM CLI sync command")))
-    toml_document.add(SYNC_STATE, cast(Item, sync_state_toml_table))
-    toml_document.add(RESOURCE_SYNC_STATES, cast(Item, resource_sync_states_toml_table))
+    resource_sync_states_table: Dict[str, Any] = {}
+    for resource_id, resource_sync_state in sync_state.resource_sync_states.items():
+        resource_sync_state_record = {
+            HASH: resource_sync_state.hash_value,
+            SYNC_TIME: resource_sync_state.sync_time.isoformat(),
+        }
+        if resource_sync_state.fingerprint:
+            resource_sync_state_record[FINGERPRINT] = resource_sync_state.fingerprint
+        resource_sync_states_table[resource_id] = resource_sync_state_record
 
-    return toml_document
+    return {SYNC_STATE: sync_state_table, RESOURCE_SYNC_STATES: resource_sync_states_table}
 
 
-def _toml_document_to_sync_state(toml_document: Dict) -> Optional[SyncState]:
+def _document_to_sync_state(document: Optional[Dict]) -> Optional[SyncState]:
     """
-    Reads the cached information from the provided toml_document.
+    Reads the cached information from the provided tables of the sync state file.
 
     Parameters
     -------
-    toml_document: SyncState
-        The toml document to read the information from
+    document: Optional[Dict]
+        The tables to read the information from
 
     """
-    if not toml_document:
+    if not document:
         return None
 
-    sync_state_toml_table = toml_document.get(SYNC_STATE)
-    resource_sync_states_toml_table = toml_document.get(RESOURCE_SYNC_STATES, {})
+    sync_state_table = document.get(SYNC_STATE)
+    resource_sync_states_table = document.get(RESOURCE_SYNC_STATES, {})
 
-    # If no info in toml file
-    if not (sync_state_toml_table or resource_sync_states_toml_table):
+    # If no info in sync state file
+    if not (sync_state_table or resource_sync_states_table):
         return None
 
     resource_sync_states = dict()
-    if resource_sync_states_toml_table:
-        for resource_id in resource_sync_states_toml_table:
-            resource_sync_state_toml_table = resource_sync_states_toml_table.get(resource_id)
-            resource_sync_state = ResourceSyncState(
-                resource_sync_state_toml_table.get(HASH),
-                datetime.fromisoformat(resource_sync_state_toml_table.get(SYNC_TIME)),
-            )
-
-            # For Nested stack resources, replace "-" with "/"
-            resource_sync_state_resource_id = resource_id.replace("-", "/")
-            resource_sync_states[resource_sync_state_resource_id] = resource_sync_state
+    for resource_id, resource_sync_state_record in (resource_sync_states_table or {}).items():
+        fingerprint = resource_sync_state_record.get(FINGERPRINT)
+        resource_sync_states[resource_id] = ResourceSyncState(
+            resource_sync_state_record.get(HASH),
+            datetime.fromisoformat(resource_sync_state_record.get(SYNC_TIME)),
+            str(fingerprint) if fingerprint else None,
+        )
 
     dependency_layer = False
     latest_infra_sync_time = None
-    if sync_state_toml_table:
-        dependency_layer = sync_state_toml_table.get(DEPENDENCY_LAYER)
-        latest_infra_sync_time = sync_state_toml_table.get(LATEST_INFRA_SYNC_TIME)
+    infra_sync_fingerprint = None
+    if sync_state_table:
+        dependency_layer = sync_state_table.get(DEPENDENCY_LAYER)
+        latest_infra_sync_time = sync_state_table.get(LATEST_INFRA_SYNC_TIME)
         if latest_infra_sync_time:
             latest_infra_sync_time = datetime.fromisoformat(str(latest_infra_sync_time))
-    sync_state = SyncState(dependency_layer, resource_sync_states, latest_infra_sync_time)
+        infra_sync_fingerprint = sync_state_table.get(INFRA_SYNC_FINGERPRINT)
+        if infra_sync_fingerprint:
+            infra_sync_fingerprint = str(infra_sync_fingerprint)
+    sync_state = SyncState(dependency_layer, resource_sync_states, latest_infra_sync_time, infra_sync_fingerprint)
 
     return sync_state
 
 
+def _read_legacy_sync_state_document(file_path: Path) -> Tables:
+    """
+    Reads the tables of the sync.toml file written by previous versions.
+
+    Parameters
+    -------
+    file_path: Path
+        Path of the sync.toml file
+    """
+    with open(file_path) as file:
+        document: Tables = tomlkit.loads(file.read()).unwrap()
+
+    # For Nested stack resources, "/" was replaced with "-" in the TOML file
+    resource_sync_states_table = document.get(RESOURCE_SYNC_STATES) or {}
+    document[RESOURCE_SYNC_STATES] = {
+        resource_id.replace("-", "/"): resource_sync_state
+        for resource_id, resource_sync_state in resource_sync_states_table.items()
+    }
+    return document
+
+
 class SyncContext:
     _current_state: SyncState
     _previous_state: Optional[SyncState]
     _build_dir: Path
     _cache_dir: Path
-    _file_path: Path
+    _store: JournalStore
+    _legacy_file_path: Path
     skip_deploy_sync: bool
 
     def __init__(self, dependency_layer: bool, build_dir: str, cache_dir: str, skip_deploy_sync: bool):
@@ -164,7 +218,8 @@ class SyncContext:
         self.skip_deploy_sync = skip_deploy_sync
         self._build_dir = Path(build_dir)
         self._cache_dir = Path(cache_dir)
-        self._file_path = Path(build_dir).parent.joinpath(DEFAULT_SYNC_STATE_FILE_NAME)
+        self._store = JournalStore(Path(build_dir).parent.joinpath(DEFAULT_SYNC_STATE_FILE_NAME), SYNC_STATE_FILE_KIND)
+        self._legacy_file_path = Path(build_dir).parent.joinpath(LEGACY_SYNC_STATE_FILE_NAME)
 
     def __enter__(self) -> "SyncContext":
         with _lock:
@@ -185,7 +240,7 @@ class SyncContext:
 
     def update_infra_sync_time(self) -> None:
         """
-        Updates the last infra sync time and stores it in the TOML file.
+        Updates the last infra sync time and stores it in the sync state file.
         """
         with _lock:
             LOG.debug("Updating latest_infra_sync_time in sync state")
@@ -204,15 +259,42 @@ class SyncContext:
         with _lock:
             infra_sync_time = self._current_state.latest_infra_sync_time
             if not infra_sync_time:
-                LOG.debug("No record of previous infrastructure sync time found from sync.toml file")
+                LOG.debug("No record of previous infrastructure sync time found from sync state file")
                 return None
             LOG.debug("Latest infra sync happened at %s ", infra_sync_time)
             return infra_sync_time
 
-    def update_resource_sync_state(self, resource_id: str, hash_value: str) -> None:
+    def update_infra_sync_fingerprint(self, fingerprint: str) -> None:
+        """
+        Updates the fingerprint of the last infra sync and stores it in the sync state file.
+
+        Parameters
+        -------
+        fingerprint: str
+            Fingerprint of the local project and the deployed stack
+        """
+        with _lock:
+            LOG.debug("Updating infra_sync_fingerprint in sync state")
+            self._current_state.update_infra_sync_fingerprint(fingerprint)
+            self._write()
+
+    def get_infra_sync_fingerprint(self) -> Optional[str]:
+        """
+        Returns the fingerprint of the local project and the deployed stack of the last infra sync,
+        which is cleared by any code sync.
+
+        Returns
+        -------
+        Optional[str]
+            The fingerprint of the last infra sync if it exists
+        """
+        with _lock:
+            return self._current_state.infra_sync_fingerprint
+
+    def update_resource_sync_state(self, resource_id: str, hash_value: str, fingerprint: Optional[str] = None) -> None:
         """
         Updates the sync_state information for the provided resource_id
-        to be stored in the TOML file.
+        to be stored in the sync state file.
 
         Parameters
         -------
@@ -220,12 +302,49 @@ class SyncContext:
             The resource identifier of the resource
         hash_value: str
             The logical ID identifier of the resource
+        fingerprint: Optional[str]
+            The fingerprint of the local inputs of the resource which produced the hash
         """
         with _lock:
             LOG.debug("Updating resource_sync_state for resource %s with hash %s", resource_id, hash_value)
-            self._current_state.update_resource_sync_state(resource_id, hash_value)
+            self._current_state.update_resource_sync_state(resource_id, hash_value, fingerprint)
+            self._write()
+
+    def update_resource_sync_fingerprint(self, resource_id: str, fingerprint: str) -> None:
+        """
+        Updates the fingerprint of the local inputs of the provided resource_id, once its stored hash is
+        known to match them, and stores it in the sync state file.
+
+        Parameters
+        -------
+        resource_id: str
+            The resource identifier of the resource
+        fingerprint: str
+            The fingerprint of the local inputs of the resource
+        """
+        with _lock:
+            LOG.debug("Updating resource_sync_state for resource %s with fingerprint %s", resource_id, fingerprint)
+            self._current_state.update_resource_sync_fingerprint(resource_id, fingerprint)
             self._write()
 
+    def get_resource_latest_sync_fingerprint(self, resource_id: str) -> Optional[str]:
+        """
+        Returns the fingerprint of the local inputs which produced the latest hash of the provided resource_id.
+
+        Parameters
+        -------
+        resource_id: str
+            The resource identifier of the resource
+
+        Returns
+        -------
+        Optional[str]
+            The fingerprint of the resource stored in resource_sync_state if it exists
+        """
+        with _lock:
+            resource_sync_state = self._current_state.resource_sync_states.get(resource_id)
+            return resource_sync_state.fingerprint if resource_sync_state else None
+
     def get_resource_latest_sync_hash(self, resource_id: str) -> Optional[str]:
         """
         Returns the latest hash from resource_sync_state if this information was
@@ -244,7 +363,7 @@ class SyncContext:
         with _lock:
             resource_sync_state = self._current_state.resource_sync_states.get(resource_id)
             if not resource_sync_state:
-                LOG.debug("No record of latest hash found for resource %s found in sync.toml file", resource_id)
+                LOG.debug("No record of latest hash found for resource %s found in sync state file", resource_id)
                 return None
             LOG.debug(
                 "Latest resource_sync_state hash %s found for resource %s", resource_id, resource_sync_state.hash_value
@@ -252,17 +371,22 @@ class SyncContext:
             return resource_sync_state.hash_value
 
     def _write(self) -> None:
-        with open(self._file_path, "w+") as file:
-            file.write(tomlkit.dumps(_sync_state_to_toml_document(self._current_state)))
+        # only the states which changed since the file was read are written
+        self._store.save(_sync_state_to_document(self._current_state))
+        if self._legacy_file_path.is_file():
+            self._legacy_file_path.unlink()
 
     def _read(self) -> None:
         try:
-            with open(self._file_path) as file:
-                toml_document = cast(Dict, tomlkit.loads(file.read()))
-            self._previous_state = _toml_document_to_sync_state(toml_document)
+            document = self._store.load()
+            if not document and not self._store.exists():
+                document = _read_legacy_sync_state_document(self._legacy_file_path)
+                LOG.debug("Migrating sync state from %s", self._legacy_file_path)
+            self._previous_state = _document_to_sync_state(document)
             if self._previous_state:
                 self._current_state.resource_sync_states = self._previous_state.resource_sync_states
                 self._current_state.latest_infra_sync_time = self._previous_state.latest_infra_sync_time
+                self._current_state.infra_sync_fingerprint = self._previous_state.infra_sync_fingerprint
         except OSError:
             LOG.debug("Missing previous sync state, will create a new file at the end of this execution")
 
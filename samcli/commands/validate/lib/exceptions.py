@@ -7,3 +7,9 @@ class InvalidSamDocumentException(Exception):
     """
     Exception for Invalid Sam Documents
     """
+
+
+class InvalidLintConfigException(Exception):
+    """
+    Exception for configurations cfn-lint can't lint templates with, like unsupported regions
+    """
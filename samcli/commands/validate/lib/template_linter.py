@@ -0,0 +1,282 @@
+"""
+Lints many templates with cfn-lint, in worker processes which load the rules of cfn-lint once, and skips the templates
+which didn't change since their last lint
+"""
+
+import glob
+import hashlib
+import json
+import logging
+import multiprocessing
+import os
+import signal
+from concurrent.futures import Future, ProcessPoolExecutor
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, NamedTuple, Optional, Tuple
+from uuid import uuid4
+
+from samcli.cli.global_config import GlobalConfig
+from samcli.commands.local.cli_common.user_exceptions import SamTemplateNotFoundException
+from samcli.commands.validate.lib.exceptions import InvalidLintConfigException
+
+LOG = logging.getLogger(__name__)
+
+CFN_LINT_LOGGER_NAME = "cfnlint"
+
+# changed when the format of the cached results changes
+LINT_CACHE_VERSION = "1"
+
+# cfn-lint reads its configuration from these files in the home and the working directories
+CFN_LINT_CONFIG_FILE_NAMES = [".cfnlintrc", ".cfnlintrc.yaml", ".cfnlintrc.yml"]
+
+# results of the templates depend on the rules of cfn-lint, and on the transform of the SAM translator
+LINT_PACKAGE_NAMES = ["cfn-lint", "aws-sam-translator"]
+
+
+class LintResult(NamedTuple):
+    template_path: str
+    # cfn-lint matches, formatted
+    matches: List[str]
+    # whether the template didn't change since its last lint, and the result of that lint was used
+    cached: bool = False
+
+
+def get_lint_cache_dir() -> Path:
+    """
+    Returns the directory of the on-disk cache of the lint results
+    """
+    return GlobalConfig().config_dir / "cache" / "lint"
+
+
+def expand_template_paths(patterns: Iterable[str]) -> List[str]:
+    """
+    Returns the paths of the templates, expanding the glob patterns, like ``stacks/**/template.yaml``
+
+    Raises
+    ------
+    SamTemplateNotFoundException
+        if a pattern matches no template
+    """
+    template_paths: List[str] = []
+    for pattern in patterns:
+        if any(character in pattern for character in "*?["):
+            matched_paths = sorted(path for path in glob.glob(pattern, recursive=True) if os.path.isfile(path))
+            if not matched_paths:
+                raise SamTemplateNotFoundException(f"No template matches {pattern}")
+            template_paths.extend(matched_paths)
+        else:
+            template_paths.append(pattern)
+    # templates matched by several patterns are linted once
+    return list(dict.fromkeys(template_paths))
+
+
+class TemplateLinter:
+    """
+    Lints templates with cfn-lint, in parallel and skipping the ones which didn't change since their last lint
+    """
+
+    def __init__(
+        self,
+        regions: Optional[List[str]] = None,
+        debug: bool = False,
+        max_workers: Optional[int] = None,
+        cache_dir: Optional[Path] = None,
+    ) -> None:
+        """
+        Parameters
+        ----------
+        regions: Optional[List[str]]
+            Regions to lint the templates for, defaults to the one of cfn-lint
+        debug: bool
+            Show the debug logs of cfn-lint
+        max_workers: Optional[int]
+            Max number of worker processes, defaults to the number of cores
+        cache_dir: Optional[Path]
+            Directory of the cache, defaults to the one in the SAM CLI config directory
+        """
+        self._linter_config: Dict[str, Any] = {"regions": regions} if regions else {}
+        self._debug = debug
+        self._max_workers = max_workers or os.cpu_count() or 1
+        self._cache_dir = cache_dir or get_lint_cache_dir()
+
+    def lint(self, template_paths: List[str]) -> List[LintResult]:
+        """
+        Lints the templates, the results are in the order of the templates
+
+        Raises
+        ------
+        SamTemplateNotFoundException
+            if a template can't be read
+        InvalidLintConfigException
+            if cfn-lint can't lint with the configuration, like when a region is not supported
+        """
+        contents = [_read_template(template_path) for template_path in template_paths]
+        config_hash = self._get_config_hash()
+        cache_keys = [_hash(config_hash, content) for content in contents]
+
+        results: List[Optional[LintResult]] = [
+            self._read_cache(template_path, cache_key) for template_path, cache_key in zip(template_paths, cache_keys)
+        ]
+        stale_indexes = [index for index, result in enumerate(results) if result is None]
+        LOG.debug("Linting %s templates, %s did not change", len(stale_indexes), len(results) - len(stale_indexes))
+
+        outcomes = self._lint_templates([(template_paths[index], contents[index]) for index in stale_indexes])
+        for index, (matches, error) in zip(stale_indexes, outcomes):
+            if error:
+                raise InvalidLintConfigException(error)
+            results[index] = LintResult(template_paths[index], matches)
+            self._write_cache(template_paths[index], cache_keys[index], matches)
+
+        return [result for result in results if result]
+
+    def _lint_templates(self, templates: List[Tuple[str, str]]) -> List[Tuple[List[str], Optional[str]]]:
+        max_workers = min(self._max_workers, len(templates))
+        if max_workers <= 1:
+            # spawning a worker takes longer than linting a template
+            _init_lint_worker(self._linter_config, self._debug, in_main_process=True)
+            return [_lint_template(template_path, content) for template_path, content in templates]
+
+        futures: List[Future] = []
+        # workers are spawned rather than forked, so that they don't inherit the state of the command
+        with ProcessPoolExecutor(
+            max_workers=max_workers,
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=_init_lint_worker,
+            initargs=(self._linter_config, self._debug),
+        ) as executor:
+            try:
+                futures = [
+                    executor.submit(_lint_template, template_path, content) for template_path, content in templates
+                ]
+                return [future.result() for future in futures]
+            except BaseException:
+                # on Ctrl+C, the templates which are not being linted yet are skipped
+                for future in futures:
+                    future.cancel()
+                raise
+
+    def _get_config_hash(self) -> str:
+        config_parts = [LINT_CACHE_VERSION, json.dumps(self._linter_config, sort_keys=True)]
+        config_parts.extend(_get_package_version(package_name) for package_name in LINT_PACKAGE_NAMES)
+        for config_dir in [Path(os.path.expanduser("~")), Path.cwd()]:
+            for file_name in CFN_LINT_CONFIG_FILE_NAMES:
+                try:
+                    config_parts.append(config_dir.joinpath(file_name).read_text(encoding="utf-8"))
+                except OSError:
+                    config_parts.append("")
+        return _hash(*config_parts)
+
+    def _read_cache(self, template_path: str, cache_key: str) -> Optional[LintResult]:
+        try:
+            with open(self._get_cache_path(template_path), "r", encoding="utf-8") as cache_file:
+                cache_entry = json.load(cache_file)
+            if cache_entry["key"] != cache_key:
+                return None
+            return LintResult(template_path, [str(match) for match in cache_entry["matches"]], cached=True)
+        except (OSError, ValueError, TypeError, KeyError):
+            return None
+
+    def _write_cache(self, template_path: str, cache_key: str, matches: List[str]) -> None:
+        cache_entry = {"template": os.path.abspath(template_path), "key": cache_key, "matches": matches}
+        try:
+            self._cache_dir.mkdir(mode=0o700, parents=True, exist_ok=True)
+            # write into a temporary file first, so concurrent readers never see a partial entry
+            cache_path = self._get_cache_path(template_path)
+            temp_cache_path = cache_path.with_name(f"{cache_path.name}.{uuid4().hex}")
+            with open(temp_cache_path, "w", encoding="utf-8") as cache_file:
+                json.dump(cache_entry, cache_file)
+            os.replace(temp_cache_path, cache_path)
+        except (OSError, TypeError, ValueError) as ex:
+            LOG.debug("Failed to cache the lint result of %s", template_path, exc_info=ex)
+
+    def _get_cache_path(self, template_path: str) -> Path:
+        # one entry per template, replaced when the template changes
+        return self._cache_dir / f"{_hash(os.path.abspath(template_path))}.json"
+
+
+def _read_template(template_path: str) -> str:
+    try:
+        with open(template_path, "r", encoding="utf-8") as template_file:
+            return template_file.read()
+    except OSError as ex:
+        raise SamTemplateNotFoundException(f"Template at {template_path} can't be read: {ex}") from ex
+
+
+def _hash(*parts: str) -> str:
+    sha256 = hashlib.sha256()
+    for part in parts:
+        sha256.update(part.encode("utf-8"))
+        # separates the parts, so that moving text from one part to the next changes the hash
+        sha256.update(b"\0")
+    return sha256.hexdigest()
+
+
+def _get_package_version(package_name: str) -> str:
+    # pylint: disable=import-outside-toplevel
+    from importlib.metadata import PackageNotFoundError, version
+
+    try:
+        return version(package_name)
+    except PackageNotFoundError:
+        # the metadata of the packages may not be bundled in the frozen binary
+        import cfnlint.version
+        import samtranslator
+
+        return str(
+            {"cfn-lint": cfnlint.version.__version__, "aws-sam-translator": samtranslator.__version__}[package_name]
+        )
+
+
+class _WorkerRunner:
+    """
+    Holds the cfn-lint runner of the process, which is created once with its rules by the first lint
+    """
+
+    def __init__(self) -> None:
+        self.runner: Any = None
+        self.config: Dict[str, Any] = {}
+
+
+_worker_runner = _WorkerRunner()
+
+
+def _init_lint_worker(linter_config: Dict[str, Any], debug: bool, in_main_process: bool = False) -> None:
+    _worker_runner.runner, _worker_runner.config = None, linter_config
+
+    if not in_main_process:
+        # Ctrl+C is also sent to the workers by the terminal, the main process stops submitting templates instead
+        signal.signal(signal.SIGINT, signal.SIG_IGN)
+        if debug:
+            logging.basicConfig(level=logging.DEBUG)
+
+    # cfn-lint loggers are not part of the SAM CLI ones, their logs are only shown with --debug
+    cfn_lint_logger = logging.getLogger(CFN_LINT_LOGGER_NAME)
+    cfn_lint_logger.propagate = debug
+    if debug:
+        cfn_lint_logger.setLevel(logging.DEBUG)
+
+
+def _lint_template(template_path: str, content: str) -> Tuple[List[str], Optional[str]]:
+    """
+    Lints a template with the runner of the process, and returns the formatted matches, or the error preventing
+    cfn-lint from linting it
+    """
+    # pylint: disable=import-outside-toplevel
+    from cfnlint.api import ManualArgs
+    from cfnlint.config import ConfigMixIn
+    from cfnlint.decode.decode import decode_str
+    from cfnlint.runner import InvalidRegionException, Runner
+
+    if _worker_runner.runner is None:
+        _worker_runner.runner = Runner(ConfigMixIn(**ManualArgs(**_worker_runner.config)))
+
+    template, errors = decode_str(content)
+    if errors:
+        return [repr(error) for error in errors], None
+    if template is None:
+        return [], None
+
+    try:
+        return [repr(match) for match in _worker_runner.runner.validate_template(template_path, template)], None
+    except InvalidRegionException as ex:
+        return [], str(ex)
@@ -5,6 +5,7 @@ CLI Command for Validating a SAM Template
 import logging
 import os
 from dataclasses import dataclass
+from typing import Tuple
 
 import boto3
 import click
@@ -57,6 +58,14 @@ class SamTemplate:
     "Create a cfnlintrc config file to specify additional parameters. "
     "For more information, see: https://github.com/aws-cloudformation/cfn-lint",
 )
+@click.option(
+    "--templates",
+    multiple=True,
+    type=click.Path(),
+    help="Paths of templates to lint with --lint instead of the template, glob patterns like 'stacks/**/template.yaml' "
+    "are expanded. Templates are linted in parallel, and the ones which didn't change since their last lint are "
+    "skipped.",
+)
 @save_params_option
 @pass_context
 @track_command
@@ -64,23 +73,28 @@ class SamTemplate:
 @print_cmdline_args
 @unsupported_command_cdk(alternative_command="cdk doctor")
 @command_exception_handler
-def cli(ctx, template_file, config_file, config_env, lint, save_params):
+def cli(ctx, template_file, config_file, config_env, lint, templates, save_params):
     # All logic must be implemented in the ``do_cli`` method. This helps with easy unit testing
 
-    do_cli(ctx, template_file, lint)  # pragma: no cover
+    do_cli(ctx, template_file, lint, templates)  # pragma: no cover
 
 
-def do_cli(ctx, template, lint):
+def do_cli(ctx, template, lint, templates=None):
     """
     Implementation of the ``cli`` method, just separated out for unit testing purposes
     """
-    from samtranslator.translator.managed_policy_translator import ManagedPolicyLoader
-
     from samcli.commands.exceptions import UserException
     from samcli.commands.local.cli_common.user_exceptions import InvalidSamTemplateException
     from samcli.commands.validate.lib.exceptions import InvalidSamDocumentException
+    from samcli.lib.translate.managed_policy_loader import CachedManagedPolicyLoader
     from samcli.lib.translate.sam_template_validator import SamTemplateValidator
 
+    if templates:
+        if not lint:
+            raise UserException("The --templates option can only be used with the --lint option.")
+        _lint_templates(ctx, templates)
+        return
+
     sam_template = _read_sam_file(template)
 
     if lint:
@@ -88,7 +102,7 @@ def do_cli(ctx, template, lint):
     else:
         iam_client = boto3.client("iam")
         validator = SamTemplateValidator(
-            sam_template.deserialized, ManagedPolicyLoader(iam_client), profile=ctx.profile, region=ctx.region
+            sam_template.deserialized, CachedManagedPolicyLoader(iam_client), profile=ctx.profile, region=ctx.region
         )
 
         try:
@@ -187,3 +201,52 @@ def _lint(ctx: Context, template: str, template_path: str) -> None:
     click.secho(matches)
 
     raise LinterRuleMatchedException("Linting failed. At least one linting rule was matched to the provided template.")
+
+
+def _lint_templates(ctx: Context, templates: Tuple[str, ...]) -> None:
+    """
+    Lints many templates with cfn-lint, in parallel worker processes. Templates which didn't change since their
+    last lint, with the same versions of cfn-lint and of its configuration, are not linted again.
+
+    Parameters
+    -----------
+    ctx
+        Click context object
+    templates
+        Paths or glob patterns of the templates
+    """
+    from samcli.commands.validate.lib.exceptions import InvalidLintConfigException
+    from samcli.commands.validate.lib.template_linter import TemplateLinter, expand_template_paths
+
+    EventTracker.track_event("UsedFeature", "CFNLint")
+
+    template_paths = expand_template_paths(templates)
+    linter = TemplateLinter(regions=[ctx.region] if ctx.region else None, debug=ctx.debug)
+
+    try:
+        results = linter.lint(template_paths)
+    except InvalidLintConfigException as ex:
+        raise UserException(
+            f"AWS Region was not found. Please configure your region through the --region option.\n{ex}",
+            wrapped_from=ex.__class__.__name__,
+        ) from ex
+
+    failed_count = 0
+    for result in results:
+        if not result.matches:
+            click.secho("{} is a valid SAM Template".format(result.template_path), fg="green")
+            continue
+        failed_count += 1
+        click.secho("{} matched linting rules:".format(result.template_path), fg="red")
+        click.secho("\n".join(result.matches))
+
+    cached_count = sum(1 for result in results if result.cached)
+    click.echo(
+        f"Linted {len(results)} templates, {cached_count} of them unchanged since their last lint, "
+        f"{failed_count} failed."
+    )
+
+    if failed_count:
+        raise LinterRuleMatchedException(
+            "Linting failed. At least one linting rule was matched to the provided templates."
+        )
@@ -7,8 +7,9 @@ import json
 import logging
 import os
 import pathlib
+from contextlib import contextmanager
 from pathlib import Path
-from typing import Dict, List, NamedTuple, Optional, cast
+from typing import Dict, Iterator, List, NamedTuple, Optional, cast
 
 import docker
 import docker.errors
@@ -20,6 +21,7 @@ from aws_lambda_builders.exceptions import LambdaBuilderError
 
 from samcli.commands._utils.experimental import get_enabled_experimental_flags
 from samcli.lib.build.build_graph import BuildGraph, FunctionBuildDefinition, LayerBuildDefinition
+from samcli.lib.build.build_process_pool import BuildProcessPool, InProcessBuildDefinition, get_build_process_count
 from samcli.lib.build.build_strategy import (
     BuildStrategy,
     CachedOrIncrementalBuildStrategyWrapper,
@@ -47,6 +49,7 @@ from samcli.lib.constants import DOCKER_MIN_API_VERSION
 from samcli.lib.docker.log_streamer import LogStreamer, LogStreamError
 from samcli.lib.providers.provider import ResourcesToBuildCollector, Stack, get_full_path
 from samcli.lib.samlib.resource_metadata_normalizer import ResourceMetadataNormalizer
+from samcli.lib.telemetry.tracing import span, traced
 from samcli.lib.utils import osutils
 from samcli.lib.utils.colors import Colored, Colors
 from samcli.lib.utils.lambda_builders import patch_runtime
@@ -61,7 +64,9 @@ from samcli.lib.utils.resources import (
     AWS_SERVERLESS_LAYERVERSION,
 )
 from samcli.lib.utils.stream_writer import StreamWriter
+from samcli.local.docker.container import Container
 from samcli.local.docker.lambda_build_container import LambdaBuildContainer
+from samcli.local.docker.lambda_build_container_pool import LambdaBuildContainerPool
 from samcli.local.docker.manager import ContainerManager, DockerImagePullFailedException
 from samcli.local.docker.utils import get_docker_platform, is_docker_reachable
 
@@ -110,6 +115,7 @@ class ApplicationBuilder:
         combine_dependencies: bool = True,
         build_in_source: Optional[bool] = None,
         mount_with_write: bool = False,
+        build_container_pool: Optional[LambdaBuildContainerPool] = None,
     ) -> None:
         """
         Initialize the class
@@ -155,6 +161,9 @@ class ApplicationBuilder:
             Set to True to build in the source directory.
         mount_with_write: bool
             Mount source code directory with write permissions when building inside container.
+        build_container_pool: Optional[LambdaBuildContainerPool]
+            Optional. If provided, builds inside container run in the long-lived containers of this pool, instead of
+            a new container per build
         """
         self._resources_to_build = resources_to_build
         self._build_dir = build_dir
@@ -178,7 +187,11 @@ class ApplicationBuilder:
         self._combine_dependencies = combine_dependencies
         self._build_in_source = build_in_source
         self._mount_with_write = mount_with_write
+        self._build_container_pool = build_container_pool
+        # set while parallel builds run, to build in worker processes instead of threads
+        self._build_process_pool: Optional[BuildProcessPool] = None
 
+    @traced("ApplicationBuilder.build")
     def build(self) -> ApplicationBuildResult:
         """
         Build the entire application
@@ -223,8 +236,29 @@ class ApplicationBuilder:
                 bool(self._container_manager),
             )
 
-        return ApplicationBuildResult(build_graph, build_strategy.build())
+        with self._use_build_process_pool():
+            return ApplicationBuildResult(build_graph, build_strategy.build())
 
+    @contextmanager
+    def _use_build_process_pool(self) -> Iterator[None]:
+        """
+        Builds in process in worker processes while the context is active, if the builds run in parallel
+        """
+        # resources sharing a build definition are built once, so this is an upper bound of the builds
+        build_count = len(self._resources_to_build.functions) + len(self._resources_to_build.layers)
+        max_workers = min(get_build_process_count(), build_count)
+        if not self._parallel or self._container_manager or max_workers <= 1:
+            yield
+            return
+
+        with BuildProcessPool(max_workers) as build_process_pool:
+            self._build_process_pool = build_process_pool
+            try:
+                yield
+            finally:
+                self._build_process_pool = None
+
+    @traced("ApplicationBuilder.get_build_graph")
     def _get_build_graph(
         self, inline_env_vars: Optional[Dict] = None, env_vars_file: Optional[str] = None
     ) -> BuildGraph:
@@ -368,6 +402,7 @@ class ApplicationBuilder:
         if resource_type == AWS_SERVERLESS_FUNCTION and resource_properties.get("PackageType", ZIP) == IMAGE:
             resource_properties["ImageUri"] = path
 
+    @traced("ApplicationBuilder.build_lambda_image")
     def _build_lambda_image(self, function_name: str, metadata: Dict, architecture: str) -> str:
         """
         Build an Lambda image
@@ -472,6 +507,7 @@ class ApplicationBuilder:
         except (docker.errors.APIError, OSError) as ex:
             raise DockerBuildFailed(msg=str(ex)) from ex
 
+    @traced("ApplicationBuilder.build_layer")
     def _build_layer(
         self,
         layer_name: str,
@@ -607,6 +643,7 @@ class ApplicationBuilder:
             # Not including subfolder in return so that we copy subfolder, instead of copying artifacts inside it.
             return artifact_dir
 
+    @traced("ApplicationBuilder.build_function")
     def _build_function(  # pylint: disable=R1710
         self,
         function_name: str,
@@ -880,38 +917,66 @@ class ApplicationBuilder:
         combine_dependencies: bool,
         is_building_layer: bool = False,
     ) -> str:
+        runtime_patched = patch_runtime(runtime)
+
+        if self._build_process_pool:
+            with span("LambdaBuilder.build", runtime=runtime, workflow=config.language, worker_process=True):
+                return self._build_process_pool.build(
+                    InProcessBuildDefinition(
+                        language=config.language,
+                        dependency_manager=config.dependency_manager,
+                        application_framework=config.application_framework,
+                        source_dir=source_dir,
+                        artifacts_dir=artifacts_dir,
+                        scratch_dir=scratch_dir,
+                        manifest_path=manifest_path,
+                        runtime=runtime_patched,
+                        unpatched_runtime=runtime,
+                        executable_search_paths=config.executable_search_paths,
+                        mode=self._mode,
+                        options=options,
+                        architecture=architecture,
+                        dependencies_dir=dependencies_dir,
+                        download_dependencies=download_dependencies,
+                        combine_dependencies=combine_dependencies,
+                        is_building_layer=is_building_layer,
+                        experimental_flags=get_enabled_experimental_flags(),
+                        build_in_source=self._build_in_source,
+                    )
+                )
+
         builder = LambdaBuilder(
             language=config.language,
             dependency_manager=config.dependency_manager,
             application_framework=config.application_framework,
         )
 
-        runtime_patched = patch_runtime(runtime)
-
         try:
-            builder.build(
-                source_dir,
-                artifacts_dir,
-                scratch_dir,
-                manifest_path,
-                runtime=runtime_patched,
-                unpatched_runtime=runtime,
-                executable_search_paths=config.executable_search_paths,
-                mode=self._mode,
-                options=options,
-                architecture=architecture,
-                dependencies_dir=dependencies_dir,
-                download_dependencies=download_dependencies,
-                combine_dependencies=combine_dependencies,
-                is_building_layer=is_building_layer,
-                experimental_flags=get_enabled_experimental_flags(),
-                build_in_source=self._build_in_source,
-            )
+            with span("LambdaBuilder.build", runtime=runtime, workflow=config.language):
+                builder.build(
+                    source_dir,
+                    artifacts_dir,
+                    scratch_dir,
+                    manifest_path,
+                    runtime=runtime_patched,
+                    unpatched_runtime=runtime,
+                    executable_search_paths=config.executable_search_paths,
+                    mode=self._mode,
+                    options=options,
+                    architecture=architecture,
+                    dependencies_dir=dependencies_dir,
+                    download_dependencies=download_dependencies,
+                    combine_dependencies=combine_dependencies,
+                    is_building_layer=is_building_layer,
+                    experimental_flags=get_enabled_experimental_flags(),
+                    build_in_source=self._build_in_source,
+                )
         except LambdaBuilderError as ex:
             raise BuildError(wrapped_from=ex.__class__.__name__, msg=str(ex)) from ex
 
         return artifacts_dir
 
+    @traced("ApplicationBuilder.build_function_on_container")
     def _build_function_on_container(
         self,  # pylint: disable=too-many-locals
         config: CONFIG,
@@ -940,6 +1005,13 @@ class ApplicationBuilder:
 
         container_env_vars = container_env_vars or {}
 
+        # build in a long-lived container of the pool, if the function or layer can be built in it
+        container_dirs = (
+            self._build_container_pool.get_container_dirs(source_dir, manifest_path)
+            if self._build_container_pool
+            else None
+        )
+
         container = LambdaBuildContainer(
             lambda_builders_protocol_version,
             config.language,
@@ -961,8 +1033,12 @@ class ApplicationBuilder:
             build_in_source=self._build_in_source,
             mount_with_write=self._mount_with_write,
             build_dir=self._build_dir,
+            container_dirs=container_dirs,
         )
 
+        if self._build_container_pool and container_dirs:
+            return self._build_function_on_pooled_container(container, container_dirs, artifacts_dir)
+
         try:
             try:
                 self._container_manager.run(container)
@@ -978,17 +1054,7 @@ class ApplicationBuilder:
             stderr_stream = osutils.stderr()
             container.wait_for_logs(stdout=stdout_stream, stderr=stderr_stream)
 
-            stdout_data = stdout_stream.getvalue().decode("utf-8")
-            LOG.debug("Build inside container returned response %s", stdout_data)
-
-            response = self._parse_builder_response(stdout_data, container.image)
-
-            # Request is successful. Now copy the artifacts back to the host
-            LOG.debug("Build inside container was successful. Copying artifacts from container to host")
-
-            # "/." is a Docker thing that instructions the copy command to download contents of the folder only
-            result_dir_in_container = response["result"]["artifacts_dir"] + "/."
-            container.copy(result_dir_in_container, artifacts_dir)
+            self._copy_artifacts_from_container(container, stdout_stream, container.image, artifacts_dir)
 
         except DockerImagePullFailedException as ex:
             raise BuildInsideContainerError(ex)
@@ -999,6 +1065,49 @@ class ApplicationBuilder:
         LOG.debug("Build inside container succeeded")
         return artifacts_dir
 
+    def _build_function_on_pooled_container(
+        self, build_container: LambdaBuildContainer, container_dirs: Dict[str, str], artifacts_dir: str
+    ) -> str:
+        """
+        Runs the build of the given build container in a long-lived container of the build container pool
+        """
+        # only called when self._build_container_pool is not None
+        build_container_pool = cast(LambdaBuildContainerPool, self._build_container_pool)
+
+        try:
+            with build_container_pool.acquire(build_container.image) as container:
+                try:
+                    stdout_stream = io.BytesIO()
+                    exit_code = container.exec_build(build_container, stdout_stream, osutils.stderr())
+                    LOG.debug("Build inside container exited with %s", exit_code)
+                    self._copy_artifacts_from_container(container, stdout_stream, build_container.image, artifacts_dir)
+                finally:
+                    container.clean(container_dirs)
+        except DockerImagePullFailedException as ex:
+            raise BuildInsideContainerError(ex)
+
+        LOG.debug("Build inside container succeeded")
+        return artifacts_dir
+
+    def _copy_artifacts_from_container(
+        self, container: Container, stdout_stream: io.BytesIO, image_name: str, artifacts_dir: str
+    ) -> None:
+        """
+        Parses the builder response written into the given stdout stream, and copies the built artifacts from the
+        container into the given artifacts directory
+        """
+        stdout_data = stdout_stream.getvalue().decode("utf-8")
+        LOG.debug("Build inside container returned response %s", stdout_data)
+
+        response = self._parse_builder_response(stdout_data, image_name)
+
+        # Request is successful. Now copy the artifacts back to the host
+        LOG.debug("Build inside container was successful. Copying artifacts from container to host")
+
+        # "/." is a Docker thing that instructions the copy command to download contents of the folder only
+        result_dir_in_container = response["result"]["artifacts_dir"] + "/."
+        container.copy(result_dir_in_container, artifacts_dir)
+
     @staticmethod
     def _parse_builder_response(stdout_data: str, image_name: str) -> Dict:
         try:
@@ -9,11 +9,10 @@ import threading
 from abc import abstractmethod
 from copy import deepcopy
 from pathlib import Path
-from typing import Any, Dict, List, NamedTuple, Optional, Sequence, Tuple, cast
+from typing import Any, Dict, List, NamedTuple, Optional, Sequence, Tuple
 from uuid import uuid4
 
 import tomlkit
-from tomlkit.toml_document import TOMLDocument
 
 from samcli.commands._utils.experimental import ExperimentalFlag, is_experimental_enabled
 from samcli.lib.build.exceptions import InvalidBuildGraphException
@@ -23,15 +22,19 @@ from samcli.lib.samlib.resource_metadata_normalizer import (
     SAM_RESOURCE_ID_KEY,
 )
 from samcli.lib.utils.architecture import X86_64
+from samcli.lib.utils.journal_store import JournalStore, Tables
 from samcli.lib.utils.packagetype import ZIP
 
 LOG = logging.getLogger(__name__)
 
-DEFAULT_BUILD_GRAPH_FILE_NAME = "build.toml"
+DEFAULT_BUILD_GRAPH_FILE_NAME = "build.json"
+BUILD_GRAPH_FILE_KIND = "build-graph"
+# file of the build graph written by previous versions, it is migrated on the first read
+LEGACY_BUILD_GRAPH_FILE_NAME = "build.toml"
 
 DEFAULT_DEPENDENCIES_DIR = os.path.join(".aws-sam", "deps")
 
-# filed names for the toml table
+# field names of the build definition records
 PACKAGETYPE_FIELD = "packagetype"
 CODE_URI_FIELD = "codeuri"
 RUNTIME_FIELD = "runtime"
@@ -52,129 +55,127 @@ SHARED_CODEURI_SUFFIX = "Shared"
 COMPILED_RUNTIMES = ["go1.x"]
 
 
-def _function_build_definition_to_toml_table(
-    function_build_definition: "FunctionBuildDefinition",
-) -> tomlkit.api.Table:
+def _function_build_definition_to_record(function_build_definition: "FunctionBuildDefinition") -> Dict[str, Any]:
     """
-    Converts given function_build_definition into toml table representation
+    Converts given function_build_definition into its record in the build graph file
 
     Parameters
     ----------
     function_build_definition: FunctionBuildDefinition
-        FunctionBuildDefinition which will be converted into toml table
+        FunctionBuildDefinition which will be converted into a record
 
     Returns
     -------
-    tomlkit.api.Table
-        toml table of FunctionBuildDefinition
+    Dict[str, Any]
+        record of FunctionBuildDefinition
     """
-    toml_table = tomlkit.table()
+    record: Dict[str, Any] = {}
     if function_build_definition.packagetype == ZIP:
-        toml_table[CODE_URI_FIELD] = function_build_definition.codeuri
-        toml_table[RUNTIME_FIELD] = function_build_definition.runtime
-        toml_table[ARCHITECTURE_FIELD] = function_build_definition.architecture
-        toml_table[HANDLER_FIELD] = function_build_definition.handler
+        record[CODE_URI_FIELD] = function_build_definition.codeuri
+        record[RUNTIME_FIELD] = function_build_definition.runtime
+        record[ARCHITECTURE_FIELD] = function_build_definition.architecture
+        record[HANDLER_FIELD] = function_build_definition.handler
         if function_build_definition.source_hash:
-            toml_table[SOURCE_HASH_FIELD] = function_build_definition.source_hash
-        toml_table[MANIFEST_HASH_FIELD] = function_build_definition.manifest_hash
-    toml_table[PACKAGETYPE_FIELD] = function_build_definition.packagetype
-    toml_table[FUNCTIONS_FIELD] = [f.full_path for f in function_build_definition.functions]
+            record[SOURCE_HASH_FIELD] = function_build_definition.source_hash
+        record[MANIFEST_HASH_FIELD] = function_build_definition.manifest_hash
+    record[PACKAGETYPE_FIELD] = function_build_definition.packagetype
+    record[FUNCTIONS_FIELD] = [f.full_path for f in function_build_definition.functions]
 
     if function_build_definition.metadata:
-        toml_table[METADATA_FIELD] = function_build_definition.metadata
+        record[METADATA_FIELD] = function_build_definition.metadata
     if function_build_definition.env_vars:
-        toml_table[ENV_VARS_FIELD] = function_build_definition.env_vars
+        record[ENV_VARS_FIELD] = function_build_definition.env_vars
 
-    return toml_table
+    return record
 
 
-def _toml_table_to_function_build_definition(uuid: str, toml_table: tomlkit.api.Table) -> "FunctionBuildDefinition":
+def _record_to_function_build_definition(uuid: str, record: Dict[str, Any]) -> "FunctionBuildDefinition":
     """
-    Converts given toml table into FunctionBuildDefinition instance
+    Converts given record of the build graph file into FunctionBuildDefinition instance
 
     Parameters
     ----------
     uuid: str
-        key of the function toml_table instance
-    toml_table: tomlkit.api.Table
-        function build definition as toml table
+        key of the function build definition record
+    record: Dict[str, Any]
+        function build definition as record
 
     Returns
     -------
     FunctionBuildDefinition
-        FunctionBuildDefinition of given toml table
+        FunctionBuildDefinition of given record
     """
     function_build_definition = FunctionBuildDefinition(
-        toml_table.get(RUNTIME_FIELD),
-        toml_table.get(CODE_URI_FIELD),
+        record.get(RUNTIME_FIELD),
+        record.get(CODE_URI_FIELD),
         None,
-        toml_table.get(PACKAGETYPE_FIELD, ZIP),
-        toml_table.get(ARCHITECTURE_FIELD, X86_64),
-        dict(toml_table.get(METADATA_FIELD, {})),
-        toml_table.get(HANDLER_FIELD, ""),
-        toml_table.get(SOURCE_HASH_FIELD, ""),
-        toml_table.get(MANIFEST_HASH_FIELD, ""),
-        dict(toml_table.get(ENV_VARS_FIELD, {})),
+        record.get(PACKAGETYPE_FIELD, ZIP),
+        record.get(ARCHITECTURE_FIELD, X86_64),
+        dict(record.get(METADATA_FIELD, {})),
+        record.get(HANDLER_FIELD, ""),
+        record.get(SOURCE_HASH_FIELD, ""),
+        record.get(MANIFEST_HASH_FIELD, ""),
+        dict(record.get(ENV_VARS_FIELD, {})),
     )
     function_build_definition.uuid = uuid
     return function_build_definition
 
 
-def _layer_build_definition_to_toml_table(layer_build_definition: "LayerBuildDefinition") -> tomlkit.api.Table:
+def _layer_build_definition_to_record(layer_build_definition: "LayerBuildDefinition") -> Dict[str, Any]:
     """
-    Converts given layer_build_definition into toml table representation
+    Converts given layer_build_definition into its record in the build graph file
 
     Parameters
     ----------
     layer_build_definition: LayerBuildDefinition
-        LayerBuildDefinition which will be converted into toml table
+        LayerBuildDefinition which will be converted into a record
 
     Returns
     -------
-    tomlkit.api.Table
-        toml table of LayerBuildDefinition
+    Dict[str, Any]
+        record of LayerBuildDefinition
     """
-    toml_table = tomlkit.table()
-    toml_table[LAYER_NAME_FIELD] = layer_build_definition.full_path
-    toml_table[CODE_URI_FIELD] = layer_build_definition.codeuri
-    toml_table[BUILD_METHOD_FIELD] = layer_build_definition.build_method
-    toml_table[COMPATIBLE_RUNTIMES_FIELD] = layer_build_definition.compatible_runtimes
-    toml_table[ARCHITECTURE_FIELD] = layer_build_definition.architecture
+    record: Dict[str, Any] = {}
+    record[LAYER_NAME_FIELD] = layer_build_definition.full_path
+    record[CODE_URI_FIELD] = layer_build_definition.codeuri
+    record[BUILD_METHOD_FIELD] = layer_build_definition.build_method
+    record[COMPATIBLE_RUNTIMES_FIELD] = layer_build_definition.compatible_runtimes
+    record[ARCHITECTURE_FIELD] = layer_build_definition.architecture
     if layer_build_definition.source_hash:
-        toml_table[SOURCE_HASH_FIELD] = layer_build_definition.source_hash
-    toml_table[MANIFEST_HASH_FIELD] = layer_build_definition.manifest_hash
+        record[SOURCE_HASH_FIELD] = layer_build_definition.source_hash
+    record[MANIFEST_HASH_FIELD] = layer_build_definition.manifest_hash
     if layer_build_definition.env_vars:
-        toml_table[ENV_VARS_FIELD] = layer_build_definition.env_vars
-    toml_table[LAYER_FIELD] = layer_build_definition.layer.full_path
+        record[ENV_VARS_FIELD] = layer_build_definition.env_vars
+    record[LAYER_FIELD] = layer_build_definition.layer.full_path
 
-    return toml_table
+    return record
 
 
-def _toml_table_to_layer_build_definition(uuid: str, toml_table: tomlkit.api.Table) -> "LayerBuildDefinition":
+def _record_to_layer_build_definition(uuid: str, record: Dict[str, Any]) -> "LayerBuildDefinition":
     """
-    Converts given toml table into LayerBuildDefinition instance
+    Converts given record of the build graph file into LayerBuildDefinition instance
 
     Parameters
     ----------
     uuid: str
-        key of the toml_table instance
-    toml_table:  tomlkit.api.Table
-        layer build definition as toml table
+        key of the layer build definition record
+    record: Dict[str, Any]
+        layer build definition as record
 
     Returns
     -------
     LayerBuildDefinition
-        LayerBuildDefinition of given toml table
+        LayerBuildDefinition of given record
     """
     layer_build_definition = LayerBuildDefinition(
-        toml_table.get(LAYER_NAME_FIELD, ""),
-        toml_table.get(CODE_URI_FIELD),
-        toml_table.get(BUILD_METHOD_FIELD),
-        toml_table.get(COMPATIBLE_RUNTIMES_FIELD),
-        toml_table.get(ARCHITECTURE_FIELD, X86_64),
-        toml_table.get(SOURCE_HASH_FIELD, ""),
-        toml_table.get(MANIFEST_HASH_FIELD, ""),
-        dict(toml_table.get(ENV_VARS_FIELD, {})),
+        record.get(LAYER_NAME_FIELD, ""),
+        record.get(CODE_URI_FIELD),
+        record.get(BUILD_METHOD_FIELD),
+        record.get(COMPATIBLE_RUNTIMES_FIELD),
+        record.get(ARCHITECTURE_FIELD, X86_64),
+        record.get(SOURCE_HASH_FIELD, ""),
+        record.get(MANIFEST_HASH_FIELD, ""),
+        dict(record.get(ENV_VARS_FIELD, {})),
     )
     layer_build_definition.uuid = uuid
     return layer_build_definition
@@ -191,19 +192,21 @@ class BuildHashingInformation(NamedTuple):
 
 class BuildGraph:
     """
-    Contains list of build definitions, with ability to read and write them into build.toml file
+    Contains list of build definitions, with ability to read and write them into the build graph file
     """
 
-    # private lock for build.toml reads and writes
-    __toml_lock = threading.Lock()
+    # private lock for build graph file reads and writes
+    __file_lock = threading.Lock()
 
     # global table build definitions key
     FUNCTION_BUILD_DEFINITIONS = "function_build_definitions"
     LAYER_BUILD_DEFINITIONS = "layer_build_definitions"
 
     def __init__(self, build_dir: str) -> None:
-        # put build.toml file inside .aws-sam folder
+        # put build graph file inside .aws-sam folder
         self._filepath = Path(build_dir).parent.joinpath(DEFAULT_BUILD_GRAPH_FILE_NAME)
+        self._legacy_filepath = Path(build_dir).parent.joinpath(LEGACY_BUILD_GRAPH_FILE_NAME)
+        self._store = JournalStore(self._filepath, BUILD_GRAPH_FILE_KIND)
         self._function_build_definitions: List["FunctionBuildDefinition"] = []
         self._layer_build_definitions: List["LayerBuildDefinition"] = []
         self._atomic_read()
@@ -314,7 +317,7 @@ class BuildGraph:
         Removes build definitions which doesn't have any function in it, which means these build definitions
         are no longer used, and they can be deleted
 
-        If persist parameter is given True, build graph is written to .aws-sam/build.toml file
+        If persist parameter is given True, build graph is written to .aws-sam/build.json file
         """
         self._function_build_definitions[:] = [
             fbd for fbd in self._function_build_definitions if len(fbd.functions) > 0
@@ -325,12 +328,12 @@ class BuildGraph:
 
     def update_definition_hash(self) -> None:
         """
-        Updates the build.toml file with the newest source_hash values of the partial build's definitions
+        Updates the build graph file with the newest source_hash values of the partial build's definitions
 
-        This operation is atomic, that no other thread accesses build.toml
+        This operation is atomic, that no other thread accesses build graph file
         during the process of reading and modifying the hash value
         """
-        with BuildGraph.__toml_lock:
+        with BuildGraph.__file_lock:
             stored_function_definitions = copy.deepcopy(self._function_build_definitions)
             stored_layer_definitions = copy.deepcopy(self._layer_build_definitions)
             self._read()
@@ -373,112 +376,118 @@ class BuildGraph:
         self, function_content: Dict[str, BuildHashingInformation], layer_content: Dict[str, BuildHashingInformation]
     ) -> None:
         """
-        Helper to write source_hash values to build.toml file
+        Helper to write source_hash values to build graph file, only the updated definitions are appended to it
         """
-        if not self._filepath.exists():
-            open(self._filepath, "a+").close()  # pylint: disable=consider-using-with
-
-        txt = self._filepath.read_text()
-        # .loads() returns a TOMLDocument,
-        # and it behaves like a standard dictionary according to https://github.com/sdispater/tomlkit.
-        # in tomlkit 0.7.2, the types are broken (tomlkit#128, #130, #134) so here we convert it to Dict.
-        document = cast(Dict[str, Dict[str, Any]], tomlkit.loads(txt))
-
-        for function_uuid, hashing_info in function_content.items():
-            if function_uuid in document.get(BuildGraph.FUNCTION_BUILD_DEFINITIONS, {}):
-                function_build_definition = document[BuildGraph.FUNCTION_BUILD_DEFINITIONS][function_uuid]
-                function_build_definition[SOURCE_HASH_FIELD] = hashing_info.source_hash
-                function_build_definition[MANIFEST_HASH_FIELD] = hashing_info.manifest_hash
-                LOG.info(
-                    "Updated source_hash and manifest_hash field in build.toml for function with UUID %s", function_uuid
-                )
+        document = self._load_document()
+        updated_tables: Tables = {}
+
+        for table_name, content in (
+            (BuildGraph.FUNCTION_BUILD_DEFINITIONS, function_content),
+            (BuildGraph.LAYER_BUILD_DEFINITIONS, layer_content),
+        ):
+            records = document.get(table_name, {})
+            for uuid, hashing_info in content.items():
+                if uuid in records:
+                    build_definition = records[uuid]
+                    build_definition[SOURCE_HASH_FIELD] = hashing_info.source_hash
+                    build_definition[MANIFEST_HASH_FIELD] = hashing_info.manifest_hash
+                    updated_tables.setdefault(table_name, {})[uuid] = build_definition
+                    LOG.info(
+                        "Updated source_hash and manifest_hash field in build graph for definition with UUID %s", uuid
+                    )
+
+        if not self._store.exists():
+            self._save_document(document)
+            return
+        for table_name, records in updated_tables.items():
+            self._store.update(table_name, records)
+
+    def _load_document(self) -> Tables:
+        """
+        Loads the tables of build definitions from the build graph file, or from the build.toml file of previous
+        versions if there is no build graph file yet
+        """
+        document = self._store.load()
+        if document or self._store.exists():
+            return document
 
-        for layer_uuid, hashing_info in layer_content.items():
-            if layer_uuid in document.get(BuildGraph.LAYER_BUILD_DEFINITIONS, {}):
-                layer_build_definition = document[BuildGraph.LAYER_BUILD_DEFINITIONS][layer_uuid]
-                layer_build_definition[SOURCE_HASH_FIELD] = hashing_info.source_hash
-                layer_build_definition[MANIFEST_HASH_FIELD] = hashing_info.manifest_hash
-                LOG.info("Updated source_hash and manifest_hash field in build.toml for layer with UUID %s", layer_uuid)
+        try:
+            txt = self._legacy_filepath.read_text()
+        except OSError:
+            return {}
+        LOG.debug("Migrating build graph from %s", self._legacy_filepath)
+        legacy_document: Tables = tomlkit.loads(txt).unwrap()
+        return legacy_document
 
-        self._filepath.write_text(tomlkit.dumps(cast(TOMLDocument, document)))
+    def _save_document(self, document: Tables) -> None:
+        """
+        Saves the tables of build definitions into the build graph file, and deletes the build.toml file of previous
+        versions once it is migrated
+        """
+        self._store.save(document)
+        try:
+            self._legacy_filepath.unlink()
+        except FileNotFoundError:
+            pass
 
     def _read(self) -> None:
         """
-        Reads build.toml file into array of build definition
+        Reads build graph file into array of build definition
         Each build definition will have empty function list, which will be populated from the current template.yaml file
         """
         LOG.debug("Instantiating build definitions")
         self._function_build_definitions = []
         self._layer_build_definitions = []
-        document = {}
-        try:
-            txt = self._filepath.read_text()
-            # .loads() returns a TOMLDocument,
-            # and it behaves like a standard dictionary according to https://github.com/sdispater/tomlkit.
-            # in tomlkit 0.7.2, the types are broken (tomlkit#128, #130, #134) so here we convert it to Dict.
-            document = cast(Dict, tomlkit.loads(txt))
-        except OSError:
+        document = self._load_document()
+        if not document:
             LOG.debug("No previous build graph found, generating new one")
+
         function_build_definitions_table = document.get(BuildGraph.FUNCTION_BUILD_DEFINITIONS, {})
-        for function_build_definition_key in function_build_definitions_table:
-            function_build_definition = _toml_table_to_function_build_definition(
-                function_build_definition_key, function_build_definitions_table[function_build_definition_key]
-            )
+        for function_build_definition_key, record in function_build_definitions_table.items():
+            function_build_definition = _record_to_function_build_definition(function_build_definition_key, record)
             self._function_build_definitions.append(function_build_definition)
 
         layer_build_definitions_table = document.get(BuildGraph.LAYER_BUILD_DEFINITIONS, {})
-        for layer_build_definition_key in layer_build_definitions_table:
-            layer_build_definition = _toml_table_to_layer_build_definition(
-                layer_build_definition_key, layer_build_definitions_table[layer_build_definition_key]
-            )
+        for layer_build_definition_key, record in layer_build_definitions_table.items():
+            layer_build_definition = _record_to_layer_build_definition(layer_build_definition_key, record)
             self._layer_build_definitions.append(layer_build_definition)
 
     def _atomic_read(self) -> None:
         """
         Performs the _read() method with a global lock acquired
-        It makes sure no other thread accesses build.toml when a read is happening
+        It makes sure no other thread accesses build graph file when a read is happening
         """
 
-        with BuildGraph.__toml_lock:
+        with BuildGraph.__file_lock:
             self._read()
 
     def _write(self) -> None:
         """
-        Writes build definition details into build.toml file, which would be used by the next build.
-        build.toml file will contain the same information as build graph,
+        Writes build definition details into build graph file, which would be used by the next build.
+        build graph file will contain the same information as build graph,
         function details will only be preserved as function names
         layer details will only be preserved as layer names
+        Only the build definitions which changed since the file was read are written
         """
-        # convert build definition list into toml table
-        function_build_definitions_table = tomlkit.table()
-        for function_build_definition in self._function_build_definitions:
-            build_definition_as_table = _function_build_definition_to_toml_table(function_build_definition)
-            function_build_definitions_table.add(function_build_definition.uuid, build_definition_as_table)
-
-        layer_build_definitions_table = tomlkit.table()
-        for layer_build_definition in self._layer_build_definitions:
-            build_definition_as_table = _layer_build_definition_to_toml_table(layer_build_definition)
-            layer_build_definitions_table.add(layer_build_definition.uuid, build_definition_as_table)
-
-        # create toml document and add build definitions
-        document = tomlkit.document()
-        document.add(tomlkit.comment("This file is auto generated by SAM CLI build command"))
-        # we need to cast `Table` to `Item` because of tomlkit#135.
-        document.add(BuildGraph.FUNCTION_BUILD_DEFINITIONS, cast(tomlkit.items.Item, function_build_definitions_table))
-        document.add(BuildGraph.LAYER_BUILD_DEFINITIONS, cast(tomlkit.items.Item, layer_build_definitions_table))
-
-        if not self._filepath.exists():
-            open(self._filepath, "a+").close()  # pylint: disable=consider-using-with
-
-        self._filepath.write_text(tomlkit.dumps(document))
+        document: Tables = {
+            BuildGraph.FUNCTION_BUILD_DEFINITIONS: {
+                function_build_definition.uuid: _function_build_definition_to_record(function_build_definition)
+                for function_build_definition in self._function_build_definitions
+            },
+            BuildGraph.LAYER_BUILD_DEFINITIONS: {
+                layer_build_definition.uuid: _layer_build_definition_to_record(layer_build_definition)
+                for layer_build_definition in self._layer_build_definitions
+            },
+        }
+        self._save_document(document)
 
     def _atomic_write(self) -> None:
         """
         Performs the _write() method with a global lock acquired
-        It makes sure no other thread accesses build.toml when a write is happening
+        It makes sure no other thread accesses build graph file when a write is happening
         """
 
-        with BuildGraph.__toml_lock:
+        with BuildGraph.__file_lock:
             self._write()
 
 
@@ -496,7 +505,7 @@ class AbstractBuildDefinition:
         self.manifest_hash = manifest_hash
         self._env_vars = env_vars if env_vars else {}
         self.architecture = architecture
-        # following properties are used during build time and they don't serialize into build.toml file
+        # following properties are used during build time and they don't serialize into build graph file
         self.download_dependencies: bool = True
 
     @property
@@ -0,0 +1,248 @@
+"""
+Runs the in-process builds of aws-lambda-builders in a pool of worker processes. Bundling, zipping, copying and
+hashing are partly CPU-bound, so parallel builds scale with the cores instead of contending for the GIL of one process.
+"""
+
+import logging
+import multiprocessing
+import os
+import signal
+import threading
+from concurrent.futures import Future, ProcessPoolExecutor
+from logging.handlers import QueueHandler, QueueListener
+from typing import Any, Dict, List, NamedTuple, Optional, Set
+
+from aws_lambda_builders.builder import LambdaBuilder
+from aws_lambda_builders.exceptions import LambdaBuilderError
+
+from samcli.lib.build.exceptions import BuildError
+
+LOG = logging.getLogger(__name__)
+
+# number of worker processes building in parallel, defaults to the number of cores. Builds run in threads when it is 1
+BUILD_PROCESSES_ENV_VAR = "SAM_CLI_BUILD_PROCESSES"
+
+# the loggers of the worker processes are configured with the level of these loggers
+FORWARDED_LOGGER_NAMES = ["samcli", "aws_lambda_builders"]
+
+
+class InProcessBuildDefinition(NamedTuple):
+    """
+    Arguments of a build with aws-lambda-builders, sent to a worker process
+    """
+
+    language: str
+    dependency_manager: Optional[str]
+    application_framework: Optional[str]
+    source_dir: str
+    artifacts_dir: str
+    scratch_dir: str
+    manifest_path: str
+    runtime: str
+    unpatched_runtime: str
+    executable_search_paths: Optional[List[str]]
+    mode: Optional[str]
+    options: Optional[Dict]
+    architecture: str
+    dependencies_dir: Optional[str]
+    download_dependencies: bool
+    combine_dependencies: bool
+    is_building_layer: bool
+    experimental_flags: List[str]
+    build_in_source: Optional[bool]
+
+
+class InProcessBuildResult(NamedTuple):
+    """
+    Result of a build in a worker process, errors of aws-lambda-builders are returned rather than raised since they
+    can't be pickled. The other exceptions are raised, and sent back to the calling process by the executor
+    """
+
+    artifacts_dir: str
+    error_type: Optional[str] = None
+    error_message: Optional[str] = None
+
+
+def run_in_process_build(definition: InProcessBuildDefinition) -> InProcessBuildResult:
+    """
+    Builds the given definition with aws-lambda-builders, in the calling process
+    """
+    try:
+        builder = LambdaBuilder(
+            language=definition.language,
+            dependency_manager=definition.dependency_manager,
+            application_framework=definition.application_framework,
+        )
+        builder.build(
+            definition.source_dir,
+            definition.artifacts_dir,
+            definition.scratch_dir,
+            definition.manifest_path,
+            runtime=definition.runtime,
+            unpatched_runtime=definition.unpatched_runtime,
+            executable_search_paths=definition.executable_search_paths,
+            mode=definition.mode,
+            options=definition.options,
+            architecture=definition.architecture,
+            dependencies_dir=definition.dependencies_dir,
+            download_dependencies=definition.download_dependencies,
+            combine_dependencies=definition.combine_dependencies,
+            is_building_layer=definition.is_building_layer,
+            experimental_flags=definition.experimental_flags,
+            build_in_source=definition.build_in_source,
+        )
+    except LambdaBuilderError as ex:
+        return InProcessBuildResult(definition.artifacts_dir, ex.__class__.__name__, str(ex))
+    return InProcessBuildResult(definition.artifacts_dir)
+
+
+def get_build_process_count() -> int:
+    """
+    Returns the max number of worker processes to build with
+    """
+    default_count = os.cpu_count() or 1
+    value = os.environ.get(BUILD_PROCESSES_ENV_VAR)
+    if not value:
+        return default_count
+    try:
+        return max(int(value), 1)
+    except ValueError:
+        LOG.warning("Ignoring %s=%s, which is not a number of processes", BUILD_PROCESSES_ENV_VAR, value)
+        return default_count
+
+
+class BuildProcessPool:
+    """
+    Pool of worker processes building definitions with aws-lambda-builders. Workers are spawned on the first build, and
+    the records they log are handled by the loggers of this process, so that their output is merged with the one of
+    the other builds.
+    """
+
+    def __init__(self, max_workers: int) -> None:
+        """
+        Parameters
+        ----------
+        max_workers: int
+            Max number of worker processes
+        """
+        self._max_workers = max_workers
+        self._lock = threading.Lock()
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self._log_listener: Optional[QueueListener] = None
+        self._futures: Set[Future] = set()
+        self._is_shut_down = False
+
+    def build(self, definition: InProcessBuildDefinition) -> str:
+        """
+        Builds the definition in a worker process, and waits for the build to complete
+
+        Returns
+        -------
+        str
+            Path of the directory of the built artifacts
+
+        Raises
+        ------
+        BuildError
+            if the build failed
+        """
+        future = self._submit(definition)
+        try:
+            result: InProcessBuildResult = future.result()
+        finally:
+            with self._lock:
+                self._futures.discard(future)
+
+        if result.error_type:
+            raise BuildError(wrapped_from=result.error_type, msg=str(result.error_message))
+        return result.artifacts_dir
+
+    def shutdown(self, cancel: bool = False) -> None:
+        """
+        Stops the worker processes once their builds complete, or right away when the builds are cancelled
+
+        Parameters
+        ----------
+        cancel: bool
+            Cancel the pending builds, and terminate the workers running the other ones
+        """
+        with self._lock:
+            self._is_shut_down = True
+            executor, self._executor = self._executor, None
+            futures = list(self._futures)
+        if not executor:
+            return
+
+        if cancel:
+            # the executor has no public way to stop the builds which are running, like pip or npm installs
+            processes = list((executor._processes or {}).values())  # pylint: disable=protected-access
+            for future in futures:
+                future.cancel()
+            executor.shutdown(wait=False)
+            for process in processes:
+                process.terminate()
+        else:
+            executor.shutdown(wait=True)
+
+        if self._log_listener:
+            if cancel:
+                # a terminated worker may have left a partial record in the queue, the listener is not awaited
+                self._log_listener.enqueue_sentinel()
+            else:
+                self._log_listener.stop()
+            self._log_listener = None
+
+    def __enter__(self) -> "BuildProcessPool":
+        return self
+
+    def __exit__(self, exc_type: Any, *args: Any) -> None:
+        # on Ctrl+C or a failure, the other builds are not awaited
+        self.shutdown(cancel=exc_type is not None)
+
+    def _submit(self, definition: InProcessBuildDefinition) -> Future:
+        with self._lock:
+            if self._is_shut_down:
+                raise RuntimeError("The build process pool was shut down")
+            if not self._executor:
+                self._executor = self._start_executor()
+            future = self._executor.submit(run_in_process_build, definition)
+            self._futures.add(future)
+            return future
+
+    def _start_executor(self) -> ProcessPoolExecutor:
+        # workers are spawned rather than forked, since the build threads of this process may hold locks
+        context = multiprocessing.get_context("spawn")
+        log_queue = context.Queue()
+        self._log_listener = QueueListener(log_queue, _LogForwarder())
+        self._log_listener.start()
+        log_level = min(logging.getLogger(name).getEffectiveLevel() for name in FORWARDED_LOGGER_NAMES)
+
+        LOG.debug("Starting up to %s build worker processes", self._max_workers)
+        return ProcessPoolExecutor(
+            max_workers=self._max_workers,
+            mp_context=context,
+            initializer=_init_worker,
+            initargs=(log_queue, log_level),
+        )
+
+
+class _LogForwarder(logging.Handler):
+    """
+    Handles the records logged by the worker processes with the loggers of this process
+    """
+
+    def emit(self, record: logging.LogRecord) -> None:
+        logger = logging.getLogger(record.name)
+        if logger.isEnabledFor(record.levelno):
+            logger.handle(record)
+
+
+def _init_worker(log_queue: Any, log_level: int) -> None:
+    # Ctrl+C is also sent to the workers by the terminal, the parent process cancels the builds instead
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+
+    root_logger = logging.getLogger()
+    for handler in list(root_logger.handlers):
+        root_logger.removeHandler(handler)
+    root_logger.addHandler(QueueHandler(log_queue))
+    root_logger.setLevel(log_level)
@@ -20,13 +20,15 @@ from samcli.lib.build.build_graph import (
     LayerBuildDefinition,
 )
 from samcli.lib.build.dependency_hash_generator import DependencyHashGenerator
+from samcli.lib.build.dependency_store import DependencyStore
 from samcli.lib.build.exceptions import MissingBuildMethodException
 from samcli.lib.build.utils import warn_on_invalid_architecture
-from samcli.lib.utils import osutils
+from samcli.lib.telemetry.tracing import span
 from samcli.lib.utils.architecture import X86_64
 from samcli.lib.utils.async_utils import AsyncContext
 from samcli.lib.utils.hash import dir_checksum
 from samcli.lib.utils.packagetype import IMAGE, ZIP
+from samcli.lib.utils.tree_materializer import is_tree_snapshot_valid, materialize_tree, write_tree_snapshot
 
 LOG = logging.getLogger(__name__)
 
@@ -78,7 +80,7 @@ class BuildStrategy(ABC):
         Builds all functions and layers in the given build graph
         """
         result = {}
-        with self:
+        with span(f"{type(self).__name__}.build"), self:
             result.update(self._build_layers(self._build_graph))
             result.update(self._build_functions(self._build_graph))
 
@@ -164,20 +166,26 @@ class DefaultBuildStrategy(BuildStrategy):
         container_env_vars = deepcopy(build_definition.env_vars)
 
         # when a function is passed here, it is ZIP function, codeuri and runtime are not None
-        result = self._build_function(
-            build_definition.get_function_name(),
-            build_definition.codeuri,  # type: ignore
-            build_definition.imageuri,
-            build_definition.packagetype,
-            build_definition.runtime,  # type: ignore
-            build_definition.architecture,
-            build_definition.get_handler_name(),
-            single_build_dir,
-            build_definition.metadata,
-            container_env_vars,
-            build_definition.dependencies_dir if self._cached else None,
-            build_definition.download_dependencies,
-        )
+        with span(
+            "DefaultBuildStrategy.build_function",
+            function=single_full_path,
+            runtime=build_definition.runtime,
+            architecture=build_definition.architecture,
+        ):
+            result = self._build_function(
+                build_definition.get_function_name(),
+                build_definition.codeuri,  # type: ignore
+                build_definition.imageuri,
+                build_definition.packagetype,
+                build_definition.runtime,  # type: ignore
+                build_definition.architecture,
+                build_definition.get_handler_name(),
+                single_build_dir,
+                build_definition.metadata,
+                container_env_vars,
+                build_definition.dependencies_dir if self._cached else None,
+                build_definition.download_dependencies,
+            )
         function_build_results[single_full_path] = result
 
         # copy results to other functions
@@ -195,8 +203,8 @@ class DefaultBuildStrategy(BuildStrategy):
                         # for zip function we need to copy over the artifacts
                         # artifacts directory will be created by the builder
                         artifacts_dir = function.get_build_dir(self._build_dir)
-                        LOG.debug("Copying artifacts from %s to %s", single_build_dir, artifacts_dir)
-                        osutils.copytree(single_build_dir, artifacts_dir)
+                        LOG.debug("Materializing artifacts from %s to %s", single_build_dir, artifacts_dir)
+                        materialize_tree(single_build_dir, artifacts_dir)
                         function_build_results[function.full_path] = artifacts_dir
         elif build_definition.packagetype == IMAGE:
             for function in build_definition.functions:
@@ -237,20 +245,21 @@ class DefaultBuildStrategy(BuildStrategy):
         single_build_dir = layer.get_build_dir(self._build_dir)
         # when a layer is passed here, it is ZIP function, codeuri and runtime are not None
         # codeuri and compatible_runtimes are not None
-        return {
-            layer.full_path: self._build_layer(
-                layer.name,
-                layer.codeuri,  # type: ignore
-                layer.build_method,
-                layer.compatible_runtimes,  # type: ignore
-                layer.build_architecture,
-                single_build_dir,
-                layer_definition.env_vars,
-                layer_definition.dependencies_dir if self._cached else None,
-                layer_definition.download_dependencies,
-                layer.metadata,
-            )
-        }
+        with span("DefaultBuildStrategy.build_layer", layer=layer.full_path, build_method=layer.build_method):
+            return {
+                layer.full_path: self._build_layer(
+                    layer.name,
+                    layer.codeuri,  # type: ignore
+                    layer.build_method,
+                    layer.compatible_runtimes,  # type: ignore
+                    layer.build_architecture,
+                    single_build_dir,
+                    layer_definition.env_vars,
+                    layer_definition.dependencies_dir if self._cached else None,
+                    layer_definition.download_dependencies,
+                    layer.metadata,
+                )
+            }
 
 
 class CachedBuildStrategy(BuildStrategy):
@@ -294,7 +303,7 @@ class CachedBuildStrategy(BuildStrategy):
         cache_function_dir = pathlib.Path(self._cache_dir, build_definition.uuid)
         function_build_results = {}
 
-        if not cache_function_dir.exists() or build_definition.source_hash != source_hash:
+        if not self._is_cache_valid(cache_function_dir, build_definition.source_hash, source_hash):
             LOG.info(
                 "Cache is invalid, running build and copying resources for following functions (%s)",
                 build_definition.get_resource_full_paths(),
@@ -302,13 +311,10 @@ class CachedBuildStrategy(BuildStrategy):
             build_result = self._delegate_build_strategy.build_single_function_definition(build_definition)
             function_build_results.update(build_result)
 
-            if cache_function_dir.exists():
-                shutil.rmtree(str(cache_function_dir))
-
             build_definition.source_hash = source_hash
             # Since all the build contents are same for a build definition, just copy any one of them into the cache
             for _, value in build_result.items():
-                osutils.copytree(value, str(cache_function_dir))
+                self._update_cache(value, cache_function_dir)
                 break
         else:
             LOG.info(
@@ -316,28 +322,19 @@ class CachedBuildStrategy(BuildStrategy):
                 build_definition.get_resource_full_paths(),
             )
             if is_experimental_enabled(ExperimentalFlag.BuildPerformance):
-                first_function_artifacts_dir: Optional[str] = None
+                # artifacts directory will be created by the builder
+                artifacts_dir = build_definition.get_build_dir(self._build_dir)
+                LOG.debug("Materializing artifacts from %s to %s", cache_function_dir, artifacts_dir)
+                materialize_tree(str(cache_function_dir), artifacts_dir)
                 for function in build_definition.functions:
-                    if not first_function_artifacts_dir:
-                        # artifacts directory will be created by the builder
-                        artifacts_dir = build_definition.get_build_dir(self._build_dir)
-                        LOG.debug("Linking artifacts from %s to %s", cache_function_dir, artifacts_dir)
-                        osutils.create_symlink_or_copy(str(cache_function_dir), artifacts_dir)
-                        function_build_results[function.full_path] = artifacts_dir
-                        first_function_artifacts_dir = artifacts_dir
-                    else:
-                        LOG.debug(
-                            "Function (%s) build folder is updated to %s",
-                            function.full_path,
-                            first_function_artifacts_dir,
-                        )
-                        function_build_results[function.full_path] = first_function_artifacts_dir
+                    LOG.debug("Function (%s) build folder is updated to %s", function.full_path, artifacts_dir)
+                    function_build_results[function.full_path] = artifacts_dir
             else:
                 for function in build_definition.functions:
                     # artifacts directory will be created by the builder
                     artifacts_dir = function.get_build_dir(self._build_dir)
-                    LOG.debug("Copying artifacts from %s to %s", cache_function_dir, artifacts_dir)
-                    osutils.copytree(str(cache_function_dir), artifacts_dir)
+                    LOG.debug("Materializing artifacts from %s to %s", cache_function_dir, artifacts_dir)
+                    materialize_tree(str(cache_function_dir), artifacts_dir)
                     function_build_results[function.full_path] = artifacts_dir
 
         return function_build_results
@@ -352,7 +349,7 @@ class CachedBuildStrategy(BuildStrategy):
         cache_function_dir = pathlib.Path(self._cache_dir, layer_definition.uuid)
         layer_build_result = {}
 
-        if not cache_function_dir.exists() or layer_definition.source_hash != source_hash:
+        if not self._is_cache_valid(cache_function_dir, layer_definition.source_hash, source_hash):
             LOG.info(
                 "Cache is invalid, running build and copying resources for following layers (%s)",
                 layer_definition.get_resource_full_paths(),
@@ -360,13 +357,10 @@ class CachedBuildStrategy(BuildStrategy):
             build_result = self._delegate_build_strategy.build_single_layer_definition(layer_definition)
             layer_build_result.update(build_result)
 
-            if cache_function_dir.exists():
-                shutil.rmtree(str(cache_function_dir))
-
             layer_definition.source_hash = source_hash
             # Since all the build contents are same for a build definition, just copy any one of them into the cache
             for _, value in build_result.items():
-                osutils.copytree(value, str(cache_function_dir))
+                self._update_cache(value, cache_function_dir)
                 break
         else:
             LOG.info(
@@ -375,17 +369,28 @@ class CachedBuildStrategy(BuildStrategy):
             )
             # artifacts directory will be created by the builder
             artifacts_dir = layer_definition.layer.get_build_dir(self._build_dir)
-
-            if is_experimental_enabled(ExperimentalFlag.BuildPerformance):
-                LOG.debug("Linking artifacts folder from %s to %s", cache_function_dir, artifacts_dir)
-                osutils.create_symlink_or_copy(str(cache_function_dir), artifacts_dir)
-            else:
-                LOG.debug("Copying artifacts from %s to %s", cache_function_dir, artifacts_dir)
-                osutils.copytree(str(cache_function_dir), artifacts_dir)
+            LOG.debug("Materializing artifacts from %s to %s", cache_function_dir, artifacts_dir)
+            materialize_tree(str(cache_function_dir), artifacts_dir)
             layer_build_result[layer_definition.layer.full_path] = artifacts_dir
 
         return layer_build_result
 
+    @staticmethod
+    def _is_cache_valid(cache_dir: pathlib.Path, cached_source_hash: str, source_hash: str) -> bool:
+        """
+        Returns whether the cache of a build definition can be used, cached artifacts are hard linked into the build
+        folder, so they are not valid anymore if a file was modified in place after the previous build
+        """
+        return cache_dir.exists() and cached_source_hash == source_hash and is_tree_snapshot_valid(str(cache_dir))
+
+    @staticmethod
+    def _update_cache(artifacts_dir: str, cache_dir: pathlib.Path) -> None:
+        """
+        Replaces the cached artifacts of a build definition with the given ones
+        """
+        materialize_tree(artifacts_dir, str(cache_dir))
+        write_tree_snapshot(str(cache_dir))
+
     def _clean_redundant_cached(self) -> None:
         """
         clean the redundant cached folder
@@ -456,6 +461,10 @@ class IncrementalBuildStrategy(BuildStrategy):
     This build strategy sets whether we need to download dependencies again (download_dependencies option) by comparing
     the hash of the manifest file of the given runtime as well as the dependencies directory location
     (dependencies_dir option).
+
+    If a dependency store is given, dependencies which need to be downloaded are linked from the store instead when
+    the same manifest was built before for the same runtime and architecture, and newly downloaded dependencies are
+    added to the store.
     """
 
     def __init__(
@@ -464,11 +473,13 @@ class IncrementalBuildStrategy(BuildStrategy):
         delegate_build_strategy: BuildStrategy,
         base_dir: str,
         manifest_path_override: Optional[str],
+        dependency_store: Optional[DependencyStore] = None,
     ):
         super().__init__(build_graph)
         self._delegate_build_strategy = delegate_build_strategy
         self._base_dir = base_dir
         self._manifest_path_override = manifest_path_override
+        self._dependency_store = dependency_store
 
     def build(self) -> Dict[str, str]:
         result = {}
@@ -478,13 +489,17 @@ class IncrementalBuildStrategy(BuildStrategy):
 
     def build_single_function_definition(self, build_definition: FunctionBuildDefinition) -> Dict[str, str]:
         self._check_whether_manifest_is_changed(build_definition, build_definition.codeuri, build_definition.runtime)
-        return self._delegate_build_strategy.build_single_function_definition(build_definition)
+        result = self._delegate_build_strategy.build_single_function_definition(build_definition)
+        self._store_dependencies(build_definition, build_definition.runtime)
+        return result
 
     def build_single_layer_definition(self, layer_definition: LayerBuildDefinition) -> Dict[str, str]:
         self._check_whether_manifest_is_changed(
             layer_definition, layer_definition.codeuri, layer_definition.build_method
         )
-        return self._delegate_build_strategy.build_single_layer_definition(layer_definition)
+        result = self._delegate_build_strategy.build_single_layer_definition(layer_definition)
+        self._store_dependencies(layer_definition, layer_definition.build_method)
+        return result
 
     def _check_whether_manifest_is_changed(
         self,
@@ -520,7 +535,38 @@ class IncrementalBuildStrategy(BuildStrategy):
                     build_definition.get_resource_full_paths(),
                 )
 
-        build_definition.download_dependencies = is_manifest_changed or is_dependencies_dir_missing
+        download_dependencies = is_manifest_changed or is_dependencies_dir_missing
+        if download_dependencies and manifest_hash and self._dependency_store:
+            dependency_store_key = self._get_dependency_store_key(build_definition, cast(str, runtime))
+            if self._dependency_store.materialize(dependency_store_key, build_definition.dependencies_dir):
+                LOG.info(
+                    "Reusing previously downloaded dependencies for (%s), running incremental build",
+                    build_definition.get_resource_full_paths(),
+                )
+                download_dependencies = False
+
+        build_definition.download_dependencies = download_dependencies
+
+    def _store_dependencies(self, build_definition: AbstractBuildDefinition, runtime: Optional[str]) -> None:
+        """
+        Adds the dependencies which are downloaded by the build of the given definition to the dependency store
+        """
+        if not (
+            self._dependency_store
+            and build_definition.download_dependencies
+            and build_definition.manifest_hash
+            and os.path.isdir(build_definition.dependencies_dir)
+        ):
+            return
+        self._dependency_store.put(
+            self._get_dependency_store_key(build_definition, cast(str, runtime)), build_definition.dependencies_dir
+        )
+
+    @staticmethod
+    def _get_dependency_store_key(build_definition: AbstractBuildDefinition, runtime: str) -> str:
+        return DependencyStore.get_key(
+            build_definition.manifest_hash, runtime, build_definition.architecture, build_definition.env_vars
+        )
 
     def _clean_redundant_dependencies(self) -> None:
         """
@@ -560,6 +606,7 @@ class CachedOrIncrementalBuildStrategyWrapper(BuildStrategy):
             delegate_build_strategy,
             base_dir,
             manifest_path_override,
+            DependencyStore(),
         )
         self._cached_build_strategy = CachedBuildStrategy(
             build_graph,
@@ -0,0 +1,173 @@
+"""
+Store of downloaded dependencies, which is shared by all the projects of the user
+"""
+
+import json
+import logging
+import os
+import shutil
+import threading
+import time
+import uuid
+from pathlib import Path
+from typing import Dict, Optional
+
+from samcli.cli.global_config import GlobalConfig
+from samcli.lib.utils.hash import str_checksum
+
+LOG = logging.getLogger(__name__)
+
+# Max number of dependency directories to keep in the store, least recently used ones are deleted above that
+DEFAULT_MAX_STORE_ENTRIES = 32
+
+# prefix of the directories which are being populated or deleted, they are never used as store entries
+_TEMP_DIR_PREFIX = ".tmp-"
+
+
+def get_dependency_store_dir() -> Path:
+    """
+    Returns the root directory of the dependency store
+    """
+    return GlobalConfig().config_dir / "cache" / "dependencies"
+
+
+class DependencyStore:
+    """
+    Keeps the downloaded dependencies of functions and layers, keyed by the hash of their manifest, their runtime,
+    their architecture and their build environment variables. So identical manifests share the same dependencies
+    across functions, projects and branches, and they are downloaded only once.
+
+    Store entries are never modified once they are added. They are hard linked (or copied if they can't be linked)
+    into the dependencies directory of a build, which is only read by the builders. Entries are added by renaming
+    a fully populated directory, so concurrent builds, including the ones in other processes, never see partial
+    entries. This class is thread-safe.
+    """
+
+    def __init__(self, store_dir: Optional[Path] = None, max_entries: int = DEFAULT_MAX_STORE_ENTRIES) -> None:
+        """
+        Parameters
+        ----------
+        store_dir: Optional[Path]
+            Root directory of the store, defaults to the one in the SAM CLI config directory
+        max_entries: int
+            Max number of entries to keep in the store
+        """
+        self._store_dir = store_dir or get_dependency_store_dir()
+        self._max_entries = max_entries
+        self._lock = threading.Lock()
+        self._lock_per_key: Dict[str, threading.Lock] = {}
+
+    @staticmethod
+    def get_key(manifest_hash: str, runtime: str, architecture: str, env_vars: Optional[Dict] = None) -> str:
+        """
+        Returns the store key of the dependencies of the given manifest for the given runtime and architecture
+        """
+        return str_checksum(json.dumps([manifest_hash, runtime, architecture, env_vars or {}], sort_keys=True))
+
+    def materialize(self, key: str, dependencies_dir: str) -> bool:
+        """
+        Replaces the given dependencies directory with the stored dependencies of the given key
+
+        Parameters
+        ----------
+        key: str
+            Store key of the dependencies, returned by ``get_key``
+        dependencies_dir: str
+            Dependencies directory of the build
+
+        Returns
+        -------
+        bool
+            True if the dependencies were in the store and they are linked into the dependencies directory
+        """
+        entry_dir = self._store_dir / key
+        if not entry_dir.is_dir():
+            return False
+
+        temp_dir = f"{dependencies_dir.rstrip(os.sep)}{_TEMP_DIR_PREFIX}{uuid.uuid4().hex}"
+        try:
+            shutil.copytree(entry_dir, temp_dir, symlinks=True, copy_function=_link_or_copy)
+            shutil.rmtree(dependencies_dir, ignore_errors=True)
+            os.replace(temp_dir, dependencies_dir)
+        except OSError as ex:
+            # the entry might be evicted by another build while being linked
+            LOG.debug("Failed to link stored dependencies %s into %s", key, dependencies_dir, exc_info=ex)
+            shutil.rmtree(temp_dir, ignore_errors=True)
+            return False
+
+        _touch(entry_dir)
+        LOG.debug("Linked stored dependencies %s into %s", key, dependencies_dir)
+        return True
+
+    def put(self, key: str, dependencies_dir: str) -> None:
+        """
+        Adds the content of the given dependencies directory to the store, if the store doesn't have it already,
+        and deletes the least recently used entries above the max number of entries
+
+        Parameters
+        ----------
+        key: str
+            Store key of the dependencies, returned by ``get_key``
+        dependencies_dir: str
+            Dependencies directory of the build, which contains the downloaded dependencies
+        """
+        with self._lock:
+            key_lock = self._lock_per_key.setdefault(key, threading.Lock())
+
+        with key_lock:
+            entry_dir = self._store_dir / key
+            if entry_dir.is_dir():
+                return
+
+            temp_dir = self._store_dir / f"{_TEMP_DIR_PREFIX}{uuid.uuid4().hex}"
+            try:
+                self._store_dir.mkdir(parents=True, exist_ok=True)
+                shutil.copytree(dependencies_dir, temp_dir, symlinks=True, copy_function=_link_or_copy)
+                os.rename(temp_dir, entry_dir)
+            except OSError as ex:
+                # another process might have added the same entry in the meantime
+                LOG.debug("Failed to store dependencies %s from %s", key, dependencies_dir, exc_info=ex)
+                shutil.rmtree(temp_dir, ignore_errors=True)
+                return
+
+            LOG.debug("Stored dependencies %s from %s", key, dependencies_dir)
+
+        self._evict_least_recently_used()
+
+    def _evict_least_recently_used(self) -> None:
+        try:
+            entries = [
+                entry
+                for entry in self._store_dir.iterdir()
+                if entry.is_dir() and not entry.name.startswith(_TEMP_DIR_PREFIX)
+            ]
+            entries.sort(key=lambda entry: entry.stat().st_mtime)
+        except OSError as ex:
+            LOG.debug("Failed to list the dependency store %s", self._store_dir, exc_info=ex)
+            return
+
+        for entry in entries[: max(len(entries) - self._max_entries, 0)]:
+            # rename first, so the entry disappears at once for the other builds
+            trash_dir = self._store_dir / f"{_TEMP_DIR_PREFIX}{uuid.uuid4().hex}"
+            try:
+                os.rename(entry, trash_dir)
+            except OSError:
+                continue
+            LOG.debug("Evicting stored dependencies %s", entry.name)
+            shutil.rmtree(trash_dir, ignore_errors=True)
+
+
+def _link_or_copy(src: str, dst: str) -> None:
+    try:
+        os.link(src, dst)
+    except OSError:
+        # hard links are not supported by the file system, or across file systems
+        shutil.copy2(src, dst)
+
+
+def _touch(path: Path) -> None:
+    try:
+        now = time.time()
+        os.utime(path, (now, now))
+    except OSError:
+        pass
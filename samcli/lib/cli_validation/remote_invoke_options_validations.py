@@ -15,7 +15,8 @@ LOG = logging.getLogger(__name__)
 
 def event_and_event_file_options_validation(func):
     """
-    This function validates the cases when both --event and --event-file are provided and
+    This function validates the cases when more than one of --event, --event-file, --test-event-name and
+    --batch-event-file are provided and
     logs if "-" is provided for --event-file and event is read from stdin.
 
     Parameters
@@ -35,16 +36,18 @@ def event_and_event_file_options_validation(func):
         event = ctx.params.get("event")
         event_file = ctx.params.get("event_file")
         test_event_name = ctx.params.get("test_event_name")
+        batch_event_file = ctx.params.get("batch_event_file")
 
         def more_than_one():
-            return (event and event_file) or (event and test_event_name) or (event_file and test_event_name)
+            return len([option for option in (event, event_file, test_event_name, batch_event_file) if option]) > 1
 
         validator = Validator(
             validation_function=more_than_one,
             exception=click.BadOptionUsage(
                 option_name="--event-file",
                 ctx=ctx,
-                message="Only one of '--event-file', '--event' and '--test-event-name' can be provided. "
+                message="Only one of '--event-file', '--event', '--test-event-name' and '--batch-event-file' "
+                "can be provided. "
                 "Please check that you don't have more than one specified in the command or in a configuration file",
             ),
         )
@@ -53,6 +56,8 @@ def event_and_event_file_options_validation(func):
         # If "-" is provided for --event-file, click uses it as a special file to refer to stdin.
         if event_file and event_file.fileno() == sys.stdin.fileno():
             LOG.info("Reading event from stdin (you can also pass it from file with --event-file)")
+        if batch_event_file and batch_event_file.fileno() == sys.stdin.fileno():
+            LOG.info("Reading events from stdin (you can also pass them from file with --batch-event-file)")
         return func(*args, **kwargs)
 
     return wrapped
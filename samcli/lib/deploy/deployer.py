@@ -37,6 +37,7 @@ from samcli.commands.deploy.exceptions import (
 from samcli.lib.deploy.utils import DeployColor, FailureMode
 from samcli.lib.package.local_files_utils import get_uploaded_s3_object_name, mktempfile
 from samcli.lib.package.s3_uploader import S3Uploader
+from samcli.lib.telemetry.tracing import traced
 from samcli.lib.utils.colors import Colored, Colors
 from samcli.lib.utils.s3 import parse_s3_url
 from samcli.lib.utils.time import to_datetime, utc_to_timestamp
@@ -140,6 +141,7 @@ class Deployer:
             LOG.debug("Unable to get stack details.", exc_info=e)
             raise e
 
+    @traced("Deployer.create_changeset")
     def create_changeset(
         self, stack_name, cfn_template, parameter_values, capabilities, role_arn, notification_arns, s3_uploader, tags
     ):
@@ -296,6 +298,7 @@ class Deployer:
 
         return changes
 
+    @traced("Deployer.wait_for_changeset")
     def wait_for_changeset(self, changeset_id, stack_name):
         """
         Waits until the changeset creation completes
@@ -332,6 +335,7 @@ class Deployer:
 
             raise ChangeSetError(stack_name=stack_name, msg=f"ex: {ex} Status: {status}. Reason: {reason}") from ex
 
+    @traced("Deployer.execute_changeset")
     def execute_changeset(self, changeset_id, stack_name, disable_rollback):
         """
         Calls CloudFormation to execute changeset
@@ -484,6 +488,7 @@ class Deployer:
     def _check_stack_not_in_progress(status: str) -> bool:
         return "IN_PROGRESS" not in status
 
+    @traced("Deployer.wait_for_execute")
     def wait_for_execute(
         self,
         stack_name: str,
@@ -596,6 +601,7 @@ class Deployer:
             LOG.debug("Unable to update stack", exc_info=ex)
             raise DeployFailedError(stack_name=stack_name, msg=str(ex)) from ex
 
+    @traced("Deployer.sync")
     def sync(
         self,
         stack_name: str,
@@ -4,6 +4,7 @@ Process and simplifies CloudFormation intrinsic properties such as FN::* and Ref
 
 import base64
 import copy
+import json
 import logging
 import re
 from collections import OrderedDict
@@ -80,6 +81,8 @@ class IntrinsicResolver:
         self._parameters = None
         self._conditions = None
         self._outputs = None
+        # results of the intrinsic functions resolved so far, keyed by the function and its serialized value
+        self._resolved_functions = {}
         self.init_template(template)
 
         self._symbol_resolver = symbol_resolver
@@ -87,6 +90,13 @@ class IntrinsicResolver:
         self.intrinsic_key_function_map = self.default_intrinsic_function_map()
         self.conditional_key_function_map = self.default_conditional_key_map()
 
+    @property
+    def resources(self):
+        """
+        Resources of the template as they were given, without resolving them
+        """
+        return self._resources
+
     def init_template(self, template):
         self._template = copy.deepcopy(template or {})
         self._resources = self._template.get("Resources", {})
@@ -94,6 +104,7 @@ class IntrinsicResolver:
         self._parameters = self._template.get("Parameters", {})
         self._conditions = self._template.get("Conditions", {})
         self._outputs = self._template.get("Outputs", {})
+        self._resolved_functions = {}
 
     def default_intrinsic_function_map(self):
         """
@@ -149,6 +160,7 @@ class IntrinsicResolver:
 
         """
         self.intrinsic_key_function_map = function_map
+        self._resolved_functions = {}
 
     def set_conditional_function_map(self, function_map):
         """
@@ -162,6 +174,7 @@ class IntrinsicResolver:
 
         """
         self.conditional_key_function_map = function_map
+        self._resolved_functions = {}
 
     def intrinsic_property_resolver(self, intrinsic, ignore_errors, parent_function="template"):
         """
@@ -177,7 +190,9 @@ class IntrinsicResolver:
         resolve_all_attributes which will recreate the resources by processing every aspect of resource.
 
         This code resolves in a top down depth first fashion in order to create a functional style recursion that
-        doesn't mutate any of the properties.
+        doesn't mutate any of the properties. Dictionaries and lists which don't contain any intrinsic function are
+        returned as they are, instead of being copied, and the results of identical intrinsic functions are only
+        resolved once.
 
         Parameters
         ----------
@@ -194,7 +209,10 @@ class IntrinsicResolver:
         if intrinsic is None:
             raise InvalidIntrinsicException("Missing Intrinsic property in {}".format(parent_function))
         if isinstance(intrinsic, list):
-            return [self.intrinsic_property_resolver(item, ignore_errors) for item in intrinsic]
+            sanitized_list = [self.intrinsic_property_resolver(item, ignore_errors) for item in intrinsic]
+            if all(sanitized is item for sanitized, item in zip(sanitized_list, intrinsic)):
+                return intrinsic
+            return sanitized_list
         if not isinstance(intrinsic, dict) or intrinsic == {}:
             return intrinsic
 
@@ -205,15 +223,20 @@ class IntrinsicResolver:
 
         if key in self.intrinsic_key_function_map:
             intrinsic_value = intrinsic.get(key)
-            return self.intrinsic_key_function_map.get(key)(intrinsic_value, ignore_errors)
+            return self._resolve_intrinsic_function(
+                self.intrinsic_key_function_map, key, intrinsic_value, ignore_errors
+            )
 
         if key in self.conditional_key_function_map:
             intrinsic_value = intrinsic.get(key)
-            return self.conditional_key_function_map.get(key)(intrinsic_value, ignore_errors)
+            return self._resolve_intrinsic_function(
+                self.conditional_key_function_map, key, intrinsic_value, ignore_errors
+            )
 
         # In this case, it is a dictionary that doesn't directly contain an intrinsic resolver, we must recursively
         # resolve each of it's sub properties.
         sanitized_dict = {}
+        is_changed = False
         for key, val in intrinsic.items():
             try:
                 sanitized_key = self.intrinsic_property_resolver(key, ignore_errors, parent_function=parent_function)
@@ -225,6 +248,7 @@ class IntrinsicResolver:
                     ),
                 )
                 sanitized_dict[sanitized_key] = sanitized_val
+                is_changed = is_changed or sanitized_key is not key or sanitized_val is not val
             # On any exception, leave the key:val of the orginal intact and continue on.
             # https://github.com/awslabs/aws-sam-cli/issues/1386
             except Exception:
@@ -234,7 +258,28 @@ class IntrinsicResolver:
                 else:
                     raise
 
-        return sanitized_dict
+        return sanitized_dict if is_changed else intrinsic
+
+    def _resolve_intrinsic_function(self, function_map, key, intrinsic_value, ignore_errors):
+        """
+        Resolves the given intrinsic function with its resolver in the given function map, or returns the result of
+        a previous resolution of the same function with the same value.
+
+        Intrinsic functions are pure within a template, since the template and the symbol resolver don't change
+        during the resolution. Results which are lists or dictionaries are copied, so the callers can't alter the
+        cached results.
+        """
+        try:
+            cache_key = (key, json.dumps(intrinsic_value, default=repr), ignore_errors)
+        except (TypeError, ValueError):
+            return function_map.get(key)(intrinsic_value, ignore_errors)
+
+        if cache_key in self._resolved_functions:
+            return _copy_if_mutable(self._resolved_functions[cache_key])
+
+        result = function_map.get(key)(intrinsic_value, ignore_errors)
+        self._resolved_functions[cache_key] = _copy_if_mutable(result)
+        return result
 
     def resolve_template(self, ignore_errors=False):
         """
@@ -254,6 +299,44 @@ class IntrinsicResolver:
 
         return processed_template
 
+    def resolve_resource_properties(self, logical_id, property_names=None, ignore_errors=False):
+        """
+        Resolves only the given properties of a single resource, instead of the whole template.
+
+        Parameters
+        -----------
+        logical_id: str
+            Logical id of the resource
+        property_names: list(str), optional
+            Names of the properties to resolve, all the properties of the resource are resolved if it is not given
+        ignore_errors: bool
+            An option to ignore errors that are InvalidIntrinsicException and InvalidSymbolException
+        Return
+        -------
+        A dictionary of the resolved properties which exist in the resource
+        """
+        properties = (self._resources.get(logical_id) or {}).get("Properties") or {}
+        if property_names is None:
+            property_names = list(properties.keys())
+
+        resolved_properties = {}
+        for property_name in property_names:
+            if property_name not in properties:
+                continue
+            value = properties[property_name]
+            try:
+                resolved_properties[property_name] = self.intrinsic_property_resolver(
+                    value, ignore_errors, parent_function=logical_id
+                )
+            except (InvalidIntrinsicException, InvalidSymbolException) as e:
+                if not ignore_errors:
+                    raise InvalidIntrinsicException(
+                        "Exception with property {} of {}".format(property_name, logical_id) + ": " + str(e.args)
+                    ) from e
+                LOG.error("Unable to process property %s of %s", property_name, logical_id)
+                resolved_properties[property_name] = value
+        return resolved_properties
+
     def resolve_attribute(self, cloud_formation_property, ignore_errors=False):
         """
         This will parse through every entry in a CloudFormation root key and resolve them based on the symbol_resolver.
@@ -948,3 +1031,9 @@ class IntrinsicResolver:
                 if condition:
                     return True
         return False
+
+
+def _copy_if_mutable(value):
+    if isinstance(value, (dict, list)):
+        return copy.deepcopy(value)
+    return value
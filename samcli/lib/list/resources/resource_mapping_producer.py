@@ -8,7 +8,6 @@ from typing import Any, Dict
 
 from botocore.exceptions import BotoCoreError, ClientError, NoCredentialsError
 from samtranslator.translator.arn_generator import NoRegionFound
-from samtranslator.translator.managed_policy_translator import ManagedPolicyLoader
 
 from samcli.commands._utils.template import get_template_data
 from samcli.commands.exceptions import UserException
@@ -23,6 +22,7 @@ from samcli.commands.validate.lib.exceptions import InvalidSamDocumentException
 from samcli.lib.list.list_interfaces import Producer
 from samcli.lib.list.resources.resources_def import ResourcesDef
 from samcli.lib.providers.sam_stack_provider import SamLocalStackProvider
+from samcli.lib.translate.managed_policy_loader import CachedManagedPolicyLoader
 from samcli.lib.translate.sam_template_validator import SamTemplateValidator
 from samcli.lib.utils.boto_utils import get_client_error_code
 from samcli.yamlhelper import yaml_parse
@@ -103,7 +103,7 @@ class ResourceMappingProducer(Producer):
             # Note to check if IAM can be mocked to get around doing a translate without it
             validator = SamTemplateValidator(
                 template_file_dict,
-                ManagedPolicyLoader(self.iam_client),
+                CachedManagedPolicyLoader(self.iam_client),
                 profile=self.profile,
                 region=self.region,
                 parameter_overrides=self.parameter_overrides,
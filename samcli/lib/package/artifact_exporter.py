@@ -38,6 +38,7 @@ from samcli.lib.package.utils import (
 )
 from samcli.lib.providers.provider import get_full_path
 from samcli.lib.samlib.resource_metadata_normalizer import ResourceMetadataNormalizer
+from samcli.lib.telemetry.tracing import span, traced
 from samcli.lib.utils.packagetype import ZIP
 from samcli.lib.utils.resources import (
     AWS_CLOUDFORMATION_STACK,
@@ -259,6 +260,7 @@ class Template:
                     if code_uri_global is not None and resource_dict is not None:
                         resource_dict["CodeUri"] = code_uri_global
 
+    @traced("Template.export")
     def export(self) -> Dict:
         """
         Exports the local artifacts referenced by the given template to an
@@ -288,7 +290,8 @@ class Template:
                     continue
                 # Export code resources
                 exporter = exporter_class(self.uploaders, self.code_signer)
-                exporter.export(full_path, resource_dict, self.template_dir)
+                with span("Template.export_resource", resource=full_path, resource_type=resource_type):
+                    exporter.export(full_path, resource_dict, self.template_dir)
 
         return self.template_dict
 
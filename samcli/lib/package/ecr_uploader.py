@@ -4,14 +4,19 @@ Client for uploading packaged artifacts to ecr
 
 import base64
 import logging
+import os
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextlib import contextmanager
 from io import StringIO
 from pathlib import Path
-from typing import Dict
+from typing import Dict, Optional
 
 import botocore
 import click
 import docker
 from docker.errors import APIError, BuildError
+from docker.models.images import Image
 
 from samcli.commands.package.exceptions import (
     DeleteArtifactFailedError,
@@ -21,6 +26,7 @@ from samcli.commands.package.exceptions import (
 )
 from samcli.lib.constants import DOCKER_MIN_API_VERSION
 from samcli.lib.docker.log_streamer import LogStreamer, LogStreamError
+from samcli.lib.package.ecr_utils import is_ecr_url
 from samcli.lib.package.image_utils import tag_translation
 from samcli.lib.utils.osutils import stderr
 from samcli.lib.utils.stream_writer import StreamWriter
@@ -28,6 +34,8 @@ from samcli.lib.utils.stream_writer import StreamWriter
 LOG = logging.getLogger(__name__)
 
 ECR_USERNAME = "AWS"
+# Max number of images pushed at the same time in parallel pushes
+MAX_CONCURRENT_PUSHES = 4
 
 
 class ECRUploader:
@@ -36,7 +44,15 @@ class ECRUploader:
     """
 
     def __init__(
-        self, docker_client, ecr_client, ecr_repo, ecr_repo_multi, no_progressbar=False, tag="latest", stream=stderr()
+        self,
+        docker_client,
+        ecr_client,
+        ecr_repo,
+        ecr_repo_multi,
+        no_progressbar=False,
+        tag="latest",
+        stream=stderr(),
+        max_concurrent_pushes=MAX_CONCURRENT_PUSHES,
     ):
         self.docker_client = docker_client if docker_client else docker.from_env(version=DOCKER_MIN_API_VERSION)
         self.ecr_client = ecr_client
@@ -48,6 +64,14 @@ class ECRUploader:
         self.stream = StreamWriter(stream=stream, auto_flush=True)
         self.log_streamer = LogStreamer(stream=self.stream)
         self.login_session_active = False
+        self.max_concurrent_pushes = max_concurrent_pushes
+
+        self._lock = threading.Lock()
+        # pushes per remote image ({repository}:{tag}), so the same image is pushed only once
+        self._pushes: Dict[str, Future] = {}
+        # images loaded per image archive path, so the same archive is loaded only once
+        self._loaded_archives: Dict[str, Image] = {}
+        self._executor: Optional[ThreadPoolExecutor] = None
 
     def login(self):
         """
@@ -67,6 +91,31 @@ class ECRUploader:
             raise DockerLoginFailedError(msg=str(ex)) from ex
         self.auth_config = {"username": username, "password": password}
 
+    @contextmanager
+    def parallel_pushes(self):
+        """
+        Context manager in which ``upload`` returns as soon as the image is tagged, and pushes the images
+        concurrently in the background, at most ``max_concurrent_pushes`` at a time. Exiting the context waits for all
+        the pushes to complete.
+
+        Raises
+        ------
+        DockerPushFailedError
+            If any of the images failed to be pushed
+        """
+        with ThreadPoolExecutor(max_workers=self.max_concurrent_pushes) as executor:
+            self._executor = executor
+            try:
+                yield
+            finally:
+                self._executor = None
+
+        with self._lock:
+            pushes = list(self._pushes.values())
+        for push in pushes:
+            # raises the push error if any
+            push.result()
+
     def upload(self, image, resource_name):
         """
         Uploads given local image to ECR.
@@ -74,20 +123,18 @@ class ECRUploader:
         :param resource_name: logical ID of the resource to be uploaded to ECR.
         :return: remote ECR image path that has been uploaded.
         """
-        if not self.login_session_active:
-            self.login()
-            self.login_session_active = True
+        with self._lock:
+            if not self.login_session_active:
+                self.login()
+                self.login_session_active = True
 
         # Sometimes the `resource_name` is used as the `image` parameter to `tag_translation`.
         # This is because these two cases (directly from an archive or by ID) are effectively
         # anonymous, so the best identifier available in scope is the resource name.
         try:
             if Path(image).is_file():
-                with open(image, mode="rb") as image_archive:
-                    [docker_img, *rest] = self.docker_client.images.load(image_archive)
-                    if len(rest) != 0:
-                        raise DockerPushFailedError("Archive must represent a single image")
-                    _tag = tag_translation(resource_name, docker_image_id=docker_img.id, gen_tag=self.tag)
+                docker_img = self._load_image_archive(image)
+                _tag = tag_translation(resource_name, docker_image_id=docker_img.id, gen_tag=self.tag)
             else:
                 # If it's not a file, it's gotta be a {repo}:{tag} or a sha256:{digest}
                 docker_img = self.docker_client.images.get(image)
@@ -104,21 +151,108 @@ class ECRUploader:
             )
 
             docker_img.tag(repository=repository, tag=_tag)
+        except (BuildError, APIError) as ex:
+            raise DockerPushFailedError(msg=str(ex)) from ex
+
+        remote_image = f"{repository}:{_tag}"
+        with self._lock:
+            push = self._pushes.get(remote_image)
+            if not push:
+                if self._executor:
+                    push = self._executor.submit(self._push, repository, _tag, False)
+                else:
+                    push = Future()
+                    push.set_running_or_notify_cancel()
+                self._pushes[remote_image] = push
+            elif self._executor is None:
+                # wait for the push of the same image which is already in progress or done
+                push.result()
+                return remote_image
+
+        if not self._executor:
+            try:
+                self._push(repository, _tag, True)
+                push.set_result(None)
+            except Exception as ex:
+                # do not cache the failed push, so that it can be retried
+                with self._lock:
+                    self._pushes.pop(remote_image, None)
+                push.set_exception(ex)
+                raise
+
+        return remote_image
+
+    def _load_image_archive(self, image_archive_path: str) -> Image:
+        """
+        Loads the image in the given archive into docker, each archive is loaded only once
+        """
+        with self._lock:
+            docker_img = self._loaded_archives.get(image_archive_path)
+            if docker_img:
+                return docker_img
+
+            with open(image_archive_path, mode="rb") as image_archive:
+                [docker_img, *rest] = self.docker_client.images.load(image_archive)
+                if len(rest) != 0:
+                    raise DockerPushFailedError("Archive must represent a single image")
+            self._loaded_archives[image_archive_path] = docker_img
+            return docker_img
+
+    def _push(self, repository: str, tag: str, stream_progress: bool) -> None:
+        """
+        Pushes the given image to ECR, unless the repository already contains it
+
+        :param repository: ECR repository to push the image to
+        :param tag: tag of the image to push
+        :param stream_progress: True to stream the push progress of the image layers, otherwise only a summary line
+            is written once the image is pushed. It must be False when several images are pushed concurrently.
+        """
+        remote_image = f"{repository}:{tag}"
+        if self._is_image_in_repository(repository, tag):
+            LOG.debug("Image %s already exists in the repository, skip pushing it", remote_image)
+            with self._lock:
+                self.stream.write_str(f"{remote_image} already exists in the repository, skipping push{os.linesep}")
+            return
+
+        try:
             push_logs = self.docker_client.api.push(
-                repository=repository, tag=_tag, auth_config=self.auth_config, stream=True, decode=True
+                repository=repository, tag=tag, auth_config=self.auth_config, stream=True, decode=True
             )
-            if not self.no_progressbar:
+            if stream_progress and not self.no_progressbar:
                 self.log_streamer.stream_progress(push_logs)
             else:
                 # we need to wait till the image got pushed to ecr, without this workaround sam sync for template
                 # contains image always fail, because the provided ecr uri is not exist.
                 _log_streamer = LogStreamer(stream=StreamWriter(stream=StringIO(), auto_flush=True))
                 _log_streamer.stream_progress(push_logs)
-
+                if not stream_progress and not self.no_progressbar:
+                    with self._lock:
+                        self.stream.write_str(f"{remote_image} pushed{os.linesep}")
         except (BuildError, APIError, LogStreamError) as ex:
             raise DockerPushFailedError(msg=str(ex)) from ex
 
-        return f"{repository}:{_tag}"
+    def _is_image_in_repository(self, repository: str, tag: str) -> bool:
+        """
+        Checks whether the given ECR repository already contains an image with the given tag. The tags generated by
+        ``tag_translation`` contain the local image id, so an existing tag means the same image is already pushed.
+        """
+        if not is_ecr_url(repository):
+            return False
+
+        registry, _, repository_name = repository.partition("/")
+        registry_id = registry.split(".")[0]
+        kwargs = {"repositoryName": repository_name, "imageIds": [{"imageTag": tag}]}
+        if registry_id.isdigit():
+            kwargs["registryId"] = registry_id
+
+        try:
+            response = self.ecr_client.describe_images(**kwargs)
+        except botocore.exceptions.ClientError as ex:
+            if ex.response.get("Error", {}).get("Code") != "ImageNotFoundException":
+                LOG.debug("Failed to check whether image %s:%s exists, pushing it", repository, tag, exc_info=ex)
+            return False
+
+        return bool(response.get("imageDetails"))
 
     def delete_artifact(self, image_uri: str, resource_id: str, property_name: str):
         """
@@ -29,6 +29,7 @@ from boto3.s3.transfer import ProgressCallbackInvoker
 
 from samcli.commands.package.exceptions import BucketNotSpecifiedError, NoSuchBucketError
 from samcli.lib.package.local_files_utils import get_uploaded_s3_object_name
+from samcli.lib.telemetry.tracing import traced
 from samcli.lib.utils.s3 import parse_s3_url
 
 LOG = logging.getLogger(__name__)
@@ -72,6 +73,7 @@ class S3Uploader:
 
         self._artifact_metadata = None
 
+    @traced("S3Uploader.upload")
     def upload(self, file_name: str, remote_path: str) -> str:
         """
         Uploads given file to S3
@@ -194,6 +196,7 @@ class S3Uploader:
             for obj in prefix_files:
                 self.delete_artifact(obj["Key"], True)
 
+    @traced("S3Uploader.file_exists")
     def file_exists(self, remote_path: str) -> bool:
         """
         Check if the file we are trying to upload already exists in S3
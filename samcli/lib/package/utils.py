@@ -25,6 +25,7 @@ from samcli.lib.package.permissions import (
     WindowsFilePermissionPermissionMapper,
 )
 from samcli.lib.package.s3_uploader import S3Uploader
+from samcli.lib.telemetry.tracing import span
 from samcli.lib.utils.hash import dir_checksum
 from samcli.lib.utils.resources import LAMBDA_LOCAL_RESOURCES
 from samcli.lib.utils.s3 import parse_s3_url
@@ -234,7 +235,8 @@ def zip_folder(folder_path, zip_method):
     md5hash = dir_checksum(folder_path, followlinks=True)
     filename = os.path.join(tempfile.mkdtemp(), "data-" + md5hash)
 
-    zipfile_name = zip_method(filename, folder_path)
+    with span("zip_folder", directory=folder_path):
+        zipfile_name = zip_method(filename, folder_path)
     try:
         yield zipfile_name, md5hash
     finally:
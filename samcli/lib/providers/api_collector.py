@@ -3,6 +3,7 @@ Class to store the API configurations in the SAM Template. This class helps stor
 routes in a standardized format
 """
 
+import copy
 import logging
 import os
 from collections import defaultdict
@@ -128,6 +129,31 @@ class ApiCollector:
         """
         self._get_routes(logical_id).extend(routes)
 
+    def merge(self, collector: "ApiCollector") -> None:
+        """
+        Adds the routes, authorizers and properties stored in the given collector to this collector. Routes are
+        copied, since they are updated when creating the api, so the given collector can be merged again later.
+        Properties which are not set in the given collector keep their current value.
+
+        Parameters
+        ----------
+        collector : ApiCollector
+            Collector to merge into this one
+        """
+        for logical_id, routes in collector._route_per_resource.items():
+            self.add_routes(logical_id, [_copy_route(route) for route in routes])
+        for logical_id, authorizers in collector._authorizers_per_resources.items():
+            self.add_authorizers(logical_id, authorizers)
+        self._default_authorizer_per_resource.update(collector._default_authorizer_per_resource)
+        self.binary_media_types_set.update(collector.binary_media_types_set)
+
+        if collector.stage_name is not None:
+            self.stage_name = collector.stage_name
+        if collector.stage_variables is not None:
+            self.stage_variables = collector.stage_variables
+        if collector.cors is not None:
+            self.cors = collector.cors
+
     def _get_routes(self, logical_id: str) -> List[Route]:
         """
         Returns the properties of resource with given logical ID. If a resource is not found, then it returns an
@@ -306,3 +332,9 @@ Testing application behaviour against authorizers deployed on AWS can be done us
             return None
 
         return value.replace("~1", "/")
+
+
+def _copy_route(route: Route) -> Route:
+    route_copy = copy.copy(route)
+    route_copy.methods = list(route.methods)
+    return route_copy
@@ -1,13 +1,16 @@
 """Class that provides the Api with a list of routes from a Template"""
 
+import json
 import logging
-from typing import Iterator, List, Optional
+import os
+from typing import Dict, Iterator, List, Optional, Tuple, Type
 
 from samcli.lib.providers.api_collector import ApiCollector
 from samcli.lib.providers.cfn_api_provider import CfnApiProvider
 from samcli.lib.providers.cfn_base_api_provider import CfnBaseApiProvider
 from samcli.lib.providers.provider import AbstractApiProvider, Api, Stack
 from samcli.lib.providers.sam_api_provider import SamApiProvider
+from samcli.lib.utils.hash import str_checksum
 
 LOG = logging.getLogger(__name__)
 
@@ -37,10 +40,34 @@ class ApiProvider(AbstractApiProvider):
         # Store a set of apis
         self.cwd = cwd
         self.disable_authorizer = disable_authorizer
+        # extracted routes and properties per stack path and logical ID, with the checksum they were extracted from
+        self._extracted_resources: Dict[Tuple[str, str], Tuple[str, ApiCollector]] = {}
+        self._extracted_provider_type: Optional[Type[CfnBaseApiProvider]] = None
         self.api = self._extract_api()
         self.routes = self.api.routes
         LOG.debug("%d APIs found in the template", len(self.routes))
 
+    def refresh(self, stacks: List[Stack]) -> Api:
+        """
+        Updates the Api with the given stacks, e.g. after their templates changed. Only the resources which changed
+        since the previous extraction are extracted again, the other ones reuse their previous extraction.
+
+        Parameters
+        ----------
+        stacks : List[Stack]
+            Updated list of stacks apis are extracted from
+
+        Returns
+        -------
+        Api
+            The updated Api
+        """
+        self.stacks = stacks
+        self.api = self._extract_api()
+        self.routes = self.api.routes
+        LOG.debug("%d APIs found in the updated template", len(self.routes))
+        return self.api
+
     def get_all(self) -> Iterator[Api]:
         """
         Yields all the Apis in the current Provider
@@ -62,11 +89,58 @@ class ApiProvider(AbstractApiProvider):
         An Api from the parsed template
         """
 
-        collector = ApiCollector()
         provider = ApiProvider.find_api_provider(self.stacks)
-        provider.extract_resources(self.stacks, collector, cwd=self.cwd, disable_authorizer=self.disable_authorizer)
+        if type(provider) is not self._extracted_provider_type:
+            # resources extracted by another provider are not reused
+            self._extracted_resources = {}
+        self._extracted_provider_type = type(provider)
+
+        collector = ApiCollector()
+        extracted_resources: Dict[Tuple[str, str], Tuple[str, ApiCollector]] = {}
+        extracted_count = 0
+        for stack in self.stacks:
+            stack_checksum = self._get_checksum(stack.resources) if provider.EXTRACTION_DEPENDS_ON_STACK else None
+            for logical_id, resource in stack.resources.items():
+                key = (stack.stack_path, logical_id)
+                checksum = stack_checksum or self._get_checksum({logical_id: resource})
+                checksum_and_collector = self._extracted_resources.get(key)
+                if not checksum_and_collector or checksum_and_collector[0] != checksum:
+                    resource_collector = ApiCollector()
+                    provider.extract_resource(
+                        stack,
+                        logical_id,
+                        resource,
+                        resource_collector,
+                        cwd=self.cwd,
+                        disable_authorizer=self.disable_authorizer,
+                    )
+                    checksum_and_collector = (checksum, resource_collector)
+                    extracted_count += 1
+                extracted_resources[key] = checksum_and_collector
+                collector.merge(checksum_and_collector[1])
+
+        LOG.debug("Extracted %d resources, reused %d", extracted_count, len(extracted_resources) - extracted_count)
+        self._extracted_resources = extracted_resources
+        provider.finalize(collector)
         return collector.get_api()
 
+    def _get_checksum(self, resources: Dict[str, Dict]) -> str:
+        """
+        Returns the checksum of the given resources, including the modification time of their local Swagger files
+        """
+        definition_file_times = []
+        for resource in resources.values():
+            properties = resource.get("Properties") or {}
+            for definition_property in ("DefinitionUri", "BodyS3Location"):
+                definition_uri = properties.get(definition_property)
+                if not isinstance(definition_uri, str) or definition_uri.startswith("s3://"):
+                    continue
+                try:
+                    definition_file_times.append(os.path.getmtime(os.path.join(self.cwd or "", definition_uri)))
+                except OSError:
+                    continue
+        return str_checksum(json.dumps([resources, definition_file_times], sort_keys=True, default=str))
+
     @staticmethod
     def find_api_provider(stacks: List[Stack]) -> CfnBaseApiProvider:
         """
@@ -46,6 +46,7 @@ class CfnApiProvider(CfnBaseApiProvider):
         AWS_APIGATEWAY_V2_STAGE,
         AWS_APIGATEWAY_V2_AUTHORIZER,
     ]
+    EXTRACTION_DEPENDS_ON_STACK = True
 
     _METHOD_AUTHORIZER_ID = "AuthorizerId"
     _ROUTE_AUTHORIZER_ID = "AuthorizerId"
@@ -76,53 +77,85 @@ class CfnApiProvider(CfnBaseApiProvider):
         """
 
         for stack in stacks:
-            resources = stack.resources
-            for logical_id, resource in resources.items():
-                resource_type = resource.get(CfnBaseApiProvider.RESOURCE_TYPE)
-                if resource_type == AWS_APIGATEWAY_RESTAPI:
-                    self._extract_cloud_formation_route(stack.stack_path, logical_id, resource, collector, cwd=cwd)
-
-                if resource_type == AWS_APIGATEWAY_STAGE:
-                    self._extract_cloud_formation_stage(resources, resource, collector)
-
-                if resource_type == AWS_APIGATEWAY_METHOD:
-                    self._extract_cloud_formation_method(
-                        stack.stack_path,
-                        resources,
-                        logical_id,
-                        resource,
-                        collector,
-                        disable_authorizer=disable_authorizer,
-                    )
+            for logical_id, resource in stack.resources.items():
+                self.extract_resource(
+                    stack, logical_id, resource, collector, cwd=cwd, disable_authorizer=disable_authorizer
+                )
 
-                if resource_type == AWS_APIGATEWAY_AUTHORIZER and not disable_authorizer:
-                    self._extract_cloud_formation_authorizer(logical_id, resource, collector)
-
-                if resource_type == AWS_APIGATEWAY_V2_API:
-                    self._extract_cfn_gateway_v2_api(
-                        stack.stack_path,
-                        logical_id,
-                        resource,
-                        collector,
-                        cwd=cwd,
-                        disable_authorizer=disable_authorizer,
-                    )
+    def extract_resource(
+        self,
+        stack: Stack,
+        logical_id: str,
+        resource: Dict,
+        collector: ApiCollector,
+        cwd: Optional[str] = None,
+        disable_authorizer: Optional[bool] = False,
+    ) -> None:
+        """
+        Extract the Route Objects of a single resource and adds them to the RouteCollector. The routes of some
+        resources also depend on the other resources of their stack, e.g. the path of an AWS::ApiGateway::Method.
 
-                if resource_type == AWS_APIGATEWAY_V2_ROUTE:
-                    self._extract_cfn_gateway_v2_route(
-                        stack.stack_path,
-                        resources,
-                        logical_id,
-                        resource,
-                        collector,
-                        disable_authorizer=disable_authorizer,
-                    )
+        Parameters
+        ----------
+        stack: Stack
+            Stack of the resource
+        logical_id: str
+            Logical ID of the resource
+        resource: Dict
+            Resource dictionary from the template
+        collector: samcli.lib.providers.api_collector.ApiCollector
+            Instance of the API collector that where we will save the API information
+        cwd : str
+            Optional working directory with respect to which we will resolve relative path to Swagger file
+        disable_authorizer : bool
+            Optional flag to disable collection of lambda authorizers
+        """
+        resources = stack.resources
+        resource_type = resource.get(CfnBaseApiProvider.RESOURCE_TYPE)
+        if resource_type == AWS_APIGATEWAY_RESTAPI:
+            self._extract_cloud_formation_route(stack.stack_path, logical_id, resource, collector, cwd=cwd)
+
+        if resource_type == AWS_APIGATEWAY_STAGE:
+            self._extract_cloud_formation_stage(resources, resource, collector)
+
+        if resource_type == AWS_APIGATEWAY_METHOD:
+            self._extract_cloud_formation_method(
+                stack.stack_path,
+                resources,
+                logical_id,
+                resource,
+                collector,
+                disable_authorizer=disable_authorizer,
+            )
+
+        if resource_type == AWS_APIGATEWAY_AUTHORIZER and not disable_authorizer:
+            self._extract_cloud_formation_authorizer(logical_id, resource, collector)
+
+        if resource_type == AWS_APIGATEWAY_V2_API:
+            self._extract_cfn_gateway_v2_api(
+                stack.stack_path,
+                logical_id,
+                resource,
+                collector,
+                cwd=cwd,
+                disable_authorizer=disable_authorizer,
+            )
+
+        if resource_type == AWS_APIGATEWAY_V2_ROUTE:
+            self._extract_cfn_gateway_v2_route(
+                stack.stack_path,
+                resources,
+                logical_id,
+                resource,
+                collector,
+                disable_authorizer=disable_authorizer,
+            )
 
-                if resource_type == AWS_APIGATEWAY_V2_STAGE:
-                    self._extract_cfn_gateway_v2_stage(resources, resource, collector)
+        if resource_type == AWS_APIGATEWAY_V2_STAGE:
+            self._extract_cfn_gateway_v2_stage(resources, resource, collector)
 
-                if resource_type == AWS_APIGATEWAY_V2_AUTHORIZER and not disable_authorizer:
-                    self._extract_cfn_gateway_v2_authorizer(logical_id, resource, collector)
+        if resource_type == AWS_APIGATEWAY_V2_AUTHORIZER and not disable_authorizer:
+            self._extract_cfn_gateway_v2_authorizer(logical_id, resource, collector)
 
     @staticmethod
     def _extract_cloud_formation_authorizer(logical_id: str, resource: dict, collector: ApiCollector) -> None:
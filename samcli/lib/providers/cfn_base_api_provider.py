@@ -29,6 +29,9 @@ MAX_AGE = "MaxAge"
 
 class CfnBaseApiProvider:
     RESOURCE_TYPE = "Type"
+    # whether the routes of a resource also depend on the other resources of its stack, in which case all the
+    # resources of a stack are extracted again when any of them changes
+    EXTRACTION_DEPENDS_ON_STACK = False
 
     def extract_resources(
         self,
@@ -53,6 +56,45 @@ class CfnBaseApiProvider:
         """
         raise NotImplementedError("not implemented")
 
+    def extract_resource(
+        self,
+        stack: Stack,
+        logical_id: str,
+        resource: Dict,
+        collector: ApiCollector,
+        cwd: Optional[str] = None,
+        disable_authorizer: Optional[bool] = False,
+    ) -> None:
+        """
+        Extract the Route Objects of a single resource and adds them to the RouteCollector.
+
+        Parameters
+        ----------
+        stack: Stack
+            Stack of the resource
+        logical_id: str
+            Logical ID of the resource
+        resource: Dict
+            Resource dictionary from the template
+        collector: samcli.lib.providers.api_collector.ApiCollector
+            Instance of the API collector that where we will save the API information
+        cwd : str
+            Optional working directory with respect to which we will resolve relative path to Swagger file
+        disable_authorizer : bool
+            Optional flag to disable collection of lambda authorizers
+        """
+        raise NotImplementedError("not implemented")
+
+    def finalize(self, collector: ApiCollector) -> None:
+        """
+        Processes the collected routes, once all the resources are extracted
+
+        Parameters
+        ----------
+        collector: samcli.lib.providers.api_collector.ApiCollector
+            Instance of the API collector with all the extracted resources
+        """
+
     @staticmethod
     def extract_swagger_route(
         stack_path: str,
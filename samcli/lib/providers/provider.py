@@ -10,13 +10,14 @@ import posixpath
 from collections import namedtuple
 from enum import Enum
 from pathlib import Path
-from typing import Any, Dict, Iterator, List, NamedTuple, Optional, Set, Union, cast
+from typing import Any, Collection, Dict, Iterator, List, NamedTuple, Optional, Set, Union, cast
 
 from samcli.commands.local.cli_common.user_exceptions import (
     InvalidFunctionPropertyType,
     InvalidLayerVersionArn,
     UnsupportedIntrinsic,
 )
+from samcli.lib.intrinsic_resolver.intrinsic_property_resolver import IntrinsicResolver
 from samcli.lib.providers.sam_base_provider import SamBaseProvider
 from samcli.lib.samlib.resource_metadata_normalizer import (
     SAM_METADATA_SKIP_BUILD_KEY,
@@ -609,6 +610,9 @@ class Stack:
         self.metadata = metadata
         self._resources: Optional[Dict] = None
         self._raw_resources: Optional[Dict] = None
+        self._resolver: Optional[IntrinsicResolver] = None
+        # resources resolved one by one, before the whole resources are resolved
+        self._resolved_resources: Dict[str, Dict] = {}
 
     @property
     def stack_id(self) -> str:
@@ -641,10 +645,53 @@ class Stack:
         """
         if self._resources is not None:
             return self._resources
-        processed_template_dict: Dict[str, Dict] = SamBaseProvider.get_template(self.template_dict, self.parameters)
+        if self._resolver:
+            processed_template_dict: Dict[str, Dict] = self._resolver.resolve_template(ignore_errors=True)
+        else:
+            processed_template_dict = SamBaseProvider.get_template(self.template_dict, self.parameters)
         self._resources = processed_template_dict.get("Resources", {})
         return self._resources
 
+    def get_resource_ids(self, resource_types: Collection[str]) -> List[str]:
+        """
+        Return the logical ids of the resources of the given types, without substituting the parameter values
+        """
+        resources = self._resources if self._resources is not None else self._get_resolver().resources
+        return [
+            logical_id
+            for logical_id, resource in resources.items()
+            if isinstance(resource, dict) and resource.get("Type") in resource_types
+        ]
+
+    def get_resource(self, logical_id: str) -> Optional[Dict]:
+        """
+        Return the resource of the given logical id where SAM plugins have been run and parameter values have been
+        substituted. Until the whole resources are needed, only the given resource is substituted.
+        """
+        if self._resources is not None:
+            return cast(Optional[Dict], self._resources.get(logical_id))
+        if logical_id in self._resolved_resources:
+            return self._resolved_resources[logical_id]
+
+        resolver = self._get_resolver()
+        resource = resolver.resources.get(logical_id)
+        if not isinstance(resource, dict):
+            return resource
+        resolved_resource = dict(resource)
+        if "Properties" in resource:
+            resolved_resource["Properties"] = resolver.resolve_resource_properties(logical_id, ignore_errors=True)
+        if resource.get("Metadata"):
+            resolved_resource["Metadata"] = resolver.intrinsic_property_resolver(
+                resource["Metadata"], True, parent_function=logical_id
+            )
+        self._resolved_resources[logical_id] = resolved_resource
+        return resolved_resource
+
+    def _get_resolver(self) -> IntrinsicResolver:
+        if not self._resolver:
+            self._resolver = SamBaseProvider.get_template_resolver(self.template_dict, self.parameters)
+        return self._resolver
+
     @property
     def raw_resources(self) -> Dict:
         """
@@ -73,30 +73,72 @@ class SamApiProvider(CfnBaseApiProvider):
         # parsed here and in InvokeContext.
         for stack in stacks:
             for logical_id, resource in stack.resources.items():
-                resource_type = resource.get(CfnBaseApiProvider.RESOURCE_TYPE)
-                if resource_type == AWS_SERVERLESS_FUNCTION:
-                    self._extract_routes_from_function(
-                        stack.stack_path, logical_id, resource, collector, disable_authorizer=disable_authorizer
-                    )
-                if resource_type == AWS_SERVERLESS_API:
-                    self._extract_from_serverless_api(
-                        stack.stack_path,
-                        logical_id,
-                        resource,
-                        collector,
-                        cwd=cwd,
-                        disable_authorizer=disable_authorizer,
-                    )
-                if resource_type == AWS_SERVERLESS_HTTPAPI:
-                    self._extract_from_serverless_http(
-                        stack.stack_path,
-                        logical_id,
-                        resource,
-                        collector,
-                        cwd=cwd,
-                        disable_authorizer=disable_authorizer,
-                    )
+                self.extract_resource(
+                    stack, logical_id, resource, collector, cwd=cwd, disable_authorizer=disable_authorizer
+                )
+
+        self.finalize(collector)
+
+    def extract_resource(
+        self,
+        stack: Stack,
+        logical_id: str,
+        resource: Dict,
+        collector: ApiCollector,
+        cwd: Optional[str] = None,
+        disable_authorizer: Optional[bool] = False,
+    ) -> None:
+        """
+        Extract the Route Objects of a single resource and adds them to the RouteCollector.
+
+        Parameters
+        ----------
+        stack: Stack
+            Stack of the resource
+        logical_id: str
+            Logical ID of the resource
+        resource: Dict
+            Resource dictionary from the template
+        collector: samcli.commands.local.lib.route_collector.ApiCollector
+            Instance of the API collector that where we will save the API information
+        cwd : str
+            Optional working directory with respect to which we will resolve relative path to Swagger file
+        disable_authorizer : bool
+            Optional flag to disable collection of lambda authorizers
+        """
+        resource_type = resource.get(CfnBaseApiProvider.RESOURCE_TYPE)
+        if resource_type == AWS_SERVERLESS_FUNCTION:
+            self._extract_routes_from_function(
+                stack.stack_path, logical_id, resource, collector, disable_authorizer=disable_authorizer
+            )
+        if resource_type == AWS_SERVERLESS_API:
+            self._extract_from_serverless_api(
+                stack.stack_path,
+                logical_id,
+                resource,
+                collector,
+                cwd=cwd,
+                disable_authorizer=disable_authorizer,
+            )
+        if resource_type == AWS_SERVERLESS_HTTPAPI:
+            self._extract_from_serverless_http(
+                stack.stack_path,
+                logical_id,
+                resource,
+                collector,
+                cwd=cwd,
+                disable_authorizer=disable_authorizer,
+            )
+
+    def finalize(self, collector: ApiCollector) -> None:
+        """
+        Merges the implicit and explicit routes of the collector, once all the resources are extracted
 
+        Parameters
+        ----------
+        collector: samcli.commands.local.lib.route_collector.ApiCollector
+            Instance of the API collector with all the extracted resources
+        """
         collector.routes = self.merge_routes(collector)
 
     def _extract_from_serverless_api(
@@ -187,18 +187,45 @@ class SamBaseProvider:
         dict
             Processed SAM template
         """
+        resolver = SamBaseProvider.get_template_resolver(template_dict, parameter_overrides, use_sam_transform)
+        template_dict = resolver.resolve_template(ignore_errors=True)
+        return template_dict
+
+    @staticmethod
+    def get_template_resolver(
+        template_dict: Dict, parameter_overrides: Optional[Dict] = None, use_sam_transform: bool = True
+    ) -> IntrinsicResolver:
+        """
+        Given a SAM template dictionary, return the intrinsic resolver of a copy of the template where SAM plugins have
+        been run. It can substitute the parameter values of the whole template, or only of the properties of some
+        resources with resolve_resource_properties.
+
+        Parameters
+        ----------
+        template_dict : dict
+            unprocessed SAM template dictionary
+
+        parameter_overrides: dict
+            Optional dictionary of values for template parameters
+
+        use_sam_transform: bool
+            Whether to transform the given template with Serverless Application Model. Default is True
+
+        Returns
+        -------
+        IntrinsicResolver
+            Resolver of the processed SAM template
+        """
         template_dict = template_dict or {}
         parameters_values = SamBaseProvider._get_parameter_values(template_dict, parameter_overrides)
         if template_dict and use_sam_transform:
             template_dict = SamTranslatorWrapper(template_dict, parameter_values=parameters_values).run_plugins()
         ResourceMetadataNormalizer.normalize(template_dict)
 
-        resolver = IntrinsicResolver(
+        return IntrinsicResolver(
             template=template_dict,
             symbol_resolver=IntrinsicsSymbolTable(logical_id_translator=parameters_values, template=template_dict),
         )
-        template_dict = resolver.resolve_template(ignore_errors=True)
-        return template_dict
 
     @staticmethod
     def get_resolved_template_dict(
@@ -65,9 +65,6 @@ class SamFunctionProvider(SamBaseProvider):
 
         self._stacks = stacks
 
-        for stack in stacks:
-            LOG.debug("%d resources found in the stack %s", len(stack.resources), stack.stack_path)
-
         # Store a map of function full_path to function information for quick reference
         self.functions = SamFunctionProvider._extract_functions(
             self._stacks, use_raw_codeuri, ignore_code_extraction_warnings, locate_layer_nested
@@ -201,7 +198,9 @@ class SamFunctionProvider(SamBaseProvider):
 
         result: Dict[str, Function] = {}  # a dict with full_path as key and extracted function as value
         for stack in stacks:
-            for name, resource in stack.resources.items():
+            # only the functions are resolved, local commands like invoke don't need the other resources
+            for name in stack.get_resource_ids([AWS_SERVERLESS_FUNCTION, AWS_LAMBDA_FUNCTION]):
+                resource = cast(Dict, stack.get_resource(name))
                 resource_type = resource.get("Type")
                 resource_properties = resource.get("Properties", {})
                 resource_metadata = resource.get("Metadata", None)
@@ -728,7 +727,7 @@ class SamFunctionProvider(SamBaseProvider):
         stack: Stack, layer: Dict, use_raw_codeuri: bool = False, ignore_code_extraction_warnings: bool = False
     ) -> Optional[LayerVersion]:
         layer_logical_id = cast(str, layer.get("Ref"))
-        layer_resource = stack.resources.get(layer_logical_id)
+        layer_resource = stack.get_resource(layer_logical_id)
         if not layer_resource or layer_resource.get("Type", "") not in (
             AWS_SERVERLESS_LAYERVERSION,
             AWS_LAMBDA_LAYERVERSION,
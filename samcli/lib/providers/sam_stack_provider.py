@@ -59,12 +59,13 @@ class SamLocalStackProvider(SamBaseProvider):
 
         self._template_file = template_file
         self._stack_path = stack_path
-        self._template_dict = self.get_template(
+        # only the stack resources are resolved, the other resources are not needed to find the stacks
+        self._resolver = self.get_template_resolver(
             template_dict,
             SamLocalStackProvider.merge_parameter_overrides(parameter_overrides, global_parameter_overrides),
             use_sam_transform=use_sam_transform,
         )
-        self._resources = self._template_dict.get("Resources", {})
+        self._resources = self._resolver.resources
         self._global_parameter_overrides = global_parameter_overrides
 
         # Store a map of stack name to stack information for quick reference -> self._stacks
@@ -111,8 +112,15 @@ class SamLocalStackProvider(SamBaseProvider):
 
         for name, resource in self._resources.items():
             resource_type = resource.get("Type")
-            resource_properties = resource.get("Properties", {})
+            if resource_type not in (AWS_SERVERLESS_APPLICATION, AWS_CLOUDFORMATION_STACK):
+                # We don't care about other resource types. Just ignore them
+                continue
+            resource_properties = self._resolver.resolve_resource_properties(name, ignore_errors=True)
             resource_metadata = resource.get("Metadata", None)
+            if resource_metadata:
+                resource_metadata = self._resolver.intrinsic_property_resolver(
+                    resource_metadata, True, parent_function=name
+                )
             # Add extra metadata information to properties under a separate field.
             if resource_metadata:
                 resource_properties["Metadata"] = resource_metadata
@@ -133,8 +141,6 @@ class SamLocalStackProvider(SamBaseProvider):
             if stack:
                 self._stacks[name] = stack
 
-            # We don't care about other resource types. Just ignore them
-
     @staticmethod
     def _convert_sam_application_resource(
         template_file: str,
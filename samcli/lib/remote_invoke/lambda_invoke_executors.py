@@ -3,11 +3,13 @@ Remote invoke executor implementation for Lambda
 """
 
 import base64
+import codecs
 import json
 import logging
 from abc import ABC, abstractmethod
+from io import TextIOWrapper
 from json import JSONDecodeError
-from typing import cast
+from typing import IO, Union, cast
 
 from botocore.eventstream import EventStream
 from botocore.exceptions import ClientError, ParamValidationError
@@ -41,11 +43,15 @@ LOG_RESULT = "LogResult"
 INVOKE_MODE = "InvokeMode"
 RESPONSE_STREAM = "RESPONSE_STREAM"
 
+# size of the chunks which are read from the response payload, so large payloads are written as they are received
+PAYLOAD_READ_CHUNK_SIZE = 64 * 1024
+
 
 class AbstractLambdaInvokeExecutor(BotoActionExecutor, ABC):
     """
     Abstract class for different lambda invocation executors, see implementation for details.
-    For Payload parameter, if a file location provided, the file handle will be passed as Payload object
+    For Payload parameter, if a file location provided, the file handle will be passed as Payload object, so boto3
+    streams it from the disk instead of keeping it in memory
     """
 
     _lambda_client: LambdaClient
@@ -75,12 +81,18 @@ class AbstractLambdaInvokeExecutor(BotoActionExecutor, ABC):
             else:
                 self.request_parameters[parameter_key] = parameter_value
 
-    def _execute_action(self, payload: str) -> RemoteInvokeIterableResponseType:
+    def _execute_action(self, payload: Union[str, IO[bytes]]) -> RemoteInvokeIterableResponseType:
         self.request_parameters[FUNCTION_NAME] = self._function_name
         self.request_parameters[PAYLOAD] = payload
 
         return self._execute_lambda_invoke(payload)
 
+    def _execute_action_file(self, payload_file: TextIOWrapper) -> RemoteInvokeIterableResponseType:
+        if not payload_file.seekable():
+            # stdin can't be rewound by boto3 if the request is retried, read it fully
+            return self._execute_action(payload_file.read())
+        return self._execute_action(payload_file.buffer)
+
     def _execute_boto_call(self, boto_client_method) -> dict:
         try:
             return cast(dict, boto_client_method(**self.request_parameters))
@@ -99,7 +111,7 @@ class AbstractLambdaInvokeExecutor(BotoActionExecutor, ABC):
             raise ErrorBotoApiCallException(client_ex) from client_ex
 
     @abstractmethod
-    def _execute_lambda_invoke(self, payload: str) -> RemoteInvokeIterableResponseType:
+    def _execute_lambda_invoke(self, payload: Union[str, IO[bytes]]) -> RemoteInvokeIterableResponseType:
         raise NotImplementedError()
 
 
@@ -108,7 +120,7 @@ class LambdaInvokeExecutor(AbstractLambdaInvokeExecutor):
     Calls "invoke" method of "lambda" service with given input.
     """
 
-    def _execute_lambda_invoke(self, payload: str) -> RemoteInvokeIterableResponseType:
+    def _execute_lambda_invoke(self, payload: Union[str, IO[bytes]]) -> RemoteInvokeIterableResponseType:
         LOG.debug(
             "Calling lambda_client.invoke with FunctionName:%s, Payload:%s, parameters:%s",
             self._function_name,
@@ -122,7 +134,16 @@ class LambdaInvokeExecutor(AbstractLambdaInvokeExecutor):
             log_result = lambda_response.get(LOG_RESULT)
             if log_result:
                 yield RemoteInvokeLogOutput(base64.b64decode(log_result).decode("utf-8"))
-            yield RemoteInvokeResponse(cast(StreamingBody, lambda_response.get(PAYLOAD)).read().decode("utf-8"))
+            # decode the payload as it is received, a multi-byte character might be split across chunks
+            decoder = codecs.getincrementaldecoder("utf-8")()
+            payload_stream = cast(StreamingBody, lambda_response.get(PAYLOAD))
+            for chunk in payload_stream.iter_chunks(PAYLOAD_READ_CHUNK_SIZE):
+                decoded_chunk = decoder.decode(chunk)
+                if decoded_chunk:
+                    yield RemoteInvokeResponse(decoded_chunk)
+            decoded_chunk = decoder.decode(b"", final=True)
+            if decoded_chunk:
+                yield RemoteInvokeResponse(decoded_chunk)
 
 
 class LambdaInvokeWithResponseStreamExecutor(AbstractLambdaInvokeExecutor):
@@ -130,7 +151,7 @@ class LambdaInvokeWithResponseStreamExecutor(AbstractLambdaInvokeExecutor):
     Calls "invoke_with_response_stream" method of "lambda" service with given input.
     """
 
-    def _execute_lambda_invoke(self, payload: str) -> RemoteInvokeIterableResponseType:
+    def _execute_lambda_invoke(self, payload: Union[str, IO[bytes]]) -> RemoteInvokeIterableResponseType:
         LOG.debug(
             "Calling lambda_client.invoke_with_response_stream with FunctionName:%s, Payload:%s, parameters:%s",
             self._function_name,
@@ -142,10 +163,16 @@ class LambdaInvokeWithResponseStreamExecutor(AbstractLambdaInvokeExecutor):
             yield RemoteInvokeResponse(lambda_response)
         if self._remote_output_format == RemoteInvokeOutputFormat.TEXT:
             event_stream: EventStream = lambda_response.get(EVENT_STREAM, [])
+            decoder = codecs.getincrementaldecoder("utf-8")()
             for event in event_stream:
                 if PAYLOAD_CHUNK in event:
-                    yield RemoteInvokeResponse(event.get(PAYLOAD_CHUNK).get(PAYLOAD).decode("utf-8"))
+                    decoded_chunk = decoder.decode(event.get(PAYLOAD_CHUNK).get(PAYLOAD))
+                    if decoded_chunk:
+                        yield RemoteInvokeResponse(decoded_chunk)
                 if INVOKE_COMPLETE in event:
+                    decoded_chunk = decoder.decode(b"", final=True)
+                    if decoded_chunk:
+                        yield RemoteInvokeResponse(decoded_chunk)
                     if LOG_RESULT in event.get(INVOKE_COMPLETE):
                         yield RemoteInvokeLogOutput(
                             base64.b64decode(event.get(INVOKE_COMPLETE).get(LOG_RESULT)).decode("utf-8")
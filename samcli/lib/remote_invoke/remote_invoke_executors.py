@@ -2,19 +2,27 @@
 Abstract class definitions and generic implementations for remote invoke
 """
 
+import copy
 import json
 import logging
+import threading
+import time
 from abc import ABC, abstractmethod
-from dataclasses import dataclass
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass, field
 from enum import Enum
 from io import TextIOWrapper
 from pathlib import Path
-from typing import Any, Callable, Generic, Iterable, List, Optional, TypeVar, Union, cast
+from typing import Any, Callable, Deque, Generic, Iterable, List, Optional, TypeVar, Union, cast
 
 from typing_extensions import TypeAlias
 
 LOG = logging.getLogger(__name__)
 
+# Default number of events which are invoked at the same time by a batch
+DEFAULT_BATCH_CONCURRENCY = 8
+
 
 @dataclass
 class RemoteInvokeResponse:
@@ -168,6 +176,8 @@ class BotoActionExecutor(ABC):
     If execution throws an exception, it updates the exception information as well
     """
 
+    request_parameters: dict
+
     @abstractmethod
     def _execute_action(self, payload: str) -> RemoteInvokeIterableResponseType:
         """
@@ -213,6 +223,34 @@ class BotoActionExecutor(ABC):
         """
         return self._execute_action(payload_file.read())
 
+    def copy(self) -> "BotoActionExecutor":
+        """
+        Returns a copy of this executor with its own request parameters, which can be executed concurrently with
+        this one. Boto clients are thread-safe, so they are shared by the copies.
+        """
+        executor_copy = copy.copy(self)
+        executor_copy.request_parameters = dict(self.request_parameters)
+        return executor_copy
+
+    def get_batch_parameters(self, parameters: dict, batch_index: int) -> dict:
+        """
+        Returns the boto parameters of the event at the given index of a batch. Executors whose parameters must be
+        unique per call override this, default implementation uses the same parameters for all the events.
+
+        Parameters
+        ----------
+        parameters: dict
+            Boto parameters provided as input
+        batch_index: int
+            Index of the event in the batch
+
+        Returns
+        -------
+        dict
+            Boto parameters of the event
+        """
+        return parameters
+
     def execute(self, remote_invoke_input: RemoteInvokeExecutionInfo) -> RemoteInvokeIterableResponseType:
         """
         Executes boto3 API and updates response or exception object depending on the result
@@ -286,6 +324,89 @@ class RemoteInvokeExecutor:
             if isinstance(remote_invoke_result, RemoteInvokeLogOutput):
                 self._log_consumer.consume(remote_invoke_result)
 
+    def execute_batch(
+        self,
+        remote_invoke_inputs: Iterable[RemoteInvokeExecutionInfo],
+        max_concurrency: int = DEFAULT_BATCH_CONCURRENCY,
+        max_rate: Optional[float] = None,
+    ) -> None:
+        """
+        Executes the given inputs concurrently, each with its own copy of the boto action executor. Outputs of an
+        input are given to the consumers once it is completed, in the order of the inputs, followed by a new line.
+        Inputs are read lazily, at most twice the concurrency of them are kept in memory at the same time.
+
+        A failed input doesn't stop the batch, its error is given to the log consumer, and the first error is raised
+        once all the inputs are completed.
+
+        Parameters
+        ----------
+        remote_invoke_inputs: Iterable[RemoteInvokeExecutionInfo]
+            Inputs to execute
+        max_concurrency: int
+            Max number of inputs which are executed at the same time
+        max_rate: Optional[float]
+            Max number of inputs which are started per second, unlimited if not provided
+        """
+        start_lock = threading.Lock()
+        next_start_time = time.monotonic()
+        pending_outputs: Deque[Future] = deque()
+        consumed_count = 0
+        first_exception: Optional[Exception] = None
+
+        def wait_for_start() -> None:
+            nonlocal next_start_time
+            if not max_rate:
+                return
+            with start_lock:
+                start_time = next_start_time
+                next_start_time = max(start_time, time.monotonic()) + 1 / max_rate
+            time.sleep(max(start_time - time.monotonic(), 0))
+
+        def execute_input(batch_index: int, remote_invoke_input: RemoteInvokeExecutionInfo) -> _BatchOutput:
+            wait_for_start()
+            batch_output = _BatchOutput()
+            boto_action_executor = self._boto_action_executor.copy()
+            remote_invoke_input.parameters = boto_action_executor.get_batch_parameters(
+                remote_invoke_input.parameters, batch_index
+            )
+            remote_invoke_executor = RemoteInvokeExecutor(
+                self._request_mappers, self._response_mappers, boto_action_executor, batch_output, batch_output
+            )
+            try:
+                remote_invoke_executor.execute(remote_invoke_input)
+            except Exception as ex:
+                batch_output.exception = ex
+            return batch_output
+
+        def consume(batch_output: _BatchOutput) -> None:
+            nonlocal consumed_count, first_exception
+            consumed_count += 1
+            for output in batch_output.outputs:
+                if isinstance(output, RemoteInvokeResponse):
+                    self._response_consumer.consume(output)
+                else:
+                    self._log_consumer.consume(output)
+            if batch_output.exception:
+                self._log_consumer.consume(
+                    RemoteInvokeLogOutput(f"Event {consumed_count} failed: {batch_output.exception}\n")
+                )
+                first_exception = first_exception or batch_output.exception
+            else:
+                self._response_consumer.consume(RemoteInvokeResponse("\n"))
+
+        with ThreadPoolExecutor(max_workers=max_concurrency) as executor:
+            for batch_index, remote_invoke_input in enumerate(remote_invoke_inputs):
+                if len(pending_outputs) >= max_concurrency * 2:
+                    consume(pending_outputs.popleft().result())
+                pending_outputs.append(executor.submit(execute_input, batch_index, remote_invoke_input))
+                while pending_outputs and pending_outputs[0].done():
+                    consume(pending_outputs.popleft().result())
+            while pending_outputs:
+                consume(pending_outputs.popleft().result())
+
+        if first_exception:
+            raise first_exception
+
     def _map_input(self, remote_invoke_input: RemoteInvokeExecutionInfo) -> RemoteInvokeExecutionInfo:
         """
         Maps the given input through the request mapper list.
@@ -321,3 +442,16 @@ class RemoteInvokeExecutor:
         for output_mapper in self._response_mappers:
             remote_invoke_output = output_mapper.map(remote_invoke_output)
         return remote_invoke_output
+
+
+@dataclass
+class _BatchOutput(RemoteInvokeConsumer):
+    """
+    Keeps the outputs of an input of a batch until the outputs of the previous inputs are consumed
+    """
+
+    outputs: List[Union[RemoteInvokeResponse, RemoteInvokeLogOutput]] = field(default_factory=list)
+    exception: Optional[Exception] = None
+
+    def consume(self, remote_invoke_response: Union[RemoteInvokeResponse, RemoteInvokeLogOutput]) -> None:
+        self.outputs.append(remote_invoke_response)
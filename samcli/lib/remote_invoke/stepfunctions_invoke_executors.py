@@ -70,8 +70,14 @@ class StepFunctionsStartExecutionExecutor(BotoActionExecutor):
                 self.request_parameters[parameter_key] = parameter_value
 
         if not self.request_parameters.get("name"):
-            current_datetime = datetime.now().strftime("%Y%m%dT%H%M%S")
-            self.request_parameters["name"] = f"sam_remote_invoke_{current_datetime}"
+            self.request_parameters["name"] = _get_default_execution_name()
+
+    def get_batch_parameters(self, parameters: dict, batch_index: int) -> dict:
+        """
+        Execution names must be unique, so the index of the event is appended to the name of each execution of a batch
+        """
+        name = parameters.get("name") or _get_default_execution_name()
+        return {**parameters, "name": f"{name}_{batch_index}"}
 
     def _execute_action(self, payload: str) -> RemoteInvokeIterableResponseType:
         """
@@ -153,3 +159,8 @@ class SfnDescribeExecutionResponseConverter(RemoteInvokeRequestResponseMapper[Re
         if stop_date_field:
             remote_invoke_input.response["stopDate"] = stop_date_field.strftime("%Y-%m-%d %H:%M:%S.%f%z")
         return remote_invoke_input
+
+
+def _get_default_execution_name() -> str:
+    current_datetime = datetime.now().strftime("%Y%m%dT%H%M%S")
+    return f"sam_remote_invoke_{current_datetime}"
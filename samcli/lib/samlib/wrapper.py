@@ -26,6 +26,7 @@ from samtranslator.translator.translator import prepare_plugins
 from samtranslator.validator.validator import SamTemplateValidator
 
 from samcli.commands.validate.lib.exceptions import InvalidSamDocumentException
+from samcli.lib.telemetry.tracing import traced
 
 from .local_uri_plugin import SupportLocalUriPlugin
 
@@ -53,6 +54,7 @@ class SamTranslatorWrapper:
         self._sam_template = sam_template
         self._offline_fallback = offline_fallback
 
+    @traced("SamTranslatorWrapper.run_plugins")
     def run_plugins(self, convert_local_uris=True):
         template_copy = self.template
 
@@ -18,7 +18,7 @@ from samcli.lib.providers.provider import Function, LayerVersion, ResourceIdenti
 from samcli.lib.providers.sam_function_provider import SamFunctionProvider
 from samcli.lib.sync.exceptions import MissingPhysicalResourceError, NoLayerVersionsFoundError
 from samcli.lib.sync.flows.function_sync_flow import wait_for_function_update_complete
-from samcli.lib.sync.sync_flow import ApiCallTypes, ResourceAPICall, SyncFlow
+from samcli.lib.sync.sync_flow import ApiCallTypes, ResourceAPICall, SyncFlow, get_build_fingerprint
 from samcli.lib.sync.sync_flow_executor import HELP_TEXT_FOR_SYNC_INFRA
 from samcli.lib.utils.colors import Colored
 from samcli.lib.utils.hash import file_checksum, str_checksum
@@ -263,6 +263,15 @@ class LayerSyncFlow(AbstractLayerSyncFlow):
         LOG.debug("%sCreated artifact ZIP file: %s", self.log_prefix, self._zip_file)
         self._local_sha = file_checksum(cast(str, self._zip_file), hashlib.sha256())
 
+    def _get_local_fingerprint(self) -> Optional[str]:
+        """Fingerprint of the layer build, so the layer is not built again if its inputs didn't change"""
+        if self._application_build_result:
+            # resources are already built, fingerprint wouldn't be computed before the build
+            return None
+        return get_build_fingerprint(
+            self._build_context, self._layer, {"resource": self._get_resource(self._layer_identifier)}
+        )
+
     def _use_prebuilt_resources(self, application_build_result: ApplicationBuildResult) -> None:
         """Uses pre-build artifacts and assigns artifact_folder"""
         self._artifact_folder = application_build_result.artifacts.get(self._layer_identifier)
@@ -16,7 +16,7 @@ from samcli.lib.package.s3_uploader import S3Uploader
 from samcli.lib.package.utils import make_zip_with_lambda_permissions
 from samcli.lib.providers.provider import Stack
 from samcli.lib.sync.flows.function_sync_flow import FunctionSyncFlow, wait_for_function_update_complete
-from samcli.lib.sync.sync_flow import ApiCallTypes, ResourceAPICall
+from samcli.lib.sync.sync_flow import ApiCallTypes, ResourceAPICall, get_build_fingerprint
 from samcli.lib.utils.colors import Colored
 from samcli.lib.utils.hash import file_checksum
 from samcli.lib.utils.osutils import rmtree_if_exists
@@ -99,6 +99,20 @@ class ZipFunctionSyncFlow(FunctionSyncFlow):
         LOG.debug("%sCreated artifact ZIP file: %s", self.log_prefix, self._zip_file)
         self._local_sha = file_checksum(cast(str, self._zip_file), hashlib.sha256())
 
+    def _get_local_fingerprint(self) -> Optional[str]:
+        """Fingerprint of the function build, so the function is not built again if its inputs didn't change"""
+        if self._application_build_result:
+            # resources are already built, fingerprint wouldn't be computed before the build
+            return None
+        return get_build_fingerprint(
+            self._build_context,
+            self._function,
+            {
+                "resource": self._get_resource(self._function_identifier),
+                "combine_dependencies": self._combine_dependencies(),
+            },
+        )
+
     def _use_prebuilt_resources(self, application_build_result: ApplicationBuildResult) -> None:
         """Uses pre-built artifacts and assigns build_graph and artifacts_folder"""
         self._build_graph = application_build_result.build_graph
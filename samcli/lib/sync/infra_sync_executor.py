@@ -4,7 +4,10 @@ InfraSyncExecutor class which runs build, package and deploy contexts
 
 import copy
 import logging
+import os
 import re
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
 from typing import TYPE_CHECKING, Dict, List, Optional, Set, cast
@@ -21,6 +24,7 @@ from samcli.lib.providers.provider import ResourceIdentifier
 from samcli.lib.providers.sam_stack_provider import is_local_path
 from samcli.lib.telemetry.event import EventTracker
 from samcli.lib.utils.boto_utils import get_boto_client_provider_from_session_with_config
+from samcli.lib.utils.hash import dir_checksum, file_checksum, str_checksum
 from samcli.lib.utils.resources import (
     AWS_APIGATEWAY_RESTAPI,
     AWS_APIGATEWAY_V2_API,
@@ -64,6 +68,7 @@ LAMBDA_FUNCTION_REMOVAL_MAP = {
 
 AUTO_INFRA_SYNC_DAYS = 7
 SYNC_FLOW_THRESHOLD = 50
+MAX_CONCURRENT_NESTED_STACK_COMPARISONS = 8
 
 
 class InfraSyncResult:
@@ -129,6 +134,7 @@ class InfraSyncExecutor:
         self._sync_context = sync_context
 
         self._code_sync_resources = set()
+        self._code_sync_resources_lock = threading.Lock()
 
         session = Session(profile_name=self._deploy_context.profile, region_name=self._deploy_context.region)
         self._cfn_client = self._boto_client("cloudformation", session)
@@ -166,8 +172,6 @@ class InfraSyncExecutor:
             Returns information containing whether infra sync executed plus resources to do code sync on
         """
         self._build_context.set_up()
-        self._build_context.run()
-        self._package_context.run()
 
         last_infra_sync_time = self._sync_context.get_latest_infra_sync_time()
         days_since_last_infra_sync = 0
@@ -175,21 +179,40 @@ class InfraSyncExecutor:
             current_time = datetime.utcnow()
             days_since_last_infra_sync = (current_time - last_infra_sync_time).days
 
-        # Will not combine the comparisons in order to save operation cost
         thread_id = uuid4()
-        if self._sync_context.skip_deploy_sync and first_sync and (days_since_last_infra_sync <= AUTO_INFRA_SYNC_DAYS):
+        can_skip_infra_sync = (
+            self._sync_context.skip_deploy_sync and first_sync and (days_since_last_infra_sync <= AUTO_INFRA_SYNC_DAYS)
+        )
+
+        # Nothing changed locally or in the stack since the last infra sync, skip it before building anything
+        local_fingerprint = self._get_local_fingerprint() if can_skip_infra_sync else None
+        if local_fingerprint and self._get_infra_sync_fingerprint(local_fingerprint) == (
+            self._sync_context.get_infra_sync_fingerprint()
+        ):
+            EventTracker.track_event("SyncFlowStart", "SkipInfraSyncExecute", thread_id=thread_id)
+            LOG.info("Template and code haven't been changed since last infra sync, skipping infra sync...")
+            EventTracker.track_event("SyncFlowEnd", "SkipInfraSyncExecute", thread_id=thread_id)
+            return InfraSyncResult(False, set())
+
+        self._build_context.run()
+        self._package_context.run()
+
+        # Will not combine the comparisons in order to save operation cost
+        if can_skip_infra_sync:
             EventTracker.track_event("SyncFlowStart", "SkipInfraSyncExecute", thread_id=thread_id)
             try:
                 if self._auto_skip_infra_sync(
                     self._package_context.output_template_file,
                     self._package_context.template_file,
                     self._deploy_context.stack_name,
-                    self._build_context._parameter_overrides or {},
+                    self._build_context.parameter_overrides or {},
                 ):
                     # We have a threshold on number of sync flows we initiate
                     # If higher than the threshold, we perform infra sync to improve performance
                     if len(self.code_sync_resources) < SYNC_FLOW_THRESHOLD:
                         LOG.info("Template haven't been changed since last deployment, skipping infra sync...")
+                        if local_fingerprint and not self.code_sync_resources:
+                            self._update_infra_sync_fingerprint(local_fingerprint)
                         EventTracker.track_event("SyncFlowEnd", "SkipInfraSyncExecute", thread_id=thread_id)
                         return InfraSyncResult(False, self.code_sync_resources)
                     else:
@@ -215,9 +238,110 @@ an infra sync will be executed for an CloudFormation deployment to improve perfo
 
         # Update latest infra sync time in sync state
         self._sync_context.update_infra_sync_time()
+        if local_fingerprint:
+            self._update_infra_sync_fingerprint(local_fingerprint)
 
         return InfraSyncResult(True)
 
+    def _get_local_fingerprint(self) -> Optional[str]:
+        """
+        Computes a fingerprint of everything that an infra sync deploys from the local project, which are the
+        templates of all the stacks, the code and definition files referenced by their resources, the stack name,
+        the region, the parameter overrides and the build settings which change the built artifacts.
+        Local paths are hashed as they are before the build, so the fingerprint can be computed without building.
+
+        Returns
+        -------
+        Optional[str]
+            Fingerprint of the local project, or None if it can't be computed
+        """
+        try:
+            fingerprint_inputs = [
+                str(self._deploy_context.stack_name),
+                str(self._deploy_context.region),
+                str(sorted((self._build_context.parameter_overrides or {}).items())),
+            ]
+            fingerprint_inputs.extend(self._get_build_settings_fingerprint_inputs())
+            for stack in self._build_context.stacks:
+                fingerprint_inputs.append(f"{stack.stack_path}:{file_checksum(stack.location)}")
+                base_dir = (
+                    self._build_context.base_dir
+                    if self._build_context.use_base_dir
+                    else os.path.dirname(os.path.abspath(stack.location))
+                )
+                for resource_logical_id, resource_dict in stack.resources.items():
+                    for local_path in _get_resource_local_paths(resource_dict):
+                        fingerprint_inputs.append(
+                            f"{stack.stack_path}:{resource_logical_id}:{_path_checksum(base_dir, local_path)}"
+                        )
+        except Exception as ex:
+            LOG.debug("Failed to compute the fingerprint of the local project", exc_info=ex)
+            return None
+        return str_checksum("\n".join(fingerprint_inputs))
+
+    def _get_build_settings_fingerprint_inputs(self) -> List[str]:
+        """
+        Returns the build settings which change the built artifacts without changing the project, like building in
+        a container, the build images or the environment variables of the build containers
+        """
+        build_context = self._build_context
+        build_settings_inputs = [
+            f"use_container:{build_context.use_container}",
+            f"build_images:{sorted((build_context.build_images or {}).items())}",
+            f"container_env_var:{sorted((build_context.container_env_var or {}).items(), key=str)}",
+            f"build_in_source:{build_context.build_in_source}",
+            f"mode:{build_context.mode}",
+            f"create_auto_dependency_layer:{build_context.create_auto_dependency_layer}",
+        ]
+        # the contents of the files are hashed, since they can change between two syncs
+        for setting_name, setting_path in [
+            ("container_env_var_file", build_context.container_env_var_file),
+            ("manifest", build_context.manifest_path_override),
+        ]:
+            setting_checksum = file_checksum(setting_path) if setting_path and os.path.isfile(setting_path) else None
+            build_settings_inputs.append(f"{setting_name}:{setting_path}:{setting_checksum}")
+        return build_settings_inputs
+
+    def _get_infra_sync_fingerprint(self, local_fingerprint: str) -> Optional[str]:
+        """
+        Combines the local fingerprint with the version of the deployed stack, so any deployment which didn't happen
+        through this sync changes the fingerprint as well.
+
+        Parameters
+        ----------
+        local_fingerprint: str
+            Fingerprint of the local project, returned by ``_get_local_fingerprint``
+
+        Returns
+        -------
+        Optional[str]
+            Fingerprint of the local project and the deployed stack, or None if the stack can't be described
+        """
+        try:
+            stacks = self._cfn_client.describe_stacks(StackName=self._deploy_context.stack_name).get("Stacks", [])
+        except ClientError as ex:
+            LOG.debug("Cannot describe stack %s", self._deploy_context.stack_name, exc_info=ex)
+            return None
+        if not stacks:
+            return None
+
+        stack_version = stacks[0].get("LastUpdatedTime") or stacks[0].get("CreationTime")
+        if not stack_version or str(stacks[0].get("StackStatus", "")).endswith("_IN_PROGRESS"):
+            return None
+        return str_checksum(f"{local_fingerprint}:{stack_version}")
+
+    def _update_infra_sync_fingerprint(self, local_fingerprint: str) -> None:
+        """
+        Stores the fingerprint of the local project and the deployed stack, once they are known to be in sync
+        """
+        try:
+            fingerprint = self._get_infra_sync_fingerprint(local_fingerprint)
+        except Exception as ex:
+            LOG.debug("Failed to compute the infra sync fingerprint", exc_info=ex)
+            return
+        if fingerprint:
+            self._sync_context.update_infra_sync_fingerprint(fingerprint)
+
     def _auto_skip_infra_sync(
         self,
         packaged_template_path: str,
@@ -282,7 +406,7 @@ an infra sync will be executed for an CloudFormation deployment to improve perfo
         if not self._param_overrides_subset_of_stack_params(stack_name, parameter_overrides):
             return False
 
-        # The recursive template check for Nested stacks
+        nested_stack_logical_ids = []
         for resource_logical_id in current_template.get("Resources", {}):
             resource_dict = current_template.get("Resources", {}).get(resource_logical_id, {})
             resource_type = resource_dict.get("Type")
@@ -295,58 +419,129 @@ an infra sync will be executed for an CloudFormation deployment to improve perfo
                     if not resource_dict.get("Properties", {}).get("Code", None) == last_resource_dict.get(
                         "Properties", {}
                     ).get("Code", None):
-                        self._code_sync_resources.add(ResourceIdentifier(resource_resolved_id))
+                        self._add_code_sync_resource(ResourceIdentifier(resource_resolved_id))
                 else:
                     for field in GENERAL_REMOVAL_MAP.get(resource_type, []):
                         if not resource_dict.get("Properties", {}).get(field, None) == last_resource_dict.get(
                             "Properties", {}
                         ).get(field, None):
-                            self._code_sync_resources.add(ResourceIdentifier(resource_resolved_id))
+                            self._add_code_sync_resource(ResourceIdentifier(resource_resolved_id))
 
             if resource_type in SYNCABLE_STACK_RESOURCES:
-                try:
-                    stack_resource_detail = self._cfn_client.describe_stack_resource(
-                        StackName=stack_name, LogicalResourceId=resource_logical_id
-                    )
-                except ClientError as ex:
-                    LOG.debug(
-                        "Cannot get resource detail with name %s on CloudFormation", resource_logical_id, exc_info=ex
-                    )
-                    return False
-
-                # If the nested stack is of type AWS::CloudFormation::Stack,
-                # The template location will be under TemplateURL property
-                # If the nested stack is of type AWS::Serverless::Application,
-                # the template location will be under Location property
-                template_field = "TemplateURL" if resource_type == AWS_CLOUDFORMATION_STACK else "Location"
-                template_location = resource_dict.get("Properties", {}).get(template_field)
-
-                # For AWS::Serverless::Application, location can be a ApplicationLocationObject dict containing SAR ID
-                if isinstance(template_location, dict):
-                    continue
-                # For other scenarios, template location will be a string (local or s3 URL)
-                nested_template_location = (
-                    current_built_template.get("Resources", {})
-                    .get(resource_logical_id, {})
-                    .get("Properties", {})
-                    .get(template_field)
+                nested_stack_logical_ids.append(resource_logical_id)
+
+        if len(nested_stack_logical_ids) <= 1:
+            return all(
+                self._auto_skip_nested_stack_infra_sync(
+                    resource_logical_id,
+                    current_template,
+                    current_built_template,
+                    built_template_path,
+                    stack_name,
+                    nested_prefix,
                 )
-                if is_local_path(nested_template_location):
-                    nested_template_location = str(Path(built_template_path).parent.joinpath(nested_template_location))
-                if not self._auto_skip_infra_sync(
-                    resource_dict.get("Properties", {}).get(template_field),
-                    nested_template_location,
-                    stack_resource_detail.get("StackResourceDetail", {}).get("PhysicalResourceId", ""),
-                    parameter_overrides={},  # Do not pass the same parameter overrides to the nested stack
-                    nested_prefix=(
-                        nested_prefix + resource_logical_id + "/" if nested_prefix else resource_logical_id + "/"
-                    ),
-                ):
-                    return False
+                for resource_logical_id in nested_stack_logical_ids
+            )
+
+        # The recursive template checks of the nested stacks are independent, they wait for CloudFormation and S3
+        # concurrently
+        with ThreadPoolExecutor(
+            max_workers=min(MAX_CONCURRENT_NESTED_STACK_COMPARISONS, len(nested_stack_logical_ids))
+        ) as executor:
+            nested_stack_comparisons = [
+                executor.submit(
+                    self._auto_skip_nested_stack_infra_sync,
+                    resource_logical_id,
+                    current_template,
+                    current_built_template,
+                    built_template_path,
+                    stack_name,
+                    nested_prefix,
+                )
+                for resource_logical_id in nested_stack_logical_ids
+            ]
+            if not all(nested_stack_comparison.result() for nested_stack_comparison in nested_stack_comparisons):
+                return False
 
         LOG.debug("There are no changes from the previously deployed template for %s", packaged_template_path)
         return True
 
+    def _auto_skip_nested_stack_infra_sync(
+        self,
+        resource_logical_id: str,
+        current_template: Dict,
+        current_built_template: Dict,
+        built_template_path: str,
+        stack_name: str,
+        nested_prefix: Optional[str],
+    ) -> bool:
+        """
+        Recursively compares the template of a nested stack with its deployed one
+
+        Parameters
+        ----------
+        resource_logical_id : str
+            Logical ID of the nested stack resource in its parent template
+        current_template : Dict
+            The packaged template of the parent stack
+        current_built_template : Dict
+            The built template of the parent stack
+        built_template_path : str
+            The template location of the parent template built
+        stack_name : str
+            The CloudFormation stack name that the parent template is deployed to
+        nested_prefix: Optional[str]
+            The nested stack stack name tree of the parent stack
+
+        Returns
+        -------
+        bool
+            Returns True if no template changes from last deployment
+            Returns False if there are template differences
+        """
+        resource_dict = current_template.get("Resources", {}).get(resource_logical_id, {})
+        resource_type = resource_dict.get("Type")
+
+        try:
+            stack_resource_detail = self._cfn_client.describe_stack_resource(
+                StackName=stack_name, LogicalResourceId=resource_logical_id
+            )
+        except ClientError as ex:
+            LOG.debug("Cannot get resource detail with name %s on CloudFormation", resource_logical_id, exc_info=ex)
+            return False
+
+        # If the nested stack is of type AWS::CloudFormation::Stack,
+        # The template location will be under TemplateURL property
+        # If the nested stack is of type AWS::Serverless::Application,
+        # the template location will be under Location property
+        template_field = "TemplateURL" if resource_type == AWS_CLOUDFORMATION_STACK else "Location"
+        template_location = resource_dict.get("Properties", {}).get(template_field)
+
+        # For AWS::Serverless::Application, location can be a ApplicationLocationObject dict containing SAR ID
+        if isinstance(template_location, dict):
+            return True
+        # For other scenarios, template location will be a string (local or s3 URL)
+        nested_template_location = (
+            current_built_template.get("Resources", {})
+            .get(resource_logical_id, {})
+            .get("Properties", {})
+            .get(template_field)
+        )
+        if is_local_path(nested_template_location):
+            nested_template_location = str(Path(built_template_path).parent.joinpath(nested_template_location))
+        return self._auto_skip_infra_sync(
+            template_location,
+            nested_template_location,
+            stack_resource_detail.get("StackResourceDetail", {}).get("PhysicalResourceId", ""),
+            parameter_overrides={},  # Do not pass the same parameter overrides to the nested stack
+            nested_prefix=(nested_prefix + resource_logical_id + "/" if nested_prefix else resource_logical_id + "/"),
+        )
+
+    def _add_code_sync_resource(self, resource_identifier: ResourceIdentifier) -> None:
+        # nested stacks are compared concurrently
+        with self._code_sync_resources_lock:
+            self._code_sync_resources.add(resource_identifier)
+
     def _sanitize_template(
         self,
         template_dict: Dict,
@@ -614,3 +809,28 @@ an infra sync will be executed for an CloudFormation deployment to improve perfo
     def code_sync_resources(self) -> Set[ResourceIdentifier]:
         """Returns the list of resources that should trigger code sync"""
         return self._code_sync_resources
+
+
+def _get_resource_local_paths(resource_dict: Dict) -> List[str]:
+    """
+    Returns the local paths referenced by the given resource, for the properties which are replaced by the
+    packaged artifacts during an infra sync, and for the docker context of the image functions
+    """
+    resource_type = str(resource_dict.get("Type"))
+    properties = resource_dict.get("Properties") or {}
+    values = [properties.get(field) for field in GENERAL_REMOVAL_MAP.get(resource_type, [])]
+    if resource_type == AWS_LAMBDA_FUNCTION:
+        values.append(properties.get("Code"))
+    metadata = resource_dict.get("Metadata") or {}
+    values.append(metadata.get("DockerContext"))
+    return [value for value in values if isinstance(value, str) and is_local_path(value)]
+
+
+def _path_checksum(base_dir: str, local_path: str) -> str:
+    path = os.path.normpath(os.path.join(base_dir, local_path))
+    if os.path.isdir(path):
+        return dir_checksum(path, followlinks=True)
+    if os.path.isfile(path):
+        return file_checksum(path)
+    # the build fails with a missing path anyway, the fingerprint only needs to be different from an existing one
+    return f"missing:{path}"
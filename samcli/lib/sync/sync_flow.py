@@ -1,19 +1,25 @@
 """SyncFlow base class """
 
+import json
 import logging
+import os
+import re
 from abc import ABC, abstractmethod
 from enum import Enum
 from os import environ
 from pathlib import Path
 from threading import Lock
-from typing import TYPE_CHECKING, Any, Dict, List, NamedTuple, Optional, Set, cast
-
-from boto3.session import Session
+from typing import TYPE_CHECKING, Any, Dict, List, NamedTuple, Optional, Set, Union, cast
 
+from samcli.commands.local.lib.exceptions import OverridesNotWellDefinedError
 from samcli.lib.build.app_builder import ApplicationBuildResult
-from samcli.lib.providers.provider import ResourceIdentifier, Stack, get_resource_by_id
+from samcli.lib.build.utils import _make_env_vars
+from samcli.lib.build.workflows import ALL_CONFIGS
+from samcli.lib.providers.provider import Function, LayerVersion, ResourceIdentifier, Stack, get_resource_by_id
 from samcli.lib.sync.exceptions import MissingLockException, MissingPhysicalResourceError
-from samcli.lib.utils.boto_utils import get_boto_client_provider_from_session_with_config
+from samcli.lib.telemetry.tracing import span
+from samcli.lib.utils.boto_utils import get_boto_client_provider_with_config
+from samcli.lib.utils.hash import dir_checksum, file_checksum, str_checksum
 from samcli.lib.utils.lock_distributor import LockChain, LockDistributor
 from samcli.lib.utils.resources import RESOURCES_WITH_LOCAL_PATHS
 
@@ -59,12 +65,14 @@ class SyncFlow(ABC):
     _deploy_context: "DeployContext"
     _sync_context: "SyncContext"
     _stacks: Optional[List[Stack]]
-    _session: Optional[Session]
     _physical_id_mapping: Dict[str, str]
     _locks: Optional[Dict[str, Lock]]
     # Local hash represents the state of a particular sync flow
     # We store the hash value in sync state toml file as value
     _local_sha: Optional[str]
+    # Local fingerprint represents the inputs of a particular sync flow, and it is known before gathering resources
+    # We store it next to the local hash, so unchanged inputs skip gathering resources on the next run
+    _local_fingerprint: Optional[str]
     _application_build_result: Optional[ApplicationBuildResult]
 
     def __init__(
@@ -100,31 +108,29 @@ class SyncFlow(ABC):
         self._sync_context = sync_context
         self._log_name = log_name
         self._stacks = stacks
-        self._session = None
         self._physical_id_mapping = physical_id_mapping
         self._locks = None
         self._local_sha = None
+        self._local_fingerprint = None
         self._application_build_result = application_build_result
 
     def set_up(self) -> None:
         """Clients and other expensives setups should be handled here instead of constructor"""
         pass
 
-    def _get_session(self) -> Session:
-        if not self._session:
-            self._session = Session(profile_name=self._deploy_context.profile, region_name=self._deploy_context.region)
-        return self._session
-
     def _boto_client(self, client_name: str):
+        # clients are cached process-wide per region and profile, so all the flows share them
         default_retry_config = get_default_retry_config()
         if not default_retry_config:
             LOG.debug("Creating boto client (%s) with user's retry config", client_name)
-            return get_boto_client_provider_from_session_with_config(self._get_session())(client_name)
+            return get_boto_client_provider_with_config(
+                region=self._deploy_context.region, profile=self._deploy_context.profile
+            )(client_name)
 
         LOG.debug("Creating boto client (%s) with default retry config", client_name)
-        return get_boto_client_provider_from_session_with_config(self._get_session(), retries=default_retry_config)(
-            client_name
-        )
+        return get_boto_client_provider_with_config(
+            region=self._deploy_context.region, profile=self._deploy_context.profile, retries=default_retry_config
+        )(client_name)
 
     @property
     @abstractmethod
@@ -148,7 +154,49 @@ class SyncFlow(ABC):
             LOG.debug("%sNo local hash is configured, skipping to update local hash", self.log_prefix)
             return
 
-        self._sync_context.update_resource_sync_state(self.sync_state_identifier, self._local_sha)
+        self._sync_context.update_resource_sync_state(
+            self.sync_state_identifier, self._local_sha, self._local_fingerprint
+        )
+
+    def _get_local_fingerprint(self) -> Optional[str]:
+        """Fingerprint of all the local inputs of gather_resources, which can be computed without running it.
+        Sync flows whose gather_resources is expensive override this, so unchanged resources are not built again.
+
+        Returns
+        -------
+        Optional[str]
+            Fingerprint of the local inputs, or None if resources must always be gathered
+        """
+        return None
+
+    def _update_local_fingerprint(self) -> None:
+        """Stores the local fingerprint next to the stored hash, once the local hash is known to match it"""
+        if not self._local_fingerprint:
+            return
+
+        self._sync_context.update_resource_sync_fingerprint(self.sync_state_identifier, self._local_fingerprint)
+
+    def compare_local_fingerprint(self) -> bool:
+        """Comparison between the local fingerprint and the one stored with the hash of the last sync,
+        before gathering resources. If they are identical, the local hash would be identical as well,
+        so gathering resources, sync and gather dependencies will be skipped.
+
+        Returns
+        -------
+        bool
+            Return True if the inputs of the resource didn't change since the last sync. Skipping rest of the execution.
+            Return False otherwise.
+        """
+        if not self._local_fingerprint:
+            return False
+        stored_fingerprint = self._sync_context.get_resource_latest_sync_fingerprint(self.sync_state_identifier)
+        LOG.debug(
+            "%sLocal fingerprint: %s Stored fingerprint: %s",
+            self.log_prefix,
+            self._local_fingerprint,
+            stored_fingerprint,
+        )
+        return self._local_fingerprint == stored_fingerprint
 
     def compare_local(self) -> bool:
         """Comparison between local resource and its local stored state.
@@ -370,6 +418,7 @@ class SyncFlow(ABC):
 
     def execute(self) -> List["SyncFlow"]:
         """Execute the sync flow and returns a list of dependent sync flows.
+        Skips gather_resources() as well if compare_local_fingerprint() is True
         Skips sync() and gather_dependencies() if compare() is True
 
         Returns
@@ -377,23 +426,42 @@ class SyncFlow(ABC):
         List[SyncFlow]
             A list of dependent sync flows
         """
-        dependencies: List["SyncFlow"] = list()
-        LOG.debug("%sSetting Up", self.log_prefix)
-        self.set_up()
-        LOG.debug("%sGathering Resources", self.log_prefix)
-        self.gather_resources()
-        LOG.debug("%sComparing with Remote", self.log_prefix)
-        if (not self.compare_local()) and (not self.compare_remote()):
-            LOG.debug("%sSyncing", self.log_prefix)
-            self.sync()
-            LOG.debug("%sUpdating local hash of the sync flow", self.log_prefix)
-            self._update_local_hash()
-            LOG.debug("%sGathering Dependencies", self.log_prefix)
-            dependencies = self.gather_dependencies()
-        else:
-            LOG.info("%sSkipping resource update as the content didn't change", self.log_prefix)
-        LOG.debug("%sFinished", self.log_prefix)
-        return dependencies
+        with span("SyncFlow.execute", flow=self.log_name):
+            dependencies: List["SyncFlow"] = list()
+            LOG.debug("%sSetting Up", self.log_prefix)
+            with span("SyncFlow.set_up"):
+                self.set_up()
+            LOG.debug("%sComparing local fingerprint", self.log_prefix)
+            with span("SyncFlow.compare_local_fingerprint"):
+                self._local_fingerprint = self._get_local_fingerprint()
+                is_fingerprint_unchanged = self.compare_local_fingerprint()
+            if is_fingerprint_unchanged:
+                LOG.info("%sSkipping resource update as the content didn't change", self.log_prefix)
+                LOG.debug("%sFinished", self.log_prefix)
+                return dependencies
+            LOG.debug("%sGathering Resources", self.log_prefix)
+            with span("SyncFlow.gather_resources"):
+                self.gather_resources()
+            LOG.debug("%sComparing with Remote", self.log_prefix)
+            with span("SyncFlow.compare"):
+                is_local_unchanged = self.compare_local()
+                is_remote_unchanged = not is_local_unchanged and self.compare_remote()
+            if is_local_unchanged:
+                LOG.info("%sSkipping resource update as the content didn't change", self.log_prefix)
+                self._update_local_fingerprint()
+            elif not is_remote_unchanged:
+                LOG.debug("%sSyncing", self.log_prefix)
+                with span("SyncFlow.sync"):
+                    self.sync()
+                LOG.debug("%sUpdating local hash of the sync flow", self.log_prefix)
+                self._update_local_hash()
+                LOG.debug("%sGathering Dependencies", self.log_prefix)
+                with span("SyncFlow.gather_dependencies"):
+                    dependencies = self.gather_dependencies()
+            else:
+                LOG.info("%sSkipping resource update as the content didn't change", self.log_prefix)
+            LOG.debug("%sFinished", self.log_prefix)
+            return dependencies
 
 
 def get_definition_path(
@@ -438,3 +506,112 @@ def get_definition_path(
             if child_stack:
                 definition_path = Path(child_stack.location).parent.joinpath(definition_file)
     return definition_path
+
+
+# build methods which can use any file of the project, not only the ones of the source tree
+BUILD_METHODS_WITH_EXTERNAL_INPUTS = {"makefile", "esbuild"}
+MANIFEST_NAMES = {config.manifest_name for config in ALL_CONFIGS}
+# a manifest path starting from a parent dir, e.g. "-e ../lib" or "file:../shared"
+PARENT_DIR_REFERENCE = re.compile(r"\.\.[/\\]")
+
+
+def get_build_fingerprint(
+    build_context: "BuildContext", resource: Union[Function, LayerVersion], build_parameters: Dict[str, Any]
+) -> Optional[str]:
+    """
+    A helper method used by sync flows which build a function or a layer to compute the fingerprint of its build,
+    without building it. The fingerprint is made of the digest of the source tree, the hash of the overridden manifest,
+    the build parameters and the container settings, so it changes whenever the build output can change.
+    There is no fingerprint if the build can use files outside of the source tree, e.g. with a Makefile, an esbuild
+    bundle or a manifest referencing a parent dir, since their changes wouldn't change the fingerprint.
+
+    Parameters
+    -------
+    build_context: BuildContext
+        BuildContext used for build related parameters
+    resource: Union[Function, LayerVersion]
+        Function or layer to be built
+    build_parameters: Dict[str, Any]
+        Parameters of the function or the layer which change the build output, must be JSON serializable
+
+    Returns
+    -------
+    Optional[str]
+        Fingerprint of the build, or None if it can't be computed
+    """
+    if not isinstance(resource.codeuri, str):
+        return None
+
+    build_method = (
+        resource.build_method if isinstance(resource, LayerVersion) else (resource.metadata or {}).get("BuildMethod")
+    )
+    if build_method in BUILD_METHODS_WITH_EXTERNAL_INPUTS:
+        LOG.debug("Build of %s can use files outside of its source, skipping its fingerprint", resource.full_path)
+        return None
+
+    source_path = os.path.normpath(os.path.join(build_context.base_dir, resource.codeuri))
+    manifest_path = build_context.manifest_path_override
+    try:
+        if _has_parent_dir_reference(source_path, manifest_path):
+            LOG.debug("Manifest of %s references a parent dir, skipping its fingerprint", resource.full_path)
+            return None
+        if os.path.isdir(source_path):
+            # build outputs change on every build, they must not change the fingerprint of a source tree containing them
+            ignore_list = [
+                _get_top_level_name(output_dir, source_path)
+                for output_dir in (build_context.build_dir, build_context.cache_dir)
+            ]
+            source_checksum = dir_checksum(
+                source_path, followlinks=True, ignore_list=[name for name in ignore_list if name]
+            )
+        else:
+            source_checksum = file_checksum(source_path)
+        fingerprint_inputs = {
+            "source": source_checksum,
+            "manifest": file_checksum(manifest_path) if manifest_path else None,
+            "mode": build_context.mode,
+            "use_container": build_context.use_container,
+            "build_in_source": build_context.build_in_source,
+            "build_parameters": build_parameters,
+        }
+        if build_context.use_container:
+            build_images = build_context.build_images or {}
+            fingerprint_inputs["build_image"] = build_images.get(resource.name, build_images.get(None))
+            fingerprint_inputs["container_env_vars"] = _get_container_env_vars(build_context, resource)
+    except (OSError, ValueError, OverridesNotWellDefinedError) as ex:
+        LOG.debug("Failed to compute the build fingerprint of %s", source_path, exc_info=ex)
+        return None
+    return str_checksum(json.dumps(fingerprint_inputs, sort_keys=True, default=str))
+
+
+def _has_parent_dir_reference(source_path: str, manifest_path: Optional[str]) -> bool:
+    """Returns whether the manifest or one of the manifests at the top of the source tree references a parent dir"""
+    manifest_paths = [manifest_path] if manifest_path else []
+    if os.path.isdir(source_path):
+        manifest_paths += [
+            os.path.join(source_path, name)
+            for name in os.listdir(source_path)
+            if name in MANIFEST_NAMES or name.endswith(".csproj")
+        ]
+    for path in manifest_paths:
+        with open(path, "r", encoding="utf-8", errors="replace") as manifest:
+            if PARENT_DIR_REFERENCE.search(manifest.read()):
+                return True
+    return False
+
+
+def _get_container_env_vars(build_context: "BuildContext", resource: Union[Function, LayerVersion]) -> Dict:
+    """Returns the environment variables of the build container of the resource, the same way the build does"""
+    file_env_vars = {}
+    if build_context.container_env_var_file:
+        with open(build_context.container_env_var_file, "r", encoding="utf-8") as env_vars_file:
+            file_env_vars = json.load(env_vars_file)
+    return _make_env_vars(resource, file_env_vars, build_context.container_env_var)
+
+
+def _get_top_level_name(path: str, parent_path: str) -> Optional[str]:
+    """Returns the name of the directory of parent_path which contains path, or None if path is not inside it"""
+    relative_path = os.path.relpath(os.path.abspath(path), os.path.abspath(parent_path))
+    if relative_path in (os.curdir, os.pardir) or relative_path.startswith(os.pardir + os.sep):
+        return None
+    return relative_path.split(os.sep)[0]
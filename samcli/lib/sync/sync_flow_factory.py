@@ -138,6 +138,7 @@ class SyncFlowFactory(ResourceTypeBasedFactory[SyncFlow]):  # pylint: disable=E1
                 boto_resource_provider=resource_provider,
                 boto_client_provider=client_provider,
                 stack_name=self._deploy_context.stack_name,
+                use_cache=True,
             )
         except ClientError as ex:
             error_code = get_client_error_code(ex)
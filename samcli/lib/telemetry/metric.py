@@ -28,6 +28,7 @@ from samcli.lib.telemetry.cicd import CICDDetector, CICDPlatform
 from samcli.lib.telemetry.event import EventTracker
 from samcli.lib.telemetry.project_metadata import get_git_remote_origin_url, get_initial_commit_hash, get_project_name
 from samcli.lib.telemetry.telemetry import Telemetry
+from samcli.lib.telemetry.tracing import span
 from samcli.lib.telemetry.user_agent import get_user_agent_string
 from samcli.lib.warnings.sam_cli_warning import TemplateWarningsChecker
 
@@ -147,7 +148,8 @@ def track_command(func):
 
             # Execute the function and capture return value. This is returned by the wrapper
             # First argument of all commands should be the Context
-            return_value = func(*args, **kwargs)
+            with span(ctx.command_path if ctx else func.__name__):
+                return_value = func(*args, **kwargs)
         except (
             UserException,
             click.Abort,
@@ -0,0 +1,158 @@
+"""
+Profiles a command with cProfile, and samples the stacks of its threads to draw flame graphs. The profile is only
+captured with --profile-output, and it covers the threads started by the command, like the ones handling the
+requests of start-api.
+"""
+
+import cProfile
+import io
+import pstats
+import sys
+import threading
+from types import FrameType
+from typing import Dict, List, Optional
+
+# from Python 3.12, a profiler sees the calls of all the threads, and a single one can be enabled at a time
+PROFILER_SEES_ALL_THREADS = sys.version_info >= (3, 12)
+
+DEFAULT_SAMPLING_INTERVAL = 0.005
+
+COLLAPSED_STACKS_EXTENSION = ".collapsed"
+
+
+class StackSampler:
+    """
+    Periodically samples the stacks of all the threads, and counts how many times each stack was seen. Stacks are
+    written in the collapsed format of flamegraph.pl, which is also read by speedscope.
+    """
+
+    def __init__(self, interval: float = DEFAULT_SAMPLING_INTERVAL) -> None:
+        """
+        Parameters
+        ----------
+        interval: float
+            Seconds between two samples
+        """
+        self._interval = interval
+        self._stop_event = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self.stack_counts: Dict[str, int] = {}
+
+    def start(self) -> None:
+        self._thread = threading.Thread(target=self._run, name="StackSampler", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stop_event.set()
+        if self._thread:
+            self._thread.join()
+
+    def sample(self) -> None:
+        """
+        Samples the stacks of all the threads but the sampling one
+        """
+        thread_names = {thread.ident: thread.name for thread in threading.enumerate()}
+        sampling_thread_id = threading.get_ident()
+        for thread_id, frame in sys._current_frames().items():  # pylint: disable=protected-access
+            if thread_id == sampling_thread_id:
+                continue
+            frames: List[str] = []
+            current_frame: Optional[FrameType] = frame
+            while current_frame is not None:
+                code = current_frame.f_code
+                frames.append(f"{code.co_name} ({code.co_filename}:{code.co_firstlineno})")
+                current_frame = current_frame.f_back
+            frames.append(thread_names.get(thread_id, str(thread_id)))
+            # semicolons separate the frames of collapsed stacks
+            stack = ";".join(reversed(frames)).replace("\n", " ")
+            self.stack_counts[stack] = self.stack_counts.get(stack, 0) + 1
+
+    def write_collapsed_stacks(self, path: str) -> None:
+        with open(path, "w", encoding="utf-8") as collapsed_file:
+            for stack, count in sorted(self.stack_counts.items()):
+                collapsed_file.write(f"{stack} {count}\n")
+
+    def _run(self) -> None:
+        while not self._stop_event.wait(self._interval):
+            self.sample()
+
+
+class CommandProfiler:
+    """
+    Profiles the calling thread and the threads it starts, until it is stopped
+    """
+
+    def __init__(self, sampling_interval: float = DEFAULT_SAMPLING_INTERVAL) -> None:
+        self._lock = threading.Lock()
+        self._profiles: List[cProfile.Profile] = []
+        self._stopped = False
+        self._sampler = StackSampler(sampling_interval)
+
+    def start(self) -> None:
+        # the sampling thread is started first, to keep it out of the profile
+        self._sampler.start()
+        self._enable_profile()
+        if not PROFILER_SEES_ALL_THREADS:
+            threading.setprofile(self._profile_new_thread)
+
+    def stop(self) -> None:
+        """
+        Stops profiling the calling thread and sampling stacks, threads started from now on are not profiled
+        """
+        threading.setprofile(None)  # type: ignore
+        with self._lock:
+            self._stopped = True
+        # disabling a profiler only stops it in the calling thread, the profilers of other threads stop collecting
+        # stats once they are read
+        self._profiles[0].disable()
+        self._sampler.stop()
+
+    def get_stats(self) -> pstats.Stats:
+        """
+        Returns the stats of all the profiled threads
+        """
+        with self._lock:
+            profiles = list(self._profiles)
+        stats = pstats.Stats(profiles[0])
+        for profile in profiles[1:]:
+            stats.add(profile)
+        return stats
+
+    def write(self, path: str, top_count: int = 20) -> str:
+        """
+        Writes the stats of the profile to the given path, which can be read with pstats, and the collapsed stacks
+        next to it, with the .collapsed extension
+
+        Parameters
+        ----------
+        path: str
+            Path of the stats file
+        top_count: int
+            Number of functions to report
+
+        Returns
+        -------
+        str
+            Report of the functions which took the most time, not counting the functions they called
+        """
+        stats = self.get_stats()
+        stats.dump_stats(path)
+        self._sampler.write_collapsed_stacks(path + COLLAPSED_STACKS_EXTENSION)
+
+        report = io.StringIO()
+        stats.stream = report  # type: ignore
+        stats.strip_dirs().sort_stats(pstats.SortKey.TIME).print_stats(top_count)
+        return report.getvalue()
+
+    def _enable_profile(self) -> None:
+        profile = cProfile.Profile()
+        with self._lock:
+            if self._stopped:
+                return
+            self._profiles.append(profile)
+        profile.enable()
+
+    def _profile_new_thread(self, frame, event, arg):
+        # called on the first call of each new thread, the profiler of the thread then replaces this function
+        sys.setprofile(None)
+        self._enable_profile()
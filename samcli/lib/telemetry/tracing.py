@@ -0,0 +1,209 @@
+"""
+Spans timing the phases of a command, like the build of a function or the upload of an artifact. Spans are recorded
+only while tracing is enabled with --trace-file, and they are written as a Chrome trace, which can be opened with
+chrome://tracing or https://ui.perfetto.dev
+"""
+
+import itertools
+import json
+import logging
+import os
+import threading
+import time
+from contextlib import contextmanager, nullcontext
+from functools import wraps
+from typing import Any, Callable, ContextManager, Dict, Iterator, List, NamedTuple, Optional, TypeVar, cast
+
+LOG = logging.getLogger(__name__)
+
+_Function = TypeVar("_Function", bound=Callable[..., Any])
+
+
+class SpanRecord(NamedTuple):
+    name: str
+    span_id: int
+    # span which was open in the same thread when this one started, if any
+    parent_id: Optional[int]
+    # seconds since the epoch
+    start: float
+    # seconds
+    duration: float
+    thread_id: int
+    thread_name: str
+    attributes: Dict[str, Any]
+
+
+class Tracer:
+    """
+    Records the spans of all the threads of the process
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._span_ids = itertools.count(1)
+        self._open_spans = threading.local()
+        # spans are timed with the performance counter, and placed on the wall clock relative to these origins
+        self._origin_time = time.time()
+        self._origin_counter = time.perf_counter()
+        self.spans: List[SpanRecord] = []
+
+    @contextmanager
+    def span(self, name: str, attributes: Dict[str, Any]) -> Iterator[None]:
+        open_span_ids = self._get_open_span_ids()
+        span_id = next(self._span_ids)
+        parent_id = open_span_ids[-1] if open_span_ids else None
+        open_span_ids.append(span_id)
+        start = time.perf_counter()
+        try:
+            yield
+        except BaseException as ex:
+            attributes = dict(attributes, error=type(ex).__name__)
+            raise
+        finally:
+            duration = time.perf_counter() - start
+            open_span_ids.pop()
+            thread = threading.current_thread()
+            record = SpanRecord(
+                name,
+                span_id,
+                parent_id,
+                self._origin_time + start - self._origin_counter,
+                duration,
+                thread.ident or 0,
+                thread.name,
+                attributes,
+            )
+            with self._lock:
+                self.spans.append(record)
+
+    def to_chrome_trace(self) -> Dict[str, Any]:
+        """
+        Returns the spans in the Chrome trace event format, as complete events nested by thread
+        """
+        process_id = os.getpid()
+        with self._lock:
+            spans = sorted(self.spans, key=lambda span: span.start)
+
+        trace_events: List[Dict[str, Any]] = []
+        thread_names: Dict[int, str] = {}
+        for span in spans:
+            thread_names.setdefault(span.thread_id, span.thread_name)
+            trace_events.append(
+                {
+                    "name": span.name,
+                    "cat": "samcli",
+                    "ph": "X",
+                    "ts": int(span.start * 1_000_000),
+                    "dur": int(span.duration * 1_000_000),
+                    "pid": process_id,
+                    "tid": span.thread_id,
+                    "args": dict(
+                        {key: _to_json_value(value) for key, value in span.attributes.items()},
+                        span_id=span.span_id,
+                        parent_id=span.parent_id,
+                    ),
+                }
+            )
+        trace_events.extend(
+            {"name": "thread_name", "ph": "M", "pid": process_id, "tid": thread_id, "args": {"name": thread_name}}
+            for thread_id, thread_name in thread_names.items()
+        )
+        return {"traceEvents": trace_events, "displayTimeUnit": "ms"}
+
+    def write_chrome_trace(self, path: str) -> None:
+        with open(path, "w", encoding="utf-8") as trace_file:
+            json.dump(self.to_chrome_trace(), trace_file)
+
+    def _get_open_span_ids(self) -> List[int]:
+        open_span_ids: Optional[List[int]] = getattr(self._open_spans, "ids", None)
+        if open_span_ids is None:
+            open_span_ids = []
+            self._open_spans.ids = open_span_ids
+        return open_span_ids
+
+
+class _TracerHolder:
+    """
+    Holds the tracer recording the spans, which is None while tracing is disabled
+    """
+
+    def __init__(self) -> None:
+        self.tracer: Optional[Tracer] = None
+
+
+_tracer_holder = _TracerHolder()
+
+_NO_OP_SPAN = nullcontext()
+
+
+def start_tracing() -> Tracer:
+    """
+    Starts recording spans, until ``stop_tracing`` is called
+    """
+    tracer = Tracer()
+    _tracer_holder.tracer = tracer
+    return tracer
+
+
+def stop_tracing() -> Optional[Tracer]:
+    """
+    Stops recording spans, and returns the tracer which recorded them, if tracing was started
+    """
+    tracer, _tracer_holder.tracer = _tracer_holder.tracer, None
+    return tracer
+
+
+def is_tracing_enabled() -> bool:
+    return _tracer_holder.tracer is not None
+
+
+def span(name: str, **attributes: Any) -> ContextManager:
+    """
+    Times the wrapped block as a span, if tracing is enabled. Spans opened in the block are nested in it.
+
+        with span("S3Uploader.upload", key=key):
+            ...
+
+    Parameters
+    ----------
+    name: str
+        Name of the span
+    attributes: Any
+        Attributes of the span, written in the arguments of its trace event
+    """
+    tracer = _tracer_holder.tracer
+    if tracer is None:
+        return _NO_OP_SPAN
+    return tracer.span(name, attributes)
+
+
+def traced(name: Optional[str] = None) -> Callable[[_Function], _Function]:
+    """
+    Decorator timing each call of a function as a span, if tracing is enabled
+
+    Parameters
+    ----------
+    name: Optional[str]
+        Name of the spans, defaults to the qualified name of the function
+    """
+
+    def decorator(func: _Function) -> _Function:
+        span_name = name or func.__qualname__
+
+        @wraps(func)
+        def wrapped(*args, **kwargs):
+            tracer = _tracer_holder.tracer
+            if tracer is None:
+                return func(*args, **kwargs)
+            with tracer.span(span_name, {}):
+                return func(*args, **kwargs)
+
+        return cast(_Function, wrapped)
+
+    return decorator
+
+
+def _to_json_value(value: Any) -> Any:
+    if value is None or isinstance(value, (bool, int, float, str)):
+        return value
+    return str(value)
@@ -0,0 +1,140 @@
+"""
+Loader of the AWS managed policies, which keeps them on disk between the commands
+"""
+
+import json
+import logging
+import os
+import threading
+import time
+from pathlib import Path
+from typing import Dict, Optional, Tuple
+from uuid import uuid4
+
+from botocore.exceptions import BotoCoreError, ClientError
+from samtranslator.translator.arn_generator import ArnGenerator
+from samtranslator.translator.managed_policy_translator import ManagedPolicyLoader
+
+from samcli.cli.global_config import GlobalConfig
+
+LOG = logging.getLogger(__name__)
+
+# Number of seconds the cached managed policies are used without loading them again from IAM
+MANAGED_POLICY_MAP_CACHE_TTL = 24 * 60 * 60
+
+
+def get_managed_policy_map_cache_dir() -> Path:
+    """
+    Returns the directory of the on-disk cache of the managed policies
+    """
+    return GlobalConfig().config_dir / "cache" / "managed-policies"
+
+
+def get_bundled_managed_policy_map(partition: str) -> Dict[str, str]:
+    """
+    Returns the snapshot of the managed policies of the given partition which is bundled with the SAM translator,
+    or an empty map if the translator doesn't bundle them
+    """
+    try:
+        # pylint: disable=import-outside-toplevel
+        from samtranslator.internal.managed_policies import get_bundled_managed_policy_map as get_bundled_map
+    except ImportError:
+        return {}
+    return dict(get_bundled_map(partition) or {})
+
+
+class CachedManagedPolicyLoader(ManagedPolicyLoader):
+    """
+    ManagedPolicyLoader which keeps the managed policy map of each partition on disk, so that IAM is called at most
+    once every MANAGED_POLICY_MAP_CACHE_TTL seconds instead of once per command. An expired map is still used, and it
+    is loaded again from IAM in the background for the next commands. If the managed policies can't be loaded from
+    IAM and they are not cached, the snapshot bundled with the SAM translator is used.
+    """
+
+    def __init__(
+        self,
+        iam_client,
+        cache_dir: Optional[Path] = None,
+        ttl: int = MANAGED_POLICY_MAP_CACHE_TTL,
+    ) -> None:
+        """
+        Parameters
+        ----------
+        iam_client: botocore.client.BaseClient
+            IAM client to load the managed policies with
+        cache_dir: Optional[Path]
+            Directory of the cache, defaults to the one in the SAM CLI config directory
+        ttl: int
+            Number of seconds the cached managed policies are used without loading them again
+        """
+        super().__init__(iam_client)
+        self._cache_dir = cache_dir or get_managed_policy_map_cache_dir()
+        self._ttl = ttl
+        self._cached_policy_map: Optional[Dict[str, str]] = None
+        self._refresh_thread: Optional[threading.Thread] = None
+
+    def load(self) -> Dict[str, str]:
+        if self._cached_policy_map is None:
+            self._cached_policy_map = self._load_policy_map()
+        return self._cached_policy_map
+
+    def _load_policy_map(self) -> Dict[str, str]:
+        partition = ArnGenerator.get_partition_name(self._iam_client.meta.region_name)
+        cache_entry = self._read_cache(partition)
+        if cache_entry:
+            created_at, policy_map = cache_entry
+            if time.time() - created_at > self._ttl:
+                LOG.debug("Cached managed policies of partition %s are expired, refreshing them", partition)
+                # daemon, so that a slow refresh doesn't keep the command from exiting. The cache file is replaced
+                # atomically, an interrupted refresh doesn't leave a partially written cache behind
+                self._refresh_thread = threading.Thread(
+                    target=self._refresh, args=(partition,), name="ManagedPolicyMapRefresh", daemon=True
+                )
+                self._refresh_thread.start()
+            return policy_map
+
+        try:
+            return self._refresh(partition, raise_errors=True)
+        except (BotoCoreError, ClientError) as ex:
+            LOG.debug("Failed to load managed policies from IAM, using the bundled ones", exc_info=ex)
+            return get_bundled_managed_policy_map(partition)
+
+    def _refresh(self, partition: str, raise_errors: bool = False) -> Dict[str, str]:
+        """
+        Loads the managed policies from IAM and caches them
+        """
+        try:
+            # a new loader, so that the refresh in the background doesn't share its state with this one
+            policy_map: Dict[str, str] = dict(ManagedPolicyLoader(self._iam_client).load())
+        except (BotoCoreError, ClientError) as ex:
+            if raise_errors:
+                raise
+            LOG.debug("Failed to refresh cached managed policies of partition %s", partition, exc_info=ex)
+            return {}
+
+        self._write_cache(partition, policy_map)
+        return policy_map
+
+    def _read_cache(self, partition: str) -> Optional[Tuple[float, Dict[str, str]]]:
+        try:
+            with open(self._get_cache_path(partition), "r", encoding="utf-8") as cache_file:
+                cache_entry = json.load(cache_file)
+            return float(cache_entry["created_at"]), dict(cache_entry["policies"])
+        except (OSError, ValueError, TypeError, KeyError):
+            return None
+
+    def _write_cache(self, partition: str, policy_map: Dict[str, str]) -> None:
+        cache_entry = {"partition": partition, "created_at": time.time(), "policies": policy_map}
+        try:
+            self._cache_dir.mkdir(mode=0o700, parents=True, exist_ok=True)
+            # write into a temporary file first, so concurrent readers never see a partial entry
+            cache_path = self._get_cache_path(partition)
+            temp_cache_path = cache_path.with_name(f"{cache_path.name}.{uuid4().hex}")
+            with open(temp_cache_path, "w", encoding="utf-8") as cache_file:
+                json.dump(cache_entry, cache_file)
+            os.replace(temp_cache_path, cache_path)
+        except (OSError, TypeError, ValueError) as ex:
+            LOG.debug("Failed to cache managed policies of partition %s", partition, exc_info=ex)
+
+    def _get_cache_path(self, partition: str) -> Path:
+        return self._cache_dir / f"{partition}.json"
@@ -2,7 +2,9 @@
 This module contains utility functions for boto3 library
 """
 
-from typing import Any, Optional
+import logging
+import threading
+from typing import Any, Dict, Optional, Tuple
 
 from boto3 import Session
 from botocore.config import Config
@@ -12,6 +14,8 @@ from typing_extensions import Protocol
 from samcli import __version__
 from samcli.cli.global_config import GlobalConfig
 
+LOG = logging.getLogger(__name__)
+
 
 def get_boto_config_with_user_agent(**kwargs) -> Config:
     """
@@ -36,22 +40,198 @@ def get_boto_config_with_user_agent(**kwargs) -> Config:
     )
 
 
+class BotoClientCache:
+    """
+    Process-wide cache of boto clients. Creating a boto client loads the service model and costs tens of milliseconds,
+    so clients are created once per session, service, endpoint and configuration, and shared afterwards. Boto clients
+    are thread-safe, and this class is thread-safe as well.
+
+    Boto sessions and resources are not thread-safe. The sessions of the regions and profiles are kept by this class
+    and never handed out, and resources are created while holding its lock, but they are not cached.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._sessions: Dict[Tuple[Optional[str], Optional[str]], Session] = {}
+        # cached clients keep a reference to their session, so the session id can't be reused by another session
+        self._clients: Dict[Tuple[int, str, Optional[str], str], Tuple[Session, Any]] = {}
+        self._created_clients = 0
+
+    @property
+    def created_clients(self) -> int:
+        """
+        Returns the number of clients created since the cache is created or cleared
+        """
+        return self._created_clients
+
+    def load_session(self, region: Optional[str] = None, profile: Optional[str] = None) -> None:
+        """
+        Creates the session of the given region and profile if it doesn't exist yet, so an unknown profile is
+        reported right away instead of when the first client is created
+
+        Parameters
+        ----------
+        region: Optional[str]
+            AWS region name
+        profile: Optional[str]
+            Profile name from credentials
+
+        Raises
+        ------
+        ProfileNotFound
+            If the profile doesn't exist
+        """
+        with self._lock:
+            self._get_session(region, profile)
+
+    def get_client(self, session: Session, service_name: str, endpoint_url: Optional[str] = None, **kwargs) -> Any:
+        """
+        Returns the client of the given service created from the given session, creating it only once per
+        endpoint and configuration
+
+        Parameters
+        ----------
+        session: Session
+            Boto3 session object
+        service_name: str
+            Name of the AWS service
+        endpoint_url: Optional[str]
+            Endpoint to send the requests to, instead of the AWS service endpoint (e.g. a local stand-in)
+        kwargs :
+            Key-value params that will be passed to get_boto_config_with_user_agent
+        """
+        with self._lock:
+            return self._get_client(session, service_name, endpoint_url, **kwargs)
+
+    def get_profile_client(
+        self,
+        region: Optional[str],
+        profile: Optional[str],
+        service_name: str,
+        endpoint_url: Optional[str] = None,
+        **kwargs,
+    ) -> Any:
+        """
+        Returns the client of the given service for the given region and profile, creating it only once per
+        endpoint and configuration
+
+        Parameters
+        ----------
+        region: Optional[str]
+            AWS region name
+        profile: Optional[str]
+            Profile name from credentials
+        service_name: str
+            Name of the AWS service
+        endpoint_url: Optional[str]
+            Endpoint to send the requests to, instead of the AWS service endpoint (e.g. a local stand-in)
+        kwargs :
+            Key-value params that will be passed to get_boto_config_with_user_agent
+        """
+        with self._lock:
+            return self._get_client(self._get_session(region, profile), service_name, endpoint_url, **kwargs)
+
+    def get_resource(self, session: Session, resource_name: str, **kwargs) -> Any:
+        """
+        Creates a resource of the given service from the given session, while holding the lock of the cache
+
+        Parameters
+        ----------
+        session: Session
+            Boto3 session object
+        resource_name: str
+            Name of the AWS service
+        kwargs :
+            Key-value params that will be passed to get_boto_config_with_user_agent
+        """
+        with self._lock:
+            return self._create_resource(session, resource_name, **kwargs)
+
+    def get_profile_resource(self, region: Optional[str], profile: Optional[str], resource_name: str, **kwargs) -> Any:
+        """
+        Creates a resource of the given service for the given region and profile, while holding the lock of the cache
+
+        Parameters
+        ----------
+        region: Optional[str]
+            AWS region name
+        profile: Optional[str]
+            Profile name from credentials
+        resource_name: str
+            Name of the AWS service
+        kwargs :
+            Key-value params that will be passed to get_boto_config_with_user_agent
+        """
+        with self._lock:
+            return self._create_resource(self._get_session(region, profile), resource_name, **kwargs)
+
+    def clear(self) -> None:
+        """
+        Drops all the cached sessions and clients
+        """
+        with self._lock:
+            self._sessions.clear()
+            self._clients.clear()
+            self._created_clients = 0
+
+    def _get_session(self, region: Optional[str], profile: Optional[str]) -> Session:
+        # called while holding the lock, the session is only used to create clients and resources
+        session = self._sessions.get((region, profile))
+        if not session:
+            session = Session(region_name=region, profile_name=profile)
+            self._sessions[(region, profile)] = session
+        return session
+
+    def _get_client(self, session: Session, service_name: str, endpoint_url: Optional[str], **kwargs) -> Any:
+        # called while holding the lock, since boto sessions are not thread-safe
+        key = (id(session), service_name, endpoint_url, repr(sorted(kwargs.items())))
+        cached = self._clients.get(key)
+        if cached and cached[0] is session:
+            return cached[1]
+
+        LOG.debug("Creating boto client (%s)", service_name)
+        # the typed overloads of boto3 only accept literal service names
+        client = session.client(
+            service_name, config=get_boto_config_with_user_agent(**kwargs), endpoint_url=endpoint_url
+        )  # type: ignore[call-overload]
+        self._clients[key] = (session, client)
+        self._created_clients += 1
+        return client
+
+    @staticmethod
+    def _create_resource(session: Session, resource_name: str, **kwargs) -> Any:
+        # called while holding the lock, since boto sessions are not thread-safe
+        LOG.debug("Creating boto resource (%s)", resource_name)
+        return session.resource(
+            resource_name, config=get_boto_config_with_user_agent(**kwargs)
+        )  # type: ignore[call-overload]
+
+
+BOTO_CLIENT_CACHE = BotoClientCache()
+
+
 # Type definition of following boto providers, which is equal to Callable[[str], Any]
 class BotoProviderType(Protocol):
     def __call__(self, service_name: str) -> Any: ...  # pragma: no cover
 
 
-def get_boto_client_provider_from_session_with_config(session: Session, **kwargs) -> BotoProviderType:
+def get_boto_client_provider_from_session_with_config(
+    session: Session, endpoint_url: Optional[str] = None, **kwargs
+) -> BotoProviderType:
     """
     Returns a wrapper function for boto client with given configuration. It can be used like;
 
     client_provider = get_boto_client_wrapper_with_config(session=session)
     lambda_client = client_provider("lambda")
 
+    Clients are cached by BOTO_CLIENT_CACHE, so the same client is returned for the same session and configuration.
+
     Parameters
     ----------
     session: Session
         Boto3 session object
+    endpoint_url: Optional[str]
+        Endpoint to send the requests to, instead of the AWS service endpoint
     kwargs :
         Key-value params that will be passed to get_boto_config_with_user_agent
 
@@ -59,11 +239,11 @@ def get_boto_client_provider_from_session_with_config(session: Session, **kwargs
     -------
         A callable function which will return a boto client
     """
-    return lambda client_name: session.client(client_name, config=get_boto_config_with_user_agent(**kwargs))
+    return lambda client_name: BOTO_CLIENT_CACHE.get_client(session, client_name, endpoint_url, **kwargs)
 
 
 def get_boto_client_provider_with_config(
-    region: Optional[str] = None, profile: Optional[str] = None, **kwargs
+    region: Optional[str] = None, profile: Optional[str] = None, endpoint_url: Optional[str] = None, **kwargs
 ) -> BotoProviderType:
     """
     Returns a wrapper function for boto client with given configuration. It can be used like;
@@ -77,6 +257,8 @@ def get_boto_client_provider_with_config(
         AWS region name
     profile: Optional[str]
         Profile name from credentials
+    endpoint_url: Optional[str]
+        Endpoint to send the requests to, instead of the AWS service endpoint
     kwargs :
         Key-value params that will be passed to get_boto_config_with_user_agent
 
@@ -84,8 +266,9 @@ def get_boto_client_provider_with_config(
     -------
         A callable function which will return a boto client
     """
-    return get_boto_client_provider_from_session_with_config(
-        Session(region_name=region, profile_name=profile), **kwargs
+    BOTO_CLIENT_CACHE.load_session(region, profile)
+    return lambda client_name: BOTO_CLIENT_CACHE.get_profile_client(
+        region, profile, client_name, endpoint_url, **kwargs
     )
 
 
@@ -107,7 +290,7 @@ def get_boto_resource_provider_from_session_with_config(session: Session, **kwar
     -------
         A callable function which will return a boto resource
     """
-    return lambda resource_name: session.resource(resource_name, config=get_boto_config_with_user_agent(**kwargs))
+    return lambda resource_name: BOTO_CLIENT_CACHE.get_resource(session, resource_name, **kwargs)
 
 
 def get_boto_resource_provider_with_config(
@@ -132,9 +315,8 @@ def get_boto_resource_provider_with_config(
     -------
         A callable function which will return a boto resource
     """
-    return get_boto_resource_provider_from_session_with_config(
-        Session(region_name=region, profile_name=profile), **kwargs
-    )
+    BOTO_CLIENT_CACHE.load_session(region, profile)
+    return lambda resource_name: BOTO_CLIENT_CACHE.get_profile_resource(region, profile, resource_name, **kwargs)
 
 
 def get_client_error_code(client_error: ClientError) -> Optional[str]:
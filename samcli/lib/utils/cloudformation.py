@@ -2,14 +2,24 @@
 This utility file contains methods to read information from certain CFN stack
 """
 
+import json
 import logging
+import os
 import posixpath
-from typing import Any, Dict, Iterable, Optional, Set
+import shutil
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
+from uuid import uuid4
 
 from attr import dataclass
 from botocore.exceptions import ClientError
 
+from samcli.cli.global_config import GlobalConfig
 from samcli.lib.utils.boto_utils import BotoProviderType, get_client_error_code
+from samcli.lib.utils.hash import str_checksum
 from samcli.lib.utils.resources import AWS_CLOUDFORMATION_STACK
 
 LOG = logging.getLogger(__name__)
@@ -35,6 +45,12 @@ STACK_ACTIVE_STATUS = [
     "REVIEW_IN_PROGRESS",
 ]
 
+# Max number of nested stacks whose resources are fetched at the same time
+MAX_CONCURRENT_STACK_FETCHES = 8
+
+# Seconds to keep the resources of a stack in the on-disk cache
+STACK_RESOURCES_CACHE_TTL = 10 * 60
+
 
 @dataclass
 class CloudFormationResourceSummary:
@@ -53,10 +69,13 @@ def get_resource_summaries(
     stack_name: str,
     resource_types: Optional[Set[str]] = None,
     nested_stack_prefix: Optional[str] = None,
+    use_cache: bool = False,
 ) -> Dict[str, CloudFormationResourceSummary]:
     """
     Collects information about CFN resources and return their summary as list
 
+    Resources of the nested stacks are fetched concurrently, at most MAX_CONCURRENT_STACK_FETCHES stacks at a time.
+
     Parameters
     ----------
     boto_resource_provider : BotoProviderType
@@ -70,17 +89,22 @@ def get_resource_summaries(
     nested_stack_prefix: Optional[str]
         This will contain logical id of the parent stack. So that ChildStackA/GrandChildStackB so that resources
         under GrandChildStackB can create their keys like ChildStackA/GrandChildStackB/MyFunction
+    use_cache: bool
+        True to keep the resources of each stack in an on-disk cache, keyed on the stack ID and its last updated
+        time, so only the stacks which changed since the previous call are fetched again
 
     Returns
     -------
         List of CloudFormationResourceSummary which contains information about resources in the given stack
 
     """
+    cache = _StackResourcesCache() if use_cache else None
+
     LOG.debug("Fetching stack (%s) resources", stack_name)
     try:
-        cfn_resource_summaries = list(
-            boto_resource_provider("cloudformation").Stack(stack_name).resource_summaries.all()
-        )
+        cfn_resource = boto_resource_provider("cloudformation")
+        stack_id, stack_version = _get_stack_version(cfn_resource, stack_name) if cache else (stack_name, None)
+        stack_resources = _get_stack_resources(cfn_resource, stack_name, stack_id, stack_version, cache)
     except ClientError as ex:
         if get_client_error_code(ex) == "ValidationError" and LOG.isEnabledFor(logging.DEBUG):
             LOG.debug(
@@ -89,27 +113,80 @@ def get_resource_summaries(
                 ", ".join(list_active_stack_names(boto_client_provider)),
             )
         raise ex
+
     resource_summaries: Dict[str, CloudFormationResourceSummary] = {}
+    stacks_to_fetch = _collect_resource_summaries(
+        stack_resources, nested_stack_prefix, resource_types, resource_summaries
+    )
+    if not stacks_to_fetch:
+        return resource_summaries
+
+    with ThreadPoolExecutor(max_workers=MAX_CONCURRENT_STACK_FETCHES) as executor:
+        # fetch the nested stacks level by level, all the stacks of the same level are fetched concurrently
+        while stacks_to_fetch:
+            fetches = []
+            for nested_stack, new_nested_stack_prefix in stacks_to_fetch:
+                LOG.debug("Fetching nested stack (%s) resources", nested_stack.physical_resource_id)
+                # boto3 resources are not thread-safe, each fetch uses its own resource
+                fetch = executor.submit(
+                    _get_stack_resources,
+                    boto_resource_provider("cloudformation"),
+                    nested_stack.physical_resource_id,
+                    nested_stack.physical_resource_id,
+                    nested_stack.version,
+                    cache,
+                )
+                fetches.append((fetch, new_nested_stack_prefix))
+
+            stacks_to_fetch = []
+            for fetch, new_nested_stack_prefix in fetches:
+                stacks_to_fetch.extend(
+                    _collect_resource_summaries(
+                        fetch.result(), new_nested_stack_prefix, resource_types, resource_summaries
+                    )
+                )
+
+    return resource_summaries
 
-    for cfn_resource_summary in cfn_resource_summaries:
+
+@dataclass
+class _StackResource:
+    """
+    Resource of a stack, with the version of the resource which changes whenever the resource is updated
+    """
+
+    resource_type: str
+    logical_resource_id: str
+    physical_resource_id: str
+    version: Optional[str] = None
+
+
+def _collect_resource_summaries(
+    stack_resources: List[_StackResource],
+    nested_stack_prefix: Optional[str],
+    resource_types: Optional[Set[str]],
+    resource_summaries: Dict[str, CloudFormationResourceSummary],
+) -> List[Tuple[_StackResource, str]]:
+    """
+    Adds the summaries of the given resources of a stack into given resource summaries
+
+    Returns
+    -------
+        List of nested stacks in the given resources, with their nested stack prefix
+    """
+    nested_stacks: List[Tuple[_StackResource, str]] = []
+
+    for stack_resource in stack_resources:
         resource_summary = CloudFormationResourceSummary(
-            cfn_resource_summary.resource_type,
-            cfn_resource_summary.logical_resource_id,
-            cfn_resource_summary.physical_resource_id,
+            stack_resource.resource_type,
+            stack_resource.logical_resource_id,
+            stack_resource.physical_resource_id,
         )
         if resource_summary.resource_type == AWS_CLOUDFORMATION_STACK:
             new_nested_stack_prefix = resource_summary.logical_resource_id
             if nested_stack_prefix:
                 new_nested_stack_prefix = posixpath.join(nested_stack_prefix, new_nested_stack_prefix)
-            resource_summaries.update(
-                get_resource_summaries(
-                    boto_resource_provider,
-                    boto_client_provider,
-                    resource_summary.physical_resource_id,
-                    resource_types,
-                    new_nested_stack_prefix,
-                )
-            )
+            nested_stacks.append((stack_resource, new_nested_stack_prefix))
         if resource_types and resource_summary.resource_type not in resource_types:
             LOG.debug(
                 "Skipping resource %s since its type %s is not supported. Supported types %s",
@@ -124,7 +201,128 @@ def get_resource_summaries(
             resource_key = posixpath.join(nested_stack_prefix, resource_key)
         resource_summaries[resource_key] = resource_summary
 
-    return resource_summaries
+    return nested_stacks
+
+
+def _get_stack_version(cfn_resource: Any, stack_name: str) -> Tuple[str, Optional[str]]:
+    """
+    Returns the ID of the given stack, and its version which changes whenever the stack is updated. The version is
+    None while the stack is being updated.
+    """
+    stack = cfn_resource.Stack(stack_name)
+    if str(stack.stack_status).endswith("_IN_PROGRESS"):
+        return stack.stack_id, None
+    return stack.stack_id, _to_version(stack.last_updated_time or stack.creation_time)
+
+
+def _to_version(timestamp: Any) -> Optional[str]:
+    if not timestamp:
+        return None
+    return timestamp.isoformat() if isinstance(timestamp, datetime) else str(timestamp)
+
+
+def _get_stack_resources(
+    cfn_resource: Any,
+    stack_name: str,
+    stack_id: str,
+    stack_version: Optional[str],
+    cache: Optional["_StackResourcesCache"],
+) -> List[_StackResource]:
+    """
+    Returns the resources of the given stack, from the cache if the same version of the stack is cached
+    """
+    if cache and stack_version:
+        cached_stack_resources = cache.get(stack_id, stack_version)
+        if cached_stack_resources is not None:
+            LOG.debug("Using cached resources of stack (%s)", stack_name)
+            return cached_stack_resources
+
+    stack_resources = [
+        _StackResource(
+            cfn_resource_summary.resource_type,
+            cfn_resource_summary.logical_resource_id,
+            cfn_resource_summary.physical_resource_id,
+            # nested stacks in progress are not cached, since they are changing
+            (
+                None
+                if str(cfn_resource_summary.resource_status).endswith("_IN_PROGRESS")
+                else _to_version(cfn_resource_summary.last_updated_timestamp)
+            ),
+        )
+        for cfn_resource_summary in cfn_resource.Stack(stack_name).resource_summaries.all()
+    ]
+
+    if cache and stack_version:
+        cache.put(stack_id, stack_version, stack_resources)
+    return stack_resources
+
+
+class _StackResourcesCache:
+    """
+    On-disk cache of the resources of stacks, keyed on the stack ID and the stack version. Entries expire after
+    STACK_RESOURCES_CACHE_TTL seconds, regardless of their version.
+    """
+
+    def __init__(self, cache_dir: Optional[Path] = None) -> None:
+        self._cache_dir = cache_dir or get_stack_resources_cache_dir()
+
+    def get(self, stack_id: str, stack_version: str) -> Optional[List[_StackResource]]:
+        try:
+            with open(self._get_cache_path(stack_id), "r", encoding="utf-8") as cache_file:
+                cache_entry = json.load(cache_file)
+        except (OSError, ValueError):
+            return None
+
+        if (
+            cache_entry.get("stack_id") != stack_id
+            or cache_entry.get("stack_version") != stack_version
+            or time.time() - cache_entry.get("created_at", 0) > STACK_RESOURCES_CACHE_TTL
+        ):
+            return None
+        return [_StackResource(*stack_resource) for stack_resource in cache_entry.get("resources", [])]
+
+    def put(self, stack_id: str, stack_version: str, stack_resources: List[_StackResource]) -> None:
+        cache_entry = {
+            "stack_id": stack_id,
+            "stack_version": stack_version,
+            "created_at": time.time(),
+            "resources": [
+                [
+                    stack_resource.resource_type,
+                    stack_resource.logical_resource_id,
+                    stack_resource.physical_resource_id,
+                    stack_resource.version,
+                ]
+                for stack_resource in stack_resources
+            ],
+        }
+        try:
+            self._cache_dir.mkdir(mode=0o700, parents=True, exist_ok=True)
+            # write into a temporary file first, so concurrent readers never see a partial entry
+            cache_path = self._get_cache_path(stack_id)
+            temp_cache_path = cache_path.with_name(f"{cache_path.name}.{uuid4().hex}")
+            with open(temp_cache_path, "w", encoding="utf-8") as cache_file:
+                json.dump(cache_entry, cache_file)
+            os.replace(temp_cache_path, cache_path)
+        except (OSError, TypeError, ValueError) as ex:
+            LOG.debug("Failed to cache resources of stack (%s)", stack_id, exc_info=ex)
+
+    def _get_cache_path(self, stack_id: str) -> Path:
+        return self._cache_dir / f"{str_checksum(stack_id)}.json"
+
+
+def get_stack_resources_cache_dir() -> Path:
+    """
+    Returns the directory of the on-disk cache of the stack resources
+    """
+    return GlobalConfig().config_dir / "cache" / "stack-resources"
+
+
+def clear_stack_resources_cache() -> None:
+    """
+    Deletes the on-disk cache of the stack resources, so they are fetched from CloudFormation next time
+    """
+    shutil.rmtree(get_stack_resources_cache_dir(), ignore_errors=True)
 
 
 def get_resource_summary(
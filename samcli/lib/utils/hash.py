@@ -7,6 +7,8 @@ import os
 import sys
 from typing import Any, List, Optional, cast
 
+from samcli.lib.telemetry.tracing import traced
+
 BLOCK_SIZE = 4096
 # earliest python version to support usedforsecurity option for hashlib.md5 is 3.9
 # https://docs.python.org/3/library/hashlib.html#hash-algorithms
@@ -55,6 +57,7 @@ def file_checksum(file_name: str, hash_generator: Any = None) -> str:
         return cast(str, hash_generator.hexdigest())
 
 
+@traced("dir_checksum")
 def dir_checksum(
     directory: str, followlinks: bool = True, ignore_list: Optional[List[str]] = None, hash_generator: Any = None
 ) -> str:
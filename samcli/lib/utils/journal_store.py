@@ -0,0 +1,227 @@
+"""
+Store of machine-generated state files, like the build graph, which are read and updated incrementally
+"""
+
+import json
+import logging
+import os
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+from uuid import uuid4
+
+LOG = logging.getLogger(__name__)
+
+# Version of the file format, files of other versions are ignored and rewritten
+JOURNAL_FORMAT_VERSION = 1
+
+# Number of superseded lines a file can hold before it is compacted, on top of one per record
+COMPACTION_MIN_SUPERSEDED_LINES = 100
+
+# tables of records, keyed on the table name and then on the record key
+Tables = Dict[str, Dict[str, Any]]
+
+# change of a record, as table name, record key and new value, or None if the record is deleted
+_Change = Tuple[str, str, Optional[Any]]
+# number of items of a change line
+_CHANGE_LENGTH = 3
+
+
+class JournalStore:
+    """
+    Keeps tables of JSON records in a JSON lines file. The first line is a header with the kind of the file and
+    the format version, and each following line sets or deletes one record, so saving a few changed records appends
+    them to the file instead of rewriting all of them. The file is compacted, which means rewritten with the latest
+    records only, once it holds more superseded lines than records.
+
+    This class is not thread-safe, callers must lock around it.
+    """
+
+    def __init__(self, path: Path, kind: str) -> None:
+        """
+        Parameters
+        ----------
+        path: Path
+            Path of the file
+        kind: str
+            Kind of the file, written in its header, files of another kind are ignored
+        """
+        self._path = path
+        self._kind = kind
+        # tables as they are in the file, and the size and modification time of the file when they were read
+        self._tables: Optional[Tables] = None
+        self._file_signature: Optional[Tuple[int, int]] = None
+        self._line_count = 0
+
+    @property
+    def path(self) -> Path:
+        return self._path
+
+    def exists(self) -> bool:
+        return os.path.isfile(self._path)
+
+    def load(self) -> Tables:
+        """
+        Reads the tables of the file, which are empty if the file doesn't exist or if it has another format
+        """
+        tables: Tables = {}
+        line_count = 0
+        try:
+            with open(self._path, "r", encoding="utf-8") as journal_file:
+                file_signature = self._get_file_signature(journal_file.fileno())
+                header = _parse_line(journal_file.readline())
+                if (
+                    not isinstance(header, dict)
+                    or header.get("kind") != self._kind
+                    or header.get("version") != JOURNAL_FORMAT_VERSION
+                ):
+                    LOG.debug("Ignoring %s, its format is not supported", self._path)
+                    self._reset()
+                    return {}
+
+                for line in journal_file:
+                    line_count += 1
+                    change = _parse_line(line)
+                    # a line can be partially written if the process was interrupted while appending it
+                    if not isinstance(change, list) or len(change) != _CHANGE_LENGTH:
+                        LOG.debug("Ignoring invalid line %s of %s", line_count + 1, self._path)
+                        continue
+                    _apply_change(tables, change[0], change[1], change[2])
+        except FileNotFoundError:
+            self._reset()
+            return {}
+
+        self._tables = tables
+        self._file_signature = file_signature
+        self._line_count = line_count
+        return _copy_tables(tables)
+
+    def save(self, tables: Tables) -> None:
+        """
+        Saves the given tables, appending only the records which changed since the file was last read or written
+        """
+        if not self._is_up_to_date():
+            self.load()
+        if self._tables is None or not self.exists():
+            self._rewrite(tables)
+            return
+
+        changes: List[_Change] = []
+        for table_name in set(self._tables) | set(tables):
+            stored_records = self._tables.get(table_name, {})
+            records = tables.get(table_name, {})
+            changes.extend((table_name, key, None) for key in stored_records if key not in records)
+            changes.extend(
+                (table_name, key, value)
+                for key, value in records.items()
+                if key not in stored_records or stored_records[key] != value
+            )
+        self._append(changes)
+
+    def update(self, table_name: str, records: Dict[str, Optional[Any]]) -> None:
+        """
+        Sets the given records of a table, a record whose value is None is deleted
+        """
+        if not self._is_up_to_date():
+            self.load()
+        if self._tables is None or not self.exists():
+            tables = _copy_tables(self._tables or {})
+            for key, value in records.items():
+                _apply_change(tables, table_name, key, value)
+            self._rewrite(tables)
+            return
+
+        self._append([(table_name, key, value) for key, value in records.items()])
+
+    def _append(self, changes: List[_Change]) -> None:
+        if not changes:
+            return
+
+        lines = [_dump_line([table_name, key, value]) for table_name, key, value in changes]
+        tables = _get_loaded_tables(self._tables)
+        for line in lines:
+            # parse the written lines back, so the tables hold copies of the records exactly as they are in the file
+            _apply_change(tables, *json.loads(line))
+
+        record_count = sum(len(records) for records in tables.values())
+        if self._line_count + len(lines) > 2 * record_count + COMPACTION_MIN_SUPERSEDED_LINES:
+            self._rewrite(tables)
+            return
+
+        with open(self._path, "a", encoding="utf-8") as journal_file:
+            journal_file.write("".join(lines))
+            journal_file.flush()
+            self._file_signature = self._get_file_signature(journal_file.fileno())
+        self._line_count += len(lines)
+
+    def _rewrite(self, tables: Tables) -> None:
+        lines = [_dump_line({"kind": self._kind, "version": JOURNAL_FORMAT_VERSION})]
+        for table_name, records in tables.items():
+            lines.extend(_dump_line([table_name, key, value]) for key, value in records.items() if value is not None)
+
+        # write into a temporary file first, so readers never see a partial file
+        temp_path = self._path.with_name(f"{self._path.name}.{uuid4().hex}")
+        try:
+            with open(temp_path, "w", encoding="utf-8") as journal_file:
+                journal_file.write("".join(lines))
+            os.replace(temp_path, self._path)
+        except BaseException:
+            temp_path.unlink(missing_ok=True)
+            raise
+
+        self._tables = {
+            table_name: {key: value for key, value in records.items() if value is not None}
+            for table_name, records in _copy_tables(tables).items()
+        }
+        self._file_signature = self._get_file_signature()
+        self._line_count = len(lines) - 1
+
+    def _is_up_to_date(self) -> bool:
+        """
+        Returns whether the tables which were last read or written are still the ones in the file, which might be
+        changed by another store of the same file
+        """
+        if self._tables is None:
+            return False
+        try:
+            return self._get_file_signature() == self._file_signature
+        except FileNotFoundError:
+            return False
+
+    def _get_file_signature(self, file_descriptor: Optional[int] = None) -> Tuple[int, int]:
+        stat_result = os.fstat(file_descriptor) if file_descriptor is not None else os.stat(self._path)
+        return stat_result.st_size, stat_result.st_mtime_ns
+
+    def _reset(self) -> None:
+        self._tables = None
+        self._file_signature = None
+        self._line_count = 0
+
+
+def _get_loaded_tables(tables: Optional[Tables]) -> Tables:
+    if tables is None:
+        raise ValueError("Tables of the journal are not loaded")
+    return tables
+
+
+def _apply_change(tables: Tables, table_name: str, key: str, value: Optional[Any]) -> None:
+    if value is None:
+        tables.get(table_name, {}).pop(key, None)
+    else:
+        tables.setdefault(table_name, {})[key] = value
+
+
+def _copy_tables(tables: Tables) -> Tables:
+    # records are JSON values, a JSON round trip is the fastest deep copy of them
+    copied_tables: Tables = json.loads(json.dumps(tables))
+    return copied_tables
+
+
+def _parse_line(line: str) -> Any:
+    try:
+        return json.loads(line)
+    except ValueError:
+        return None
+
+
+def _dump_line(value: Any) -> str:
+    return json.dumps(value, separators=(",", ":")) + "\n"
@@ -0,0 +1,111 @@
+"""
+Records how long the phases of a unit of work, like the handling of a request by a local service, take
+"""
+
+import threading
+import time
+from contextlib import contextmanager, nullcontext
+from typing import ContextManager, Dict, Iterator, List, NamedTuple, Optional
+
+
+class EmulationPhase:
+    """
+    Phases of handling a request by the local services
+    """
+
+    ROUTING = "routing"
+    EVENT_CONSTRUCTION = "event_construction"
+    CONTAINER_WAIT = "container_wait"
+    RIE_ROUND_TRIP = "rie_round_trip"
+    RESPONSE_PARSING = "response_parsing"
+
+    ALL = [ROUTING, EVENT_CONSTRUCTION, CONTAINER_WAIT, RIE_ROUND_TRIP, RESPONSE_PARSING]
+
+
+class PhaseRecord(NamedTuple):
+    phase: str
+    duration: float
+    # resource the phase kept busy, like a container, if any
+    resource: Optional[str]
+
+
+class PhaseRecorder:
+    """
+    Collects the phases recorded by ``record_phase`` in the threads it is active in
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self.records: List[PhaseRecord] = []
+
+    def add(self, phase: str, duration: float, resource: Optional[str] = None) -> None:
+        with self._lock:
+            self.records.append(PhaseRecord(phase, duration, resource))
+
+    def get_durations(self) -> Dict[str, float]:
+        """
+        Returns the total duration of each recorded phase, in seconds
+        """
+        durations: Dict[str, float] = {}
+        for record in self.records:
+            durations[record.phase] = durations.get(record.phase, 0.0) + record.duration
+        return durations
+
+    def get_busy_times(self, phase: str) -> Dict[str, float]:
+        """
+        Returns how long each resource was busy in the given phase, in seconds
+        """
+        busy_times: Dict[str, float] = {}
+        for record in self.records:
+            if record.phase == phase and record.resource:
+                busy_times[record.resource] = busy_times.get(record.resource, 0.0) + record.duration
+        return busy_times
+
+    @contextmanager
+    def activate(self) -> Iterator["PhaseRecorder"]:
+        """
+        Makes this recorder the one of the current thread until the context exits
+        """
+        previous_recorder = getattr(_active, "recorder", None)
+        _active.recorder = self
+        try:
+            yield self
+        finally:
+            _active.recorder = previous_recorder
+
+
+_active = threading.local()
+
+_NO_OP_CONTEXT = nullcontext()
+
+
+def get_active_recorder() -> Optional[PhaseRecorder]:
+    recorder: Optional[PhaseRecorder] = getattr(_active, "recorder", None)
+    return recorder
+
+
+def record_phase(phase: str, resource: Optional[str] = None) -> ContextManager:
+    """
+    Times the wrapped block as the given phase, if a recorder is active in the current thread. Nothing is timed
+    otherwise, so the phases of the local services cost next to nothing outside of ``sam local bench``.
+
+    Parameters
+    ----------
+    phase: str
+        Name of the phase
+    resource: Optional[str]
+        Resource the phase keeps busy, like a container id
+    """
+    recorder = get_active_recorder()
+    if recorder is None:
+        return _NO_OP_CONTEXT
+    return _time_phase(recorder, phase, resource)
+
+
+@contextmanager
+def _time_phase(recorder: PhaseRecorder, phase: str, resource: Optional[str]) -> Iterator[None]:
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        recorder.add(phase, time.perf_counter() - start, resource)
@@ -2,13 +2,16 @@
 Tarball Archive utility
 """
 
+import copy
+import io
 import logging
 import os
+import shutil
 import tarfile
 from contextlib import contextmanager
 from pathlib import Path
 from tempfile import TemporaryFile
-from typing import IO, Callable, Dict, List, Optional, Union
+from typing import IO, Callable, Dict, Iterable, Iterator, List, Optional, Union
 
 LOG = logging.getLogger(__name__)
 
@@ -140,3 +143,142 @@ def extract_tarfile(
                 raise tarfile.ExtractError("Attempted Path Traversal in Tar File")
 
         tar.extractall(unpack_dir)
+
+
+def extract_tarfile_stream(chunks: Iterable[bytes], unpack_dir: Union[str, os.PathLike]) -> None:
+    """
+    Extracts a tarfile while its content arrives in chunks, without storing the whole tarfile first.
+    Members are checked against directory traversal one by one, before being extracted.
+
+    Parameters
+    ----------
+    chunks Iterable[bytes]
+        Content of the tarfile, in order (e.g. the stream returned by Docker get_archive API)
+
+    unpack_dir Union[str, os.PathLike]
+        The directory where the tarfile members will be extracted.
+    """
+    # "r|*" reads the tarfile sequentially, as a stream, it can't seek back to previous members
+    with tarfile.open(fileobj=io.BufferedReader(_ChunkedReader(chunks)), mode="r|*") as tar:
+        directories = []
+        # links which couldn't be created before their target was extracted
+        deferred_links = []
+        for member in tar:
+            # Makes sure the tar file is sanitized and is free of directory traversal vulnerability
+            # See: https://github.com/advisories/GHSA-gw9q-c7gh-j9vm
+            member_path = os.path.join(unpack_dir, member.name)
+            if not _is_within_directory(unpack_dir, member_path):
+                raise tarfile.ExtractError("Attempted Path Traversal in Tar File")
+
+            # when a link can't be created, tarfile extracts the link target again from the archive, which needs to
+            # seek back in the stream. The already extracted target is copied instead
+            if member.issym() or member.islnk():
+                if not _extract_link(member, unpack_dir):
+                    deferred_links.append(member)
+                continue
+
+            # same as extractall, directory attributes are set once all the members are extracted, so read-only
+            # directories can still be extracted into
+            extracted_member = member
+            if member.isdir():
+                directories.append(member)
+                extracted_member = copy.copy(member)
+                extracted_member.mode = 0o700
+            tar.extract(extracted_member, unpack_dir, set_attrs=not member.isdir())
+
+        directories.sort(key=lambda directory: directory.name, reverse=True)
+        for directory in directories:
+            directory_path = os.path.join(unpack_dir, directory.name)
+            tar.chown(directory, directory_path, False)
+            tar.utime(directory, directory_path)
+            tar.chmod(directory, directory_path)
+
+    for link in deferred_links:
+        if not _copy_link_target(link, unpack_dir):
+            LOG.warning("Unable to extract %s, its target %s is not in the archive", link.name, link.linkname)
+
+
+def _extract_link(member: tarfile.TarInfo, unpack_dir: Union[str, os.PathLike]) -> bool:
+    """
+    Creates the symlink or hardlink of the given member. If the link can't be created (e.g. symlinks on Windows
+    without the privilege to create them), its target is copied instead.
+
+    Parameters
+    ----------
+    member tarfile.TarInfo
+        Symlink or hardlink member of the tarfile
+
+    unpack_dir Union[str, os.PathLike]
+        The directory where the tarfile members are extracted.
+
+    Return
+    ------
+    bool:
+        False if the link couldn't be created and its target isn't extracted yet, otherwise True
+    """
+    link_path = os.path.join(unpack_dir, member.name)
+    os.makedirs(os.path.dirname(link_path), exist_ok=True)
+    if os.path.lexists(link_path):
+        os.unlink(link_path)
+
+    try:
+        if member.issym():
+            os.symlink(member.linkname, link_path)
+        else:
+            os.link(os.path.join(unpack_dir, member.linkname), link_path)
+        return True
+    except (OSError, NotImplementedError):
+        LOG.debug("Failed to create link %s, copying its target instead", member.name, exc_info=True)
+
+    return _copy_link_target(member, unpack_dir)
+
+
+def _copy_link_target(member: tarfile.TarInfo, unpack_dir: Union[str, os.PathLike]) -> bool:
+    """
+    Copies the extracted target of a symlink or hardlink member to the path of the member
+
+    Return
+    ------
+    bool:
+        False if the target isn't extracted into unpack_dir, otherwise True
+    """
+    link_path = os.path.join(unpack_dir, member.name)
+    if member.issym():
+        # symlink targets are relative to the link, hardlink targets to the root of the archive
+        target_path = os.path.join(os.path.dirname(link_path), member.linkname)
+    else:
+        target_path = os.path.join(unpack_dir, member.linkname)
+
+    if not _is_within_directory(unpack_dir, target_path) or not os.path.exists(target_path):
+        return False
+
+    if os.path.isdir(target_path):
+        shutil.copytree(target_path, link_path, symlinks=True)
+    else:
+        shutil.copy2(target_path, link_path)
+    return True
+
+
+class _ChunkedReader(io.RawIOBase):
+    """
+    Read-only file object over an iterable of byte chunks
+    """
+
+    def __init__(self, chunks: Iterable[bytes]) -> None:
+        self._chunks: Iterator[bytes] = iter(chunks)
+        self._buffer = b""
+
+    def readable(self) -> bool:
+        return True
+
+    def readinto(self, buffer) -> int:
+        while not self._buffer:
+            chunk = next(self._chunks, None)
+            if chunk is None:
+                return 0
+            self._buffer = chunk
+
+        size = min(len(buffer), len(self._buffer))
+        buffer[:size] = self._buffer[:size]
+        self._buffer = self._buffer[size:]
+        return size
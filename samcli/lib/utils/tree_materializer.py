@@ -0,0 +1,259 @@
+"""
+Materializes directory trees, like build artifacts, without copying the content of their files when possible
+"""
+
+import errno
+import json
+import logging
+import os
+import platform
+import shutil
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from enum import Enum
+from typing import Callable, Dict, List, Optional, Tuple
+
+LOG = logging.getLogger(__name__)
+
+# ioctl request of Linux to clone the content of a file into another one, on file systems supporting it (btrfs, xfs)
+_FICLONE = 0x40049409
+
+# errors meaning that the file system doesn't support linking or cloning files between the given paths
+_UNSUPPORTED_ERRNOS = {
+    errno.EXDEV,
+    errno.EINVAL,
+    errno.EPERM,
+    errno.EACCES,
+    errno.EMLINK,
+    errno.ENOTTY,
+    errno.ENOSYS,
+    getattr(errno, "EOPNOTSUPP", errno.ENOSYS),
+    getattr(errno, "ENOTSUP", errno.ENOSYS),
+}
+
+# Max number of files copied at the same time when files can't be cloned or linked
+DEFAULT_COPY_WORKERS = 8
+
+# file keeping the snapshot of a materialized tree, it is never materialized itself
+TREE_SNAPSHOT_FILE_NAME = ".samcli-tree-snapshot.json"
+
+_TEMP_DIR_SUFFIX = ".tmp-"
+
+
+class MaterializeMethod(Enum):
+    """
+    Ways of materializing a file, from the cheapest to the most expensive one
+    """
+
+    REFLINK = "reflink"
+    HARDLINK = "hardlink"
+    COPY = "copy"
+
+
+def materialize_tree(
+    source: str, destination: str, allow_hardlinks: bool = True, max_copy_workers: int = DEFAULT_COPY_WORKERS
+) -> MaterializeMethod:
+    """
+    Replaces the destination directory with the content of the source directory. Files are cloned (copy-on-write)
+    if the file system supports it, then hard linked if allowed, and copied in parallel otherwise. Symlinks are
+    followed, like ``osutils.copytree`` does.
+
+    Hard linked files share their content with the source, so writing into one of them in place changes the other
+    one too. Callers which keep the source, like build caches, should write a snapshot of it with
+    ``write_tree_snapshot`` and check it with ``is_tree_snapshot_valid`` before using it again.
+
+    Parameters
+    ----------
+    source: str
+        Directory to materialize
+    destination: str
+        Directory to materialize the source into, its current content is deleted
+    allow_hardlinks: bool
+        Whether files can be hard linked when they can't be cloned
+    max_copy_workers: int
+        Max number of files copied at the same time
+
+    Returns
+    -------
+    MaterializeMethod
+        The most expensive method which was used to materialize the files of the tree
+    """
+    materializer = _TreeMaterializer(allow_hardlinks)
+    temp_dir = f"{destination.rstrip(os.sep)}{_TEMP_DIR_SUFFIX}{uuid.uuid4().hex}"
+    try:
+        files_to_copy = materializer.link_tree(source, temp_dir)
+        if files_to_copy:
+            with ThreadPoolExecutor(max_workers=max_copy_workers) as executor:
+                # list() to raise the first copy error, if any
+                list(executor.map(lambda paths: shutil.copy2(*paths), files_to_copy))
+        if os.path.islink(destination):
+            os.unlink(destination)
+        else:
+            shutil.rmtree(destination, ignore_errors=True)
+        os.replace(temp_dir, destination)
+    except BaseException:
+        shutil.rmtree(temp_dir, ignore_errors=True)
+        raise
+
+    LOG.debug("Materialized %s into %s with %s", source, destination, materializer.method.value)
+    return materializer.method
+
+
+def write_tree_snapshot(directory: str) -> None:
+    """
+    Writes the size and modification time of the files of the given directory into it, so that a file modified
+    in place through a hard link materialized by ``materialize_tree`` can be detected
+    """
+    snapshot_path = os.path.join(directory, TREE_SNAPSHOT_FILE_NAME)
+    with open(snapshot_path, "w") as snapshot_file:
+        json.dump(_get_tree_snapshot(directory), snapshot_file)
+
+
+def is_tree_snapshot_valid(directory: str) -> bool:
+    """
+    Returns whether the files of the given directory are the ones of its snapshot, written by ``write_tree_snapshot``.
+    A directory without snapshot is valid, it was never materialized with hard links.
+    """
+    snapshot_path = os.path.join(directory, TREE_SNAPSHOT_FILE_NAME)
+    try:
+        with open(snapshot_path, "r") as snapshot_file:
+            snapshot = json.load(snapshot_file)
+    except FileNotFoundError:
+        return True
+    except (OSError, ValueError) as ex:
+        LOG.debug("Failed to read the tree snapshot of %s", directory, exc_info=ex)
+        return False
+
+    try:
+        current_snapshot = _get_tree_snapshot(directory)
+    except OSError as ex:
+        LOG.debug("Failed to take the tree snapshot of %s", directory, exc_info=ex)
+        return False
+
+    if current_snapshot != snapshot:
+        LOG.debug("Files of %s were modified since it was materialized", directory)
+        return False
+    return True
+
+
+def _get_tree_snapshot(directory: str) -> Dict[str, List[int]]:
+    snapshot = {}
+    for root, _, files in os.walk(directory, followlinks=True):
+        for name in files:
+            path = os.path.join(root, name)
+            relative_path = os.path.relpath(path, directory)
+            if relative_path == TREE_SNAPSHOT_FILE_NAME:
+                continue
+            stat_result = os.stat(path)
+            snapshot[relative_path] = [stat_result.st_size, stat_result.st_mtime_ns]
+    return snapshot
+
+
+class _TreeMaterializer:
+    """
+    Creates the directories of a tree and clones or links its files, falling back to the next method as soon as one
+    is not supported, since it won't be supported for the other files of the same tree either
+    """
+
+    def __init__(self, allow_hardlinks: bool) -> None:
+        self._can_reflink = _reflink is not None
+        self._can_hardlink = allow_hardlinks
+        self.method: MaterializeMethod = MaterializeMethod.REFLINK
+
+    def link_tree(self, source: str, destination: str, is_root: bool = True) -> List[Tuple[str, str]]:
+        """
+        Creates the given tree, and returns the source and destination paths of the files which must be copied
+        """
+        os.makedirs(destination)
+        files_to_copy: List[Tuple[str, str]] = []
+        with os.scandir(source) as entries:
+            for entry in entries:
+                if is_root and entry.name == TREE_SNAPSHOT_FILE_NAME:
+                    continue
+                destination_path = os.path.join(destination, entry.name)
+                if entry.is_dir():
+                    files_to_copy.extend(self.link_tree(entry.path, destination_path, is_root=False))
+                elif not self._link_file(entry.path, destination_path):
+                    files_to_copy.append((entry.path, destination_path))
+
+        try:
+            shutil.copystat(source, destination)
+        except OSError as ex:
+            # Can't copy file access times in Windows
+            LOG.debug("Unable to copy file access times from %s to %s", source, destination, exc_info=ex)
+        return files_to_copy
+
+    def _link_file(self, source: str, destination: str) -> bool:
+        if self._can_reflink and _reflink:
+            try:
+                _reflink(source, destination)
+                shutil.copystat(source, destination)
+                return True
+            except OSError as ex:
+                if ex.errno not in _UNSUPPORTED_ERRNOS:
+                    raise
+                LOG.debug("Cloning files is not supported from %s to %s", source, destination, exc_info=ex)
+                self._can_reflink = False
+                _remove_if_exists(destination)
+
+        if self._can_hardlink:
+            try:
+                os.link(source, destination)
+                self._set_method(MaterializeMethod.HARDLINK)
+                return True
+            except OSError as ex:
+                if ex.errno not in _UNSUPPORTED_ERRNOS:
+                    raise
+                LOG.debug("Hard linking files is not supported from %s to %s", source, destination, exc_info=ex)
+                self._can_hardlink = False
+
+        self._set_method(MaterializeMethod.COPY)
+        return False
+
+    def _set_method(self, method: MaterializeMethod) -> None:
+        methods = list(MaterializeMethod)
+        if methods.index(method) > methods.index(self.method):
+            self.method = method
+
+
+def _remove_if_exists(path: str) -> None:
+    try:
+        os.remove(path)
+    except FileNotFoundError:
+        pass
+
+
+def _get_reflink_function() -> Optional[Callable[[str, str], None]]:
+    """
+    Returns the function cloning a file into a new one on this platform, or None if the platform can't clone files
+    """
+    system = platform.system().lower()
+    if system == "linux":
+        import fcntl  # pylint: disable=import-outside-toplevel
+
+        def _ficlone(source: str, destination: str) -> None:
+            with open(source, "rb") as source_file, open(destination, "wb") as destination_file:
+                fcntl.ioctl(destination_file.fileno(), _FICLONE, source_file.fileno())
+
+        return _ficlone
+
+    if system == "darwin":
+        import ctypes  # pylint: disable=import-outside-toplevel
+
+        try:
+            libc = ctypes.CDLL(None, use_errno=True)
+            clonefile = libc.clonefile
+        except (OSError, AttributeError):
+            return None
+
+        def _clonefile(source: str, destination: str) -> None:
+            if clonefile(os.fsencode(source), os.fsencode(destination), 0) != 0:
+                error_number = ctypes.get_errno()
+                raise OSError(error_number, os.strerror(error_number), source)
+
+        return _clonefile
+
+    return None
+
+
+_reflink = _get_reflink_function()
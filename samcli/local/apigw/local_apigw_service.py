@@ -6,11 +6,11 @@ import logging
 from datetime import datetime
 from io import StringIO
 from time import time
-from typing import Any, Dict, List, Optional, Tuple, Union
+from typing import Any, Dict, List, Optional, Set, Tuple, Union, cast
 
 from flask import Flask, Request, request
 from werkzeug.datastructures import Headers
-from werkzeug.routing import BaseConverter
+from werkzeug.routing import BaseConverter, Map, MapAdapter, Rule
 from werkzeug.serving import WSGIRequestHandler
 
 from samcli.commands.local.lib.exceptions import UnsupportedInlineCodeError
@@ -18,6 +18,7 @@ from samcli.commands.local.lib.local_lambda import LocalLambdaRunner
 from samcli.lib.providers.exceptions import MissingFunctionNameException
 from samcli.lib.providers.provider import Api, Cors
 from samcli.lib.telemetry.event import EventName, EventTracker, UsedFeature
+from samcli.lib.utils.phase_timer import EmulationPhase, record_phase
 from samcli.lib.utils.stream_writer import StreamWriter
 from samcli.local.apigw.authorizers.lambda_authorizer import LambdaAuthorizer
 from samcli.local.apigw.event_constructor import construct_v1_event, construct_v2_event_http
@@ -30,6 +31,7 @@ from samcli.local.apigw.exceptions import (
 )
 from samcli.local.apigw.path_converter import PathConverter
 from samcli.local.apigw.route import Route
+from samcli.local.apigw.route_index import RouteIndex
 from samcli.local.apigw.service_error_responses import ServiceErrorResponses
 from samcli.local.docker.exceptions import DockerContainerCreationFailedException
 from samcli.local.events.api_event import (
@@ -56,6 +58,56 @@ class CatchAllPathConverter(BaseConverter):
         return value
 
 
+class RouteIndexUrlAdapter(MapAdapter):
+    """
+    URL adapter of the Flask app which matches the requests with the route index first, and falls back to the
+    rules of the Flask app (e.g. static files) if none of the routes matches
+    """
+
+    def __init__(self, url_adapter: MapAdapter, route_index: RouteIndex, rules: Dict[str, Rule]):
+        super().__init__(
+            url_adapter.map,
+            url_adapter.server_name,
+            url_adapter.script_name,
+            url_adapter.subdomain,
+            url_adapter.url_scheme,
+            url_adapter.path_info,
+            url_adapter.default_method,
+            url_adapter.query_args,
+        )
+        self._route_index = route_index
+        self._rules = rules
+
+    def match(self, path_info=None, method=None, return_rule=False, query_args=None, websocket=None):
+        with record_phase(EmulationPhase.ROUTING):
+            route_match = self._route_index.match(
+                method or self.default_method,
+                self.path_info if path_info is None else path_info,
+            )
+        if not route_match:
+            return super().match(path_info, method, return_rule, query_args, websocket)
+
+        rule = self._rules[route_match.endpoint]
+        return (rule if return_rule else rule.endpoint), route_match.path_parameters
+
+
+class RouteIndexFlask(Flask):
+    """
+    Flask app which matches the requests with a route index before the rules of its url map
+    """
+
+    def __init__(self, import_name: str, route_index: RouteIndex, route_rules: Dict[str, Rule], **kwargs):
+        super().__init__(import_name, **kwargs)
+        self.route_index = route_index
+        self.route_rules = route_rules
+
+    def create_url_adapter(self, flask_request: Optional[Request]) -> Optional[MapAdapter]:
+        url_adapter = super().create_url_adapter(flask_request)
+        if url_adapter is None or flask_request is None:
+            return url_adapter
+        return RouteIndexUrlAdapter(url_adapter, self.route_index, self.route_rules)
+
+
 class LocalApigwService(BaseLocalService):
     _DEFAULT_PORT = 3000
     _DEFAULT_HOST = "127.0.0.1"
@@ -98,6 +150,11 @@ class LocalApigwService(BaseLocalService):
         self.lambda_runner = lambda_runner
         self.static_dir = static_dir
         self._dict_of_routes: Dict[str, Route] = {}
+        self._route_index = RouteIndex()
+        # rules of the routes in the route index per endpoint, they are not added to the Flask app
+        self._route_rules: Dict[str, Rule] = {}
+        # routes added for the $default route of the api
+        self._catch_all_routes: List[Route] = []
         self.stderr = stderr
 
         self._click_session_id = None
@@ -120,8 +177,11 @@ class LocalApigwService(BaseLocalService):
         # Setting sam local start-api to respond using HTTP/1.1 instead of the default HTTP/1.0
         WSGIRequestHandler.protocol_version = "HTTP/1.1"
 
-        self._app = Flask(
+        # Requests are matched with the route index, instead of adding a Flask rule per route
+        self._app = RouteIndexFlask(
             __name__,
+            route_index=self._route_index,
+            route_rules=self._route_rules,
             static_url_path="",  # Mount static files at root '/'
             static_folder=self.static_dir,  # Serve static files from this directory
         )
@@ -134,39 +194,146 @@ class LocalApigwService(BaseLocalService):
 
         # This will normalize all endpoints and strip any trailing '/'
         self._app.url_map.strict_slashes = False
-        default_route = None
-
         for api_gateway_route in self.api.routes:
-            if api_gateway_route.path == "$default":
-                default_route = api_gateway_route
-                continue
-            path = PathConverter.convert_path_to_flask(api_gateway_route.path)
-            for route_key in self._generate_route_keys(api_gateway_route.methods, path):
-                self._dict_of_routes[route_key] = api_gateway_route
-            self._app.add_url_rule(
-                path,
-                endpoint=path,
-                view_func=self._request_handler,
-                methods=api_gateway_route.methods,
-                provide_automatic_options=False,
-            )
-
-        if default_route:
-            LOG.debug("add catch-all route")
-            all_methods = Route.ANY_HTTP_METHODS
-            try:
-                rules_iter = self._app.url_map.iter_rules("/")
-                while True:
-                    rule = next(rules_iter)
-                    all_methods = [method for method in all_methods if method not in rule.methods]
-            except (KeyError, StopIteration):
-                pass
+            if api_gateway_route.path != "$default":
+                self._register_route(api_gateway_route)
 
-            self._add_catch_all_path(all_methods, "/", default_route)
-            self._add_catch_all_path(Route.ANY_HTTP_METHODS, "/<path:any_path>", default_route)
+        self._register_default_route()
 
         self._construct_error_handling()
 
+    def update_api(self, api: Api) -> None:
+        """
+        Updates the running service with the given Api, e.g. after the template changed. Only the routes which were
+        added, removed or changed are updated, the Flask app is not created again.
+
+        Parameters
+        ----------
+        api : Api
+            Updated Api object that contains the list of routes and properties
+        """
+        routes = cast(List[Route], api.routes)
+        removed_routes = _get_missing_routes(cast(List[Route], self.api.routes), routes)
+        added_routes = _get_missing_routes(routes, cast(List[Route], self.api.routes))
+        self.api = api
+        LOG.debug("Updating the api, %d routes removed and %d routes added", len(removed_routes), len(added_routes))
+
+        for route in removed_routes:
+            if route.path != "$default":
+                self._unregister_route(route)
+
+        # the remaining routes of the paths of the removed routes are added again, in case a removed route was replacing
+        # them for some methods
+        removed_paths = {route.path for route in removed_routes}
+        added_route_ids = {id(route) for route in added_routes}
+        for route in routes:
+            if route.path != "$default" and (id(route) in added_route_ids or route.path in removed_paths):
+                self._register_route(route)
+
+        if any(route.path in ("$default", "/") for route in removed_routes + added_routes):
+            for catch_all_route in self._catch_all_routes:
+                self._remove_route_keys(catch_all_route.path, catch_all_route.methods)
+            self._remove_url_rules({catch_all_route.path for catch_all_route in self._catch_all_routes})
+            self._catch_all_routes = []
+            self._register_default_route()
+
+    def _register_route(self, route: Route) -> None:
+        """
+        Adds the route to the dictionary of routes, and to the route index or the Flask app
+
+        :param Route route: Route to add
+        """
+        path = PathConverter.convert_path_to_flask(route.path)
+        for route_key in self._generate_route_keys(route.methods, path):
+            self._dict_of_routes[route_key] = route
+        self._add_route(path, route.methods, route)
+
+    def _unregister_route(self, route: Route) -> None:
+        """
+        Removes the route from the dictionary of routes, and from the route index or the Flask app
+
+        :param Route route: Route to remove
+        """
+        path = PathConverter.convert_path_to_flask(route.path)
+        self._remove_route_keys(path, route.methods)
+        apigw_path = PathConverter.convert_path_to_api_gateway(path)
+        if RouteIndex.is_supported_path(apigw_path):
+            self._route_index.remove(apigw_path, route.methods)
+        else:
+            self._remove_url_rules({path})
+
+    def _remove_route_keys(self, path: str, methods: List[str]) -> None:
+        """
+        Removes the routes of the path and methods from the dictionary of routes
+
+        :param str path: Flask path of the route
+        :param list(str) methods: List of HTTP Methods
+        """
+        for route_key in self._generate_route_keys(methods, path):
+            self._dict_of_routes.pop(route_key, None)
+
+    def _remove_url_rules(self, paths: Set[str]) -> None:
+        """
+        Removes the rules of the given paths from the Flask app. Werkzeug can't remove rules from a url map, so the
+        url map is replaced by a new one with the other rules.
+
+        :param set(str) paths: Flask paths of the rules to remove
+        """
+        url_map = self._app.url_map
+        self._app.url_map = Map(
+            [rule.empty() for rule in url_map.iter_rules() if rule.endpoint not in paths],
+            strict_slashes=url_map.strict_slashes,
+            merge_slashes=url_map.merge_slashes,
+            host_matching=url_map.host_matching,
+            converters=url_map.converters,
+        )
+
+    def _register_default_route(self) -> None:
+        """
+        Adds the catch-all routes of the $default route of the api, if any
+        """
+        default_routes = [route for route in cast(List[Route], self.api.routes) if route.path == "$default"]
+        if not default_routes:
+            return
+
+        LOG.debug("add catch-all route")
+        default_route = default_routes[-1]
+        all_methods = [
+            method for method in Route.ANY_HTTP_METHODS if self._route_key(method, "/") not in self._dict_of_routes
+        ]
+
+        self._add_catch_all_path(all_methods, "/", default_route)
+        self._add_catch_all_path(Route.ANY_HTTP_METHODS, "/<path:any_path>", default_route)
+
+    def _add_route(self, path: str, methods: List[str], route: Route) -> None:
+        """
+        Adds the route to the route index, or to the Flask app if its path is not supported by the route index
+
+        :param str path: Flask path of the route
+        :param list(str) methods: List of HTTP Methods
+        :param Route route: Route to invoke for the path and methods
+        """
+        apigw_path = PathConverter.convert_path_to_api_gateway(path)
+        if not RouteIndex.is_supported_path(apigw_path):
+            self._add_url_rule(path, methods)
+            return
+
+        self._route_index.add(apigw_path, methods, route)
+        if path not in self._route_rules:
+            self._route_rules[path] = Rule(path, endpoint=path)
+            self._app.view_functions[path] = self._request_handler
+
+    def _add_url_rule(self, path: str, methods: List[str]) -> None:
+        """
+        Adds a rule for the path to the Flask app. It is added to the url map directly, since Flask doesn't allow
+        adding rules once it handled a request.
+
+        :param str path: Flask path of the route
+        :param list(str) methods: List of HTTP Methods
+        """
+        self._app.url_map.add(Rule(path, endpoint=path, methods=methods))
+        self._app.view_functions[path] = self._request_handler
+
     def _add_catch_all_path(self, methods: List[str], path: str, route: Route):
         """
         Add the catch all route to the _app and the dictionary of routes.
@@ -176,26 +343,24 @@ class LocalApigwService(BaseLocalService):
         :param Route route: contains the default route configurations
         """
 
-        self._app.add_url_rule(
-            path,
-            endpoint=path,
-            view_func=self._request_handler,
+        catch_all_route = Route(
+            function_name=route.function_name,
+            path=path,
             methods=methods,
-            provide_automatic_options=False,
+            event_type=Route.HTTP,
+            payload_format_version=route.payload_format_version,
+            is_default_route=True,
+            stack_path=route.stack_path,
+            authorizer_name=route.authorizer_name,
+            authorizer_object=route.authorizer_object,
+            use_default_authorizer=route.use_default_authorizer,
         )
         for route_key in self._generate_route_keys(methods, path):
-            self._dict_of_routes[route_key] = Route(
-                function_name=route.function_name,
-                path=path,
-                methods=methods,
-                event_type=Route.HTTP,
-                payload_format_version=route.payload_format_version,
-                is_default_route=True,
-                stack_path=route.stack_path,
-                authorizer_name=route.authorizer_name,
-                authorizer_object=route.authorizer_object,
-                use_default_authorizer=route.use_default_authorizer,
-            )
+            self._dict_of_routes[route_key] = catch_all_route
+        # catch-all paths are added to the Flask app, so they only match the requests which don't match another
+        # route, including the routes which are not in the route index
+        self._add_url_rule(path, methods)
+        self._catch_all_routes.append(catch_all_route)
 
     def _generate_route_keys(self, methods, path):
         """
@@ -613,11 +778,13 @@ class LocalApigwService(BaseLocalService):
             A string or bytes containing the output from the Lambda function
         """
         with StringIO() as stdout:
-            event_str = json.dumps(event, sort_keys=True)
+            with record_phase(EmulationPhase.EVENT_CONSTRUCTION):
+                event_str = json.dumps(event, sort_keys=True)
             stdout_writer = StreamWriter(stdout, auto_flush=True)
 
             self.lambda_runner.invoke(lambda_function_name, event_str, stdout=stdout_writer, stderr=self.stderr)
-            lambda_response, is_lambda_user_error_response = LambdaOutputParser.get_lambda_output(stdout)
+            with record_phase(EmulationPhase.RESPONSE_PARSING):
+                lambda_response, is_lambda_user_error_response = LambdaOutputParser.get_lambda_output(stdout)
             if is_lambda_user_error_response:
                 raise LambdaResponseParseException
 
@@ -647,7 +814,11 @@ class LocalApigwService(BaseLocalService):
         Response object
         """
 
-        route: Route = self._get_current_route(request)
+        try:
+            route: Route = self._get_current_route(request)
+        except KeyError:
+            # the route was removed from the api while the service is running
+            return ServiceErrorResponses.route_not_found()
 
         request_origin = request.headers.get("Origin")
         cors_headers = Cors.cors_to_headers(self.api.cors, request_origin, route.event_type)
@@ -672,11 +843,12 @@ class LocalApigwService(BaseLocalService):
             return ServiceErrorResponses.missing_lambda_auth_identity_sources()
 
         try:
-            route_lambda_event = self._generate_lambda_event(request, route, method, endpoint)
-            auth_lambda_event = None
+            with record_phase(EmulationPhase.EVENT_CONSTRUCTION):
+                route_lambda_event = self._generate_lambda_event(request, route, method, endpoint)
+                auth_lambda_event = None
 
-            if lambda_authorizer:
-                auth_lambda_event = self._generate_lambda_authorizer_event(request, route, lambda_authorizer)
+                if lambda_authorizer:
+                    auth_lambda_event = self._generate_lambda_authorizer_event(request, route, lambda_authorizer)
         except UnicodeDecodeError as error:
             LOG.error("UnicodeDecodeError while processing HTTP request: %s", error)
             return ServiceErrorResponses.lambda_failure_response()
@@ -743,16 +915,17 @@ class LocalApigwService(BaseLocalService):
             return endpoint_service_error
 
         try:
-            if route.event_type == Route.HTTP and (
-                not route.payload_format_version or route.payload_format_version == "2.0"
-            ):
-                (status_code, headers, body) = self._parse_v2_payload_format_lambda_output(
-                    lambda_response, self.api.binary_media_types, request
-                )
-            else:
-                (status_code, headers, body) = self._parse_v1_payload_format_lambda_output(
-                    lambda_response, self.api.binary_media_types, request, route.event_type
-                )
+            with record_phase(EmulationPhase.RESPONSE_PARSING):
+                if route.event_type == Route.HTTP and (
+                    not route.payload_format_version or route.payload_format_version == "2.0"
+                ):
+                    (status_code, headers, body) = self._parse_v2_payload_format_lambda_output(
+                        lambda_response, self.api.binary_media_types, request
+                    )
+                else:
+                    (status_code, headers, body) = self._parse_v1_payload_format_lambda_output(
+                        lambda_response, self.api.binary_media_types, request, route.event_type
+                    )
         except LambdaResponseParseException as ex:
             LOG.error("Invalid lambda response received: %s", ex)
             return ServiceErrorResponses.lambda_failure_response()
@@ -803,12 +976,15 @@ class LocalApigwService(BaseLocalService):
         Get the route (Route) based on the current request
 
         :param request flask_request: Flask Request
-        :return: Route matching the endpoint and method of the request
+        :return: Route matching the endpoint and method of the request, a HEAD request without a HEAD route is
+            handled by the GET route like Flask does
         """
         method, endpoint = self.get_request_methods_endpoints(flask_request)
 
         route_key = self._route_key(method, endpoint)
         route = self._dict_of_routes.get(route_key, None)
+        if not route and method == "HEAD":
+            route = self._dict_of_routes.get(self._route_key("GET", endpoint), None)
 
         if not route:
             LOG.debug(
@@ -1081,3 +1257,24 @@ class LocalApigwService(BaseLocalService):
             processed_headers.add(header, headers[header])
 
         return processed_headers
+
+
+def _get_missing_routes(routes: List[Route], other_routes: List[Route]) -> List[Route]:
+    """
+    Returns the routes which don't have an identical route in the other routes
+    """
+    other_routes_per_hash: Dict[int, List[Route]] = {}
+    for other_route in other_routes:
+        other_routes_per_hash.setdefault(hash(other_route), []).append(other_route)
+
+    return [
+        route
+        for route in routes
+        if not any(
+            route == other_route
+            and route.event_type == other_route.event_type
+            and route.payload_format_version == other_route.payload_format_version
+            and route.is_default_route == other_route.is_default_route
+            for other_route in other_routes_per_hash.get(hash(route), [])
+        )
+    ]
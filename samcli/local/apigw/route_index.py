@@ -0,0 +1,191 @@
+"""
+Index of the routes of an Api, which finds the route of a request the way API Gateway does
+"""
+
+from typing import Dict, List, NamedTuple, Optional
+
+from samcli.local.apigw.path_converter import PathConverter
+from samcli.local.apigw.route import Route
+
+
+class RouteMatch(NamedTuple):
+    """
+    Route matching a request, with the path parameters of the request
+    """
+
+    route: Route
+    # path of the route in the format used by Flask, which is also its endpoint
+    endpoint: str
+    path_parameters: Dict[str, str]
+
+
+class _RouteEntry(NamedTuple):
+    route: Route
+    endpoint: str
+
+
+class _RouteNode:
+    """
+    Node of the route tree, for one segment of the route paths
+    """
+
+    __slots__ = ("static_children", "parameter_children", "greedy_routes", "routes")
+
+    def __init__(self) -> None:
+        # children per static segment value
+        self.static_children: Dict[str, "_RouteNode"] = {}
+        # children per path parameter name, for segments like {id}
+        self.parameter_children: Dict[str, "_RouteNode"] = {}
+        # routes per greedy path parameter name and method, for the last segments like {proxy+}
+        self.greedy_routes: Dict[str, Dict[str, _RouteEntry]] = {}
+        # routes per method, whose path ends at this node
+        self.routes: Dict[str, _RouteEntry] = {}
+
+
+class RouteIndex:
+    """
+    Tree of route paths, one level per path segment, which matches a request with a single walk down the tree instead
+    of trying every route. Segments are matched in API Gateway precedence order, static segments first, then path
+    parameters like {id}, then greedy path parameters like {proxy+}, and the next candidates are tried if the more
+    specific ones don't lead to a route of the request method. Like the Flask rules, a HEAD request matches the GET
+    route of a path that has no HEAD route.
+    """
+
+    def __init__(self) -> None:
+        self._root = _RouteNode()
+
+    @staticmethod
+    def is_supported_path(path: str) -> bool:
+        """
+        Returns whether the given API Gateway path can be added to the index, path parameters must take whole
+        segments and greedy path parameters must be the last segment
+        """
+        segments = _split_path(path)
+        for position, segment in enumerate(segments):
+            is_parameter = segment.startswith("{") and segment.endswith("}")
+            if not is_parameter and ("{" in segment or "}" in segment):
+                return False
+            if is_parameter and segment.endswith("+}") and position != len(segments) - 1:
+                return False
+        return True
+
+    def add(self, path: str, methods: List[str], route: Route) -> None:
+        """
+        Adds the given route, a route added later replaces the previous one with the same path and method
+
+        Parameters
+        ----------
+        path: str
+            API Gateway path of the route, e.g. /users/{id}/{proxy+}, it must be supported by the index
+        methods: List[str]
+            HTTP methods of the route
+        route: Route
+            Route to return when a request matches the path and one of the methods
+        """
+        routes = self._get_routes(path, create=True)
+        if routes is None:
+            return
+        entry = _RouteEntry(route, PathConverter.convert_path_to_flask(path))
+        for method in methods:
+            routes[method] = entry
+
+    def remove(self, path: str, methods: List[str]) -> None:
+        """
+        Removes the routes of the given path and methods
+
+        Parameters
+        ----------
+        path: str
+            API Gateway path of the route
+        methods: List[str]
+            HTTP methods of the route
+        """
+        routes = self._get_routes(path, create=False)
+        if routes is None:
+            return
+        for method in methods:
+            routes.pop(method, None)
+
+    def _get_routes(self, path: str, create: bool) -> Optional[Dict[str, _RouteEntry]]:
+        """
+        Returns the routes per method of the given path, creating the missing nodes if create is True
+        """
+        node = self._root
+        for segment in _split_path(path):
+            if segment.endswith("+}"):
+                if create:
+                    return node.greedy_routes.setdefault(segment[1:-2], {})
+                return node.greedy_routes.get(segment[1:-2])
+            if segment.startswith("{"):
+                children, name = node.parameter_children, segment[1:-1]
+            else:
+                children, name = node.static_children, segment
+            child = children.get(name)
+            if not child:
+                if not create:
+                    return None
+                child = children[name] = _RouteNode()
+            node = child
+        return node.routes
+
+    def match(self, method: str, path: str) -> Optional[RouteMatch]:
+        """
+        Finds the route of the given request
+
+        Parameters
+        ----------
+        method: str
+            HTTP method of the request
+        path: str
+            Decoded path of the request, a trailing slash is ignored
+
+        Returns
+        -------
+        Optional[RouteMatch]
+            Route matching the request with its path parameters, or None if no route matches
+        """
+        path_parameters: Dict[str, str] = {}
+        entry = self._match(self._root, _split_path(path), 0, method, path_parameters)
+        if not entry:
+            return None
+        return RouteMatch(entry.route, entry.endpoint, path_parameters)
+
+    def _match(
+        self, node: _RouteNode, segments: List[str], position: int, method: str, path_parameters: Dict[str, str]
+    ) -> Optional[_RouteEntry]:
+        if position == len(segments):
+            return _get_method_entry(node.routes, method)
+
+        segment = segments[position]
+        static_child = node.static_children.get(segment)
+        if static_child:
+            entry = self._match(static_child, segments, position + 1, method, path_parameters)
+            if entry:
+                return entry
+
+        if segment:
+            for name, parameter_child in node.parameter_children.items():
+                entry = self._match(parameter_child, segments, position + 1, method, path_parameters)
+                if entry:
+                    path_parameters[name] = segment
+                    return entry
+
+        for name, greedy_routes in node.greedy_routes.items():
+            entry = _get_method_entry(greedy_routes, method)
+            if entry:
+                path_parameters[name] = "/".join(segments[position:])
+                return entry
+
+        return None
+
+
+def _get_method_entry(routes: Dict[str, _RouteEntry], method: str) -> Optional[_RouteEntry]:
+    entry = routes.get(method)
+    if not entry and method == "HEAD":
+        return routes.get("GET")
+    return entry
+
+
+def _split_path(path: str) -> List[str]:
+    path = path.strip("/")
+    return path.split("/") if path else []
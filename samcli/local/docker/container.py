@@ -10,7 +10,6 @@ import pathlib
 import re
 import shutil
 import socket
-import tempfile
 import threading
 import time
 from typing import Dict, Iterator, Optional, Tuple, Union
@@ -25,9 +24,10 @@ from docker.errors import (
 )
 
 from samcli.lib.constants import DOCKER_MIN_API_VERSION
+from samcli.lib.utils.phase_timer import EmulationPhase, record_phase
 from samcli.lib.utils.retry import retry
 from samcli.lib.utils.stream_writer import StreamWriter
-from samcli.lib.utils.tar import extract_tarfile
+from samcli.lib.utils.tar import extract_tarfile_stream
 from samcli.local.docker.effective_user import ROOT_USER_ID, EffectiveUser
 from samcli.local.docker.exceptions import (
     ContainerNotStartableException,
@@ -46,6 +46,13 @@ CONCURRENT_CALL_MANAGER_LOCK = threading.Lock()
 # Keeps locks per container (aka per function) so that one function can be invoked one at a time
 CONCURRENT_CALL_MANAGER: Dict[str, threading.Lock] = {}
 
+# The RIE writes this line to the container logs at the end of every invoke, it is used as the end-of-invoke marker
+END_OF_INVOKE_LOG_PATTERN = re.compile(
+    r"^REPORT RequestId:\s.+ Duration:\s.+\sMemory Size:\s.+\sMax Memory Used:\s.+", re.MULTILINE
+)
+# Max length of the trailing partial log line kept to detect a marker split across two log frames
+MAX_PENDING_LOG_LINE_LENGTH = 4096
+
 
 class ContainerResponseException(Exception):
     """
@@ -407,12 +414,19 @@ class Container:
                 lock = threading.Lock()
                 CONCURRENT_CALL_MANAGER[lock_key] = lock
         LOG.debug("Waiting to retrieve the lock (%s) to start invocation", lock_key)
-        with lock:
-            resp = requests.post(
-                self.URL.format(host=self._container_host, port=self.rapid_port_host, function_name="function"),
-                data=event.encode("utf-8"),
-                timeout=(self.RAPID_CONNECTION_TIMEOUT, None),
-            )
+        # waiting for the invocations in flight is part of waiting for the container, so that the round-trip phase
+        # only measures the time the container is busy with this invocation
+        with record_phase(EmulationPhase.CONTAINER_WAIT):
+            lock.acquire()
+        try:
+            with record_phase(EmulationPhase.RIE_ROUND_TRIP, resource=self.id):
+                resp = requests.post(
+                    self.URL.format(host=self._container_host, port=self.rapid_port_host, function_name="function"),
+                    data=event.encode("utf-8"),
+                    timeout=(self.RAPID_CONNECTION_TIMEOUT, None),
+                )
+        finally:
+            lock.release()
 
         try:
             # if response is an image then json.loads/dumps will throw a UnicodeDecodeError so return raw content
@@ -439,7 +453,8 @@ class Container:
 
         # wait_for_http_response will attempt to establish a connection to the socket
         # but it'll fail if the socket is not listening yet, so we wait for the socket
-        self._wait_for_socket_connection()
+        with record_phase(EmulationPhase.CONTAINER_WAIT):
+            self._wait_for_socket_connection()
 
         # start the timer for function timeout right before executing the function, as waiting for the socket
         # can take some time
@@ -448,7 +463,10 @@ class Container:
         if timer:
             timer.cancel()
 
-        self._logs_thread_event.wait(timeout=1)
+        # wait for the end-of-invoke marker, so the function logs are written before its response. There is nothing
+        # to wait for if the logs stream is already closed
+        if self._logs_thread.is_alive():
+            self._logs_thread_event.wait(timeout=1)
         if isinstance(response, str):
             stdout.write_str(response)
         elif isinstance(response, bytes) and is_image:
@@ -516,15 +534,10 @@ class Container:
         real_container = self.docker_client.containers.get(self.id)
 
         LOG.debug("Copying from container: %s -> %s", from_container_path, to_host_path)
-        with tempfile.NamedTemporaryFile() as fp:
-            tar_stream, _ = real_container.get_archive(from_container_path)
-            for data in tar_stream:
-                fp.write(data)
-
-            # Seek the handle back to start of file for tarfile to use
-            fp.seek(0)
+        tar_stream, _ = real_container.get_archive(from_container_path)
 
-            extract_tarfile(file_obj=fp, unpack_dir=to_host_path)
+        # extract the archive while it is downloaded, instead of writing it into a temporary file first
+        extract_tarfile_stream(tar_stream, unpack_dir=to_host_path)
 
     @staticmethod
     def _write_container_output(
@@ -544,17 +557,27 @@ class Container:
             Stream writer to write stdout data from Container into
         stderr: samcli.lib.utils.stream_writer.StreamWriter, optional
             Stream writer to write stderr data from the Container into
+        event: threading.Event, optional
+            Event to set whenever the end-of-invoke marker is found in the Container output
         """
+        # trailing partial lines of each stream, a log line can be split across two frames
+        pending_lines = {"stdout": "", "stderr": ""}
 
         # following iterator might throw an exception (see: https://github.com/aws/aws-sam-cli/issues/4222)
         try:
             # Iterator returns a tuple of (stdout, stderr)
             for stdout_data, stderr_data in output_itr:
                 if stdout_data and stdout:
-                    Container._handle_data_writing(stdout, stdout_data, event)
+                    output_str = Container._handle_data_writing(stdout, stdout_data)
+                    pending_lines["stdout"] = Container._detect_end_of_invoke(
+                        pending_lines["stdout"] + output_str, event
+                    )
 
                 if stderr_data and stderr:
-                    Container._handle_data_writing(stderr, stderr_data, event)
+                    output_str = Container._handle_data_writing(stderr, stderr_data)
+                    pending_lines["stderr"] = Container._detect_end_of_invoke(
+                        pending_lines["stderr"] + output_str, event
+                    )
         except Exception as ex:
             LOG.debug("Failed to get the logs from the container", exc_info=ex)
 
@@ -562,14 +585,12 @@ class Container:
     def _handle_data_writing(
         output_stream: Union[StreamWriter, io.BytesIO, io.TextIOWrapper],
         output_data: bytes,
-        event: Optional[threading.Event],
-    ):
+    ) -> str:
         # Decode the output and strip the string of carriage return characters. Stack traces are returned
         # with carriage returns from the RIE. If these are left in the string then only the last line after
         # the carriage return will be printed instead of the entire stack trace. Encode the string after cleaning
         # to be printed by the correct output stream
         output_str = output_data.decode("utf-8").replace("\r", os.linesep)
-        pattern = r"(.*\s)?REPORT RequestId:\s.+ Duration:\s.+\sMemory Size:\s.+\sMax Memory Used:\s.+"
         if isinstance(output_stream, StreamWriter):
             output_stream.write_str(output_str)
             output_stream.flush()
@@ -579,8 +600,36 @@ class Container:
 
         if isinstance(output_stream, io.TextIOWrapper):
             output_stream.buffer.write(output_str.encode("utf-8"))
-        if re.match(pattern, output_str) is not None and event:
+        return output_str
+
+    @staticmethod
+    def _detect_end_of_invoke(output_str: str, event: Optional[threading.Event]) -> str:
+        """
+        Sets the given event if the output contains the end-of-invoke marker, and returns the trailing partial line
+        of the output which should be prepended to the next frame of the same stream
+
+        Parameters
+        ----------
+        output_str: str
+            Output of the container, including the pending partial line of the previous frame
+        event: threading.Event, optional
+            Event to set when the end-of-invoke marker is found
+
+        Returns
+        -------
+        str
+            The trailing partial line of the output, empty if the output ends with a new line
+        """
+        if not event:
+            return ""
+
+        if END_OF_INVOKE_LOG_PATTERN.search(output_str):
             event.set()
+            # do not carry the marker over, otherwise it would be detected again in the next frame
+            return ""
+
+        _, _, pending_line = output_str.rpartition("\n")
+        return pending_line[-MAX_PENDING_LOG_LINE_LENGTH:]
 
     # This method exists because otherwise when writing tests patching/mocking threading.Event breaks everything
     # this allows for the tests to exist as they do currently without any major refactoring
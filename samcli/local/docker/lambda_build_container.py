@@ -60,6 +60,7 @@ class LambdaBuildContainer(Container):
         build_in_source=None,
         mount_with_write: bool = False,
         build_dir=None,
+        container_dirs=None,
     ):
         abs_manifest_path = pathlib.Path(manifest_path).resolve()
         manifest_file_name = abs_manifest_path.name
@@ -67,7 +68,7 @@ class LambdaBuildContainer(Container):
 
         source_dir = str(pathlib.Path(source_dir).resolve())
 
-        container_dirs = LambdaBuildContainer.get_container_dirs(source_dir, manifest_dir)
+        container_dirs = container_dirs or LambdaBuildContainer.get_container_dirs(source_dir, manifest_dir)
         env_vars = env_vars if env_vars else {}
 
         # `executable_search_paths` are provided as a list of paths on the host file system that needs to passed to
@@ -139,6 +140,20 @@ class LambdaBuildContainer(Container):
     def executable_name(self):
         return LambdaBuildContainer._BUILDERS_EXECUTABLE
 
+    @property
+    def entrypoint(self):
+        """
+        Returns the command running the build, made of the builders executable and the build request
+        """
+        return self._entrypoint
+
+    @property
+    def env_vars(self):
+        """
+        Returns the environment variables of the build
+        """
+        return self._env_vars
+
     @staticmethod
     def _make_request(
         protocol_version,
@@ -0,0 +1,244 @@
+"""
+Pool of long-lived build containers, which are reused for successive builds inside container
+"""
+
+import logging
+import os
+import pathlib
+import threading
+from contextlib import contextmanager
+from typing import Dict, Iterator, List, Optional, Union
+from uuid import uuid4
+
+from samcli.local.docker.container import Container
+from samcli.local.docker.lambda_build_container import LambdaBuildContainer
+from samcli.local.docker.manager import ContainerManager
+
+LOG = logging.getLogger(__name__)
+
+# Named volume which keeps the package manager caches between builds, and between `sam build` runs
+BUILD_CACHE_VOLUME_NAME = "aws-sam-cli-build-cache"
+BUILD_CACHE_DIR = "/tmp/samcli-cache"
+
+# Environment variables pointing the package managers to their caches in the cache volume
+BUILD_CACHE_ENV_VARS = {
+    "PIP_CACHE_DIR": f"{BUILD_CACHE_DIR}/pip",
+    "npm_config_cache": f"{BUILD_CACHE_DIR}/npm",
+    "GOMODCACHE": f"{BUILD_CACHE_DIR}/go-mod",
+    "GRADLE_USER_HOME": f"{BUILD_CACHE_DIR}/gradle",
+    "MAVEN_OPTS": f"-Dmaven.repo.local={BUILD_CACHE_DIR}/maven",
+}
+
+
+class PersistentBuildContainer(Container):
+    """
+    Build container which keeps running until it is stopped, and runs each build through ``docker exec``.
+    The root directory of the project is mounted into the container, so it can build any function or layer in it.
+    """
+
+    _BASE_DIR = "/tmp/samcli"
+    _PROJECT_DIR = f"{_BASE_DIR}/project"
+    # keeps the container running without doing anything, builds are executed separately
+    _IDLE_ENTRYPOINT = ["tail", "-f", "/dev/null"]
+
+    def __init__(self, image: str, project_dir: str, docker_client=None):
+        """
+        Parameters
+        ----------
+        image: str
+            Build image of the container
+        project_dir: str
+            Root directory of the project on the host, which is mounted into the container
+        docker_client: docker.DockerClient, optional
+            Docker client to replace the default one loaded from env
+        """
+        super().__init__(
+            image,
+            [],
+            self._PROJECT_DIR,
+            project_dir,
+            entrypoint=self._IDLE_ENTRYPOINT,
+            env_vars=dict(BUILD_CACHE_ENV_VARS),
+            docker_client=docker_client,
+            additional_volumes={BUILD_CACHE_VOLUME_NAME: {"bind": BUILD_CACHE_DIR, "mode": "rw"}},
+        )
+
+    @staticmethod
+    def get_container_dirs(source_dir: str, manifest_dir: str, project_dir: str) -> Optional[Dict[str, str]]:
+        """
+        Provides paths to directories within the container that is required by the builder, for a build of the given
+        source and manifest directories. Each build gets its own artifacts and scratch directories.
+
+        Parameters
+        ----------
+        source_dir : str
+            Path to the function source code
+        manifest_dir : str
+            Path to the directory containing manifest
+        project_dir : str
+            Root directory of the project which is mounted into the container
+
+        Returns
+        -------
+        Optional[Dict[str, str]]
+            Contains paths to base, source, artifacts, scratch & manifest directories, or None if the source or the
+            manifest directory are not within the project directory
+        """
+        source_dir_in_container = PersistentBuildContainer._to_container_path(source_dir, project_dir)
+        manifest_dir_in_container = PersistentBuildContainer._to_container_path(manifest_dir, project_dir)
+        if not source_dir_in_container or not manifest_dir_in_container:
+            return None
+
+        base = f"{PersistentBuildContainer._BASE_DIR}/builds/{uuid4().hex}"
+        return {
+            "base_dir": base,
+            "source_dir": source_dir_in_container,
+            "artifacts_dir": f"{base}/artifacts",
+            "scratch_dir": f"{base}/scratch",
+            "manifest_dir": manifest_dir_in_container,
+        }
+
+    @staticmethod
+    def _to_container_path(host_path: str, project_dir: str) -> Optional[str]:
+        path = pathlib.Path(host_path).resolve()
+        project_path = pathlib.Path(project_dir).resolve()
+        if path != project_path and project_path not in path.parents:
+            return None
+
+        # only the project directory itself is mounted, symlinks pointing outside of it can't be resolved
+        if any(child.is_symlink() for child in path.iterdir()):
+            return None
+
+        relative_path = path.relative_to(project_path).as_posix()
+        return PersistentBuildContainer._PROJECT_DIR + ("" if relative_path == "." else f"/{relative_path}")
+
+    def exec_build(self, build_container: LambdaBuildContainer, stdout, stderr) -> Optional[int]:
+        """
+        Runs the build of the given build container inside this container, and writes its output to the given streams
+
+        Parameters
+        ----------
+        build_container: LambdaBuildContainer
+            Build container whose build is executed, it must be created with the container directories returned by
+            ``get_container_dirs``
+        stdout: io.BytesIO
+            Stream to write the response of the builder into
+        stderr: samcli.lib.utils.stream_writer.StreamWriter
+            Stream to write the logs of the builder into
+
+        Returns
+        -------
+        Optional[int]
+            Exit code of the builder
+        """
+        return self._exec(build_container.entrypoint, build_container.env_vars, stdout, stderr)
+
+    def clean(self, container_dirs: Dict[str, str]) -> None:
+        """
+        Deletes the artifacts and scratch directories of a completed build
+
+        Parameters
+        ----------
+        container_dirs: Dict[str, str]
+            Container directories of the build, returned by ``get_container_dirs``
+        """
+        self._exec(["rm", "-rf", container_dirs["base_dir"]])
+
+    def _exec(self, cmd: List[str], env_vars: Optional[Dict] = None, stdout=None, stderr=None) -> Optional[int]:
+        if not self.is_created():
+            raise RuntimeError("Container does not exist. Cannot run a command in this container")
+
+        exec_id = self.docker_client.api.exec_create(self.id, cmd, environment=env_vars, workdir=self._working_dir)
+        output_itr = self.docker_client.api.exec_start(exec_id, stream=True, demux=True)
+        # consumes the whole output, so the command is completed when returning
+        self._write_container_output(output_itr, stdout=stdout, stderr=stderr)
+        exit_code: Optional[int] = self.docker_client.api.exec_inspect(exec_id).get("ExitCode")
+        return exit_code
+
+
+class LambdaBuildContainerPool:
+    """
+    Pool of long-lived build containers per build image. A container runs one build at a time, and it is given back to
+    the pool to run the next build once the previous one is completed, so the container creation and the toolchain
+    warm-up are paid once per image instead of once per build. Containers are stopped by ``shutdown``.
+    This class is thread-safe.
+    """
+
+    def __init__(self, container_manager: ContainerManager, project_dir: str) -> None:
+        """
+        Parameters
+        ----------
+        container_manager: ContainerManager
+            Container manager to create, run and stop the containers with
+        project_dir: str
+            Root directory of the project which is mounted into the containers, only the functions and layers inside
+            it can be built in the pooled containers
+        """
+        self._container_manager = container_manager
+        self._project_dir = project_dir
+        self._lock = threading.Lock()
+        self._idle_containers: Dict[str, List[PersistentBuildContainer]] = {}
+        self._containers: List[PersistentBuildContainer] = []
+
+    def get_container_dirs(self, source_dir: str, manifest_path: Union[str, pathlib.Path]) -> Optional[Dict[str, str]]:
+        """
+        Returns the container directories for a build in a pooled container, or None if the given source and
+        manifest can't be built in a pooled container
+        """
+        manifest_dir = str(pathlib.Path(manifest_path).resolve().parent)
+        if not os.path.isdir(source_dir):
+            return None
+        return PersistentBuildContainer.get_container_dirs(source_dir, manifest_dir, self._project_dir)
+
+    @contextmanager
+    def acquire(self, image: str) -> Iterator[PersistentBuildContainer]:
+        """
+        Gives a running container of the given image which is not running another build, creating it if there is no
+        idle container, and takes it back to the pool on exit.
+
+        Parameters
+        ----------
+        image: str
+            Build image of the container
+        """
+        with self._lock:
+            idle_containers = self._idle_containers.setdefault(image, [])
+            container = idle_containers.pop() if idle_containers else None
+
+        if not container:
+            LOG.debug("Starting a new build container of %s", image)
+            container = PersistentBuildContainer(image, self._project_dir)
+            with self._lock:
+                self._containers.append(container)
+            self._container_manager.run(container)
+
+        is_usable = True
+        try:
+            yield container
+        except Exception:
+            is_usable = container.is_running()
+            raise
+        finally:
+            if is_usable:
+                with self._lock:
+                    self._idle_containers.setdefault(image, []).append(container)
+            else:
+                # the container is not usable anymore, drop it from the pool
+                with self._lock:
+                    self._containers.remove(container)
+                self._container_manager.stop(container)
+
+    def shutdown(self) -> None:
+        """
+        Stops and deletes all the containers of the pool
+        """
+        with self._lock:
+            containers = self._containers
+            self._containers = []
+            self._idle_containers = {}
+
+        for container in containers:
+            try:
+                self._container_manager.stop(container)
+            except Exception as ex:
+                LOG.debug("Failed to stop build container %s", container.id, exc_info=ex)
@@ -8,10 +8,11 @@ import os
 import platform
 import re
 import sys
+import threading
 import uuid
 from enum import Enum
 from pathlib import Path
-from typing import Optional
+from typing import Dict, Optional, Set
 
 import docker
 
@@ -137,6 +138,11 @@ class LambdaImage:
         self.docker_client = docker_client or docker.from_env(version=DOCKER_MIN_API_VERSION)
         self.invoke_images = invoke_images
 
+        self._lock = threading.Lock()
+        self._lock_per_image: Dict[str, threading.Lock] = {}
+        # images which are forcibly built during this session, so concurrent containers do not rebuild them again
+        self._force_built_images: Set[str] = set()
+
     def build(self, runtime, packagetype, image, layers, architecture, stream=None, function_name=None):
         """
         Build the image if one is not already on the system that matches the runtime and layers
@@ -203,51 +209,63 @@ class LambdaImage:
             docker_image_version = self._generate_docker_image_version(downloaded_layers, runtime_image_tag)
             rapid_image = f"{self._SAM_CLI_REPO_NAME}-{docker_image_version}"
 
-        image_not_found = False
-
-        # If we are not using layers, build anyways to ensure any updates to rapid get added
-        try:
-            self.docker_client.images.get(rapid_image)
-            # Check if the base image is up-to-date locally and modify build/pull parameters accordingly
-            self._check_base_image_is_current(base_image)
-        except docker.errors.ImageNotFound:
-            LOG.info("Local image was not found.")
-            image_not_found = True
-        except docker.errors.APIError as e:
-            if e.__class__ is docker.errors.NotFound:
-                # A generic "NotFound" is raised when we aren't able to check the image version
-                # for example when the docker daemon's api doesn't support this action.
-                #
-                # See Also: https://github.com/containers/podman/issues/17726
-                LOG.warning(
-                    "Unknown 404 - Unable to check if base image is current.\n\nPossible incompatible "
-                    "Docker engine clone employed. Consider `--skip-pull-image` for improved speed, the "
-                    "tradeoff being not running the latest image."
-                )
+        # use a global lock to get the image lock
+        with self._lock:
+            image_lock = self._lock_per_image.get(rapid_image)
+            if not image_lock:
+                image_lock = threading.Lock()
+                self._lock_per_image[rapid_image] = image_lock
+
+        # with specific image lock, check and build this image only once, when containers for several functions
+        # sharing the same image are created concurrently. Different images can still be built in parallel
+        with image_lock:
+            image_not_found = False
+
+            # If we are not using layers, build anyways to ensure any updates to rapid get added
+            try:
+                self.docker_client.images.get(rapid_image)
+                # Check if the base image is up-to-date locally and modify build/pull parameters accordingly
+                self._check_base_image_is_current(base_image)
+            except docker.errors.ImageNotFound:
+                LOG.info("Local image was not found.")
                 image_not_found = True
-            else:
-                raise DockerDistributionAPIError(str(e)) from e
-
-        # If building a new rapid image, delete older rapid images
-        if image_not_found and rapid_image == f"{image_repo}:{tag_prefix}{RAPID_IMAGE_TAG_PREFIX}-{architecture}":
-            if tag_prefix:
-                # ZIP functions with new RAPID format. Delete images from the old ecr/sam repository
-                self._remove_rapid_images(f"{self._SAM_INVOKE_REPO_PREFIX}-{runtime}")
-            else:
-                self._remove_rapid_images(image_repo)
-
-        if (
-            self.force_image_build
-            or image_not_found
-            or any(layer.is_defined_within_template for layer in downloaded_layers)
-            or not runtime
-        ):
-            stream_writer = stream or StreamWriter(sys.stderr)
-            stream_writer.write_str("Building image...")
-            stream_writer.flush()
-            self._build_image(
-                image if image else base_image, rapid_image, downloaded_layers, architecture, stream=stream_writer
-            )
+            except docker.errors.APIError as e:
+                if e.__class__ is docker.errors.NotFound:
+                    # A generic "NotFound" is raised when we aren't able to check the image version
+                    # for example when the docker daemon's api doesn't support this action.
+                    #
+                    # See Also: https://github.com/containers/podman/issues/17726
+                    LOG.warning(
+                        "Unknown 404 - Unable to check if base image is current.\n\nPossible incompatible "
+                        "Docker engine clone employed. Consider `--skip-pull-image` for improved speed, the "
+                        "tradeoff being not running the latest image."
+                    )
+                    image_not_found = True
+                else:
+                    raise DockerDistributionAPIError(str(e)) from e
+
+            # If building a new rapid image, delete older rapid images
+            if image_not_found and rapid_image == f"{image_repo}:{tag_prefix}{RAPID_IMAGE_TAG_PREFIX}-{architecture}":
+                if tag_prefix:
+                    # ZIP functions with new RAPID format. Delete images from the old ecr/sam repository
+                    self._remove_rapid_images(f"{self._SAM_INVOKE_REPO_PREFIX}-{runtime}")
+                else:
+                    self._remove_rapid_images(image_repo)
+
+            if (
+                (self.force_image_build and rapid_image not in self._force_built_images)
+                or image_not_found
+                or any(layer.is_defined_within_template for layer in downloaded_layers)
+                or not runtime
+            ):
+                stream_writer = stream or StreamWriter(sys.stderr)
+                stream_writer.write_str("Building image...")
+                stream_writer.flush()
+                self._build_image(
+                    image if image else base_image, rapid_image, downloaded_layers, architecture, stream=stream_writer
+                )
+                if self.force_image_build:
+                    self._force_built_images.add(rapid_image)
 
         return rapid_image
 
@@ -42,6 +42,8 @@ class ContainerManager:
 
         self._lock = threading.Lock()
         self._lock_per_image = {}
+        # images pulled by this manager, so that containers created concurrently for the same image pull it only once
+        self._pulled_images = set()
 
     @property
     def is_docker_reachable(self):
@@ -160,6 +162,10 @@ class ContainerManager:
         # with specific image lock, pull this image only once
         # since there are different locks for each image, different images can be pulled in parallel
         with image_lock:
+            if (image_name, tag) in self._pulled_images:
+                LOG.debug("Image %s:%s is already pulled, skip pulling it again", image_name, tag)
+                return
+
             stream_writer = stream or StreamWriter(sys.stderr)
 
             try:
@@ -179,6 +185,7 @@ class ContainerManager:
 
             # We are done. Go to the next line
             stream_writer.write_str("\n")
+            self._pulled_images.add((image_name, tag))
 
     def has_image(self, image_name):
         """
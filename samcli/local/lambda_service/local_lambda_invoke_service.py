@@ -3,11 +3,16 @@
 import io
 import json
 import logging
+import threading
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Dict, Iterator, List, Optional, Tuple
 
-from flask import Flask, request
+from flask import Flask, Response, request
 from werkzeug.routing import BaseConverter
 
 from samcli.commands.local.lib.exceptions import UnsupportedInlineCodeError
+from samcli.lib.utils.phase_timer import EmulationPhase, record_phase
 from samcli.lib.utils.stream_writer import StreamWriter
 from samcli.local.docker.exceptions import DockerContainerCreationFailedException
 from samcli.local.lambdafn.exceptions import FunctionNotFound
@@ -17,6 +22,16 @@ from .lambda_error_responses import LambdaErrorResponses
 
 LOG = logging.getLogger(__name__)
 
+# Path of the endpoint invoking a batch of events, which is not part of the Lambda API
+BATCH_INVOKE_PATH = "/2015-03-31/batch-invocations"
+
+# Default number of functions whose events of a batch are invoked at the same time
+DEFAULT_BATCH_INVOKE_CONCURRENCY = 8
+
+BATCH_FUNCTION_NAME_KEY = "FunctionName"
+BATCH_PAYLOAD_KEY = "Payload"
+BATCH_CONTENT_TYPE = "application/x-ndjson"
+
 
 class FunctionNamePathConverter(BaseConverter):
     regex = ".+"
@@ -31,7 +46,15 @@ class FunctionNamePathConverter(BaseConverter):
 
 
 class LocalLambdaInvokeService(BaseLocalService):
-    def __init__(self, lambda_runner, port, host, stderr=None, ssl_context=None):
+    def __init__(
+        self,
+        lambda_runner,
+        port,
+        host,
+        stderr=None,
+        ssl_context=None,
+        batch_concurrency=DEFAULT_BATCH_INVOKE_CONCURRENCY,
+    ):
         """
         Creates a Local Lambda Service that will only response to invoking a function
 
@@ -48,10 +71,14 @@ class LocalLambdaInvokeService(BaseLocalService):
             Defaults to None
         stderr io.BaseIO
             Optional stream where the stderr from Docker container should be written to
+        batch_concurrency int
+            Optional. Max number of functions whose events of a batch are invoked at the same time
         """
         super().__init__(lambda_runner.is_debugging(), port=port, host=host, ssl_context=ssl_context)
         self.lambda_runner = lambda_runner
         self.stderr = stderr
+        # a debugger can only be attached to one container at a time
+        self.batch_concurrency = 1 if self.is_debugging else batch_concurrency
 
     def create(self):
         """
@@ -70,6 +97,13 @@ class LocalLambdaInvokeService(BaseLocalService):
             methods=["POST"],
             provide_automatic_options=False,
         )
+        self._app.add_url_rule(
+            BATCH_INVOKE_PATH,
+            endpoint=BATCH_INVOKE_PATH,
+            view_func=self._invoke_batch_request_handler,
+            methods=["POST"],
+            provide_automatic_options=False,
+        )
 
         # setup request validation before Flask calls the view_func
         self._app.before_request(LocalLambdaInvokeService.validate_request)
@@ -88,6 +122,8 @@ class LocalLambdaInvokeService(BaseLocalService):
             4. 'X-Amz-Log-Type' header is not 'None'
             5. 'X-Amz-Invocation-Type' header is not 'RequestResponse'
 
+        The body of batch requests is not validated here, each of their events is validated once it is parsed
+
         Returns
         -------
         flask.Response
@@ -97,20 +133,22 @@ class LocalLambdaInvokeService(BaseLocalService):
             If the request passes all validation
         """
         flask_request = request
-        request_data = flask_request.get_data()
 
-        if not request_data:
-            request_data = b"{}"
+        if flask_request.endpoint != BATCH_INVOKE_PATH:
+            request_data = flask_request.get_data()
 
-        request_data = request_data.decode("utf-8")
+            if not request_data:
+                request_data = b"{}"
 
-        try:
-            json.loads(request_data)
-        except ValueError as json_error:
-            LOG.debug("Request body was not json. Exception: %s", str(json_error))
-            return LambdaErrorResponses.invalid_request_content(
-                "Could not parse request body into json: No JSON object could be decoded"
-            )
+            request_data = request_data.decode("utf-8")
+
+            try:
+                json.loads(request_data)
+            except ValueError as json_error:
+                LOG.debug("Request body was not json. Exception: %s", str(json_error))
+                return LambdaErrorResponses.invalid_request_content(
+                    "Could not parse request body into json: No JSON object could be decoded"
+                )
 
         if flask_request.args:
             LOG.debug("Query parameters are in the request but not supported")
@@ -166,6 +204,23 @@ class LocalLambdaInvokeService(BaseLocalService):
 
         request_data = request_data.decode("utf-8")
 
+        return self._invoke(function_name, request_data)
+
+    def _invoke(self, function_name: str, request_data: str):
+        """
+        Invokes the Local Lambda Function with the given event
+
+        Parameters
+        ----------
+        function_name str
+            Name of the function to invoke
+        request_data str
+            Event to invoke the function with, as a JSON string
+
+        Returns
+        -------
+        A Flask Response response object as if it was returned from Lambda
+        """
         stdout_stream_string = io.StringIO()
         stdout_stream_bytes = io.BytesIO()
         stdout_stream_writer = StreamWriter(stdout_stream_string, stdout_stream_bytes, auto_flush=True)
@@ -182,9 +237,10 @@ class LocalLambdaInvokeService(BaseLocalService):
         except DockerContainerCreationFailedException as ex:
             return LambdaErrorResponses.container_creation_failed(ex.message)
 
-        lambda_response, is_lambda_user_error_response = LambdaOutputParser.get_lambda_output(
-            stdout_stream_string, stdout_stream_bytes
-        )
+        with record_phase(EmulationPhase.RESPONSE_PARSING):
+            lambda_response, is_lambda_user_error_response = LambdaOutputParser.get_lambda_output(
+                stdout_stream_string, stdout_stream_bytes
+            )
 
         if is_lambda_user_error_response:
             return self.service_response(
@@ -192,3 +248,145 @@ class LocalLambdaInvokeService(BaseLocalService):
             )
 
         return self.service_response(lambda_response, {"Content-Type": "application/json"}, 200)
+
+    def _invoke_batch_request_handler(self):
+        """
+        Request Handler for the batch invoke path. The body is either a JSON array or JSON lines of events, each
+        event being an object with the FunctionName to invoke and the Payload to invoke it with. Events of different
+        functions are invoked concurrently, while the events of a function are invoked one after the other, so that
+        they reuse its warm container. Results are streamed back as JSON lines, in the order of the events, as soon
+        as all the previous ones are completed.
+
+        Returns
+        -------
+        A Flask Response streaming one result per event
+        """
+        request_data = request.get_data().decode("utf-8")
+
+        try:
+            events = _read_batch_events(request_data)
+        except ValueError as json_error:
+            LOG.debug("Batch request body was not a json array. Exception: %s", str(json_error))
+            return LambdaErrorResponses.invalid_request_content(
+                "Could not parse request body into json: No JSON array could be decoded"
+            )
+
+        return self.service_response(self._run_batch(events), {"Content-Type": BATCH_CONTENT_TYPE}, 200)
+
+    def _run_batch(self, events: List[Any]) -> Iterator[str]:
+        """
+        Invokes the given batch of events and yields their results as JSON lines, in the order of the events
+
+        Parameters
+        ----------
+        events List[Any]
+            Parsed events of the batch, or the ValueError raised when parsing them
+
+        Returns
+        -------
+        Iterator[str]
+            Result of each event, as a JSON line
+        """
+        results: List[Future] = [Future() for _ in events]
+        # events of each function, in their order in the batch
+        lanes: Dict[Optional[str], List[Tuple[int, Any]]] = OrderedDict()
+        for index, event in enumerate(events):
+            function_name = event.get(BATCH_FUNCTION_NAME_KEY) if isinstance(event, dict) else None
+            lanes.setdefault(function_name if isinstance(function_name, str) else None, []).append((index, event))
+
+        stopped = threading.Event()
+
+        def run_lane(lane: List[Tuple[int, Any]]) -> None:
+            for index, event in lane:
+                if stopped.is_set():
+                    results[index].cancel()
+                    continue
+                try:
+                    results[index].set_result(self._invoke_batch_event(event))
+                except Exception as ex:  # pylint: disable=broad-except
+                    LOG.debug("Failed to invoke event %s of the batch", index, exc_info=ex)
+                    results[index].set_result(_batch_result(event, LambdaErrorResponses.generic_service_exception()))
+
+        executor = ThreadPoolExecutor(max_workers=max(1, min(self.batch_concurrency, len(lanes))))
+        try:
+            for lane in lanes.values():
+                executor.submit(run_lane, lane)
+            for result in results:
+                yield result.result()
+        finally:
+            # the client can disconnect before all the events are invoked, the remaining ones are skipped
+            stopped.set()
+            executor.shutdown(wait=False)
+
+    def _invoke_batch_event(self, event: Any) -> str:
+        """
+        Invokes one event of a batch, and returns its result as a JSON line
+        """
+        if isinstance(event, ValueError):
+            return _batch_result(
+                None,
+                LambdaErrorResponses.invalid_request_content(
+                    "Could not parse event into json: No JSON object could be decoded"
+                ),
+            )
+
+        function_name = event.get(BATCH_FUNCTION_NAME_KEY) if isinstance(event, dict) else None
+        if not function_name or not isinstance(function_name, str):
+            return _batch_result(
+                event,
+                LambdaErrorResponses.invalid_request_content(
+                    "Each event must be a json object with a {} field".format(BATCH_FUNCTION_NAME_KEY)
+                ),
+            )
+
+        payload = event.get(BATCH_PAYLOAD_KEY)
+        request_data = json.dumps(payload if payload is not None else {})
+        return _batch_result(event, self._invoke(function_name, request_data))
+
+
+def _read_batch_events(request_data: str) -> List[Any]:
+    """
+    Parses the events of a batch request body, which is either a JSON array or JSON lines. An invalid line is
+    replaced with its ValueError, so that its result is an error while the other events are still invoked.
+
+    Raises
+    ------
+    ValueError
+        If the body is an invalid JSON array
+    """
+    if request_data.lstrip().startswith("["):
+        parsed_events = json.loads(request_data)
+        if not isinstance(parsed_events, list):
+            raise ValueError("Batch request body is not a json array")
+        return list(parsed_events)
+
+    events: List[Any] = []
+    for line in request_data.splitlines():
+        if not line.strip():
+            continue
+        try:
+            events.append(json.loads(line))
+        except ValueError as json_error:
+            events.append(json_error)
+    return events
+
+
+def _batch_result(event: Any, response: Response) -> str:
+    """
+    Converts the response of an event of a batch into its result, as a JSON line
+    """
+    function_name = event.get(BATCH_FUNCTION_NAME_KEY) if isinstance(event, dict) else None
+    result: Dict[str, Any] = OrderedDict(
+        [
+            (BATCH_FUNCTION_NAME_KEY, function_name),
+            ("StatusCode", response.status_code),
+            (BATCH_PAYLOAD_KEY, response.get_data().decode("utf-8", errors="replace")),
+        ]
+    )
+    function_error = response.headers.get("x-amz-function-error")
+    if function_error:
+        result["FunctionError"] = function_error
+    error_type = response.headers.get("x-amzn-errortype")
+    if error_type:
+        result["ErrorType"] = error_type
+    return json.dumps(result) + "\n"
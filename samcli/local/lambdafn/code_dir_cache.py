@@ -0,0 +1,168 @@
+"""
+Cache of the directories that function and layer archives get decompressed into
+"""
+
+import logging
+import os
+import shutil
+import threading
+from collections import OrderedDict
+from typing import Callable, Dict, Tuple
+
+from samcli.lib.utils.hash import file_checksum
+
+LOG = logging.getLogger(__name__)
+
+# Max number of decompressed directories which are not used by any container, but are kept to be reused
+DEFAULT_MAX_UNUSED_DIRS = 16
+
+
+class _CachedCodeDir:
+    """
+    A decompressed archive directory, and the number of its current users
+    """
+
+    def __init__(self, path: str) -> None:
+        self.path = path
+        self.ref_count = 0
+
+
+class CodeDirCache:
+    """
+    Keeps the directories that archives (zip/jar) get decompressed into, keyed by the archive content hash, so the
+    same artifact is decompressed only once and shared by all the functions and layers pointing at it.
+
+    Each ``acquire`` must be paired with a ``release``. Directories which are no longer used are kept to be reused by
+    the next invokes, and the least recently used ones are deleted when there are more than ``max_unused_dirs`` of
+    them. This class is thread-safe.
+    """
+
+    def __init__(self, max_unused_dirs: int = DEFAULT_MAX_UNUSED_DIRS) -> None:
+        """
+        Parameters
+        ----------
+        max_unused_dirs: int
+            Max number of decompressed directories to keep while not being used by any container
+        """
+        self._max_unused_dirs = max_unused_dirs
+        self._lock = threading.Lock()
+        self._lock_per_key: Dict[str, threading.Lock] = {}
+        # ordered from the least to the most recently used
+        self._code_dirs: "OrderedDict[str, _CachedCodeDir]" = OrderedDict()
+        self._keys_per_path: Dict[str, str] = {}
+        # archive content hash per archive (path, size, modification time), so unchanged archives are hashed only once
+        self._archive_hashes: Dict[Tuple[str, int, int], str] = {}
+
+    def acquire(self, archive_path: str, decompress: Callable[[str], str]) -> str:
+        """
+        Returns the directory containing the decompressed content of the given archive, decompressing it only if
+        the same content was not decompressed before.
+
+        Parameters
+        ----------
+        archive_path: str
+            Path to the archive file
+        decompress: Callable[[str], str]
+            Function which decompresses the given archive and returns the directory it got decompressed into
+
+        Returns
+        -------
+        str
+            Directory containing the decompressed archive content
+        """
+        key = self._get_archive_hash(archive_path)
+
+        # use a global lock to get the key lock
+        with self._lock:
+            key_lock = self._lock_per_key.get(key)
+            if not key_lock:
+                key_lock = threading.Lock()
+                self._lock_per_key[key] = key_lock
+
+        # with specific key lock, decompress the same content only once, different archives can still be
+        # decompressed in parallel
+        with key_lock:
+            with self._lock:
+                code_dir = self._code_dirs.get(key)
+                if code_dir:
+                    LOG.debug("Reusing the decompressed directory %s of %s", code_dir.path, archive_path)
+                    code_dir.ref_count += 1
+                    self._code_dirs.move_to_end(key)
+                    return code_dir.path
+
+            decompressed_path = decompress(archive_path)
+
+            with self._lock:
+                code_dir = _CachedCodeDir(decompressed_path)
+                code_dir.ref_count += 1
+                self._code_dirs[key] = code_dir
+                self._keys_per_path[decompressed_path] = key
+                return decompressed_path
+
+    def release(self, decompressed_path: str) -> None:
+        """
+        Marks one user of the given decompressed directory as done, and deletes the least recently used directories
+        which are not used anymore if there are more than the allowed number of them.
+
+        Parameters
+        ----------
+        decompressed_path: str
+            Directory returned by ``acquire``
+        """
+        with self._lock:
+            key = self._keys_per_path.get(decompressed_path)
+            code_dir = self._code_dirs.get(key) if key else None
+            if not code_dir:
+                LOG.debug("Directory %s is not a cached decompressed directory", decompressed_path)
+                return
+            code_dir.ref_count = max(code_dir.ref_count - 1, 0)
+            paths_to_delete = self._evict_unused_dirs()
+
+        for path in paths_to_delete:
+            _delete_dir(path)
+
+    def clear(self) -> None:
+        """
+        Deletes all the decompressed directories, regardless of their users
+        """
+        with self._lock:
+            paths_to_delete = [code_dir.path for code_dir in self._code_dirs.values()]
+            self._code_dirs.clear()
+            self._keys_per_path.clear()
+
+        for path in paths_to_delete:
+            _delete_dir(path)
+
+    def _evict_unused_dirs(self):
+        """
+        Drops the least recently used unused directories above the allowed count from the cache. Must be called while
+        holding the lock.
+
+        Returns
+        -------
+        list(str)
+            Directories which got dropped from the cache, and should be deleted
+        """
+        unused_keys = [key for key, code_dir in self._code_dirs.items() if not code_dir.ref_count]
+        keys_to_evict = unused_keys[: max(len(unused_keys) - self._max_unused_dirs, 0)]
+
+        paths_to_delete = []
+        for key in keys_to_evict:
+            code_dir = self._code_dirs.pop(key)
+            self._keys_per_path.pop(code_dir.path, None)
+            paths_to_delete.append(code_dir.path)
+        return paths_to_delete
+
+    def _get_archive_hash(self, archive_path: str) -> str:
+        stat = os.stat(archive_path)
+        archive_id = (os.path.realpath(archive_path), stat.st_size, stat.st_mtime_ns)
+        archive_hash = self._archive_hashes.get(archive_id)
+        if not archive_hash:
+            archive_hash = file_checksum(archive_path)
+            self._archive_hashes[archive_id] = archive_hash
+        return archive_hash
+
+
+def _delete_dir(path: str) -> None:
+    LOG.debug("Deleting decompressed directory %s", path)
+    shutil.rmtree(path, ignore_errors=True)
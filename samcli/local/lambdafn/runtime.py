@@ -9,11 +9,12 @@ import shutil
 import signal
 import tempfile
 import threading
-from typing import Dict, Optional, Union
+from typing import Dict, List, Optional, Union
 
 from samcli.lib.telemetry.metric import capture_parameter
 from samcli.lib.utils.file_observer import LambdaFunctionObserver
 from samcli.lib.utils.packagetype import ZIP
+from samcli.lib.utils.phase_timer import EmulationPhase, record_phase
 from samcli.local.docker.container import Container
 from samcli.local.docker.container_analyzer import ContainerAnalyzer
 from samcli.local.docker.exceptions import ContainerFailureError, DockerContainerCreationFailedException
@@ -21,6 +22,7 @@ from samcli.local.docker.lambda_container import LambdaContainer
 
 from ...lib.providers.provider import LayerVersion
 from ...lib.utils.stream_writer import StreamWriter
+from .code_dir_cache import CodeDirCache
 from .zip import unzip
 
 LOG = logging.getLogger(__name__)
@@ -35,7 +37,7 @@ class LambdaRuntime:
 
     SUPPORTED_ARCHIVE_EXTENSIONS = (".zip", ".jar", ".ZIP", ".JAR")
 
-    def __init__(self, container_manager, image_builder):
+    def __init__(self, container_manager, image_builder, mount_with_write=False):
         """
         Initialize the Local Lambda runtime
 
@@ -45,11 +47,16 @@ class LambdaRuntime:
             Instance of the ContainerManager class that can run a local Docker container
         image_builder samcli.local.docker.lambda_image.LambdaImage
             Instance of the LambdaImage class that can create am image
+        mount_with_write bool
+            Optional. Mount the code directories with write permissions. Decompressed archives are then extracted
+            for each container, instead of being shared through the code dir cache
         """
         self._container_manager = container_manager
         self._image_builder = image_builder
-        self._temp_uncompressed_paths_to_be_cleaned = []
+        self._mount_with_write = mount_with_write
+        self._decompressed_paths_by_container: Dict[Container, List[str]] = {}
         self._lock = threading.Lock()
+        self._code_dir_cache = CodeDirCache()
 
     def create(
         self, function_config, debug_context=None, container_host=None, container_host_interface=None, extra_hosts=None
@@ -80,8 +87,9 @@ class LambdaRuntime:
         # Generate a dictionary of environment variable key:values
         env_vars = function_config.env_vars.resolve()
 
-        code_dir = self._get_code_dir(function_config.code_abs_path)
-        layers = [self._unarchived_layer(layer) for layer in function_config.layers]
+        decompressed_paths: List[str] = []
+        code_dir = self._get_code_dir(function_config.code_abs_path, decompressed_paths)
+        layers = [self._unarchived_layer(layer, decompressed_paths) for layer in function_config.layers]
         if function_config.runtime_management_config and function_config.runtime_management_config.get(
             "RuntimeVersionArn"
         ):
@@ -110,20 +118,25 @@ class LambdaRuntime:
             container_host_interface=container_host_interface,
             extra_hosts=extra_hosts,
             function_full_path=function_config.full_path,
+            mount_with_write=self._mount_with_write,
         )
         try:
             # create the container.
             self._container_manager.create(container)
-            return container
-
         except DockerContainerCreationFailedException:
             LOG.warning("Failed to create container for function %s", function_config.full_path)
+            self._release_decompressed_paths(decompressed_paths)
             raise
 
         except KeyboardInterrupt:
             LOG.debug("Ctrl+C was pressed. Aborting container creation")
+            self._release_decompressed_paths(decompressed_paths)
             raise
 
+        with self._lock:
+            self._decompressed_paths_by_container[container] = decompressed_paths
+        return container
+
     def run(
         self,
         container,
@@ -221,10 +234,11 @@ class LambdaRuntime:
         container = None
         try:
             # Start the container. This call returns immediately after the container starts
-            container = self.create(
-                function_config, debug_context, container_host, container_host_interface, extra_hosts
-            )
-            container = self.run(container, function_config, debug_context)
+            with record_phase(EmulationPhase.CONTAINER_WAIT):
+                container = self.create(
+                    function_config, debug_context, container_host, container_host_interface, extra_hosts
+                )
+                container = self.run(container, function_config, debug_context)
             # Setup appropriate interrupt - timeout or Ctrl+C - before function starts executing and
             # get callback function to start timeout timer
             start_timer = self._configure_interrupt(
@@ -260,9 +274,11 @@ class LambdaRuntime:
            The current running container
         """
         if container:
-            self._check_exit_state(container)
-            self._container_manager.stop(container)
-        self._clean_decompressed_paths()
+            try:
+                self._check_exit_state(container)
+                self._container_manager.stop(container)
+            finally:
+                self._clean_decompressed_paths(container)
 
     def _check_exit_state(self, container: Container):
         """
@@ -321,7 +337,7 @@ class LambdaRuntime:
 
         return start_timer
 
-    def _get_code_dir(self, code_path: str) -> str:
+    def _get_code_dir(self, code_path: str, decompressed_paths: List[str]) -> str:
         """
         Method to get a path to a directory where the function/layer code is available. This directory will
         be mounted directly inside the Docker container.
@@ -337,6 +353,8 @@ class LambdaRuntime:
         code_path: str
             Path to the code. This could be pointing at a file or folder either on a local
             disk or in some network file system
+        decompressed_paths: List[str]
+            The decompressed code dirs of the container being created, the decompressed dir is appended to it
 
         Returns
         -------
@@ -345,14 +363,21 @@ class LambdaRuntime:
         """
 
         if code_path and os.path.isfile(code_path) and code_path.endswith(self.SUPPORTED_ARCHIVE_EXTENSIONS):
-            decompressed_dir: str = _unzip_file(code_path)
-            self._temp_uncompressed_paths_to_be_cleaned += [decompressed_dir]
+            # a dir mounted with write permissions must not be shared with the other containers
+            decompressed_dir: str = (
+                _unzip_file(code_path)
+                if self._mount_with_write
+                else self._code_dir_cache.acquire(code_path, _unzip_file)
+            )
+            decompressed_paths.append(decompressed_dir)
             return decompressed_dir
 
         LOG.debug("Code %s is not a zip/jar file", code_path)
         return code_path
 
-    def _unarchived_layer(self, layer: Union[str, Dict, LayerVersion]) -> Union[str, Dict, LayerVersion]:
+    def _unarchived_layer(
+        self, layer: Union[str, Dict, LayerVersion], decompressed_paths: List[str]
+    ) -> Union[str, Dict, LayerVersion]:
         """
         If the layer's content uri points to a supported local archive file, use self._get_code_dir() to
         un-archive it and so that it can be mounted directly inside the Docker container.
@@ -360,6 +385,8 @@ class LambdaRuntime:
         ----------
         layer
             a str, dict or a LayerVersion object representing a layer
+        decompressed_paths
+            The decompressed code dirs of the container being created
 
         Returns
         -------
@@ -368,20 +395,53 @@ class LambdaRuntime:
         """
         if isinstance(layer, LayerVersion) and isinstance(layer.codeuri, str):
             unarchived_layer = copy.deepcopy(layer)
-            unarchived_layer.codeuri = self._get_code_dir(layer.codeuri)
+            unarchived_layer.codeuri = self._get_code_dir(layer.codeuri, decompressed_paths)
             return unarchived_layer if unarchived_layer.codeuri != layer.codeuri else layer
 
         return layer
 
-    def _clean_decompressed_paths(self):
+    def _clean_decompressed_paths(self, container):
         """
-        Clean the temporary decompressed code dirs
+        Release the temporary decompressed code dirs of the given container, the dirs of the other containers may
+        still be mounted.
+
+        Parameters
+        ----------
+        container: Container
+           The container that its decompressed code dirs are no longer used
+        """
+        with self._lock:
+            decompressed_paths = self._decompressed_paths_by_container.pop(container, [])
+        self._release_decompressed_paths(decompressed_paths)
+
+    def _release_decompressed_paths(self, decompressed_paths: List[str]):
+        """
+        Release the temporary decompressed code dirs. They are kept in the code dir cache to be reused by the next
+        invokes of the same archives, until the cache deletes them. The dirs extracted for a container mounted with
+        write permissions are deleted directly.
+
+        Parameters
+        ----------
+        decompressed_paths: List[str]
+            The decompressed code dirs to be released
+        """
+        for decompressed_dir in decompressed_paths:
+            LOG.debug("Releasing decompressed code dir %s", decompressed_dir)
+            if self._mount_with_write:
+                shutil.rmtree(decompressed_dir, ignore_errors=True)
+            else:
+                self._code_dir_cache.release(decompressed_dir)
+
+    def clean_decompressed_code_dirs(self):
+        """
+        Delete all the decompressed code dirs, including the ones kept to be reused
         """
-        LOG.debug("Cleaning all decompressed code dirs")
         with self._lock:
-            for decompressed_dir in self._temp_uncompressed_paths_to_be_cleaned:
-                shutil.rmtree(decompressed_dir)
-            self._temp_uncompressed_paths_to_be_cleaned = []
+            all_decompressed_paths = list(self._decompressed_paths_by_container.values())
+            self._decompressed_paths_by_container = {}
+        for decompressed_paths in all_decompressed_paths:
+            self._release_decompressed_paths(decompressed_paths)
+        self._code_dir_cache.clear()
 
 
 class WarmLambdaRuntime(LambdaRuntime):
@@ -390,7 +450,7 @@ class WarmLambdaRuntime(LambdaRuntime):
     warm containers life cycle.
     """
 
-    def __init__(self, container_manager, image_builder, observer=None):
+    def __init__(self, container_manager, image_builder, observer=None, mount_with_write=False):
         """
         Initialize the Local Lambda runtime
 
@@ -402,13 +462,15 @@ class WarmLambdaRuntime(LambdaRuntime):
             Instance of the LambdaImage class that can create am image
         warm_containers bool
             Determines if the warm containers is enabled or not.
+        mount_with_write bool
+            Optional. Mount the code directories with write permissions
         """
         self._function_configs = {}
         self._containers = {}
 
         self._observer = observer if observer else LambdaFunctionObserver(self._on_code_change)
 
-        super().__init__(container_manager, image_builder)
+        super().__init__(container_manager, image_builder, mount_with_write)
 
     def create(
         self, function_config, debug_context=None, container_host=None, container_host_interface=None, extra_hosts=None
@@ -438,7 +500,12 @@ class WarmLambdaRuntime(LambdaRuntime):
         # reuse the cached container if it is created, and if the function configuration is not changed
         exist_function_config = self._function_configs.get(function_config.full_path, None)
         container = self._containers.get(function_config.full_path, None)
-        if exist_function_config and _require_container_reloading(exist_function_config, function_config):
+        # the same memoized config object means nothing changed, so skip comparing the configurations
+        if (
+            exist_function_config
+            and exist_function_config is not function_config
+            and _require_container_reloading(exist_function_config, function_config)
+        ):
             LOG.info(
                 "Lambda Function '%s' definition has been changed in the stack template, "
                 "terminate the created warm container.",
@@ -539,7 +606,7 @@ class WarmLambdaRuntime(LambdaRuntime):
         for function_name, container in self._containers.items():
             LOG.debug("Terminate running warm container for Lambda Function '%s'", function_name)
             self._container_manager.stop(container)
-        self._clean_decompressed_paths()
+        self.clean_decompressed_code_dirs()
         self._observer.stop()
 
     def _on_code_change(self, functions):
@@ -78,6 +78,20 @@ class BaseLocalService:
 
         self._app.run(threaded=multi_threaded, host=self.host, port=self.port, ssl_context=self.ssl_context)
 
+    def test_client(self):
+        """
+        Returns a client sending requests to the service in the calling thread, without starting the server
+
+        Raises
+        ------
+        RuntimeError
+            if the service was not created
+        """
+        if not self._app:
+            raise RuntimeError("The application must be created before sending requests to it")
+
+        return self._app.test_client()
+
     @staticmethod
     def service_response(body, headers, status_code):
         """
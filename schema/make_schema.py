@@ -139,6 +139,10 @@ def format_param(param: click.core.Option) -> SamCliParameterSchema:
             formatted_param_types.append("string")
         elif param_name == "list":
             formatted_param_types.append("array")
+        elif param_name == "integer range":
+            formatted_param_types.append("integer")
+        elif param_name in ["float", "float range"]:
+            formatted_param_types.append("number")
         else:
             formatted_param_types.append(param_name or "string")
     formatted_param_types = sorted(list(set(formatted_param_types)))  # deduplicate
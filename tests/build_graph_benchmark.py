@@ -0,0 +1,61 @@
+"""
+Script for measuring how long the build graph takes to write, read and update a thousand build definitions.
+It is not collected by pytest, run it with `python -m tests.build_graph_benchmark`.
+"""
+
+import time
+from pathlib import Path
+
+from samcli.lib.build.build_graph import BuildGraph, FunctionBuildDefinition
+from samcli.lib.utils import osutils
+from samcli.lib.utils.architecture import X86_64
+from samcli.lib.utils.packagetype import ZIP
+from tests.unit.lib.build_module.test_build_graph import generate_function
+
+DEFINITION_COUNT = 1000
+
+
+def main():
+    with osutils.mkdir_temp() as temp_base_dir:
+        build_dir = Path(temp_base_dir, ".aws-sam", "build")
+        build_dir.mkdir(parents=True)
+        build_graph = BuildGraph(str(build_dir))
+        for index in range(DEFINITION_COUNT):
+            build_definition = FunctionBuildDefinition(
+                "python3.12",
+                f"src/function{index}",
+                None,
+                ZIP,
+                X86_64,
+                {"BuildMethod": "python3.12", "BuildProperties": {"Index": index}},
+                "app.handler",
+                f"source_hash{index}",
+                f"manifest_hash{index}",
+                {f"ENV_VAR{env_index}": f"value{index}" for env_index in range(5)},
+            )
+            function = generate_function(
+                function_id=f"Function{index}", name=f"Function{index}", codeuri=f"src/function{index}"
+            )
+            build_graph.put_function_build_definition(build_definition, function)
+
+        start = time.perf_counter()
+        build_graph.clean_redundant_definitions_and_update(True)
+        write_duration = time.perf_counter() - start
+
+        start = time.perf_counter()
+        build_graph = BuildGraph(str(build_dir))
+        read_duration = time.perf_counter() - start
+
+        build_graph.get_function_build_definitions()[0].source_hash = "updated_source_hash"
+        start = time.perf_counter()
+        build_graph.update_definition_hash()
+        update_duration = time.perf_counter() - start
+
+    print(f"{DEFINITION_COUNT} build definitions")
+    print(f"write: {write_duration:.3f}s")
+    print(f"read: {read_duration:.3f}s")
+    print(f"update one definition: {update_duration:.3f}s")
+
+
+if __name__ == "__main__":
+    main()
@@ -86,6 +86,12 @@ class DummyStack:
     def __init__(self, resource):
         self.resources = resource
 
+    def get_resource_ids(self, resource_types):
+        return [name for name, resource in self.resources.items() if resource.get("Type") in resource_types]
+
+    def get_resource(self, logical_id):
+        return self.resources.get(logical_id)
+
 
 class TestBuildContext__enter__(TestCase):
     @patch("samcli.commands.build.build_context.get_template_data")
@@ -1030,6 +1036,7 @@ class TestBuildContext_run(TestCase):
                 combine_dependencies=not auto_dependency_layer,
                 build_in_source=build_context._build_in_source,
                 mount_with_write=False,
+                build_container_pool=None,
             )
             builder_mock.build.assert_called_once()
             builder_mock.update_template.assert_has_calls(
@@ -129,6 +129,41 @@ class TestSamDeployCommand(TestCase):
             self.assertEqual(self.deploy_command_context.deployer.execute_changeset.call_count, 1)
             self.assertEqual(self.deploy_command_context.deployer.wait_for_execute.call_count, 1)
 
+    @patch("samcli.commands.deploy.deploy_context.clear_stack_resources_cache")
+    @patch("boto3.Session")
+    @patch("boto3.client")
+    @patch.object(Deployer, "create_and_wait_for_changeset", MagicMock(return_value=({"Id": "test"}, "CREATE")))
+    @patch.object(Deployer, "execute_changeset", MagicMock())
+    @patch.object(Deployer, "wait_for_execute", MagicMock())
+    def test_execute_changeset_clears_stack_resources_cache(self, mock_client, mock_session, clear_cache_mock):
+        with tempfile.NamedTemporaryFile(delete=False) as template_file:
+            template_file.write(b"{}")
+            template_file.flush()
+            self.deploy_command_context.template_file = template_file.name
+
+            self.deploy_command_context.run()
+
+            clear_cache_mock.assert_called_once_with()
+
+    @patch("samcli.commands.deploy.deploy_context.clear_stack_resources_cache")
+    @patch("boto3.Session")
+    @patch("boto3.client")
+    @patch.object(Deployer, "create_and_wait_for_changeset", MagicMock(return_value=({"Id": "test"}, "CREATE")))
+    @patch.object(Deployer, "execute_changeset", MagicMock())
+    @patch.object(
+        Deployer, "wait_for_execute", MagicMock(side_effect=DeployFailedError(stack_name="stack", msg="failed"))
+    )
+    def test_failed_deploy_clears_stack_resources_cache(self, mock_client, mock_session, clear_cache_mock):
+        with tempfile.NamedTemporaryFile(delete=False) as template_file:
+            template_file.write(b"{}")
+            template_file.flush()
+            self.deploy_command_context.template_file = template_file.name
+
+            with self.assertRaises(DeployFailedError):
+                self.deploy_command_context.run()
+
+            clear_cache_mock.assert_called_once_with()
+
     @patch("boto3.Session")
     @patch("boto3.client")
     @patch.object(Deployer, "create_and_wait_for_changeset", MagicMock(return_value=({"Id": "test"}, "CREATE")))
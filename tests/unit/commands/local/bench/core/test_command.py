@@ -0,0 +1,63 @@
+import unittest
+from unittest.mock import Mock, patch
+
+from samcli.commands.local.bench.cli import DESCRIPTION, LocalBenchCommand
+from tests.unit.cli.test_command import MockFormatter
+
+
+class MockParams:
+    def __init__(self, rv, name):
+        self.rv = rv
+        self.name = name
+
+    def get_help_record(self, ctx):
+        return self.rv
+
+
+class TestLocalBenchCommand(unittest.TestCase):
+    @patch.object(LocalBenchCommand, "get_params")
+    def test_get_options_local_bench_command(self, mock_get_params):
+        ctx = Mock()
+        ctx.command_path = "sam local bench"
+        ctx.parent.command_path = "sam"
+        formatter = MockFormatter(scrub_text=True)
+        # One option per option section.
+        mock_get_params.return_value = [
+            MockParams(rv=("--template-file", ""), name="template_file"),
+            MockParams(rv=("--concurrency", ""), name="concurrency"),
+            MockParams(rv=("--parameter-overrides", ""), name="parameter_overrides"),
+            MockParams(rv=("--region", "Region"), name="region"),
+            MockParams(rv=("--warm-containers", ""), name="warm_containers"),
+            MockParams(rv=("--log-file", ""), name="log_file"),
+            MockParams(rv=("--config-file", ""), name="config_file"),
+            MockParams(rv=("--beta-features", ""), name="beta_features"),
+            MockParams(rv=("--debug", ""), name="debug"),
+        ]
+
+        cmd = LocalBenchCommand(name="local bench", requires_credentials=False, description=DESCRIPTION)
+        expected_output = {
+            "Description": [(cmd.description + cmd.description_addendum, "")],
+            "Examples": [
+                ("", ""),
+                ("Invoke a function 200 times, 8 invokes at a time, with warm containers.", ""),
+                (
+                    "$sam local bench --function-name HelloWorldFunction --event event.json --requests 200 "
+                    "--concurrency 8 --warm-containers EAGER\x1b[0m",
+                    "",
+                ),
+                ("Replay recorded API Gateway events against the API at 20 requests per second.", ""),
+                ("$sam local bench --event api-events.jsonl --rate 20 --concurrency 4\x1b[0m", ""),
+            ],
+            "Required Options": [("", ""), ("--template-file", ""), ("", "")],
+            "Bench Options": [("", ""), ("--concurrency", ""), ("", "")],
+            "Template Options": [("", ""), ("--parameter-overrides", ""), ("", "")],
+            "AWS Credential Options": [("", ""), ("--region", ""), ("", "")],
+            "Container Options": [("", ""), ("--warm-containers", ""), ("", "")],
+            "Artifact Location Options": [("", ""), ("--log-file", ""), ("", "")],
+            "Configuration Options": [("", ""), ("--config-file", ""), ("", "")],
+            "Beta Options": [("", ""), ("--beta-features", ""), ("", "")],
+            "Other Options": [("", ""), ("--debug", ""), ("", "")],
+        }
+
+        cmd.format_options(ctx, formatter)
+        self.assertEqual(formatter.data, expected_output)
@@ -0,0 +1,12 @@
+from shutil import get_terminal_size
+from unittest import TestCase
+
+from samcli.cli.row_modifiers import BaseLineRowModifier
+from samcli.commands.local.bench.core.formatters import LocalBenchCommandHelpTextFormatter
+
+
+class TestLocalBenchCommandHelpTextFormatter(TestCase):
+    def test_local_bench_formatter(self):
+        self.formatter = LocalBenchCommandHelpTextFormatter()
+        self.assertTrue(self.formatter.left_justification_length <= get_terminal_size().columns // 2)
+        self.assertIsInstance(self.formatter.modifiers[0], BaseLineRowModifier)
@@ -0,0 +1,174 @@
+import json
+from unittest import TestCase
+from unittest.mock import patch, Mock
+
+from parameterized import parameterized
+
+from samcli.commands.local.bench.cli import do_cli as bench_cli
+from samcli.commands.local.cli_common.user_exceptions import UserException
+from samcli.commands.local.lib.exceptions import InvalidBenchEventError, OverridesNotWellDefinedError
+from samcli.commands.local.lib.local_bench import ApiBenchRequest, BenchResult, BenchSample
+from samcli.commands.validate.lib.exceptions import InvalidSamDocumentException
+from samcli.local.docker.exceptions import ContainerNotStartableException
+
+
+class TestCli(TestCase):
+    def setUp(self):
+        self.function_name = "HelloWorldFunction"
+        self.event = None
+        self.requests = 10
+        self.concurrency = 2
+        self.rate = None
+        self.disable_authorizer = False
+        self.output = "json"
+        self.template = "template"
+        self.env_vars = "env-vars"
+        self.debug_ports = [123]
+        self.debug_args = "args"
+        self.debugger_path = "/test/path"
+        self.container_env_vars = "container-env-vars"
+        self.docker_volume_basedir = "basedir"
+        self.docker_network = "network"
+        self.log_file = "logfile"
+        self.skip_pull_image = True
+        self.parameter_overrides = {}
+        self.layer_cache_basedir = "/some/layers/path"
+        self.force_image_build = True
+        self.warm_containers = "EAGER"
+        self.shutdown = True
+        self.debug_function = None
+        self.container_host = "localhost"
+        self.container_host_interface = "127.0.0.1"
+        self.add_host = {}
+        self.invoke_image = ()
+
+        self.ctx_mock = Mock()
+        self.ctx_mock.region = "region"
+        self.ctx_mock.profile = "profile"
+
+        self.result = BenchResult([BenchSample(0.1, True, {}, {})], duration=0.1, concurrency=self.concurrency)
+
+    @patch("samcli.commands.local.bench.cli.click")
+    @patch("samcli.commands.local.lib.local_bench.run_bench")
+    @patch("samcli.local.lambda_service.local_lambda_invoke_service.LocalLambdaInvokeService")
+    @patch("samcli.commands.local.cli_common.invoke_context.InvokeContext")
+    def test_must_bench_function(self, invoke_context_mock, service_mock, run_bench_mock, click_mock):
+        context_mock = Mock()
+        invoke_context_mock.return_value.__enter__.return_value = context_mock
+        run_bench_mock.return_value = self.result
+
+        self.call_cli()
+
+        invoke_context_mock.assert_called_once()
+        self.assertEqual(invoke_context_mock.call_args.kwargs["warm_container_initialization_mode"], "EAGER")
+        self.assertIsNone(invoke_context_mock.call_args.kwargs["function_identifier"])
+        service_mock.assert_called_once_with(
+            lambda_runner=context_mock.local_lambda_runner, port=None, host=None, stderr=context_mock.stderr
+        )
+        service_mock.return_value.create.assert_called_once_with()
+        send, events, request_count = run_bench_mock.call_args.args
+        self.assertEqual(send._path, "/2015-03-31/functions/HelloWorldFunction/invocations")
+        self.assertEqual(events, [{}])
+        self.assertEqual(request_count, self.requests)
+        self.assertEqual(run_bench_mock.call_args.kwargs, {"concurrency": self.concurrency, "rate": None})
+        self.assertEqual(json.loads(click_mock.echo.call_args.args[0]), self.result.to_dict())
+
+    @patch("samcli.commands.local.bench.cli.click")
+    @patch("samcli.commands.local.lib.local_bench.read_bench_events")
+    @patch("samcli.commands.local.lib.local_bench.run_bench")
+    @patch("samcli.local.apigw.local_apigw_service.LocalApigwService")
+    @patch("samcli.lib.providers.api_provider.ApiProvider")
+    @patch("samcli.commands.local.cli_common.invoke_context.InvokeContext")
+    def test_must_bench_api(
+        self, invoke_context_mock, api_provider_mock, service_mock, run_bench_mock, read_events_mock, click_mock
+    ):
+        context_mock = Mock()
+        invoke_context_mock.return_value.__enter__.return_value = context_mock
+        run_bench_mock.return_value = self.result
+        read_events_mock.return_value = [{"httpMethod": "GET", "path": "/hello"}]
+        self.function_name = None
+        self.output = "text"
+
+        self.call_cli()
+
+        api_provider_mock.assert_called_once_with(
+            context_mock.stacks, cwd=context_mock.get_cwd.return_value, disable_authorizer=False
+        )
+        service_mock.assert_called_once_with(
+            api=api_provider_mock.return_value.api,
+            lambda_runner=context_mock.local_lambda_runner,
+            stderr=context_mock.stderr,
+        )
+        self.assertEqual(run_bench_mock.call_args.args[1], [ApiBenchRequest("GET", "/hello", {}, {}, "")])
+        self.assertIn("Requests: 1 (0 failed)", click_mock.echo.call_args.args[0])
+
+    @patch("samcli.lib.providers.api_provider.ApiProvider")
+    @patch("samcli.commands.local.cli_common.invoke_context.InvokeContext")
+    def test_must_raise_user_exception_without_apis(self, invoke_context_mock, api_provider_mock):
+        api_provider_mock.return_value.api.routes = []
+        self.function_name = None
+
+        with self.assertRaises(UserException) as context:
+            self.call_cli()
+
+        self.assertIn("No APIs available in template", str(context.exception))
+
+    @patch("samcli.commands.local.lib.local_bench.read_bench_events")
+    @patch("samcli.lib.providers.api_provider.ApiProvider")
+    @patch("samcli.commands.local.cli_common.invoke_context.InvokeContext")
+    def test_must_raise_user_exception_on_invalid_api_events(
+        self, invoke_context_mock, api_provider_mock, read_events_mock
+    ):
+        read_events_mock.return_value = [{"key": "value"}]
+        self.function_name = None
+
+        with self.assertRaises(InvalidBenchEventError):
+            self.call_cli()
+
+    @parameterized.expand(
+        [
+            (InvalidSamDocumentException("bad template"), "bad template"),
+            (OverridesNotWellDefinedError("bad env vars"), "bad env vars"),
+            (ContainerNotStartableException("no free ports"), "no free ports"),
+        ]
+    )
+    @patch("samcli.commands.local.cli_common.invoke_context.InvokeContext")
+    def test_must_raise_user_exception(self, exception, message, invoke_context_mock):
+        invoke_context_mock.side_effect = exception
+
+        with self.assertRaises(UserException) as context:
+            self.call_cli()
+
+        self.assertEqual(str(context.exception), message)
+
+    def call_cli(self):
+        bench_cli(
+            ctx=self.ctx_mock,
+            function_name=self.function_name,
+            event=self.event,
+            requests=self.requests,
+            concurrency=self.concurrency,
+            rate=self.rate,
+            disable_authorizer=self.disable_authorizer,
+            output=self.output,
+            template=self.template,
+            env_vars=self.env_vars,
+            debug_port=self.debug_ports,
+            debug_args=self.debug_args,
+            debugger_path=self.debugger_path,
+            container_env_vars=self.container_env_vars,
+            docker_volume_basedir=self.docker_volume_basedir,
+            docker_network=self.docker_network,
+            log_file=self.log_file,
+            layer_cache_basedir=self.layer_cache_basedir,
+            skip_pull_image=self.skip_pull_image,
+            force_image_build=self.force_image_build,
+            parameter_overrides=self.parameter_overrides,
+            warm_containers=self.warm_containers,
+            shutdown=self.shutdown,
+            debug_function=self.debug_function,
+            container_host=self.container_host,
+            container_host_interface=self.container_host_interface,
+            add_host=self.add_host,
+            invoke_image=self.invoke_image,
+        )
@@ -9,6 +9,7 @@ from parameterized import parameterized
 
 from samcli.lib.utils.packagetype import ZIP
 from samcli.commands._utils.template import TemplateFailedParsingException
+from samcli.commands.exceptions import ContainersInitializationException
 from samcli.commands.local.cli_common.invoke_context import (
     InvokeContext,
     ContainersInitializationMode,
@@ -23,6 +24,7 @@ from unittest import TestCase
 from unittest.mock import Mock, PropertyMock, patch, ANY, mock_open, call
 
 from samcli.lib.providers.provider import Stack
+from samcli.local.docker.exceptions import PortAlreadyInUse
 
 
 class TestInvokeContext__enter__(TestCase):
@@ -502,6 +504,84 @@ class TestInvokeContext__exit__(TestCase):
         context.__exit__()
         self.assertIsNone(context._log_file_handle)
 
+    def test_must_clean_decompressed_code_dirs_of_cold_runtime(self):
+        context = InvokeContext(template_file="template")
+        runtime_mock = Mock()
+        context._lambda_runtimes = {ContainersMode.COLD: runtime_mock}
+        context._containers_mode = ContainersMode.COLD
+
+        context.__exit__()
+
+        runtime_mock.clean_decompressed_code_dirs.assert_called_once_with()
+
+
+class TestInvokeContext_initialize_all_functions_containers(TestCase):
+    def setUp(self):
+        self.context = InvokeContext(template_file="template")
+        self.context._function_provider = Mock()
+        self.context._local_lambda_runner = Mock()
+        self.context._lambda_runtimes = {ContainersMode.WARM: Mock()}
+        self.context._containers_mode = ContainersMode.WARM
+        self.context._clean_running_containers_and_related_resources = Mock()
+        self.runtime = self.context._lambda_runtimes[ContainersMode.WARM]
+
+        self.function1 = Mock(full_path="Function1")
+        self.function2 = Mock(full_path="Function2")
+        self.context._function_provider.get_all.return_value = [self.function1, self.function2]
+        self.context._local_lambda_runner.get_invoke_config.side_effect = lambda function: function.full_path
+
+    def test_must_run_container_for_each_function(self):
+        self.context._initialize_all_functions_containers()
+
+        self.runtime.run.assert_has_calls(
+            [
+                call(
+                    container=None,
+                    function_config="Function1",
+                    debug_context=None,
+                    container_host=None,
+                    container_host_interface=None,
+                    extra_hosts=None,
+                ),
+                call(
+                    container=None,
+                    function_config="Function2",
+                    debug_context=None,
+                    container_host=None,
+                    container_host_interface=None,
+                    extra_hosts=None,
+                ),
+            ],
+            any_order=True,
+        )
+        self.context._clean_running_containers_and_related_resources.assert_not_called()
+
+    def test_must_isolate_failure_of_one_function(self):
+        def run(function_config, **kwargs):
+            if function_config == "Function1":
+                raise ValueError("failed to create container")
+
+        self.runtime.run.side_effect = run
+
+        self.context._initialize_all_functions_containers()
+
+        self.assertEqual(self.runtime.run.call_count, 2)
+        self.context._clean_running_containers_and_related_resources.assert_not_called()
+
+    def test_must_raise_if_all_functions_failed(self):
+        self.runtime.run.side_effect = ValueError("failed to create container")
+
+        with self.assertRaises(ContainersInitializationException):
+            self.context._initialize_all_functions_containers()
+
+        self.context._clean_running_containers_and_related_resources.assert_called_once_with()
+
+    def test_must_raise_port_already_in_use(self):
+        self.runtime.run.side_effect = PortAlreadyInUse("port in use")
+
+        with self.assertRaises(PortAlreadyInUse):
+            self.context._initialize_all_functions_containers()
+
 
 class TestInvokeContextAsContextManager(TestCase):
     """
@@ -1380,6 +1460,24 @@ class TestInvokeContext_get_stacks(TestCase):
         )
 
 
+class TestInvokeContext_reloads_templates_property(TestCase):
+    @parameterized.expand(
+        [
+            (None, False),
+            (ContainersInitializationMode.EAGER.value, True),
+            (ContainersInitializationMode.LAZY.value, True),
+        ]
+    )
+    @patch("samcli.commands.local.cli_common.invoke_context.InvokeContext._add_account_id_to_global")
+    def test_must_reload_templates_with_warm_containers(
+        self, warm_container_initialization_mode, expected_result, add_account_id_to_global_mock
+    ):
+        invoke_context = InvokeContext(
+            "template_file", warm_container_initialization_mode=warm_container_initialization_mode
+        )
+        self.assertEqual(invoke_context.reloads_templates, expected_result)
+
+
 class TestInvokeContext_add_account_id_to_global(TestCase):
     def test_must_work_with_no_token(self):
         invoke_context = InvokeContext("template_file")
@@ -160,3 +160,41 @@ class TestApiCollector_linking_authorizer(TestCase):
         self.api_collector._link_authorizers()
 
         self.assertEqual(self.api_collector._route_per_resource, {self.apigw_id: expected_routes})
+
+
+class TestApiCollector_merge(TestCase):
+    def test_must_merge_routes_authorizers_and_properties(self):
+        authorizer = Authorizer(authorizer_name="auth1", type="token1", payload_version="1.0")
+        route = Route(function_name="func1", path="/path1", methods=["GET"])
+        other_collector = ApiCollector()
+        other_collector.add_routes("apigw1", [route])
+        other_collector.add_authorizers("apigw1", {"auth1": authorizer})
+        other_collector.set_default_authorizer("apigw1", "auth1")
+        other_collector.add_binary_media_types("apigw1", ["image~1gif"])
+        other_collector.stage_name = "dev"
+
+        collector = ApiCollector()
+        collector.stage_name = "prod"
+        collector.stage_variables = {"key": "value"}
+        collector.merge(other_collector)
+        api = collector.get_api()
+
+        self.assertEqual(api.routes[0].authorizer_object, authorizer)
+        self.assertEqual(api.binary_media_types, ["image/gif"])
+        self.assertEqual(api.stage_name, "dev")
+        self.assertEqual(api.stage_variables, {"key": "value"})
+        # routes are copied, so the merged collector is not updated when the api is created
+        self.assertIsNone(route.authorizer_object)
+
+    def test_must_merge_same_collector_again(self):
+        other_collector = ApiCollector()
+        other_collector.add_routes("apigw1", [Route(function_name="func1", path="/path1", methods=["GET"])])
+
+        first_collector = ApiCollector()
+        first_collector.merge(other_collector)
+        first_collector.cors = True
+        first_collector.get_api()
+        second_collector = ApiCollector()
+        second_collector.merge(other_collector)
+
+        self.assertEqual(second_collector.get_api().routes[0].methods, ["GET"])
@@ -23,6 +23,85 @@ class TestApiProvider_init(TestCase):
         self.assertEqual(provider.routes, set(["set", "of", "values"]))
 
 
+class TestApiProvider_refresh(TestCase):
+    def setUp(self):
+        self.template = {
+            "Resources": {
+                "Func1": {
+                    "Type": "AWS::Serverless::Function",
+                    "Properties": {
+                        "Events": {"Api": {"Type": "Api", "Properties": {"Path": "/path1", "Method": "GET"}}}
+                    },
+                },
+                "Func2": {
+                    "Type": "AWS::Serverless::Function",
+                    "Properties": {
+                        "Events": {"Api": {"Type": "Api", "Properties": {"Path": "/path2", "Method": "GET"}}}
+                    },
+                },
+            }
+        }
+
+    @staticmethod
+    def make_stacks(template):
+        return [Stack("", "", "template.yaml", parameters=None, template_dict=template)]
+
+    def test_must_extract_only_changed_resources(self):
+        provider = ApiProvider(self.make_stacks(self.template))
+        self.template["Resources"]["Func2"]["Properties"]["Events"]["Api"]["Properties"]["Path"] = "/path3"
+
+        with patch.object(SamApiProvider, "extract_resource", autospec=True) as extract_resource_mock:
+            provider.refresh(self.make_stacks(self.template))
+
+        # the implicit api is generated from the events of all the functions, so it changes with them
+        self.assertEqual([call[0][2] for call in extract_resource_mock.call_args_list], ["Func2", "ServerlessRestApi"])
+
+    def test_must_return_updated_api(self):
+        provider = ApiProvider(self.make_stacks(self.template))
+        del self.template["Resources"]["Func1"]
+        self.template["Resources"]["Func2"]["Properties"]["Events"]["Api"]["Properties"]["Path"] = "/path3"
+
+        api = provider.refresh(self.make_stacks(self.template))
+
+        self.assertEqual([route.path for route in api.routes], ["/path3"])
+        self.assertIs(provider.api, api)
+        self.assertEqual(provider.routes, api.routes)
+
+    def test_must_return_same_routes_for_unchanged_template(self):
+        provider = ApiProvider(self.make_stacks(self.template))
+        routes = provider.routes
+
+        api = provider.refresh(self.make_stacks(self.template))
+
+        self.assertCountEqual(api.routes, routes)
+
+    def test_must_extract_whole_stack_again_when_extraction_depends_on_stack(self):
+        template = {
+            "Resources": {
+                "Api": {"Type": "AWS::ApiGateway::RestApi", "Properties": {}},
+                "Resource": {
+                    "Type": "AWS::ApiGateway::Resource",
+                    "Properties": {"PathPart": "path1", "RestApiId": "Api"},
+                },
+                "Method": {
+                    "Type": "AWS::ApiGateway::Method",
+                    "Properties": {
+                        "HttpMethod": "GET",
+                        "RestApiId": "Api",
+                        "ResourceId": "Resource",
+                        "Integration": {"Uri": "arn:aws:lambda:us-east-1:123456789012:function:Func1"},
+                    },
+                },
+            }
+        }
+        provider = ApiProvider(self.make_stacks(template))
+        template["Resources"]["Resource"]["Properties"]["PathPart"] = "path2"
+
+        api = provider.refresh(self.make_stacks(template))
+
+        self.assertEqual([route.path for route in api.routes], ["/path2"])
+
+
 class TestApiProviderSelection(TestCase):
     def make_mock_stacks_with_resources(self, resources):
         stack_mock = Mock(resources=resources)
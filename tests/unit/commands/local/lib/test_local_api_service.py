@@ -2,15 +2,21 @@
 Unit test for local API service
 """
 
+import os
+import shutil
+import tempfile
 from unittest import TestCase
 
-from unittest.mock import Mock, patch
+from unittest.mock import Mock, PropertyMock, patch
 
+from samcli.commands._utils.template import TemplateFailedParsingException
 from samcli.lib.providers.provider import Api
+from samcli.lib.providers.sam_stack_provider import SamLocalStackProvider
 from samcli.lib.providers.api_collector import ApiCollector
 from samcli.lib.providers.api_provider import ApiProvider
 from samcli.commands.local.lib.exceptions import NoApisDefined
 from samcli.commands.local.lib.local_api_service import LocalApiService
+from samcli.local.apigw.local_apigw_service import LocalApigwService
 from samcli.local.apigw.route import Route
 
 
@@ -35,6 +41,7 @@ class TestLocalApiService_start(TestCase):
         self.lambda_invoke_context_mock.get_cwd = Mock()
         self.lambda_invoke_context_mock.get_cwd.return_value = self.cwd
         self.lambda_invoke_context_mock.stderr = self.stderr_mock
+        self.lambda_invoke_context_mock.reloads_templates = False
 
     @patch("samcli.commands.local.lib.local_api_service.LocalApigwService")
     @patch("samcli.commands.local.lib.local_api_service.ApiProvider")
@@ -109,6 +116,163 @@ class TestLocalApiService_start(TestCase):
         with self.assertRaises(NoApisDefined):
             local_service.start()
 
+    @patch("samcli.commands.local.lib.local_api_service.FileObserver")
+    @patch("samcli.commands.local.lib.local_api_service.LocalApigwService")
+    @patch("samcli.commands.local.lib.local_api_service.ApiProvider")
+    @patch.object(LocalApiService, "_make_static_dir_path")
+    @patch.object(LocalApiService, "_print_routes")
+    def test_must_watch_templates_if_they_are_reloaded(
+        self, log_routes_mock, make_static_dir_mock, SamApiProviderMock, ApiGwServiceMock, FileObserverMock
+    ):
+        self.lambda_invoke_context_mock.reloads_templates = True
+        self.api_provider_mock.stacks = [Mock(location="template.yaml"), Mock(location="child/template.yaml")]
+        SamApiProviderMock.return_value = self.api_provider_mock
+        ApiGwServiceMock.return_value = self.apigw_service
+
+        local_service = LocalApiService(
+            self.lambda_invoke_context_mock,
+            self.port,
+            self.host,
+            self.static_dir,
+            self.disable_authorizer,
+            self.ssl_context,
+        )
+        local_service.start()
+
+        FileObserverMock.return_value.start.assert_called_once_with()
+        self.assertEqual(
+            [watch_call.args for watch_call in FileObserverMock.return_value.watch.call_args_list],
+            [("template.yaml",), ("child/template.yaml",)],
+        )
+
+    @patch("samcli.commands.local.lib.local_api_service.FileObserver")
+    @patch("samcli.commands.local.lib.local_api_service.LocalApigwService")
+    @patch("samcli.commands.local.lib.local_api_service.ApiProvider")
+    @patch.object(LocalApiService, "_make_static_dir_path")
+    @patch.object(LocalApiService, "_print_routes")
+    def test_must_not_watch_templates_if_they_are_not_reloaded(
+        self, log_routes_mock, make_static_dir_mock, SamApiProviderMock, ApiGwServiceMock, FileObserverMock
+    ):
+        SamApiProviderMock.return_value = self.api_provider_mock
+        ApiGwServiceMock.return_value = self.apigw_service
+
+        local_service = LocalApiService(
+            self.lambda_invoke_context_mock,
+            self.port,
+            self.host,
+            self.static_dir,
+            self.disable_authorizer,
+            self.ssl_context,
+        )
+        local_service.start()
+
+        FileObserverMock.assert_not_called()
+
+
+class TestLocalApiService_update_routes(TestCase):
+    TEMPLATE = """
+Resources:
+  FunctionA:
+    Type: AWS::Serverless::Function
+    Properties:
+      Handler: index.handler
+      Runtime: python3.12
+      CodeUri: .
+      Events:
+        Get:
+          Type: Api
+          Properties:
+            Path: /a
+            Method: get
+  FunctionB:
+    Type: AWS::Serverless::Function
+    Properties:
+      Handler: index.handler
+      Runtime: python3.12
+      CodeUri: .
+      Events:
+        Get:
+          Type: Api
+          Properties:
+            Path: {function_b_path}
+            Method: get
+"""
+
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+        self.template_path = os.path.join(self.temp_dir, "template.yaml")
+        self._write_template("/b")
+
+        self.lambda_invoke_context_mock = Mock()
+        self.lambda_invoke_context_mock.get_cwd.return_value = self.temp_dir
+        self.stacks_mock = PropertyMock(side_effect=self._get_stacks)
+        type(self.lambda_invoke_context_mock).stacks = self.stacks_mock
+        self.lambda_invoke_context_mock.local_lambda_runner.is_debugging.return_value = False
+
+        self.local_service = LocalApiService(self.lambda_invoke_context_mock, 3000, "127.0.0.1", None, False, None)
+        self.service = LocalApigwService(
+            api=self.local_service.api_provider.api,
+            lambda_runner=self.lambda_invoke_context_mock.local_lambda_runner,
+        )
+        self.service.create()
+        self.observer_mock = Mock()
+        self.local_service._watch_stack_templates(self.observer_mock, self.local_service.api_provider.stacks)
+        self.observer_mock.reset_mock()
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir)
+
+    def _write_template(self, function_b_path):
+        with open(self.template_path, "w") as template_file:
+            template_file.write(self.TEMPLATE.format(function_b_path=function_b_path))
+
+    def _get_stacks(self):
+        stacks, _ = SamLocalStackProvider.get_stacks(self.template_path)
+        return stacks
+
+    @patch.object(LocalApiService, "_print_routes")
+    def test_must_swap_only_the_changed_routes(self, print_routes_mock):
+        route_a = self.service._dict_of_routes["/a:GET"]
+        route_b = self.service._dict_of_routes["/b:GET"]
+        self._write_template("/c")
+
+        with patch.object(self.service, "_register_route", wraps=self.service._register_route) as register_mock:
+            with patch.object(
+                self.service, "_unregister_route", wraps=self.service._unregister_route
+            ) as unregister_mock:
+                self.local_service._update_routes(self.service, self.observer_mock)
+
+        unregister_mock.assert_called_once_with(route_b)
+        self.assertEqual([register_call.args[0].path for register_call in register_mock.call_args_list], ["/c"])
+        self.assertIs(self.service._dict_of_routes["/a:GET"], route_a)
+        self.assertNotIn("/b:GET", self.service._dict_of_routes)
+        self.assertEqual(self.service._route_index.match("GET", "/c").route.function_name, "FunctionB")
+        self.assertIsNone(self.service._route_index.match("GET", "/b"))
+        self.observer_mock.watch.assert_called_once_with(self.template_path)
+
+    @patch.object(LocalApiService, "_print_routes")
+    def test_must_keep_the_routes_if_templates_cant_be_loaded(self, print_routes_mock):
+        stacks = self.local_service.api_provider.stacks
+        self.stacks_mock.side_effect = TemplateFailedParsingException("invalid template")
+
+        with patch.object(self.service, "update_api") as update_api_mock:
+            self.local_service._update_routes(self.service, self.observer_mock)
+
+        update_api_mock.assert_not_called()
+        self.assertIs(self.local_service.api_provider.stacks, stacks)
+        self.assertEqual(self.service._route_index.match("GET", "/b").route.function_name, "FunctionB")
+        self.observer_mock.watch.assert_called_once_with(self.template_path)
+
+    @patch("samcli.commands.local.lib.local_api_service.threading.Thread")
+    def test_must_update_routes_in_another_thread_on_templates_change(self, thread_mock):
+        self.local_service._on_templates_change(self.service, self.observer_mock, [self.template_path])
+
+        self.observer_mock.unwatch.assert_called_once_with(self.template_path)
+        thread_mock.assert_called_once_with(
+            target=self.local_service._update_routes, args=(self.service, self.observer_mock), daemon=True
+        )
+        thread_mock.return_value.start.assert_called_once_with()
+
 
 class TestLocalApiService_print_routes(TestCase):
     def test_must_print_routes(self):
@@ -0,0 +1,271 @@
+import base64
+import json
+import os
+import shutil
+import tempfile
+import threading
+import time
+from unittest import TestCase
+from unittest.mock import Mock, patch
+
+import flask
+from parameterized import parameterized
+
+from samcli.commands.local.lib.exceptions import InvalidBenchEventError
+from samcli.commands.local.lib.local_bench import (
+    ApiBenchRequest,
+    ApiEventSender,
+    BenchResult,
+    BenchSample,
+    LambdaEventSender,
+    format_bench_result,
+    percentile,
+    read_bench_events,
+    run_bench,
+)
+from samcli.lib.providers.provider import Api
+from samcli.lib.utils.phase_timer import EmulationPhase, record_phase
+from samcli.local.apigw.local_apigw_service import LocalApigwService
+from samcli.local.apigw.route import Route
+from samcli.local.lambda_service import local_lambda_invoke_service
+from samcli.local.lambda_service.local_lambda_invoke_service import LocalLambdaInvokeService
+
+
+class TestPercentile(TestCase):
+    @parameterized.expand(
+        [
+            ([5.0], 99, 5.0),
+            ([1.0, 2.0, 3.0, 4.0, 5.0], 50, 3.0),
+            ([5.0, 1.0, 4.0, 2.0, 3.0], 0, 1.0),
+            ([1.0, 2.0, 3.0, 4.0, 5.0], 100, 5.0),
+            ([1.0, 2.0], 95, 1.95),
+        ]
+    )
+    def test_must_interpolate_percentiles(self, values, percent, expected):
+        self.assertAlmostEqual(percentile(values, percent), expected)
+
+    def test_must_require_values(self):
+        with self.assertRaises(ValueError):
+            percentile([], 50)
+
+
+class TestReadBenchEvents(TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+        self.event_file = os.path.join(self.temp_dir, "events")
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def _write(self, content):
+        with open(self.event_file, "w") as file:
+            file.write(content)
+
+    def test_must_send_empty_event_without_file(self):
+        self.assertEqual(read_bench_events(None), [{}])
+
+    def test_must_read_single_json_document(self):
+        self._write(json.dumps({"key": ["value"]}, indent=2))
+
+        self.assertEqual(read_bench_events(self.event_file), [{"key": ["value"]}])
+
+    def test_must_read_json_lines(self):
+        self._write('{"index": 0}\n\n{"index": 1}\n')
+
+        self.assertEqual(read_bench_events(self.event_file), [{"index": 0}, {"index": 1}])
+
+    @parameterized.expand([('{"index": 0}\n{"index"\n',), ("\n\n",)])
+    def test_must_fail_on_invalid_events(self, content):
+        self._write(content)
+
+        with self.assertRaises(InvalidBenchEventError):
+            read_bench_events(self.event_file)
+
+    def test_must_fail_on_missing_file(self):
+        with self.assertRaises(InvalidBenchEventError):
+            read_bench_events(self.event_file)
+
+
+class TestApiBenchRequest(TestCase):
+    def test_must_read_v1_event(self):
+        request = ApiBenchRequest.from_event(
+            {
+                "httpMethod": "POST",
+                "path": "/users",
+                "queryStringParameters": {"a": "1"},
+                "multiValueQueryStringParameters": {"a": ["1", "2"]},
+                "headers": {"Content-Type": "text/plain", "Content-Length": "3"},
+                "body": base64.b64encode(b"abc").decode("utf-8"),
+                "isBase64Encoded": True,
+            }
+        )
+
+        self.assertEqual(
+            request, ApiBenchRequest("POST", "/users", {"a": ["1", "2"]}, {"Content-Type": "text/plain"}, b"abc")
+        )
+
+    def test_must_read_v2_event(self):
+        request = ApiBenchRequest.from_event(
+            {
+                "rawPath": "/users/42",
+                "rawQueryString": "a=1&a=2",
+                "requestContext": {"http": {"method": "GET"}},
+                "body": None,
+            }
+        )
+
+        self.assertEqual(request, ApiBenchRequest("GET", "/users/42", "a=1&a=2", {}, ""))
+
+    @parameterized.expand([({},), ({"httpMethod": "GET"},), ([],), ("event",)])
+    def test_must_fail_on_other_events(self, event):
+        with self.assertRaises(InvalidBenchEventError):
+            ApiBenchRequest.from_event(event)
+
+
+class TestRunBench(TestCase):
+    def test_must_send_requests_cycling_through_events(self):
+        sent_events = []
+        lock = threading.Lock()
+        # like the containers, which handle one invocation at a time
+        container_locks = [threading.Lock(), threading.Lock()]
+
+        def send(event):
+            with container_locks[event % 2], record_phase(EmulationPhase.RIE_ROUND_TRIP, resource=f"c{event % 2}"):
+                time.sleep(0.01)
+            with lock:
+                sent_events.append(event)
+            return event != 2
+
+        result = run_bench(send, [0, 1, 2], request_count=7, concurrency=3)
+
+        self.assertEqual(sorted(sent_events), [0, 0, 0, 1, 1, 2, 2])
+        summary = result.to_dict()
+        self.assertEqual(summary["requests"], 7)
+        self.assertEqual(summary["failed"], 2)
+        self.assertEqual(summary["concurrency"], 3)
+        self.assertEqual(list(summary["phases"]), [EmulationPhase.RIE_ROUND_TRIP])
+        self.assertEqual(summary["phases"][EmulationPhase.RIE_ROUND_TRIP]["count"], 7)
+        self.assertEqual(summary["containers"]["count"], 2)
+        self.assertGreater(summary["containers"]["utilization"], 0)
+        self.assertLessEqual(summary["containers"]["utilization"], 1)
+
+    def test_must_count_send_errors_as_failures(self):
+        result = run_bench(Mock(side_effect=ValueError()), [{}], request_count=3, concurrency=2)
+
+        self.assertEqual(result.to_dict()["failed"], 3)
+
+    def test_must_raise_invalid_event_errors(self):
+        with self.assertRaises(InvalidBenchEventError):
+            run_bench(Mock(side_effect=InvalidBenchEventError("invalid")), [{}], request_count=3)
+
+    def test_must_start_requests_at_rate(self):
+        start = time.perf_counter()
+        result = run_bench(Mock(return_value=True), [{}], request_count=5, concurrency=5, rate=50)
+
+        # the last request starts 4 / 50 seconds after the first one
+        self.assertGreaterEqual(time.perf_counter() - start, 0.08)
+        self.assertEqual(len(result.samples), 5)
+
+    def test_must_require_events(self):
+        with self.assertRaises(ValueError):
+            run_bench(Mock(), [], request_count=1)
+
+
+class TestBenchResult(TestCase):
+    def test_must_compute_statistics(self):
+        samples = [
+            BenchSample(0.1, True, {EmulationPhase.ROUTING: 0.001, EmulationPhase.RIE_ROUND_TRIP: 0.05}, {"c1": 0.05}),
+            BenchSample(0.3, False, {EmulationPhase.RIE_ROUND_TRIP: 0.25}, {"c1": 0.25}),
+        ]
+
+        summary = BenchResult(samples, duration=0.5, concurrency=1).to_dict()
+
+        self.assertEqual(
+            summary,
+            {
+                "requests": 2,
+                "failed": 1,
+                "concurrency": 1,
+                "duration": 0.5,
+                "throughput": 4.0,
+                "latency": {"count": 2, "p50": 200.0, "p95": 290.0, "p99": 298.0, "mean": 200.0, "max": 300.0},
+                "phases": {
+                    EmulationPhase.ROUTING: {"count": 1, "p50": 1.0, "p95": 1.0, "p99": 1.0, "mean": 1.0, "max": 1.0},
+                    EmulationPhase.RIE_ROUND_TRIP: {
+                        "count": 2,
+                        "p50": 150.0,
+                        "p95": 240.0,
+                        "p99": 248.0,
+                        "mean": 150.0,
+                        "max": 250.0,
+                    },
+                },
+                "containers": {"count": 1, "utilization": 0.6},
+            },
+        )
+
+    def test_must_format_statistics(self):
+        samples = [BenchSample(0.1, True, {EmulationPhase.RIE_ROUND_TRIP: 0.05}, {"c1": 0.05})]
+
+        text = format_bench_result(BenchResult(samples, duration=0.1, concurrency=1).to_dict())
+
+        self.assertIn("Requests: 1 (0 failed) in 0.1s, 10.0 requests/s, concurrency 1", text)
+        self.assertIn("Containers: 1, utilization 50.0%", text)
+        self.assertRegex(text, r"total\s+1\s+100.00\s+100.00\s+100.00\s+100.00\s+100.00")
+        self.assertRegex(text, r"rie_round_trip\s+1\s+50.00")
+
+
+class TestEventSenders(TestCase):
+    def setUp(self):
+        self.lambda_runner = Mock()
+        self.lambda_runner.is_debugging.return_value = False
+        self.lambda_runner.invoke.side_effect = self._invoke
+        # other tests replace the flask request of the module
+        request_patch = patch.object(local_lambda_invoke_service, "request", flask.request)
+        request_patch.start()
+        self.addCleanup(request_patch.stop)
+
+    @staticmethod
+    def _invoke(function_name, event, stdout, stderr):
+        with record_phase(EmulationPhase.RIE_ROUND_TRIP, resource="container"):
+            if json.loads(event).get("fail"):
+                stdout.write_str(json.dumps({"errorMessage": "failed", "errorType": "Error"}))
+            else:
+                stdout.write_str(json.dumps({"statusCode": 200, "body": function_name}))
+
+    def test_must_send_events_to_lambda_service(self):
+        service = LocalLambdaInvokeService(self.lambda_runner, port=None, host=None)
+        service.create()
+
+        result = run_bench(LambdaEventSender(service, "HelloWorld"), [{}, {"fail": True}], request_count=4)
+
+        summary = result.to_dict()
+        self.assertEqual(summary["failed"], 2)
+        self.assertEqual(set(summary["phases"]), {EmulationPhase.RIE_ROUND_TRIP, EmulationPhase.RESPONSE_PARSING})
+        self.assertEqual(self.lambda_runner.invoke.call_args[0][0], "HelloWorld")
+
+    def test_must_send_events_to_api_service(self):
+        route = Route(function_name="HelloWorld", path="/hello/{name}", methods=["GET"])
+        service = LocalApigwService(Api(routes=[route]), self.lambda_runner)
+        service.create()
+        events = [
+            ApiBenchRequest.from_event({"httpMethod": "GET", "path": "/hello/world"}),
+            ApiBenchRequest.from_event({"httpMethod": "GET", "path": "/unknown"}),
+        ]
+
+        result = run_bench(ApiEventSender(service), events, request_count=4, concurrency=2)
+
+        summary = result.to_dict()
+        self.assertEqual(summary["failed"], 0)
+        self.assertEqual(self.lambda_runner.invoke.call_count, 2)
+        self.assertEqual(
+            set(summary["phases"]),
+            {
+                EmulationPhase.ROUTING,
+                EmulationPhase.EVENT_CONSTRUCTION,
+                EmulationPhase.RIE_ROUND_TRIP,
+                EmulationPhase.RESPONSE_PARSING,
+            },
+        )
+        self.assertEqual(summary["phases"][EmulationPhase.ROUTING]["count"], 4)
+        self.assertEqual(summary["containers"]["count"], 1)
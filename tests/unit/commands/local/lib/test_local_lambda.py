@@ -402,6 +402,8 @@ class TestLocalLambda_get_invoke_config(TestCase):
             env_vars_values=self.env_vars_values,
             debug_context=self.debug_context,
         )
+        self.aws_creds = {"key": "key", "secret": "secret", "sessiontoken": "token"}
+        self.local_lambda.get_aws_creds = Mock(side_effect=lambda: dict(self.aws_creds))
 
     @patch("samcli.commands.local.lib.local_lambda.resolve_code_path")
     @patch("samcli.commands.local.lib.local_lambda.LocalLambdaRunner.is_debugging")
@@ -468,7 +470,7 @@ class TestLocalLambda_get_invoke_config(TestCase):
         )
 
         resolve_code_path_patch.assert_called_with(self.real_path, function.codeuri)
-        self.local_lambda._make_env_vars.assert_called_with(function)
+        self.local_lambda._make_env_vars.assert_called_with(function, self.aws_creds)
 
     @patch("samcli.commands.local.lib.local_lambda.resolve_code_path")
     @patch("samcli.commands.local.lib.local_lambda.LocalLambdaRunner.is_debugging")
@@ -538,7 +540,46 @@ class TestLocalLambda_get_invoke_config(TestCase):
         )
 
         resolve_code_path_patch.assert_called_with(self.real_path, "codeuri")
-        self.local_lambda._make_env_vars.assert_called_with(function)
+        self.local_lambda._make_env_vars.assert_called_with(function, self.aws_creds)
+
+    @patch("samcli.commands.local.lib.local_lambda.resolve_code_path")
+    @patch("samcli.commands.local.lib.local_lambda.FunctionConfig")
+    def test_must_memoize_config_per_function(self, FunctionConfigMock, resolve_code_path_patch):
+        self.local_lambda._make_env_vars = Mock()
+        function = Mock(full_path="function_name", packagetype=ZIP)
+
+        configs = [self.local_lambda.get_invoke_config(function) for _ in range(1000)]
+
+        self.assertTrue(all(config is configs[0] for config in configs))
+        FunctionConfigMock.assert_called_once()
+        self.local_lambda._make_env_vars.assert_called_once_with(function, self.aws_creds)
+
+    @patch("samcli.commands.local.lib.local_lambda.resolve_code_path")
+    @patch("samcli.commands.local.lib.local_lambda.FunctionConfig")
+    def test_must_regenerate_config_when_function_is_reloaded(self, FunctionConfigMock, resolve_code_path_patch):
+        self.local_lambda._make_env_vars = Mock()
+        FunctionConfigMock.side_effect = ["config1", "config2"]
+        function = Mock(full_path="function_name", packagetype=ZIP)
+        reloaded_function = Mock(full_path="function_name", packagetype=ZIP)
+
+        self.assertEqual(self.local_lambda.get_invoke_config(function), "config1")
+        self.assertEqual(self.local_lambda.get_invoke_config(reloaded_function), "config2")
+        self.assertEqual(self.local_lambda.get_invoke_config(reloaded_function), "config2")
+
+    @patch("samcli.commands.local.lib.local_lambda.resolve_code_path")
+    @patch("samcli.commands.local.lib.local_lambda.FunctionConfig")
+    def test_must_regenerate_config_when_credentials_are_refreshed(self, FunctionConfigMock, resolve_code_path_patch):
+        self.local_lambda._make_env_vars = Mock()
+        FunctionConfigMock.side_effect = ["config1", "config2"]
+        function = Mock(full_path="function_name", packagetype=ZIP)
+
+        self.assertEqual(self.local_lambda.get_invoke_config(function), "config1")
+        self.aws_creds["sessiontoken"] = "refreshed token"
+        self.assertEqual(self.local_lambda.get_invoke_config(function), "config2")
+        self.assertEqual(self.local_lambda.get_invoke_config(function), "config2")
+
+        self.local_lambda._make_env_vars.assert_called_with(function, self.aws_creds)
+        self.assertEqual(self.local_lambda._make_env_vars.call_count, 2)
 
 
 class TestLocalLambda_invoke(TestCase):
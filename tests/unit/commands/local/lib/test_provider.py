@@ -123,6 +123,48 @@ class TestStack(TestCase):
         self.assertEqual(self.expected_stack_path, self.stack.stack_path)
 
 
+class TestStackGetResource(TestCase):
+    def setUp(self):
+        self.template = {
+            "Parameters": {"Runtime": {"Type": "String"}, "Tag": {"Type": "String"}},
+            "Resources": {
+                "Function": {
+                    "Type": "AWS::Lambda::Function",
+                    "Properties": {
+                        "Runtime": {"Ref": "Runtime"},
+                        "Environment": {"Variables": {"REGION": {"Ref": "AWS::Region"}}},
+                    },
+                    "Metadata": {"BuildMethod": {"Ref": "Runtime"}},
+                },
+                "Queue": {"Type": "AWS::SQS::Queue", "Properties": {"Tags": [{"Key": "k", "Value": {"Ref": "Tag"}}]}},
+            },
+        }
+        self.stack = Stack("", "", "template.yaml", {"Runtime": "python3.12", "Tag": "t"}, self.template)
+
+    def test_get_resource_ids_by_type(self):
+        self.assertEqual(self.stack.get_resource_ids(["AWS::Lambda::Function"]), ["Function"])
+
+    @patch("samcli.lib.intrinsic_resolver.intrinsic_property_resolver.IntrinsicResolver.resolve_template")
+    def test_get_resource_resolves_only_the_given_resource(self, resolve_template_mock):
+        resource = self.stack.get_resource("Function")
+
+        self.assertEqual(resource["Properties"]["Runtime"], "python3.12")
+        self.assertEqual(resource["Properties"]["Environment"]["Variables"]["REGION"], "us-east-1")
+        self.assertEqual(resource["Metadata"]["BuildMethod"], "python3.12")
+        self.assertIs(self.stack.get_resource("Function"), resource)
+        self.assertNotIn("Queue", self.stack._resolved_resources)
+        resolve_template_mock.assert_not_called()
+
+    def test_get_resource_returns_none_for_unknown_resource(self):
+        self.assertIsNone(self.stack.get_resource("Unknown"))
+
+    def test_get_resource_uses_the_resolved_resources(self):
+        resources = self.stack.resources
+
+        self.assertIs(self.stack.get_resource("Queue"), resources["Queue"])
+        self.assertEqual(resources["Queue"]["Properties"]["Tags"][0]["Value"], "t")
+
+
 class TestStackEqual(TestCase):
     def test_stacks_are_equal(self):
         stack1 = Stack(
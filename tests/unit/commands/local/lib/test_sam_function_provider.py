@@ -1,7 +1,7 @@
 import os
 import posixpath
 from unittest import TestCase
-from unittest.mock import patch, PropertyMock, Mock, call
+from unittest.mock import patch, Mock, call
 
 from parameterized import parameterized
 from samcli.lib.build.exceptions import MissingFunctionHandlerException
@@ -1112,7 +1112,7 @@ class TestSamFunctionProvider_init(TestCase):
         provider = SamFunctionProvider([stack])
 
         extract_mock.assert_called_with([stack], False, False, False)
-        get_template_mock.assert_called_with(template, self.parameter_overrides)
+        get_template_mock.assert_not_called()
         self.assertEqual(provider.functions, extract_result)
 
     @patch.object(SamFunctionProvider, "_extract_functions")
@@ -1141,34 +1141,33 @@ class TestSamFunctionProvider_init(TestCase):
         provider = SamFunctionProvider([stack], locate_layer_nested=True)
 
         extract_mock.assert_called_with([stack], False, False, True)
-        get_template_mock.assert_called_with(template, self.parameter_overrides)
+        get_template_mock.assert_not_called()
         self.assertEqual(provider.functions, extract_result)
 
 
 class TestSamFunctionProvider_extract_functions(TestCase):
-    @patch("samcli.lib.providers.sam_function_provider.Stack.resources", new_callable=PropertyMock)
     @patch.object(SamFunctionProvider, "_convert_sam_function_resource")
-    def test_must_work_for_sam_function(self, convert_mock, resources_mock):
+    def test_must_work_for_sam_function(self, convert_mock):
         convertion_result = Mock()
         convertion_result.full_path = "A/B/C/Func1"
         convert_mock.return_value = convertion_result
 
-        resources_mock.return_value = {"Func1": {"Type": "AWS::Serverless::Function", "Properties": {"a": "b"}}}
+        resources = {"Func1": {"Type": "AWS::Serverless::Function", "Properties": {"a": "b"}}}
         expected = {"A/B/C/Func1": convertion_result}
 
         stack = make_root_stack(None)
+        stack._resources = resources
         result = SamFunctionProvider._extract_functions([stack])
         self.assertEqual(expected, result)
         convert_mock.assert_called_with(stack, "Func1", {"a": "b"}, [], False)
 
-    @patch("samcli.lib.providers.sam_function_provider.Stack.resources", new_callable=PropertyMock)
     @patch.object(SamFunctionProvider, "_convert_sam_function_resource")
-    def test_must_work_with_no_properties(self, convert_mock, resources_mock):
+    def test_must_work_with_no_properties(self, convert_mock):
         convertion_result = Mock()
         convertion_result.full_path = "A/B/C/Func1"
         convert_mock.return_value = convertion_result
 
-        resources_mock.return_value = {
+        resources = {
             "Func1": {
                 "Type": "AWS::Serverless::Function"
                 # No Properties
@@ -1178,6 +1177,7 @@ class TestSamFunctionProvider_extract_functions(TestCase):
         expected = {"A/B/C/Func1": convertion_result}
 
         stack = make_root_stack(None)
+        stack._resources = resources
         result = SamFunctionProvider._extract_functions([stack])
         self.assertEqual(expected, result)
         convert_mock.assert_called_with(
@@ -1188,31 +1188,56 @@ class TestSamFunctionProvider_extract_functions(TestCase):
             False,
         )
 
-    @patch("samcli.lib.providers.sam_function_provider.Stack.resources", new_callable=PropertyMock)
     @patch.object(SamFunctionProvider, "_convert_lambda_function_resource")
-    def test_must_work_for_lambda_function(self, convert_mock, resources_mock):
+    def test_must_work_for_lambda_function(self, convert_mock):
         convertion_result = Mock()
         convertion_result.full_path = "A/B/C/Func1"
         convert_mock.return_value = convertion_result
 
-        resources_mock.return_value = {"Func1": {"Type": "AWS::Lambda::Function", "Properties": {"a": "b"}}}
+        resources = {"Func1": {"Type": "AWS::Lambda::Function", "Properties": {"a": "b"}}}
 
         expected = {"A/B/C/Func1": convertion_result}
 
         stack = make_root_stack(None)
+        stack._resources = resources
         result = SamFunctionProvider._extract_functions([stack])
         self.assertEqual(expected, result)
         convert_mock.assert_called_with(stack, "Func1", {"a": "b"}, [], False)
 
-    @patch("samcli.lib.providers.sam_function_provider.Stack.resources", new_callable=PropertyMock)
-    def test_must_skip_unknown_resource(self, resources_mock):
-        resources_mock.return_value = {"Func1": {"Type": "AWS::SomeOther::Function", "Properties": {"a": "b"}}}
+    def test_must_skip_unknown_resource(self):
+        resources = {"Func1": {"Type": "AWS::SomeOther::Function", "Properties": {"a": "b"}}}
 
         expected = {}
 
-        result = SamFunctionProvider._extract_functions([make_root_stack(None)])
+        stack = make_root_stack(None)
+        stack._resources = resources
+        result = SamFunctionProvider._extract_functions([stack])
         self.assertEqual(expected, result)
 
+    @patch("samcli.lib.intrinsic_resolver.intrinsic_property_resolver.IntrinsicResolver.resolve_template")
+    @patch.object(SamFunctionProvider, "_convert_lambda_function_resource")
+    def test_must_resolve_only_the_function_resources(self, convert_mock, resolve_template_mock):
+        convertion_result = Mock()
+        convertion_result.full_path = "Func1"
+        convert_mock.return_value = convertion_result
+        template = {
+            "Parameters": {"Memory": {"Type": "Number"}},
+            "Resources": {
+                "Func1": {"Type": "AWS::Lambda::Function", "Properties": {"MemorySize": {"Ref": "Memory"}}},
+                "Queue": {"Type": "AWS::SQS::Queue", "Properties": {"DelaySeconds": {"Ref": "Memory"}}},
+            },
+        }
+
+        stack = make_root_stack(template, {"Memory": 128})
+        result = SamFunctionProvider._extract_functions([stack])
+
+        self.assertEqual({"Func1": convertion_result}, result)
+        convert_mock.assert_called_with(
+            stack, "Func1", {"MemorySize": 128, "Metadata": {"SamResourceId": "Func1"}}, [], False
+        )
+        self.assertEqual(list(stack._resolved_resources), ["Func1"])
+        resolve_template_mock.assert_not_called()
+
     @patch.object(SamFunctionProvider, "_convert_lambda_function_resource")
     def test_must_work_for_multiple_functions_with_name_but_in_different_stacks(
         self,
@@ -1225,13 +1250,13 @@ class TestSamFunctionProvider_extract_functions(TestCase):
         function_child.name = "Func1"
         function_child.full_path = "C/Func1"
 
-        stack_root = Mock()
-        stack_root.resources = {
+        stack_root = make_root_stack(None)
+        stack_root._resources = {
             "Func1": {"Type": "AWS::Lambda::Function", "Properties": {"a": "b"}},
             "C": {"Type": "AWS::Serverless::Application", "Properties": {"Location": "./child.yaml"}},
         }
-        stack_child = Mock()
-        stack_child.resources = {
+        stack_child = Stack("", "C", "./child.yaml", None, None)
+        stack_child._resources = {
             "Func1": {"Type": "AWS::Lambda::Function", "Properties": {"a": "b"}},
         }
 
@@ -1248,22 +1273,22 @@ class TestSamFunctionProvider_extract_functions(TestCase):
             ]
         )
 
-    @patch("samcli.lib.providers.sam_function_provider.Stack.resources", new_callable=PropertyMock)
     @patch.object(SamFunctionProvider, "_parse_layer_info")
     @patch.object(SamFunctionProvider, "_convert_lambda_function_resource")
-    def test_must_work_for_lambda_function_search_layer(self, convert_mock, parse_layer_mock, resources_mock):
+    def test_must_work_for_lambda_function_search_layer(self, convert_mock, parse_layer_mock):
         convertion_result = Mock()
         convertion_result.full_path = "A/B/C/Func1"
         convert_mock.return_value = convertion_result
         parse_layer_mock.return_value = []
 
-        resources_mock.return_value = {
+        resources = {
             "Func1": {"Type": "AWS::Lambda::Function", "Properties": {"a": "b"}, "Metadata": {"SamResourceId": "id"}}
         }
 
         expected = {"A/B/C/Func1": convertion_result}
 
         stack = make_root_stack(None)
+        stack._resources = resources
         result = SamFunctionProvider._extract_functions([stack], locate_layer_nested=True)
         self.assertEqual(expected, result)
         convert_mock.assert_called_with(stack, "Func1", {"a": "b", "Metadata": {"SamResourceId": "id"}}, [], False)
@@ -1277,16 +1302,15 @@ class TestSamFunctionProvider_extract_functions(TestCase):
             function_id="id",
         )
 
-    @patch("samcli.lib.providers.sam_function_provider.Stack.resources", new_callable=PropertyMock)
     @patch.object(SamFunctionProvider, "_parse_layer_info")
     @patch.object(SamFunctionProvider, "_convert_sam_function_resource")
-    def test_must_work_for_serverless_function_search_layer(self, convert_mock, parse_layer_mock, resources_mock):
+    def test_must_work_for_serverless_function_search_layer(self, convert_mock, parse_layer_mock):
         convertion_result = Mock()
         convertion_result.full_path = "A/B/C/Func1"
         convert_mock.return_value = convertion_result
         parse_layer_mock.return_value = []
 
-        resources_mock.return_value = {
+        resources = {
             "Func1": {
                 "Type": "AWS::Serverless::Function",
                 "Properties": {"a": "b"},
@@ -1297,6 +1321,7 @@ class TestSamFunctionProvider_extract_functions(TestCase):
         expected = {"A/B/C/Func1": convertion_result}
 
         stack = make_root_stack(None)
+        stack._resources = resources
         result = SamFunctionProvider._extract_functions([stack], locate_layer_nested=True)
         self.assertEqual(expected, result)
         convert_mock.assert_called_with(stack, "Func1", {"a": "b", "Metadata": {"SamResourceId": "id"}}, [], False)
@@ -1310,22 +1335,22 @@ class TestSamFunctionProvider_extract_functions(TestCase):
             function_id="id",
         )
 
-    @patch("samcli.lib.providers.sam_function_provider.Stack.resources", new_callable=PropertyMock)
     @patch.object(SamFunctionProvider, "_parse_layer_info")
     @patch.object(SamFunctionProvider, "_convert_lambda_function_resource")
-    def test_must_work_for_lambda_function_no_search_layer(self, convert_mock, parse_layer_mock, resources_mock):
+    def test_must_work_for_lambda_function_no_search_layer(self, convert_mock, parse_layer_mock):
         convertion_result = Mock()
         convertion_result.full_path = "A/B/C/Func1"
         convert_mock.return_value = convertion_result
         parse_layer_mock.return_value = []
 
-        resources_mock.return_value = {
+        resources = {
             "Func1": {"Type": "AWS::Lambda::Function", "Properties": {"a": "b"}, "Metadata": {"SamResourceId": "id"}}
         }
 
         expected = {"A/B/C/Func1": convertion_result}
 
         stack = make_root_stack(None)
+        stack._resources = resources
         result = SamFunctionProvider._extract_functions([stack])
         self.assertEqual(expected, result)
         convert_mock.assert_called_with(stack, "Func1", {"a": "b", "Metadata": {"SamResourceId": "id"}}, [], False)
@@ -1339,16 +1364,15 @@ class TestSamFunctionProvider_extract_functions(TestCase):
             function_id=None,
         )
 
-    @patch("samcli.lib.providers.sam_function_provider.Stack.resources", new_callable=PropertyMock)
     @patch.object(SamFunctionProvider, "_parse_layer_info")
     @patch.object(SamFunctionProvider, "_convert_sam_function_resource")
-    def test_must_work_for_serverless_function_no_search_layer(self, convert_mock, parse_layer_mock, resources_mock):
+    def test_must_work_for_serverless_function_no_search_layer(self, convert_mock, parse_layer_mock):
         convertion_result = Mock()
         convertion_result.full_path = "A/B/C/Func1"
         convert_mock.return_value = convertion_result
         parse_layer_mock.return_value = []
 
-        resources_mock.return_value = {
+        resources = {
             "Func1": {
                 "Type": "AWS::Serverless::Function",
                 "Properties": {"a": "b"},
@@ -1359,6 +1383,7 @@ class TestSamFunctionProvider_extract_functions(TestCase):
         expected = {"A/B/C/Func1": convertion_result}
 
         stack = make_root_stack(None)
+        stack._resources = resources
         result = SamFunctionProvider._extract_functions([stack])
         self.assertEqual(expected, result)
         convert_mock.assert_called_with(stack, "Func1", {"a": "b", "Metadata": {"SamResourceId": "id"}}, [], False)
@@ -1832,7 +1857,7 @@ class TestSamFunctionProvider_parse_layer_info(TestCase):
             "arn:aws:lambda:::awslayer:AmazonLinux1803",
         ]
         actual = SamFunctionProvider._parse_layer_info(
-            Mock(stack_path=STACK_PATH, location="template.yaml", resources=resources), list_of_layers
+            Mock(stack_path=STACK_PATH, location="template.yaml", get_resource=resources.get), list_of_layers
         )
 
         for actual_layer, expected_layer in zip(
@@ -1853,7 +1878,7 @@ class TestSamFunctionProvider_parse_layer_info(TestCase):
             {"NonRef": "Something"},
         ]
         actual = SamFunctionProvider._parse_layer_info(
-            Mock(stack_path=STACK_PATH, location="template.yaml", resources=resources), list_of_layers
+            Mock(stack_path=STACK_PATH, location="template.yaml", get_resource=resources.get), list_of_layers
         )
 
         for actual_layer, expected_layer in zip(
@@ -1870,7 +1895,7 @@ class TestSamFunctionProvider_parse_layer_info(TestCase):
         resources = {"Function": {"Type": "AWS::Serverless::Function", "Properties": {}}}
 
         actual = SamFunctionProvider._parse_layer_info(
-            Mock(stack_path=STACK_PATH, location="template.yaml", resources=resources), []
+            Mock(stack_path=STACK_PATH, location="template.yaml", get_resource=resources.get), []
         )
 
         self.assertEqual(actual, [])
@@ -1889,7 +1914,7 @@ class TestSamFunctionProvider_parse_layer_info(TestCase):
         mock_stack = Mock(
             stack_path=STACK_PATH,
             location="template.yaml",
-            resources=resources,
+            get_resource=resources.get,
             template_dict={"Resources": {"function_id": func_temp}},
         )
 
@@ -2099,7 +2124,7 @@ class TestRefreshableSamFunctionProvider(TestCase):
         )
 
         extract_mock.assert_called_with([stack, stack2], False, False, False)
-        get_template_mock.assert_called_with(template, self.parameter_overrides)
+        get_template_mock.assert_not_called()
         self.assertEqual(provider.functions, extract_result)
 
         FileObserverMock.assert_called_with(provider._set_templates_changed)
@@ -255,6 +255,42 @@ class TestRemoteInvokeCliCommand(TestCase):
         # Assert metric was emitted
         self.assertIn(["RemoteInvokeEventType", "text"], tracked_events)
 
+    @patch("samcli.lib.utils.boto_utils.get_boto_client_provider_with_config")
+    @patch("samcli.lib.utils.boto_utils.get_boto_resource_provider_with_config")
+    @patch("samcli.commands.remote.remote_invoke_context.RemoteInvokeContext")
+    @patch("samcli.lib.telemetry.event.EventTracker.track_event")
+    def test_remote_invoke_batch_command(self, mock_track_event, mock_remote_invoke_context, *_):
+        context_mock = Mock()
+        mock_remote_invoke_context.return_value.__enter__.return_value = context_mock
+        given_batch_event_file = Mock()
+
+        do_cli(
+            stack_name=self.stack_name,
+            resource_id=self.resource_id,
+            event=None,
+            event_file=None,
+            parameter={"InvocationType": "Event"},
+            output=RemoteInvokeOutputFormat.TEXT,
+            test_event_name=None,
+            region=self.region,
+            profile=self.profile,
+            config_file=self.config_file,
+            config_env=self.config_env,
+            batch_event_file=given_batch_event_file,
+            batch_concurrency=4,
+            batch_rate=10,
+        )
+
+        context_mock.run_batch.assert_called_once_with(
+            given_batch_event_file,
+            {"InvocationType": "Event"},
+            RemoteInvokeOutputFormat.TEXT,
+            max_concurrency=4,
+            max_rate=10,
+        )
+        context_mock.run.assert_not_called()
+        mock_track_event.assert_called_once_with("RemoteInvokeEventType", "file")
+
     @parameterized.expand(
         [
             (InvalideBotoResponseException,),
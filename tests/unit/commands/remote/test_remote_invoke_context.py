@@ -1,5 +1,5 @@
 from unittest import TestCase
-from unittest.mock import Mock, patch
+from unittest.mock import ANY, Mock, patch
 from parameterized import parameterized
 from uuid import uuid4
 
@@ -16,6 +16,7 @@ from samcli.commands.remote.remote_invoke_context import (
     SUPPORTED_SERVICES,
     RESOURCES_PRIORITY_ORDER,
 )
+from samcli.lib.remote_invoke.remote_invoke_executors import RemoteInvokeOutputFormat
 from samcli.lib.utils.cloudformation import CloudFormationResourceSummary
 
 
@@ -259,3 +260,30 @@ class TestRemoteInvokeContext(TestCase):
 
             mocked_remote_invoke_executor_factory.create_remote_invoke_executor.assert_called_once()
             mocked_remote_invoke_executor.execute.assert_called_with(given_input)
+
+    @patch("samcli.commands.remote.remote_invoke_context.RemoteInvokeExecutorFactory")
+    @patch("samcli.commands.remote.remote_invoke_context.get_resource_summary")
+    def test_running_batch_should_execute_batch_of_file_lines(
+        self, patched_get_resource_summary, patched_remote_invoke_executor_factory
+    ):
+        patched_get_resource_summary.return_value = Mock(resource_type=SUPPORTED_SERVICES["lambda"])
+        mocked_remote_invoke_executor = Mock()
+        mocked_remote_invoke_executor_factory = patched_remote_invoke_executor_factory.return_value
+        mocked_remote_invoke_executor_factory.create_remote_invoke_executor.return_value = mocked_remote_invoke_executor
+        remote_invoke_inputs = []
+        mocked_remote_invoke_executor.execute_batch.side_effect = lambda inputs, *_: remote_invoke_inputs.extend(inputs)
+        given_parameters = {"InvocationType": "Event"}
+
+        with self._get_remote_invoke_context() as remote_invoke_context:
+            remote_invoke_context.run_batch(
+                ['{"id": 1}\n', "\n", '{"id": 2}\n'], given_parameters, RemoteInvokeOutputFormat.TEXT, 4, 10
+            )
+
+        mocked_remote_invoke_executor.execute_batch.assert_called_once_with(ANY, 4, 10)
+        self.assertEqual(
+            [remote_invoke_input.payload for remote_invoke_input in remote_invoke_inputs], ['{"id": 1}', '{"id": 2}']
+        )
+        for remote_invoke_input in remote_invoke_inputs:
+            self.assertEqual(remote_invoke_input.parameters, given_parameters)
+            self.assertIsNot(remote_invoke_input.parameters, given_parameters)
+            self.assertEqual(remote_invoke_input.output_format, RemoteInvokeOutputFormat.TEXT)
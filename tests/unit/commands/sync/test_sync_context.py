@@ -1,25 +1,31 @@
+import shutil
+import tempfile
 from pathlib import Path
 from unittest import TestCase, mock
-from unittest.mock import mock_open, call, patch, Mock, MagicMock
+from unittest.mock import call, patch
 
-import tomlkit
 from parameterized import parameterized, parameterized_class
 
 from samcli.commands.sync.sync_context import (
     SyncState,
     ResourceSyncState,
     datetime,
-    _sync_state_to_toml_document,
+    _sync_state_to_document,
     HASH,
+    FINGERPRINT,
     SYNC_TIME,
     SYNC_STATE,
     DEPENDENCY_LAYER,
     RESOURCE_SYNC_STATES,
     LATEST_INFRA_SYNC_TIME,
-    _toml_document_to_sync_state,
+    INFRA_SYNC_FINGERPRINT,
+    _document_to_sync_state,
+    _read_legacy_sync_state_document,
+    SYNC_STATE_FILE_KIND,
     SyncContext,
 )
 from samcli.lib.build.build_graph import DEFAULT_DEPENDENCIES_DIR
+from samcli.lib.utils.journal_store import JournalStore
 
 MOCK_RESOURCE_SYNC_TIME = datetime(2023, 2, 8, 12, 12, 12)
 MOCK_INFRA_SYNC_TIME = datetime.utcnow()
@@ -104,7 +110,7 @@ sync_time = "{resource_sync_time}"
 """
 
 
-class TestSyncStateToTomlSerde(TestCase):
+class TestSyncStateSerde(TestCase):
     @parameterized.expand(
         [
             (True, MOCK_INFRA_SYNC_TIME, {"MockResourceId": ResourceSyncState("mock-hash", MOCK_RESOURCE_SYNC_TIME)}),
@@ -123,39 +129,27 @@ class TestSyncStateToTomlSerde(TestCase):
             ),
         ]
     )
-    def test_sync_state_to_toml(self, dependency_layer, latest_infra_sync_time, resource_sync_states):
+    def test_sync_state_to_document(self, dependency_layer, latest_infra_sync_time, resource_sync_states):
         sync_state = SyncState(
             dependency_layer=dependency_layer,
             latest_infra_sync_time=latest_infra_sync_time,
             resource_sync_states=resource_sync_states,
         )
 
-        toml_document = _sync_state_to_toml_document(sync_state)
-        self.assertIsNotNone(toml_document)
+        document = _sync_state_to_document(sync_state)
+        self.assertIsNotNone(document)
 
-        sync_state_toml_table = toml_document.get(SYNC_STATE)
-        self.assertIsNotNone(sync_state_toml_table)
+        sync_state_table = document.get(SYNC_STATE)
+        self.assertIsNotNone(sync_state_table)
+        self.assertEqual(sync_state_table.get(DEPENDENCY_LAYER), dependency_layer)
+        self.assertEqual(sync_state_table.get(LATEST_INFRA_SYNC_TIME), latest_infra_sync_time.isoformat())
 
-        dependency_layer_toml_field = sync_state_toml_table.get(DEPENDENCY_LAYER)
-        self.assertEqual(dependency_layer_toml_field, dependency_layer)
-
-        latest_infra_sync_time_toml_field = sync_state_toml_table.get(LATEST_INFRA_SYNC_TIME)
-        self.assertEqual(latest_infra_sync_time_toml_field, latest_infra_sync_time.isoformat())
-
-        resource_sync_states_toml_field = toml_document.get(RESOURCE_SYNC_STATES)
-        self.assertIsNotNone(resource_sync_states_toml_field)
-
-        for resource_id in resource_sync_states_toml_field:
-            resource_sync_state_toml_table = resource_sync_states_toml_field.get(resource_id)
-            resource_sync_state_resource_id = resource_id.replace("-", "/")
-
-            self.assertEqual(
-                resource_sync_states[resource_sync_state_resource_id].hash_value,
-                resource_sync_state_toml_table.get(HASH),
-            )
+        resource_sync_states_table = document.get(RESOURCE_SYNC_STATES)
+        self.assertEqual(set(resource_sync_states_table), set(resource_sync_states))
+        for resource_id, resource_sync_state_record in resource_sync_states_table.items():
+            self.assertEqual(resource_sync_states[resource_id].hash_value, resource_sync_state_record.get(HASH))
             self.assertEqual(
-                resource_sync_states[resource_sync_state_resource_id].sync_time.isoformat(),
-                resource_sync_state_toml_table.get(SYNC_TIME),
+                resource_sync_states[resource_id].sync_time.isoformat(), resource_sync_state_record.get(SYNC_TIME)
             )
 
     @parameterized.expand(
@@ -170,7 +164,7 @@ class TestSyncStateToTomlSerde(TestCase):
             ),
         ]
     )
-    def test_toml_to_sync_state(self, dependency_layer, resource_sync_states):
+    def test_legacy_toml_to_sync_state(self, dependency_layer, resource_sync_states):
         toml_template_str = TOML_TEMPLATE.format(
             dependency_layer=str(dependency_layer).lower(), latest_infra_sync_time=MOCK_INFRA_SYNC_TIME.isoformat()
         )
@@ -186,17 +180,29 @@ class TestSyncStateToTomlSerde(TestCase):
 
             toml_template_str += resource_sync_state_template
 
-        toml_doc = tomlkit.loads(toml_template_str)
-        sync_state = _toml_document_to_sync_state(toml_doc)
+        with tempfile.TemporaryDirectory() as temp_dir:
+            file_path = Path(temp_dir, "sync.toml")
+            file_path.write_text(toml_template_str)
+            sync_state = _document_to_sync_state(_read_legacy_sync_state_document(file_path))
         self.assertEqual(sync_state.dependency_layer, dependency_layer)
         self.assertEqual(sync_state.latest_infra_sync_time, MOCK_INFRA_SYNC_TIME)
         self.assertEqual(sync_state.resource_sync_states, resource_sync_states)
 
-    def test_none_toml_doc_should_return_none(self):
-        self.assertIsNone(_toml_document_to_sync_state(None))
+    def test_document_to_sync_state_round_trip(self):
+        sync_state = SyncState(
+            True,
+            {"Parent/Child/Mock-Resource": ResourceSyncState("mock-hash", MOCK_RESOURCE_SYNC_TIME, "fingerprint")},
+            MOCK_INFRA_SYNC_TIME,
+            "infra-fingerprint",
+        )
+
+        self.assertEqual(_document_to_sync_state(_sync_state_to_document(sync_state)), sync_state)
+
+    def test_none_doc_should_return_none(self):
+        self.assertIsNone(_document_to_sync_state(None))
 
-    def test_none_toml_table_should_return_none(self):
-        self.assertIsNone(_toml_document_to_sync_state(tomlkit.document()))
+    def test_empty_doc_should_return_none(self):
+        self.assertIsNone(_document_to_sync_state({}))
 
 
 @parameterized_class(
@@ -207,9 +213,19 @@ class TestSyncContext(TestCase):
     skip_deploy_sync: bool
 
     def setUp(self) -> None:
-        self.build_dir = "build_dir"
-        self.cache_dir = "cache_dir"
+        self.temp_dir = tempfile.mkdtemp()
+        self.build_dir = str(Path(self.temp_dir, ".aws-sam", "build"))
+        self.cache_dir = str(Path(self.temp_dir, ".aws-sam", "cache"))
+        Path(self.build_dir).mkdir(parents=True)
         self.sync_context = SyncContext(self.dependency_layer, self.build_dir, self.cache_dir, self.skip_deploy_sync)
+        self.file_path = Path(self.temp_dir, ".aws-sam", "sync.json")
+        self.legacy_file_path = Path(self.temp_dir, ".aws-sam", "sync.toml")
+
+    def tearDown(self) -> None:
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def _read_sync_state_file(self):
+        return JournalStore(self.file_path, SYNC_STATE_FILE_KIND).load()
 
     @parameterized.expand([(True,), (False,)])
     @patch("samcli.commands.sync.sync_context.rmtree_if_exists")
@@ -218,22 +234,22 @@ class TestSyncContext(TestCase):
             dependency_layer=str(previous_dependency_layer_value).lower(),
             latest_infra_sync_time=MOCK_INFRA_SYNC_TIME.isoformat(),
         )
-        with mock.patch("builtins.open", mock_open(read_data=previous_session_state)) as mock_file:
-            with self.sync_context:
-                pass
+        self.legacy_file_path.write_text(previous_session_state)
 
-            mock_file.assert_has_calls(
-                [call().write(tomlkit.dumps(_sync_state_to_toml_document(self.sync_context._current_state)))]
-            )
+        with self.sync_context:
+            pass
 
-            if previous_dependency_layer_value != self.dependency_layer:
-                patched_rmtree_if_exists.assert_has_calls(
-                    [
-                        call(self.sync_context._build_dir),
-                        call(self.sync_context._cache_dir),
-                        call(Path(DEFAULT_DEPENDENCIES_DIR)),
-                    ]
-                )
+        self.assertEqual(_document_to_sync_state(self._read_sync_state_file()), self.sync_context._current_state)
+        self.assertFalse(self.legacy_file_path.exists())
+
+        if previous_dependency_layer_value != self.dependency_layer:
+            patched_rmtree_if_exists.assert_has_calls(
+                [
+                    call(self.sync_context._build_dir),
+                    call(self.sync_context._cache_dir),
+                    call(Path(DEFAULT_DEPENDENCIES_DIR)),
+                ]
+            )
 
     @parameterized.expand(
         [(True, "MockResourceId", "mock-hash"), (False, "Parent/Child/MockResourceId", "nested-mock-hash")]
@@ -245,12 +261,15 @@ class TestSyncContext(TestCase):
             dependency_layer=str(previous_dependency_layer_value).lower(),
             latest_infra_sync_time=MOCK_INFRA_SYNC_TIME.isoformat(),
         )
-        with mock.patch("builtins.open", mock_open(read_data=previous_session_state)) as mock_file:
-            with self.sync_context as sync_context:
-                self.assertIsNone(sync_context.get_resource_latest_sync_hash(resource_id))
-                sync_context.update_resource_sync_state(resource_id, resource_hash)
-                self.assertEqual(sync_context.get_resource_latest_sync_hash(resource_id), resource_hash)
-                self.assertEqual(sync_context.get_latest_infra_sync_time(), MOCK_INFRA_SYNC_TIME)
+        self.legacy_file_path.write_text(previous_session_state)
+
+        with self.sync_context as sync_context:
+            self.assertIsNone(sync_context.get_resource_latest_sync_hash(resource_id))
+            sync_context.update_resource_sync_state(resource_id, resource_hash)
+            self.assertEqual(sync_context.get_resource_latest_sync_hash(resource_id), resource_hash)
+            self.assertEqual(sync_context.get_latest_infra_sync_time(), MOCK_INFRA_SYNC_TIME)
+
+        self.assertEqual(self._read_sync_state_file()[RESOURCE_SYNC_STATES][resource_id][HASH], resource_hash)
 
     @parameterized.expand(
         [(True, "MockResourceId", "mock-hash"), (False, "Parent/Child/MockResourceId", "nested-mock-hash")]
@@ -265,22 +284,97 @@ class TestSyncContext(TestCase):
         dependency_layer = {dependency_layer}
         """
         previous_session_state = template.format(dependency_layer=str(previous_dependency_layer_value).lower())
-        with mock.patch("builtins.open", mock_open(read_data=previous_session_state)) as mock_file:
-            with self.sync_context as sync_context:
-                self.assertIsNone(sync_context.get_resource_latest_sync_hash(resource_id))
-                sync_context.update_resource_sync_state(resource_id, resource_hash)
-                self.assertEqual(sync_context.get_resource_latest_sync_hash(resource_id), resource_hash)
+        self.legacy_file_path.write_text(previous_session_state)
+
+        with self.sync_context as sync_context:
+            self.assertIsNone(sync_context.get_resource_latest_sync_hash(resource_id))
+            sync_context.update_resource_sync_state(resource_id, resource_hash)
+            self.assertEqual(sync_context.get_resource_latest_sync_hash(resource_id), resource_hash)
+
+            self.assertIsNone(sync_context.get_latest_infra_sync_time())
+            sync_context.update_infra_sync_time()
+            self.assertEqual(sync_context.get_latest_infra_sync_time(), MOCK_INFRA_SYNC_TIME)
+
+    def test_sync_context_infra_sync_fingerprint_methods(self):
+        previous_session_state = """
+        [sync_state]
+        dependency_layer = {dependency_layer}
+        infra_sync_fingerprint = "previous-fingerprint"
+        """.format(
+            dependency_layer=str(self.dependency_layer).lower()
+        )
+        self.legacy_file_path.write_text(previous_session_state)
+
+        with self.sync_context as sync_context:
+            self.assertEqual(sync_context.get_infra_sync_fingerprint(), "previous-fingerprint")
+            sync_context.update_infra_sync_fingerprint("fingerprint")
+            self.assertEqual(sync_context.get_infra_sync_fingerprint(), "fingerprint")
+
+            # a code sync changes the deployed code, fingerprint is not valid anymore
+            sync_context.update_resource_sync_state("MockResourceId", "mock-hash")
+            self.assertIsNone(sync_context.get_infra_sync_fingerprint())
+
+        self.assertNotIn(INFRA_SYNC_FINGERPRINT, self._read_sync_state_file()[SYNC_STATE])
+
+    def test_sync_context_resource_sync_fingerprint_methods(self):
+        previous_session_state = """
+        [sync_state]
+        dependency_layer = {dependency_layer}
+        infra_sync_fingerprint = "infra-fingerprint"
+
+        [resource_sync_states.MockResourceId]
+        hash = "mock-hash"
+        sync_time = "{sync_time}"
+        fingerprint = "previous-fingerprint"
+        """.format(
+            dependency_layer=str(self.dependency_layer).lower(), sync_time=MOCK_RESOURCE_SYNC_TIME.isoformat()
+        )
+        self.legacy_file_path.write_text(previous_session_state)
+
+        with self.sync_context as sync_context:
+            self.assertEqual(
+                sync_context.get_resource_latest_sync_fingerprint("MockResourceId"), "previous-fingerprint"
+            )
+            self.assertIsNone(sync_context.get_resource_latest_sync_fingerprint("OtherResourceId"))
+
+            # the stored hash is still the deployed one, fingerprint of the last infra sync stays valid
+            sync_context.update_resource_sync_fingerprint("MockResourceId", "fingerprint")
+            self.assertEqual(sync_context.get_resource_latest_sync_fingerprint("MockResourceId"), "fingerprint")
+            self.assertEqual(sync_context.get_resource_latest_sync_hash("MockResourceId"), "mock-hash")
+            self.assertEqual(sync_context.get_infra_sync_fingerprint(), "infra-fingerprint")
+
+            sync_context.update_resource_sync_state("MockResourceId", "new-hash", "new-fingerprint")
+            self.assertEqual(sync_context.get_resource_latest_sync_fingerprint("MockResourceId"), "new-fingerprint")
+
+            # fingerprint is only stored next to a hash
+            sync_context.update_resource_sync_fingerprint("OtherResourceId", "fingerprint")
+            self.assertIsNone(sync_context.get_resource_latest_sync_fingerprint("OtherResourceId"))
+
+        self.assertEqual(
+            self._read_sync_state_file()[RESOURCE_SYNC_STATES]["MockResourceId"][FINGERPRINT], "new-fingerprint"
+        )
+
+    def test_sync_context_appends_updated_resource_sync_states_only(self):
+        with self.sync_context as sync_context:
+            for index in range(10):
+                sync_context.update_resource_sync_state(f"Resource{index}", "hash")
+        line_count = len(self.file_path.read_text().splitlines())
+
+        sync_context = SyncContext(self.dependency_layer, self.build_dir, self.cache_dir, self.skip_deploy_sync)
+        with sync_context:
+            sync_context.update_resource_sync_state("Resource0", "new-hash")
 
-                self.assertIsNone(sync_context.get_latest_infra_sync_time())
-                sync_context.update_infra_sync_time()
-                self.assertEqual(sync_context.get_latest_infra_sync_time(), MOCK_INFRA_SYNC_TIME)
+        lines = self.file_path.read_text().splitlines()
+        # the infra sync fingerprint was already cleared, only the updated resource is written
+        self.assertEqual(len(lines), line_count + 1)
+        self.assertIn("Resource0", lines[-1])
+        self.assertEqual(self._read_sync_state_file()[RESOURCE_SYNC_STATES]["Resource0"][HASH], "new-hash")
 
     @patch("samcli.commands.sync.sync_context.rmtree_if_exists")
     def test_sync_context_has_no_previous_state_if_file_doesnt_exist(self, patched_rmtree_if_exists):
-        with mock.patch("builtins.open", mock_open()) as mock_file:
-            mock_file.side_effect = [OSError("File does not exist"), MagicMock()]
-            with self.sync_context:
-                pass
-            self.assertIsNone(self.sync_context._previous_state)
-            self.assertIsNotNone(self.sync_context._current_state)
-            patched_rmtree_if_exists.assert_not_called()
+        with self.sync_context:
+            pass
+        self.assertIsNone(self.sync_context._previous_state)
+        self.assertIsNotNone(self.sync_context._current_state)
+        self.assertTrue(self.file_path.exists())
+        patched_rmtree_if_exists.assert_not_called()
@@ -0,0 +1,116 @@
+import os
+import shutil
+import tempfile
+from pathlib import Path
+from unittest import TestCase
+from unittest.mock import patch
+
+from samcli.commands.local.cli_common.user_exceptions import SamTemplateNotFoundException
+from samcli.commands.validate.lib.exceptions import InvalidLintConfigException
+from samcli.commands.validate.lib.template_linter import LintResult, TemplateLinter, expand_template_paths
+
+VALID_TEMPLATE = """
+AWSTemplateFormatVersion: "2010-09-09"
+Resources:
+  Topic:
+    Type: AWS::SNS::Topic
+"""
+
+INVALID_TEMPLATE = """
+AWSTemplateFormatVersion: "2010-09-09"
+Resources:
+  Topic:
+    Type: AWS::SNS::Topic
+    Properties:
+      UnknownProperty: value
+"""
+
+
+class TestExpandTemplatePaths(TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+        for path in ["stacks/a/template.yaml", "stacks/b/template.yaml", "stacks/b/nested/template.yaml"]:
+            os.makedirs(os.path.join(self.temp_dir, os.path.dirname(path)), exist_ok=True)
+            Path(self.temp_dir, path).write_text(VALID_TEMPLATE)
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def test_must_expand_glob_patterns(self):
+        a_path = os.path.join(self.temp_dir, "stacks", "a", "template.yaml")
+
+        template_paths = expand_template_paths(
+            [a_path, os.path.join(self.temp_dir, "stacks", "**", "template.yaml"), "other.yaml"]
+        )
+
+        self.assertEqual(
+            template_paths,
+            [
+                a_path,
+                os.path.join(self.temp_dir, "stacks", "b", "nested", "template.yaml"),
+                os.path.join(self.temp_dir, "stacks", "b", "template.yaml"),
+                "other.yaml",
+            ],
+        )
+
+    def test_must_raise_when_pattern_matches_nothing(self):
+        with self.assertRaises(SamTemplateNotFoundException):
+            expand_template_paths([os.path.join(self.temp_dir, "*.json")])
+
+
+class TestTemplateLinter(TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+        self.cache_dir = Path(self.temp_dir, "cache")
+        self.valid_path = os.path.join(self.temp_dir, "valid.yaml")
+        self.invalid_path = os.path.join(self.temp_dir, "invalid.yaml")
+        Path(self.valid_path).write_text(VALID_TEMPLATE)
+        Path(self.invalid_path).write_text(INVALID_TEMPLATE)
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def test_must_lint_templates_in_worker_processes(self):
+        linter = TemplateLinter(regions=["us-east-1"], max_workers=2, cache_dir=self.cache_dir)
+
+        results = linter.lint([self.valid_path, self.invalid_path])
+
+        self.assertEqual([result.template_path for result in results], [self.valid_path, self.invalid_path])
+        self.assertEqual(results[0], LintResult(self.valid_path, []))
+        self.assertEqual(len(results[1].matches), 1)
+        self.assertIn("UnknownProperty", results[1].matches[0])
+        self.assertFalse(results[1].cached)
+
+    def test_must_skip_unchanged_templates(self):
+        linter = TemplateLinter(max_workers=1, cache_dir=self.cache_dir)
+        first_results = linter.lint([self.valid_path, self.invalid_path])
+        Path(self.valid_path).write_text(VALID_TEMPLATE + "Outputs: {}\n")
+
+        with patch("samcli.commands.validate.lib.template_linter._lint_template") as lint_template_mock:
+            lint_template_mock.return_value = (["changed"], None)
+            second_results = linter.lint([self.valid_path, self.invalid_path])
+
+        lint_template_mock.assert_called_once_with(self.valid_path, VALID_TEMPLATE + "Outputs: {}\n")
+        self.assertEqual(second_results[0], LintResult(self.valid_path, ["changed"]))
+        self.assertEqual(second_results[1], LintResult(self.invalid_path, first_results[1].matches, cached=True))
+
+    def test_must_lint_again_when_config_changes(self):
+        TemplateLinter(max_workers=1, cache_dir=self.cache_dir).lint([self.valid_path])
+
+        results = TemplateLinter(regions=["us-west-2"], max_workers=1, cache_dir=self.cache_dir).lint([self.valid_path])
+
+        self.assertFalse(results[0].cached)
+
+    def test_must_raise_for_unsupported_region(self):
+        linter = TemplateLinter(regions=["moon-1"], max_workers=1, cache_dir=self.cache_dir)
+
+        with self.assertRaises(InvalidLintConfigException):
+            linter.lint([self.valid_path])
+
+        self.assertFalse(self.cache_dir.exists())
+
+    def test_must_raise_when_template_is_missing(self):
+        linter = TemplateLinter(cache_dir=self.cache_dir)
+
+        with self.assertRaises(SamTemplateNotFoundException):
+            linter.lint([os.path.join(self.temp_dir, "missing.yaml")])
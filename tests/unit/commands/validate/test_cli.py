@@ -6,7 +6,8 @@ from botocore.exceptions import NoCredentialsError
 
 from samcli.commands.exceptions import UserException, LinterRuleMatchedException
 from samcli.commands.local.cli_common.user_exceptions import SamTemplateNotFoundException, InvalidSamTemplateException
-from samcli.commands.validate.lib.exceptions import InvalidSamDocumentException
+from samcli.commands.validate.lib.exceptions import InvalidLintConfigException, InvalidSamDocumentException
+from samcli.commands.validate.lib.template_linter import LintResult
 from samcli.commands.validate.validate import do_cli, _read_sam_file, _lint, SamTemplate
 
 ctx_mock = namedtuple("ctx_mock", ["profile", "region"])
@@ -124,3 +125,52 @@ class TestValidateCli(TestCase):
         self.assertEqual(
             ex.exception.message, "Linting failed. At least one linting rule was matched to the provided template."
         )
+
+    @patch("samcli.commands.validate.validate._read_sam_file")
+    def test_templates_require_lint(self, read_sam_file_patch):
+        with self.assertRaises(UserException):
+            do_cli(ctx=ctx_lint_mock(debug=False, region="region"), template="template", lint=False, templates=("a",))
+
+        read_sam_file_patch.assert_not_called()
+
+    @patch("samcli.commands.validate.lib.template_linter.expand_template_paths")
+    @patch("samcli.commands.validate.lib.template_linter.TemplateLinter")
+    @patch("samcli.commands.validate.validate.click")
+    def test_lint_templates_passes(self, click_patch, linter_patch, expand_patch):
+        expand_patch.return_value = ["a.yaml", "b.yaml"]
+        linter_patch.return_value.lint.return_value = [LintResult("a.yaml", []), LintResult("b.yaml", [], cached=True)]
+
+        do_cli(ctx=ctx_lint_mock(debug=True, region="region"), template="template", lint=True, templates=("*.yaml",))
+
+        expand_patch.assert_called_once_with(("*.yaml",))
+        linter_patch.assert_called_once_with(regions=["region"], debug=True)
+        linter_patch.return_value.lint.assert_called_once_with(["a.yaml", "b.yaml"])
+        click_patch.secho.assert_any_call("b.yaml is a valid SAM Template", fg="green")
+        click_patch.echo.assert_called_once_with(
+            "Linted 2 templates, 1 of them unchanged since their last lint, 0 failed."
+        )
+
+    @patch("samcli.commands.validate.lib.template_linter.expand_template_paths")
+    @patch("samcli.commands.validate.lib.template_linter.TemplateLinter")
+    @patch("samcli.commands.validate.validate.click")
+    def test_lint_templates_raises_exception_if_matches_found(self, click_patch, linter_patch, expand_patch):
+        expand_patch.return_value = ["a.yaml", "b.yaml"]
+        linter_patch.return_value.lint.return_value = [LintResult("a.yaml", []), LintResult("b.yaml", ["rule A"])]
+
+        with self.assertRaises(LinterRuleMatchedException):
+            do_cli(ctx=ctx_lint_mock(debug=False, region=None), template="template", lint=True, templates=("*.yaml",))
+
+        linter_patch.assert_called_once_with(regions=None, debug=False)
+        click_patch.secho.assert_any_call("rule A")
+
+    @patch("samcli.commands.validate.lib.template_linter.expand_template_paths")
+    @patch("samcli.commands.validate.lib.template_linter.TemplateLinter")
+    @patch("samcli.commands.validate.validate.click")
+    def test_lint_templates_raises_user_exception_for_invalid_region(self, click_patch, linter_patch, expand_patch):
+        expand_patch.return_value = ["a.yaml"]
+        linter_patch.return_value.lint.side_effect = InvalidLintConfigException("Regions ['moon'] are unsupported")
+
+        with self.assertRaises(UserException) as ex:
+            do_cli(ctx=ctx_lint_mock(debug=False, region="moon"), template="template", lint=True, templates=("a.yaml",))
+
+        self.assertEqual(ex.exception.wrapped_from, "InvalidLintConfigException")
@@ -22,6 +22,10 @@ class TestNestedStackManager(TestCase):
         self.stack = Mock(
             wraps=Stack("", "", "", template_dict={}, parameters={}), stack_path="", location="foo/bar", resources={}
         )
+        self.stack.get_resource_ids.side_effect = lambda resource_types: [
+            name for name, resource in self.stack.resources.items() if resource.get("Type") in resource_types
+        ]
+        self.stack.get_resource.side_effect = lambda logical_id: self.stack.resources.get(logical_id)
 
     def test_nothing_to_add(self):
         template = {}
@@ -26,6 +26,7 @@ from samcli.lib.build.app_builder import (
     DockerBuildFailed,
     DockerConnectionError,
 )
+from samcli.lib.build.build_process_pool import InProcessBuildDefinition
 from samcli.commands.local.cli_common.user_exceptions import InvalidFunctionPropertyType
 from samcli.lib.telemetry.event import EventName, EventTracker
 from samcli.lib.utils.architecture import X86_64, ARM64
@@ -261,8 +262,8 @@ class TestApplicationBuilder_build(TestCase):
 
     @patch("samcli.lib.build.build_graph.BuildGraph._write")
     @patch("samcli.lib.build.build_graph.BuildGraph._read")
-    @patch("samcli.lib.build.build_strategy.osutils")
-    def test_should_run_build_for_only_unique_builds(self, persist_mock, read_mock, osutils_mock):
+    @patch("samcli.lib.build.build_strategy.materialize_tree")
+    def test_should_run_build_for_only_unique_builds(self, persist_mock, read_mock, materialize_mock):
         build_function_mock = Mock()
 
         # create 3 function resources where 2 of them would have same codeuri, runtime and metadata
@@ -422,10 +423,62 @@ class TestApplicationBuilder_build(TestCase):
         mock_parallel_build_strategy.build.assert_called_once()
         self.assertEqual(result, mock_parallel_build_strategy.build())
 
+    @parameterized.expand(
+        [
+            (True, None, 4, True),
+            (False, None, 4, False),
+            (True, Mock(), 4, False),
+            (True, None, 1, False),
+        ]
+    )
+    @patch("samcli.lib.build.app_builder.get_build_process_count")
+    @patch("samcli.lib.build.app_builder.BuildProcessPool")
+    @patch("samcli.lib.build.app_builder.ParallelBuildStrategy")
+    @patch("samcli.lib.build.app_builder.DefaultBuildStrategy")
+    def test_must_build_in_worker_processes_when_parallel(
+        self,
+        parallel,
+        container_manager,
+        process_count,
+        expect_pool,
+        default_build_strategy_class_mock,
+        parallel_build_strategy_class_mock,
+        build_process_pool_class_mock,
+        get_build_process_count_mock,
+    ):
+        get_build_process_count_mock.return_value = process_count
+        build_process_pool_mock = build_process_pool_class_mock.return_value.__enter__.return_value
+        builder = ApplicationBuilder(
+            self.builder._resources_to_build,
+            "builddir",
+            "basedir",
+            "cachedir",
+            parallel=parallel,
+            container_manager=container_manager,
+            stream_writer=StreamWriter(sys.stderr),
+        )
+        builder._get_build_graph = Mock()
+        pools_during_build = []
+        build_strategy_mock = (
+            parallel_build_strategy_class_mock if parallel else default_build_strategy_class_mock
+        ).return_value
+        build_strategy_mock.build.side_effect = lambda: pools_during_build.append(builder._build_process_pool)
+
+        builder.build()
+
+        if expect_pool:
+            # bounded by the 5 resources to build
+            build_process_pool_class_mock.assert_called_once_with(4)
+            self.assertEqual(pools_during_build, [build_process_pool_mock])
+        else:
+            build_process_pool_class_mock.assert_not_called()
+            self.assertEqual(pools_during_build, [None])
+        self.assertIsNone(builder._build_process_pool)
+
     @patch("samcli.lib.build.build_graph.BuildGraph._write")
     @patch("samcli.lib.build.build_graph.BuildGraph._read")
-    @patch("samcli.lib.build.build_strategy.osutils")
-    def test_must_raise_for_functions_with_multi_architecture(self, persist_mock, read_mock, osutils_mock):
+    @patch("samcli.lib.build.build_strategy.materialize_tree")
+    def test_must_raise_for_functions_with_multi_architecture(self, persist_mock, read_mock, materialize_mock):
         build_function_mock = Mock()
 
         function = Function(
@@ -2853,6 +2906,54 @@ class TestApplicationBuilder_build_function_in_process(TestCase):
             ]
         )
 
+    @patch("samcli.lib.build.app_builder.LambdaBuilder")
+    @patch("samcli.lib.build.app_builder.get_enabled_experimental_flags")
+    def test_must_build_in_worker_process_when_pool_is_used(self, experimental_flags_mock, lambda_builder_mock):
+        experimental_flags_mock.return_value = ["A"]
+        config_mock = Mock()
+        build_process_pool_mock = self.builder._build_process_pool = Mock()
+        build_process_pool_mock.build.return_value = "artifacts_dir"
+
+        result = self.builder._build_function_in_process(
+            config_mock,
+            "source_dir",
+            "artifacts_dir",
+            "scratch_dir",
+            "manifest_path",
+            "runtime",
+            X86_64,
+            None,
+            None,
+            True,
+            True,
+        )
+
+        self.assertEqual(result, "artifacts_dir")
+        lambda_builder_mock.assert_not_called()
+        build_process_pool_mock.build.assert_called_once_with(
+            InProcessBuildDefinition(
+                language=config_mock.language,
+                dependency_manager=config_mock.dependency_manager,
+                application_framework=config_mock.application_framework,
+                source_dir="source_dir",
+                artifacts_dir="artifacts_dir",
+                scratch_dir="scratch_dir",
+                manifest_path="manifest_path",
+                runtime="runtime",
+                unpatched_runtime="runtime",
+                executable_search_paths=config_mock.executable_search_paths,
+                mode="mode",
+                options=None,
+                architecture=X86_64,
+                dependencies_dir=None,
+                download_dependencies=True,
+                combine_dependencies=True,
+                is_building_layer=False,
+                experimental_flags=["A"],
+                build_in_source=False,
+            )
+        )
+
 
 class TestApplicationBuilder_build_function_on_container(TestCase):
     def setUp(self):
@@ -2925,6 +3026,7 @@ class TestApplicationBuilder_build_function_on_container(TestCase):
             build_in_source=False,
             mount_with_write=False,
             build_dir="/build/dir",
+            container_dirs=None,
         )
 
         self.container_manager.run.assert_called_with(container_mock)
@@ -2932,6 +3034,40 @@ class TestApplicationBuilder_build_function_on_container(TestCase):
         container_mock.copy.assert_called_with(response["result"]["artifacts_dir"] + "/.", "artifacts_dir")
         self.container_manager.stop.assert_called_with(container_mock)
 
+    @patch("samcli.lib.build.app_builder.LambdaBuildContainer")
+    @patch("samcli.lib.build.app_builder.osutils")
+    def test_must_build_in_pooled_container(self, osutils_mock, LambdaBuildContainerMock):
+        config = Mock()
+        stdout_data = "container stdout response data"
+        response = {"result": {"artifacts_dir": "/some/dir"}}
+        container_dirs = {"base_dir": "/tmp/samcli/builds/id"}
+
+        build_container_pool = self.builder._build_container_pool = MagicMock()
+        build_container_pool.get_container_dirs.return_value = container_dirs
+        pooled_container = build_container_pool.acquire.return_value.__enter__.return_value
+
+        def mock_exec_build(build_container, stdout, stderr):
+            stdout.write(stdout_data.encode("utf-8"))
+
+        pooled_container.exec_build.side_effect = mock_exec_build
+        build_container_mock = LambdaBuildContainerMock.return_value
+        self.builder._parse_builder_response.return_value = response
+
+        result = self.builder._build_function_on_container(
+            config, "source_dir", "artifacts_dir", "manifest_path", "runtime", X86_64, None
+        )
+
+        self.assertEqual(result, "artifacts_dir")
+        build_container_pool.get_container_dirs.assert_called_once_with("source_dir", "manifest_path")
+        self.assertEqual(LambdaBuildContainerMock.call_args.kwargs["container_dirs"], container_dirs)
+        build_container_pool.acquire.assert_called_once_with(build_container_mock.image)
+        pooled_container.exec_build.assert_called_once_with(build_container_mock, ANY, osutils_mock.stderr())
+        self.builder._parse_builder_response.assert_called_once_with(stdout_data, build_container_mock.image)
+        pooled_container.copy.assert_called_once_with("/some/dir/.", "artifacts_dir")
+        pooled_container.clean.assert_called_once_with(container_dirs)
+        self.container_manager.run.assert_not_called()
+        self.container_manager.stop.assert_not_called()
+
     @patch("samcli.lib.build.app_builder.LambdaBuildContainer")
     def test_must_raise_on_unsupported_container(self, LambdaBuildContainerMock):
         config = Mock()
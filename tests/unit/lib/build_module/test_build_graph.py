@@ -5,15 +5,13 @@ from unittest.mock import patch, Mock
 from uuid import uuid4
 from pathlib import Path
 
-import tomlkit
 from samcli.lib.utils.architecture import X86_64, ARM64
 from parameterized import parameterized
-from typing import Dict, cast
 
 from samcli.lib.build.build_graph import (
     FunctionBuildDefinition,
-    _function_build_definition_to_toml_table,
-    _layer_build_definition_to_toml_table,
+    _function_build_definition_to_record,
+    _layer_build_definition_to_record,
     CODE_URI_FIELD,
     RUNTIME_FIELD,
     PACKAGETYPE_FIELD,
@@ -26,17 +24,19 @@ from samcli.lib.build.build_graph import (
     COMPATIBLE_RUNTIMES_FIELD,
     LAYER_FIELD,
     ARCHITECTURE_FIELD,
-    _toml_table_to_function_build_definition,
-    _toml_table_to_layer_build_definition,
+    _record_to_function_build_definition,
+    _record_to_layer_build_definition,
     BuildGraph,
     InvalidBuildGraphException,
     LayerBuildDefinition,
     MANIFEST_HASH_FIELD,
     BuildHashingInformation,
     HANDLER_FIELD,
+    BUILD_GRAPH_FILE_KIND,
 )
 from samcli.lib.providers.provider import Function, LayerVersion, FunctionBuildInfo
 from samcli.lib.utils import osutils
+from samcli.lib.utils.journal_store import JournalStore
 from samcli.lib.utils.packagetype import ZIP
 
 
@@ -107,7 +107,7 @@ def generate_layer(
 
 
 class TestConversionFunctions(TestCase):
-    def test_function_build_definition_to_toml_table(self):
+    def test_function_build_definition_to_record(self):
         build_definition = FunctionBuildDefinition(
             "runtime",
             "codeuri",
@@ -121,18 +121,18 @@ class TestConversionFunctions(TestCase):
         )
         build_definition.add_function(generate_function())
 
-        toml_table = _function_build_definition_to_toml_table(build_definition)
-        self.assertEqual(toml_table[CODE_URI_FIELD], build_definition.codeuri)
-        self.assertEqual(toml_table[PACKAGETYPE_FIELD], build_definition.packagetype)
-        self.assertEqual(toml_table[RUNTIME_FIELD], build_definition.runtime)
-        self.assertEqual(toml_table[METADATA_FIELD], build_definition.metadata)
-        self.assertEqual(toml_table[FUNCTIONS_FIELD], [f.name for f in build_definition.functions])
-        self.assertEqual(toml_table[SOURCE_HASH_FIELD], build_definition.source_hash)
-        self.assertEqual(toml_table[MANIFEST_HASH_FIELD], build_definition.manifest_hash)
-        self.assertEqual(toml_table[ENV_VARS_FIELD], build_definition.env_vars)
-        self.assertEqual(toml_table[ARCHITECTURE_FIELD], build_definition.architecture)
-
-    def test_layer_build_definition_to_toml_table(self):
+        record = _function_build_definition_to_record(build_definition)
+        self.assertEqual(record[CODE_URI_FIELD], build_definition.codeuri)
+        self.assertEqual(record[PACKAGETYPE_FIELD], build_definition.packagetype)
+        self.assertEqual(record[RUNTIME_FIELD], build_definition.runtime)
+        self.assertEqual(record[METADATA_FIELD], build_definition.metadata)
+        self.assertEqual(record[FUNCTIONS_FIELD], [f.name for f in build_definition.functions])
+        self.assertEqual(record[SOURCE_HASH_FIELD], build_definition.source_hash)
+        self.assertEqual(record[MANIFEST_HASH_FIELD], build_definition.manifest_hash)
+        self.assertEqual(record[ENV_VARS_FIELD], build_definition.env_vars)
+        self.assertEqual(record[ARCHITECTURE_FIELD], build_definition.architecture)
+
+    def test_layer_build_definition_to_record(self):
         build_definition = LayerBuildDefinition(
             "name",
             "codeuri",
@@ -145,114 +145,114 @@ class TestConversionFunctions(TestCase):
         )
         build_definition.layer = generate_function()
 
-        toml_table = _layer_build_definition_to_toml_table(build_definition)
-
-        self.assertEqual(toml_table[LAYER_NAME_FIELD], build_definition.full_path)
-        self.assertEqual(toml_table[CODE_URI_FIELD], build_definition.codeuri)
-        self.assertEqual(toml_table[BUILD_METHOD_FIELD], build_definition.build_method)
-        self.assertEqual(toml_table[COMPATIBLE_RUNTIMES_FIELD], build_definition.compatible_runtimes)
-        self.assertEqual(toml_table[LAYER_FIELD], build_definition.layer.name)
-        self.assertEqual(toml_table[SOURCE_HASH_FIELD], build_definition.source_hash)
-        self.assertEqual(toml_table[MANIFEST_HASH_FIELD], build_definition.manifest_hash)
-        self.assertEqual(toml_table[ENV_VARS_FIELD], build_definition.env_vars)
-        self.assertEqual(toml_table[ARCHITECTURE_FIELD], build_definition.architecture)
-
-    def test_toml_table_to_function_build_definition(self):
-        toml_table = tomlkit.table()
-        toml_table[CODE_URI_FIELD] = "codeuri"
-        toml_table[RUNTIME_FIELD] = "runtime"
-        toml_table[PACKAGETYPE_FIELD] = ZIP
-        toml_table[METADATA_FIELD] = {"key": "value"}
-        toml_table[FUNCTIONS_FIELD] = ["function1"]
-        toml_table[SOURCE_HASH_FIELD] = "source_hash"
-        toml_table[MANIFEST_HASH_FIELD] = "manifest_hash"
-        toml_table[ENV_VARS_FIELD] = {"env_vars": "value"}
-        toml_table[ARCHITECTURE_FIELD] = X86_64
+        record = _layer_build_definition_to_record(build_definition)
+
+        self.assertEqual(record[LAYER_NAME_FIELD], build_definition.full_path)
+        self.assertEqual(record[CODE_URI_FIELD], build_definition.codeuri)
+        self.assertEqual(record[BUILD_METHOD_FIELD], build_definition.build_method)
+        self.assertEqual(record[COMPATIBLE_RUNTIMES_FIELD], build_definition.compatible_runtimes)
+        self.assertEqual(record[LAYER_FIELD], build_definition.layer.name)
+        self.assertEqual(record[SOURCE_HASH_FIELD], build_definition.source_hash)
+        self.assertEqual(record[MANIFEST_HASH_FIELD], build_definition.manifest_hash)
+        self.assertEqual(record[ENV_VARS_FIELD], build_definition.env_vars)
+        self.assertEqual(record[ARCHITECTURE_FIELD], build_definition.architecture)
+
+    def test_record_to_function_build_definition(self):
+        record = {}
+        record[CODE_URI_FIELD] = "codeuri"
+        record[RUNTIME_FIELD] = "runtime"
+        record[PACKAGETYPE_FIELD] = ZIP
+        record[METADATA_FIELD] = {"key": "value"}
+        record[FUNCTIONS_FIELD] = ["function1"]
+        record[SOURCE_HASH_FIELD] = "source_hash"
+        record[MANIFEST_HASH_FIELD] = "manifest_hash"
+        record[ENV_VARS_FIELD] = {"env_vars": "value"}
+        record[ARCHITECTURE_FIELD] = X86_64
         uuid = str(uuid4())
 
-        build_definition = _toml_table_to_function_build_definition(uuid, toml_table)
+        build_definition = _record_to_function_build_definition(uuid, record)
 
-        self.assertEqual(build_definition.codeuri, toml_table[CODE_URI_FIELD])
-        self.assertEqual(build_definition.packagetype, toml_table[PACKAGETYPE_FIELD])
-        self.assertEqual(build_definition.runtime, toml_table[RUNTIME_FIELD])
-        self.assertEqual(build_definition.metadata, toml_table[METADATA_FIELD])
+        self.assertEqual(build_definition.codeuri, record[CODE_URI_FIELD])
+        self.assertEqual(build_definition.packagetype, record[PACKAGETYPE_FIELD])
+        self.assertEqual(build_definition.runtime, record[RUNTIME_FIELD])
+        self.assertEqual(build_definition.metadata, record[METADATA_FIELD])
         self.assertEqual(build_definition.uuid, uuid)
         self.assertEqual(build_definition.functions, [])
-        self.assertEqual(build_definition.source_hash, toml_table[SOURCE_HASH_FIELD])
-        self.assertEqual(build_definition.manifest_hash, toml_table[MANIFEST_HASH_FIELD])
-        self.assertEqual(build_definition.env_vars, toml_table[ENV_VARS_FIELD])
-        self.assertEqual(build_definition.architecture, toml_table[ARCHITECTURE_FIELD])
-
-    def test_toml_table_to_layer_build_definition(self):
-        toml_table = tomlkit.table()
-        toml_table[LAYER_NAME_FIELD] = "name"
-        toml_table[CODE_URI_FIELD] = "codeuri"
-        toml_table[BUILD_METHOD_FIELD] = "method"
-        toml_table[COMPATIBLE_RUNTIMES_FIELD] = "runtime"
-        toml_table[COMPATIBLE_RUNTIMES_FIELD] = "layer1"
-        toml_table[SOURCE_HASH_FIELD] = "source_hash"
-        toml_table[MANIFEST_HASH_FIELD] = "manifest_hash"
-        toml_table[ENV_VARS_FIELD] = {"env_vars": "value"}
-        toml_table[ARCHITECTURE_FIELD] = ARM64
+        self.assertEqual(build_definition.source_hash, record[SOURCE_HASH_FIELD])
+        self.assertEqual(build_definition.manifest_hash, record[MANIFEST_HASH_FIELD])
+        self.assertEqual(build_definition.env_vars, record[ENV_VARS_FIELD])
+        self.assertEqual(build_definition.architecture, record[ARCHITECTURE_FIELD])
+
+    def test_record_to_layer_build_definition(self):
+        record = {}
+        record[LAYER_NAME_FIELD] = "name"
+        record[CODE_URI_FIELD] = "codeuri"
+        record[BUILD_METHOD_FIELD] = "method"
+        record[COMPATIBLE_RUNTIMES_FIELD] = "runtime"
+        record[COMPATIBLE_RUNTIMES_FIELD] = "layer1"
+        record[SOURCE_HASH_FIELD] = "source_hash"
+        record[MANIFEST_HASH_FIELD] = "manifest_hash"
+        record[ENV_VARS_FIELD] = {"env_vars": "value"}
+        record[ARCHITECTURE_FIELD] = ARM64
         uuid = str(uuid4())
 
-        build_definition = _toml_table_to_layer_build_definition(uuid, toml_table)
+        build_definition = _record_to_layer_build_definition(uuid, record)
 
-        self.assertEqual(build_definition.full_path, toml_table[LAYER_NAME_FIELD])
-        self.assertEqual(build_definition.codeuri, toml_table[CODE_URI_FIELD])
-        self.assertEqual(build_definition.build_method, toml_table[BUILD_METHOD_FIELD])
+        self.assertEqual(build_definition.full_path, record[LAYER_NAME_FIELD])
+        self.assertEqual(build_definition.codeuri, record[CODE_URI_FIELD])
+        self.assertEqual(build_definition.build_method, record[BUILD_METHOD_FIELD])
         self.assertEqual(build_definition.uuid, uuid)
-        self.assertEqual(build_definition.compatible_runtimes, toml_table[COMPATIBLE_RUNTIMES_FIELD])
+        self.assertEqual(build_definition.compatible_runtimes, record[COMPATIBLE_RUNTIMES_FIELD])
         self.assertEqual(build_definition.layer, None)
-        self.assertEqual(build_definition.source_hash, toml_table[SOURCE_HASH_FIELD])
-        self.assertEqual(build_definition.manifest_hash, toml_table[MANIFEST_HASH_FIELD])
-        self.assertEqual(build_definition.env_vars, toml_table[ENV_VARS_FIELD])
-        self.assertEqual(build_definition.architecture, toml_table[ARCHITECTURE_FIELD])
+        self.assertEqual(build_definition.source_hash, record[SOURCE_HASH_FIELD])
+        self.assertEqual(build_definition.manifest_hash, record[MANIFEST_HASH_FIELD])
+        self.assertEqual(build_definition.env_vars, record[ENV_VARS_FIELD])
+        self.assertEqual(build_definition.architecture, record[ARCHITECTURE_FIELD])
 
-    def test_minimal_function_build_definition_to_toml_table(self):
+    def test_minimal_function_build_definition_to_record(self):
         build_definition = FunctionBuildDefinition("runtime", "codeuri", None, ZIP, X86_64, {"key": "value"}, "handler")
         build_definition.add_function(generate_function())
 
-        toml_table = _function_build_definition_to_toml_table(build_definition)
-        self.assertEqual(toml_table[CODE_URI_FIELD], build_definition.codeuri)
-        self.assertEqual(toml_table[PACKAGETYPE_FIELD], build_definition.packagetype)
-        self.assertEqual(toml_table[RUNTIME_FIELD], build_definition.runtime)
-        self.assertEqual(toml_table[METADATA_FIELD], build_definition.metadata)
-        self.assertEqual(toml_table[HANDLER_FIELD], build_definition.handler)
-        self.assertEqual(toml_table[FUNCTIONS_FIELD], [f.name for f in build_definition.functions])
+        record = _function_build_definition_to_record(build_definition)
+        self.assertEqual(record[CODE_URI_FIELD], build_definition.codeuri)
+        self.assertEqual(record[PACKAGETYPE_FIELD], build_definition.packagetype)
+        self.assertEqual(record[RUNTIME_FIELD], build_definition.runtime)
+        self.assertEqual(record[METADATA_FIELD], build_definition.metadata)
+        self.assertEqual(record[HANDLER_FIELD], build_definition.handler)
+        self.assertEqual(record[FUNCTIONS_FIELD], [f.name for f in build_definition.functions])
         if build_definition.source_hash:
-            self.assertEqual(toml_table[SOURCE_HASH_FIELD], build_definition.source_hash)
-        self.assertEqual(toml_table[MANIFEST_HASH_FIELD], build_definition.manifest_hash)
-        self.assertEqual(toml_table[ARCHITECTURE_FIELD], build_definition.architecture)
+            self.assertEqual(record[SOURCE_HASH_FIELD], build_definition.source_hash)
+        self.assertEqual(record[MANIFEST_HASH_FIELD], build_definition.manifest_hash)
+        self.assertEqual(record[ARCHITECTURE_FIELD], build_definition.architecture)
 
-    def test_minimal_layer_build_definition_to_toml_table(self):
+    def test_minimal_layer_build_definition_to_record(self):
         build_definition = LayerBuildDefinition("name", "codeuri", "method", "runtime", ARM64)
         build_definition.layer = generate_function()
 
-        toml_table = _layer_build_definition_to_toml_table(build_definition)
+        record = _layer_build_definition_to_record(build_definition)
 
-        self.assertEqual(toml_table[LAYER_NAME_FIELD], build_definition.full_path)
-        self.assertEqual(toml_table[CODE_URI_FIELD], build_definition.codeuri)
-        self.assertEqual(toml_table[BUILD_METHOD_FIELD], build_definition.build_method)
-        self.assertEqual(toml_table[COMPATIBLE_RUNTIMES_FIELD], build_definition.compatible_runtimes)
-        self.assertEqual(toml_table[LAYER_FIELD], build_definition.layer.name)
+        self.assertEqual(record[LAYER_NAME_FIELD], build_definition.full_path)
+        self.assertEqual(record[CODE_URI_FIELD], build_definition.codeuri)
+        self.assertEqual(record[BUILD_METHOD_FIELD], build_definition.build_method)
+        self.assertEqual(record[COMPATIBLE_RUNTIMES_FIELD], build_definition.compatible_runtimes)
+        self.assertEqual(record[LAYER_FIELD], build_definition.layer.name)
         if build_definition.source_hash:
-            self.assertEqual(toml_table[SOURCE_HASH_FIELD], build_definition.source_hash)
-        self.assertEqual(toml_table[MANIFEST_HASH_FIELD], build_definition.manifest_hash)
-        self.assertEqual(toml_table[ARCHITECTURE_FIELD], build_definition.architecture)
-
-    def test_minimal_toml_table_to_function_build_definition(self):
-        toml_table = tomlkit.table()
-        toml_table[CODE_URI_FIELD] = "codeuri"
-        toml_table[RUNTIME_FIELD] = "runtime"
-        toml_table[FUNCTIONS_FIELD] = ["function1"]
+            self.assertEqual(record[SOURCE_HASH_FIELD], build_definition.source_hash)
+        self.assertEqual(record[MANIFEST_HASH_FIELD], build_definition.manifest_hash)
+        self.assertEqual(record[ARCHITECTURE_FIELD], build_definition.architecture)
+
+    def test_minimal_record_to_function_build_definition(self):
+        record = {}
+        record[CODE_URI_FIELD] = "codeuri"
+        record[RUNTIME_FIELD] = "runtime"
+        record[FUNCTIONS_FIELD] = ["function1"]
         uuid = str(uuid4())
 
-        build_definition = _toml_table_to_function_build_definition(uuid, toml_table)
+        build_definition = _record_to_function_build_definition(uuid, record)
 
-        self.assertEqual(build_definition.codeuri, toml_table[CODE_URI_FIELD])
+        self.assertEqual(build_definition.codeuri, record[CODE_URI_FIELD])
         self.assertEqual(build_definition.packagetype, ZIP)
-        self.assertEqual(build_definition.runtime, toml_table[RUNTIME_FIELD])
+        self.assertEqual(build_definition.runtime, record[RUNTIME_FIELD])
         self.assertEqual(build_definition.metadata, {})
         self.assertEqual(build_definition.uuid, uuid)
         self.assertEqual(build_definition.functions, [])
@@ -261,21 +261,21 @@ class TestConversionFunctions(TestCase):
         self.assertEqual(build_definition.env_vars, {})
         self.assertEqual(build_definition.architecture, X86_64)
 
-    def test_minimal_toml_table_to_layer_build_definition(self):
-        toml_table = tomlkit.table()
-        toml_table[LAYER_NAME_FIELD] = "name"
-        toml_table[CODE_URI_FIELD] = "codeuri"
-        toml_table[BUILD_METHOD_FIELD] = "method"
-        toml_table[COMPATIBLE_RUNTIMES_FIELD] = "runtime"
+    def test_minimal_record_to_layer_build_definition(self):
+        record = {}
+        record[LAYER_NAME_FIELD] = "name"
+        record[CODE_URI_FIELD] = "codeuri"
+        record[BUILD_METHOD_FIELD] = "method"
+        record[COMPATIBLE_RUNTIMES_FIELD] = "runtime"
         uuid = str(uuid4())
 
-        build_definition = _toml_table_to_layer_build_definition(uuid, toml_table)
+        build_definition = _record_to_layer_build_definition(uuid, record)
 
-        self.assertEqual(build_definition.full_path, toml_table[LAYER_NAME_FIELD])
-        self.assertEqual(build_definition.codeuri, toml_table[CODE_URI_FIELD])
-        self.assertEqual(build_definition.build_method, toml_table[BUILD_METHOD_FIELD])
+        self.assertEqual(build_definition.full_path, record[LAYER_NAME_FIELD])
+        self.assertEqual(build_definition.codeuri, record[CODE_URI_FIELD])
+        self.assertEqual(build_definition.build_method, record[BUILD_METHOD_FIELD])
         self.assertEqual(build_definition.uuid, uuid)
-        self.assertEqual(build_definition.compatible_runtimes, toml_table[COMPATIBLE_RUNTIMES_FIELD])
+        self.assertEqual(build_definition.compatible_runtimes, record[COMPATIBLE_RUNTIMES_FIELD])
         self.assertEqual(build_definition.layer, None)
         self.assertEqual(build_definition.source_hash, "")
         self.assertEqual(build_definition.manifest_hash, "")
@@ -331,6 +331,14 @@ class TestBuildGraph(TestCase):
     env_vars = "{ENV_VARS['env_vars']}"
     """
 
+    @staticmethod
+    def _read_legacy_build_graph(build_dir):
+        Path(build_dir.parent, "build.toml").write_text(TestBuildGraph.BUILD_GRAPH_CONTENTS)
+        build_graph = BuildGraph(str(build_dir))
+        for layer_build_definition in build_graph.get_layer_build_definitions():
+            layer_build_definition.layer = generate_layer()
+        return build_graph
+
     def test_should_instantiate_first_time(self):
         with osutils.mkdir_temp() as temp_base_dir:
             build_dir = Path(temp_base_dir, ".aws-sam", "build")
@@ -657,8 +665,8 @@ class TestBuildGraph(TestCase):
                 {TestBuildGraph.LAYER_UUID: BuildHashingInformation("new_value", "new_manifest_value")},
             )
 
-            txt = build_graph_path.read_text()
-            document = cast(Dict, tomlkit.loads(txt))
+            self.assertFalse(build_graph_path.exists())
+            document = JournalStore(Path(build_dir.parent, "build.json"), BUILD_GRAPH_FILE_KIND).load()
 
             self.assertEqual(
                 document["function_build_definitions"][TestBuildGraph.UUID][SOURCE_HASH_FIELD], "new_value"
@@ -674,6 +682,61 @@ class TestBuildGraph(TestCase):
                 "new_manifest_value",
             )
 
+    def test_write_source_hash_should_append_updated_definitions_only(self):
+        with osutils.mkdir_temp() as temp_base_dir:
+            build_dir = Path(temp_base_dir, ".aws-sam", "build")
+            build_dir.mkdir(parents=True)
+            build_graph = TestBuildGraph._read_legacy_build_graph(build_dir)
+            build_graph._atomic_write()
+            build_graph_path = Path(build_dir.parent, "build.json")
+            line_count = len(build_graph_path.read_text().splitlines())
+
+            build_graph._write_source_hash(
+                {TestBuildGraph.UUID: BuildHashingInformation("new_value", "new_manifest_value")}, {}
+            )
+
+            lines = build_graph_path.read_text().splitlines()
+            self.assertEqual(len(lines), line_count + 1)
+            self.assertIn(TestBuildGraph.UUID, lines[-1])
+            function_build_definition = BuildGraph(str(build_dir)).get_function_build_definitions()[0]
+            self.assertEqual(function_build_definition.source_hash, "new_value")
+            self.assertEqual(function_build_definition.manifest_hash, "new_manifest_value")
+
+    def test_should_migrate_legacy_build_graph(self):
+        with osutils.mkdir_temp() as temp_base_dir:
+            build_dir = Path(temp_base_dir, ".aws-sam", "build")
+            build_dir.mkdir(parents=True)
+
+            build_graph1 = TestBuildGraph._read_legacy_build_graph(build_dir)
+            build_graph1._atomic_write()
+
+            self.assertFalse(Path(build_dir.parent, "build.toml").exists())
+            self.assertTrue(Path(build_dir.parent, "build.json").exists())
+            build_graph2 = BuildGraph(str(build_dir))
+            self.assertEqual(
+                build_graph1.get_function_build_definitions(), build_graph2.get_function_build_definitions()
+            )
+            self.assertEqual(build_graph1.get_layer_build_definitions(), build_graph2.get_layer_build_definitions())
+            function_build_definition = build_graph2.get_function_build_definitions()[0]
+            self.assertEqual(function_build_definition.uuid, TestBuildGraph.UUID)
+            self.assertEqual(function_build_definition.metadata, TestBuildGraph.METADATA)
+            self.assertEqual(function_build_definition.env_vars, TestBuildGraph.ENV_VARS)
+
+    def test_should_not_rewrite_unchanged_build_graph(self):
+        with osutils.mkdir_temp() as temp_base_dir:
+            build_dir = Path(temp_base_dir, ".aws-sam", "build")
+            build_dir.mkdir(parents=True)
+            TestBuildGraph._read_legacy_build_graph(build_dir)._atomic_write()
+            build_graph_path = Path(build_dir.parent, "build.json")
+            content = build_graph_path.read_text()
+
+            build_graph = BuildGraph(str(build_dir))
+            for layer_build_definition in build_graph.get_layer_build_definitions():
+                layer_build_definition.layer = generate_layer()
+            build_graph._atomic_write()
+
+            self.assertEqual(build_graph_path.read_text(), content)
+
     def test_empty_get_function_build_definition_with_logical_id(self):
         build_graph = BuildGraph("build_dir")
         self.assertIsNone(build_graph.get_function_build_definition_with_full_path("function_logical_id"))
@@ -691,6 +754,47 @@ class TestBuildGraph(TestCase):
         )
 
 
+class TestBuildGraphManyDefinitions(TestCase):
+    DEFINITION_COUNT = 50
+
+    def test_must_persist_many_build_definitions(self):
+        with osutils.mkdir_temp() as temp_base_dir:
+            build_dir = Path(temp_base_dir, ".aws-sam", "build")
+            build_dir.mkdir(parents=True)
+            build_graph = BuildGraph(str(build_dir))
+            for index in range(self.DEFINITION_COUNT):
+                build_definition = FunctionBuildDefinition(
+                    "python3.12",
+                    f"src/function{index}",
+                    None,
+                    ZIP,
+                    X86_64,
+                    {"BuildMethod": "python3.12", "BuildProperties": {"Index": index}},
+                    "app.handler",
+                    f"source_hash{index}",
+                    f"manifest_hash{index}",
+                    {f"ENV_VAR{env_index}": f"value{index}" for env_index in range(5)},
+                )
+                function = generate_function(
+                    function_id=f"Function{index}", name=f"Function{index}", codeuri=f"src/function{index}"
+                )
+                build_graph.put_function_build_definition(build_definition, function)
+            build_graph.clean_redundant_definitions_and_update(True)
+            build_graph_path = Path(build_dir.parent, "build.json")
+            line_count = len(build_graph_path.read_text().splitlines())
+
+            build_graph = BuildGraph(str(build_dir))
+            build_definitions = build_graph.get_function_build_definitions()
+            self.assertEqual(len(build_definitions), self.DEFINITION_COUNT)
+            build_definitions[0].source_hash = "updated_source_hash"
+            build_graph.update_definition_hash()
+
+            self.assertEqual(len(build_graph_path.read_text().splitlines()), line_count + 1)
+            self.assertEqual(
+                BuildGraph(str(build_dir)).get_function_build_definitions()[0].source_hash, "updated_source_hash"
+            )
+
+
 class TestBuildDefinition(TestCase):
     def test_single_function_should_return_function_and_handler_name(self):
         build_definition = FunctionBuildDefinition(
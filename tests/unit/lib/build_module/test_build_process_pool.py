@@ -0,0 +1,189 @@
+import logging
+import os
+import shutil
+import sys
+import tempfile
+from unittest import TestCase
+from unittest.mock import Mock, patch
+
+from aws_lambda_builders.exceptions import LambdaBuilderError
+from parameterized import parameterized
+
+from samcli.lib.build.build_process_pool import (
+    BUILD_PROCESSES_ENV_VAR,
+    BuildProcessPool,
+    InProcessBuildDefinition,
+    InProcessBuildResult,
+    _LogForwarder,
+    get_build_process_count,
+    run_in_process_build,
+)
+from samcli.lib.build.exceptions import BuildError
+from samcli.lib.utils.architecture import X86_64
+
+RUNTIME = f"python{sys.version_info.major}.{sys.version_info.minor}"
+
+
+def _make_definition(source_dir, artifacts_dir, scratch_dir, language="python"):
+    return InProcessBuildDefinition(
+        language=language,
+        dependency_manager="pip",
+        application_framework=None,
+        source_dir=source_dir,
+        artifacts_dir=artifacts_dir,
+        scratch_dir=scratch_dir,
+        manifest_path=os.path.join(source_dir, "requirements.txt"),
+        runtime=RUNTIME,
+        unpatched_runtime=RUNTIME,
+        executable_search_paths=None,
+        mode=None,
+        options=None,
+        architecture=X86_64,
+        dependencies_dir=None,
+        download_dependencies=True,
+        combine_dependencies=True,
+        is_building_layer=False,
+        experimental_flags=[],
+        build_in_source=None,
+    )
+
+
+class TestRunInProcessBuild(TestCase):
+    def setUp(self):
+        self.definition = _make_definition("source_dir", "artifacts_dir", "scratch_dir")
+
+    @patch("samcli.lib.build.build_process_pool.LambdaBuilder")
+    def test_must_build_with_lambda_builder(self, lambda_builder_mock):
+        result = run_in_process_build(self.definition)
+
+        self.assertEqual(result, InProcessBuildResult("artifacts_dir"))
+        lambda_builder_mock.assert_called_once_with(
+            language="python", dependency_manager="pip", application_framework=None
+        )
+        lambda_builder_mock.return_value.build.assert_called_once_with(
+            "source_dir",
+            "artifacts_dir",
+            "scratch_dir",
+            os.path.join("source_dir", "requirements.txt"),
+            runtime=RUNTIME,
+            unpatched_runtime=RUNTIME,
+            executable_search_paths=None,
+            mode=None,
+            options=None,
+            architecture=X86_64,
+            dependencies_dir=None,
+            download_dependencies=True,
+            combine_dependencies=True,
+            is_building_layer=False,
+            experimental_flags=[],
+            build_in_source=None,
+        )
+
+    @patch("samcli.lib.build.build_process_pool.LambdaBuilder")
+    def test_must_return_lambda_builder_errors(self, lambda_builder_mock):
+        error = LambdaBuilderError(message="failed")
+        lambda_builder_mock.return_value.build.side_effect = error
+
+        result = run_in_process_build(self.definition)
+
+        self.assertEqual(result, InProcessBuildResult("artifacts_dir", "LambdaBuilderError", str(error)))
+
+    @patch("samcli.lib.build.build_process_pool.LambdaBuilder")
+    def test_must_raise_other_errors(self, lambda_builder_mock):
+        error = OSError("failed")
+        lambda_builder_mock.return_value.build.side_effect = error
+
+        with self.assertRaises(OSError) as context:
+            run_in_process_build(self.definition)
+
+        self.assertIs(context.exception, error)
+
+
+class TestGetBuildProcessCount(TestCase):
+    @parameterized.expand([(None, 8), ("", 8), ("3", 3), ("0", 1), ("many", 8)])
+    @patch("samcli.lib.build.build_process_pool.os.cpu_count")
+    def test_must_read_count_from_environment(self, value, expected, cpu_count_mock):
+        cpu_count_mock.return_value = 8
+        environ = {BUILD_PROCESSES_ENV_VAR: value} if value is not None else {}
+
+        with patch.dict(os.environ, environ, clear=True):
+            self.assertEqual(get_build_process_count(), expected)
+
+
+class TestLogForwarder(TestCase):
+    def test_must_handle_enabled_records_with_logger_of_this_process(self):
+        logger = logging.getLogger("samcli.test_build_process_pool")
+        logger.setLevel(logging.INFO)
+        self.addCleanup(logger.setLevel, logging.NOTSET)
+        handler = Mock(level=logging.NOTSET)
+        logger.addHandler(handler)
+        self.addCleanup(logger.removeHandler, handler)
+        forwarder = _LogForwarder()
+
+        forwarder.emit(logging.LogRecord(logger.name, logging.DEBUG, "path", 1, "debug", None, None))
+        forwarder.emit(logging.LogRecord(logger.name, logging.INFO, "path", 1, "info", None, None))
+
+        self.assertEqual([call.args[0].getMessage() for call in handler.handle.call_args_list], ["info"])
+
+
+class TestBuildProcessPool(TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+        self.source_dir = os.path.join(self.temp_dir, "source")
+        os.mkdir(self.source_dir)
+        with open(os.path.join(self.source_dir, "app.py"), "w") as app_file:
+            app_file.write("def handler(event, context):\n    return event\n")
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def _make_definition(self, name, language="python"):
+        return _make_definition(
+            self.source_dir,
+            os.path.join(self.temp_dir, name, "artifacts"),
+            os.path.join(self.temp_dir, name, "scratch"),
+            language=language,
+        )
+
+    def test_must_build_in_worker_processes(self):
+        with self.assertLogs("aws_lambda_builders", level=logging.WARNING) as logs:
+            with BuildProcessPool(max_workers=2) as pool:
+                artifacts_dir = pool.build(self._make_definition("function1"))
+                with self.assertRaises(BuildError) as context:
+                    pool.build(self._make_definition("function2", language="unknown"))
+
+        self.assertTrue(os.path.isfile(os.path.join(artifacts_dir, "app.py")))
+        self.assertEqual(context.exception.wrapped_from, "WorkflowNotFoundError")
+        # records logged by the workers are handled by the loggers of the tests
+        self.assertTrue(any("requirements.txt file not found" in message for message in logs.output))
+
+    def test_must_raise_errors_other_than_lambda_builder_ones_unchanged(self):
+        # the scratch dir can't be created under a file
+        file_path = os.path.join(self.temp_dir, "file")
+        with open(file_path, "w") as file:
+            file.write("content")
+        definition = self._make_definition("function1")._replace(scratch_dir=os.path.join(file_path, "scratch"))
+
+        with BuildProcessPool(max_workers=1) as pool:
+            with self.assertRaises(OSError):
+                pool.build(definition)
+
+    def test_must_terminate_workers_when_cancelled(self):
+        pool = BuildProcessPool(max_workers=1)
+        pool.build(self._make_definition("function1"))
+        processes = list(pool._executor._processes.values())
+
+        pool.shutdown(cancel=True)
+
+        for process in processes:
+            process.join(timeout=10)
+            self.assertFalse(process.is_alive())
+        with self.assertRaises(RuntimeError):
+            pool.build(self._make_definition("function2"))
+
+    def test_must_not_start_workers_without_builds(self):
+        pool = BuildProcessPool(max_workers=2)
+
+        pool.shutdown()
+
+        self.assertIsNone(pool._executor)
@@ -9,6 +9,7 @@ from parameterized import parameterized
 from samcli.lib.utils.architecture import X86_64, ARM64
 from samcli.lib.build.exceptions import MissingBuildMethodException
 from samcli.lib.build.build_graph import BuildGraph, FunctionBuildDefinition, LayerBuildDefinition
+from samcli.lib.build.dependency_store import DependencyStore
 from samcli.lib.build.build_strategy import (
     ParallelBuildStrategy,
     BuildStrategy,
@@ -188,7 +189,7 @@ class BuildStrategyTest(BuildStrategyBaseTest):
         patched_shutil.rmtree.assert_called_with(patched_deleted_path)
 
 
-@patch("samcli.lib.build.build_strategy.osutils.copytree")
+@patch("samcli.lib.build.build_strategy.materialize_tree")
 class DefaultBuildStrategyTest(BuildStrategyBaseTest):
     def test_layer_build_should_fail_when_no_build_method_is_provided(self, mock_copy_tree):
         given_layer = Mock()
@@ -372,11 +373,11 @@ class CachedBuildStrategyTest(BuildStrategyBaseTest):
     """
 
     @patch("samcli.lib.build.build_strategy.pathlib.Path")
-    @patch("samcli.lib.build.build_strategy.osutils.copytree")
-    @patch("samcli.lib.build.build_strategy.shutil.rmtree")
+    @patch("samcli.lib.build.build_strategy.materialize_tree")
+    @patch("samcli.lib.build.build_strategy.write_tree_snapshot")
     @patch("samcli.lib.build.build_strategy.DefaultBuildStrategy.build_single_function_definition")
     @patch("samcli.lib.build.build_strategy.DefaultBuildStrategy.build_single_layer_definition")
-    def test_build_call(self, mock_layer_build, mock_function_build, mock_rmtree, mock_copy_tree, mock_path):
+    def test_build_call(self, mock_layer_build, mock_function_build, mock_write_snapshot, mock_materialize, mock_path):
         given_build_function = Mock()
         given_build_layer = Mock()
         given_build_dir = "build_dir"
@@ -390,10 +391,12 @@ class CachedBuildStrategyTest(BuildStrategyBaseTest):
         mock_function_build.assert_called()
         mock_layer_build.assert_called()
 
-    @patch("samcli.lib.build.build_strategy.osutils.copytree")
+    @patch("samcli.lib.build.build_strategy.materialize_tree")
     @patch("samcli.lib.build.build_strategy.pathlib.Path.exists")
     @patch("samcli.lib.build.build_strategy.dir_checksum")
-    def test_if_cached_valid_when_build_single_function_definition(self, dir_checksum_mock, exists_mock, copytree_mock):
+    def test_if_cached_valid_when_build_single_function_definition(
+        self, dir_checksum_mock, exists_mock, materialize_mock
+    ):
         with osutils.mkdir_temp() as temp_base_dir:
             build_dir = Path(temp_base_dir, ".aws-sam", "build")
             build_dir.mkdir(parents=True)
@@ -427,20 +430,16 @@ class CachedBuildStrategyTest(BuildStrategyBaseTest):
             build_graph.put_layer_build_definition(layer_definition, layer)
             cached_build_strategy.build_single_function_definition(build_definition)
             cached_build_strategy.build_single_layer_definition(layer_definition)
-            self.assertEqual(copytree_mock.call_count, 3)
+            self.assertEqual(materialize_mock.call_count, 3)
 
-    @parameterized.expand([(True,), (False,)])
-    @patch("samcli.lib.build.build_strategy.osutils.copytree")
+    @patch("samcli.lib.build.build_strategy.materialize_tree")
     @patch("samcli.lib.build.build_strategy.pathlib.Path.exists")
     @patch("samcli.lib.build.build_strategy.dir_checksum")
-    @patch("samcli.lib.utils.osutils.os")
     @patch("samcli.lib.build.build_strategy.is_experimental_enabled")
     def test_if_cached_valid_when_build_single_function_definition_with_build_improvements_22(
-        self, should_raise_os_error, patch_is_experimental, patch_os, dir_checksum_mock, exists_mock, copytree_mock
+        self, patch_is_experimental, dir_checksum_mock, exists_mock, materialize_mock
     ):
         patch_is_experimental.return_value = True
-        if should_raise_os_error:
-            patch_os.symlink.side_effect = OSError()
         with osutils.mkdir_temp() as temp_base_dir:
             build_dir = Path(temp_base_dir, ".aws-sam", "build")
             build_dir.mkdir(parents=True)
@@ -474,45 +473,68 @@ class CachedBuildStrategyTest(BuildStrategyBaseTest):
             layer.full_path = "layer_full_path"
             layer.get_build_dir.return_value = "layer/build/dir"
             build_graph.put_layer_build_definition(layer_definition, layer)
-            cached_build_strategy.build_single_function_definition(build_definition)
+            function_build_results = cached_build_strategy.build_single_function_definition(build_definition)
             cached_build_strategy.build_single_layer_definition(layer_definition)
 
-            if should_raise_os_error:
-                copytree_mock.assert_has_calls(
-                    [
-                        call(
-                            str(cache_dir.joinpath(build_graph.get_function_build_definitions()[0].uuid)),
-                            build_graph.get_function_build_definitions()[0].functions[0].get_build_dir(build_dir),
-                        ),
-                        call(
-                            str(cache_dir.joinpath(build_graph.get_layer_build_definitions()[0].uuid)),
-                            build_graph.get_layer_build_definitions()[0].layer.get_build_dir(build_dir),
-                        ),
-                    ]
-                )
-            else:
-                copytree_mock.assert_not_called()
-                patch_os.symlink.assert_has_calls(
-                    [
-                        call(
-                            cache_dir.joinpath(build_graph.get_function_build_definitions()[0].uuid),
-                            Path(
-                                build_graph.get_function_build_definitions()[0].functions[0].get_build_dir(build_dir)
-                            ).absolute(),
-                        ),
-                        call(
-                            cache_dir.joinpath(build_graph.get_layer_build_definitions()[0].uuid),
-                            Path(
-                                build_graph.get_layer_build_definitions()[0].layer.get_build_dir(build_dir)
-                            ).absolute(),
-                        ),
-                    ]
-                )
-
-    @patch("samcli.lib.build.build_strategy.osutils.copytree")
+            # artifacts are materialized once per build definition, and shared by its functions
+            materialize_mock.assert_has_calls(
+                [
+                    call(str(cache_dir.joinpath(build_definition.uuid)), "func1/build/dir"),
+                    call(str(cache_dir.joinpath(layer_definition.uuid)), "layer/build/dir"),
+                ]
+            )
+            self.assertEqual(materialize_mock.call_count, 2)
+            self.assertEqual(
+                function_build_results, {"func1_full_path": "func1/build/dir", "func2_full_path": "func1/build/dir"}
+            )
+
+    @patch("samcli.lib.build.build_strategy.materialize_tree")
+    @patch("samcli.lib.build.build_strategy.is_tree_snapshot_valid")
+    @patch("samcli.lib.build.build_strategy.write_tree_snapshot")
+    @patch("samcli.lib.build.build_strategy.pathlib.Path.exists")
+    @patch("samcli.lib.build.build_strategy.dir_checksum")
+    @patch("samcli.lib.build.build_strategy.DefaultBuildStrategy.build_single_function_definition")
+    def test_if_cached_artifacts_modified_should_build(
+        self,
+        build_function_mock,
+        dir_checksum_mock,
+        exists_mock,
+        write_snapshot_mock,
+        is_snapshot_valid_mock,
+        materialize_mock,
+    ):
+        with osutils.mkdir_temp() as temp_base_dir:
+            build_dir = Path(temp_base_dir, ".aws-sam", "build")
+            build_dir.mkdir(parents=True)
+            cache_dir = Path(temp_base_dir, ".aws-sam", "cache")
+
+            exists_mock.return_value = True
+            dir_checksum_mock.return_value = CachedBuildStrategyTest.SOURCE_HASH
+            is_snapshot_valid_mock.return_value = False
+            build_function_mock.return_value = {"HelloWorldPython": "artifact1", "HelloWorld2Python": "artifact1"}
+
+            build_graph_path = Path(build_dir.parent, "build.toml")
+            build_graph_path.write_text(CachedBuildStrategyTest.BUILD_GRAPH_CONTENTS)
+            build_graph = BuildGraph(str(build_dir))
+            cached_build_strategy = CachedBuildStrategy(
+                build_graph, DefaultBuildStrategy, temp_base_dir, build_dir, cache_dir
+            )
+            build_definition = build_graph.get_function_build_definitions()[0]
+            cached_build_strategy.build_single_function_definition(build_definition)
+
+            cached_function_dir = str(cache_dir.joinpath(build_definition.uuid))
+            build_function_mock.assert_called_once_with(build_definition)
+            is_snapshot_valid_mock.assert_called_once_with(cached_function_dir)
+            materialize_mock.assert_called_once_with("artifact1", cached_function_dir)
+            write_snapshot_mock.assert_called_once_with(cached_function_dir)
+
+    @patch("samcli.lib.build.build_strategy.materialize_tree")
+    @patch("samcli.lib.build.build_strategy.write_tree_snapshot")
     @patch("samcli.lib.build.build_strategy.DefaultBuildStrategy.build_single_function_definition")
     @patch("samcli.lib.build.build_strategy.DefaultBuildStrategy.build_single_layer_definition")
-    def test_if_cached_invalid_with_no_cached_folder(self, build_layer_mock, build_function_mock, copytree_mock):
+    def test_if_cached_invalid_with_no_cached_folder(
+        self, build_layer_mock, build_function_mock, write_snapshot_mock, materialize_mock
+    ):
         with osutils.mkdir_temp() as temp_base_dir:
             build_dir = Path(temp_base_dir, ".aws-sam", "build")
             build_dir.mkdir(parents=True)
@@ -532,7 +554,8 @@ class CachedBuildStrategyTest(BuildStrategyBaseTest):
             cached_build_strategy.build_single_layer_definition(build_graph.get_layer_build_definitions()[0])
             build_function_mock.assert_called_once()
             build_layer_mock.assert_called_once()
-            self.assertEqual(copytree_mock.call_count, 2)
+            self.assertEqual(materialize_mock.call_count, 2)
+            self.assertEqual(write_snapshot_mock.call_count, 2)
 
     def test_redundant_cached_should_be_clean(self):
         with osutils.mkdir_temp() as temp_base_dir:
@@ -719,6 +742,40 @@ class TestIncrementalBuildStrategy(TestCase):
             ANY, ANY, ANY, ANY, ANY, ANY, ANY, dependency_dir, download_dependencies, ANY
         )
 
+    @parameterized.expand([(True,), (False,)])
+    def test_must_use_dependency_store(self, patched_manifest_hash, patched_os, is_stored):
+        patched_os.path.exists.return_value = False
+        patched_os.path.isdir.return_value = True
+        patched_manifest_hash.return_value = Mock(hash="hash")
+        dependency_store = Mock()
+        dependency_store.materialize.return_value = is_stored
+        build_strategy = IncrementalBuildStrategy(
+            self.build_graph, self.delegate_build_strategy, Mock(), Mock(), dependency_store
+        )
+
+        given_function_build_def = Mock(
+            manifest_hash="hash",
+            functions=[Mock()],
+            dependencies_dir="dependencies_dir",
+            runtime="python3.12",
+            architecture="arm64",
+            env_vars={},
+        )
+        self.build_graph.get_function_build_definitions.return_value = [given_function_build_def]
+        self.build_graph.get_layer_build_definitions.return_value = []
+
+        build_strategy.build()
+
+        dependency_store_key = DependencyStore.get_key("hash", "python3.12", "arm64", {})
+        dependency_store.materialize.assert_called_once_with(dependency_store_key, "dependencies_dir")
+        self.build_function.assert_called_with(
+            ANY, ANY, ANY, ANY, ANY, ANY, ANY, ANY, ANY, ANY, "dependencies_dir", not is_stored
+        )
+        if is_stored:
+            dependency_store.put.assert_not_called()
+        else:
+            dependency_store.put.assert_called_once_with(dependency_store_key, "dependencies_dir")
+
 
 @patch("samcli.lib.build.build_graph.BuildGraph._write")
 @patch("samcli.lib.build.build_graph.BuildGraph._read")
@@ -0,0 +1,74 @@
+import os
+import shutil
+import tempfile
+from pathlib import Path
+from unittest import TestCase
+from unittest.mock import patch
+
+from samcli.lib.build.dependency_store import DependencyStore
+
+
+class TestDependencyStore(TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+        self.store_dir = Path(self.temp_dir, "store")
+        self.dependency_store = DependencyStore(self.store_dir, max_entries=2)
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def _create_dependencies_dir(self, name, content="content"):
+        dependencies_dir = os.path.join(self.temp_dir, name)
+        os.makedirs(os.path.join(dependencies_dir, "package"))
+        Path(dependencies_dir, "package", "__init__.py").write_text(content)
+        return dependencies_dir
+
+    def test_key_depends_on_manifest_runtime_architecture_and_env_vars(self):
+        key = DependencyStore.get_key("hash", "python3.12", "x86_64")
+
+        self.assertEqual(key, DependencyStore.get_key("hash", "python3.12", "x86_64", {}))
+        self.assertNotEqual(key, DependencyStore.get_key("other", "python3.12", "x86_64"))
+        self.assertNotEqual(key, DependencyStore.get_key("hash", "python3.11", "x86_64"))
+        self.assertNotEqual(key, DependencyStore.get_key("hash", "python3.12", "arm64"))
+        self.assertNotEqual(key, DependencyStore.get_key("hash", "python3.12", "x86_64", {"KEY": "value"}))
+
+    def test_must_not_materialize_missing_entry(self):
+        dependencies_dir = os.path.join(self.temp_dir, "deps")
+
+        self.assertFalse(self.dependency_store.materialize("key", dependencies_dir))
+        self.assertFalse(os.path.exists(dependencies_dir))
+
+    def test_must_materialize_stored_entry(self):
+        self.dependency_store.put("key", self._create_dependencies_dir("source"))
+        dependencies_dir = self._create_dependencies_dir("deps", "stale")
+
+        self.assertTrue(self.dependency_store.materialize("key", dependencies_dir))
+
+        self.assertEqual(Path(dependencies_dir, "package", "__init__.py").read_text(), "content")
+        self.assertEqual(sorted(os.listdir(self.temp_dir)), ["deps", "source", "store"])
+
+    def test_must_copy_if_linking_fails(self):
+        self.dependency_store.put("key", self._create_dependencies_dir("source"))
+        dependencies_dir = os.path.join(self.temp_dir, "deps")
+
+        with patch("samcli.lib.build.dependency_store.os.link", side_effect=OSError("cross-device link")):
+            self.assertTrue(self.dependency_store.materialize("key", dependencies_dir))
+
+        self.assertEqual(Path(dependencies_dir, "package", "__init__.py").read_text(), "content")
+
+    def test_must_keep_first_stored_entry(self):
+        self.dependency_store.put("key", self._create_dependencies_dir("first", "first"))
+        self.dependency_store.put("key", self._create_dependencies_dir("second", "second"))
+
+        self.assertEqual(Path(self.store_dir, "key", "package", "__init__.py").read_text(), "first")
+
+    def test_must_evict_least_recently_used_entries(self):
+        for index, key in enumerate(["key1", "key2"]):
+            self.dependency_store.put(key, self._create_dependencies_dir(f"source{index}"))
+            os.utime(self.store_dir / key, (index, index))
+        # using key1 makes key2 the least recently used one
+        self.dependency_store.materialize("key1", os.path.join(self.temp_dir, "deps"))
+
+        self.dependency_store.put("key3", self._create_dependencies_dir("source3"))
+
+        self.assertEqual(sorted(os.listdir(self.store_dir)), ["key1", "key3"])
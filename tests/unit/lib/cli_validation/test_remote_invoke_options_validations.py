@@ -72,7 +72,8 @@ class TestEventFileValidation(TestCase):
             event_and_event_file_options_validation(mock_func)()
 
         self.assertIn(
-            "Only one of '--event-file', '--event' and '--test-event-name' can be provided.", ex.exception.message
+            "Only one of '--event-file', '--event', '--test-event-name' and '--batch-event-file' can be provided.",
+            ex.exception.message,
         )
 
         mock_func.assert_not_called()
@@ -91,7 +92,8 @@ class TestEventFileValidation(TestCase):
             event_and_event_file_options_validation(mock_func)()
 
         self.assertIn(
-            "Only one of '--event-file', '--event' and '--test-event-name' can be provided.", ex.exception.message
+            "Only one of '--event-file', '--event', '--test-event-name' and '--batch-event-file' can be provided.",
+            ex.exception.message,
         )
 
         mock_func.assert_not_called()
@@ -110,11 +112,27 @@ class TestEventFileValidation(TestCase):
             event_and_event_file_options_validation(mock_func)()
 
         self.assertIn(
-            "Only one of '--event-file', '--event' and '--test-event-name' can be provided.", ex.exception.message
+            "Only one of '--event-file', '--event', '--test-event-name' and '--batch-event-file' can be provided.",
+            ex.exception.message,
         )
 
         mock_func.assert_not_called()
 
+    @patch("samcli.lib.cli_validation.remote_invoke_options_validations.click.get_current_context")
+    def test_event_and_batch_event_file_params(self, patched_click_context):
+        mock_func = Mock()
+        mocked_context = Mock()
+        patched_click_context.return_value = mocked_context
+
+        mocked_context.params.get.side_effect = lambda key: (
+            "event_content" if key in ("event", "batch_event_file") else None
+        )
+
+        with self.assertRaises(BadOptionUsage):
+            event_and_event_file_options_validation(mock_func)()
+
+        mock_func.assert_not_called()
+
 
 class TestRemoteInvokeAtleast1OptionProvidedValidation(TestCase):
     @patch("samcli.lib.cli_validation.remote_invoke_options_validations.click.get_current_context")
@@ -1103,6 +1103,87 @@ class TestResolveTemplate(TestCase):
         self.assertEqual(processed_template, expected_template)
 
 
+class TestResolveResourceProperties(TestCase):
+    def setUp(self):
+        self.template = {
+            "Parameters": {"Stage": {"Default": "prod"}},
+            "Resources": {
+                "Function": {
+                    "Type": "AWS::Serverless::Function",
+                    "Properties": {
+                        "Environment": {"Variables": {"STAGE": {"Ref": "Stage"}}},
+                        "Description": {"Fn::Sub": "${Stage} function"},
+                        "Tags": {"Invalid": {"Fn::ImportValue": "Export"}},
+                    },
+                }
+            },
+        }
+        symbol_resolver = IntrinsicsSymbolTable(template=self.template, logical_id_translator={})
+        self.resolver = IntrinsicResolver(template=self.template, symbol_resolver=symbol_resolver)
+
+    def test_must_resolve_only_given_properties(self):
+        self.assertEqual(
+            self.resolver.resolve_resource_properties("Function", ["Environment", "Missing"]),
+            {"Environment": {"Variables": {"STAGE": "prod"}}},
+        )
+
+    def test_must_resolve_all_properties(self):
+        self.assertEqual(
+            self.resolver.resolve_resource_properties("Function", ignore_errors=True),
+            {
+                "Environment": {"Variables": {"STAGE": "prod"}},
+                "Description": "prod function",
+                "Tags": {"Invalid": {"Fn::ImportValue": "Export"}},
+            },
+        )
+
+    def test_must_raise_for_invalid_property(self):
+        with self.assertRaises(InvalidIntrinsicException):
+            self.resolver.resolve_resource_properties("Function", ["Tags"])
+
+    def test_must_return_empty_dict_for_missing_resource(self):
+        self.assertEqual(self.resolver.resolve_resource_properties("Missing"), {})
+
+
+class TestIntrinsicResolverCaching(TestCase):
+    def setUp(self):
+        self.template = {
+            "Parameters": {"Stage": {"Default": "prod"}},
+            "Resources": {
+                "Function1": {"Type": "AWS::Serverless::Function", "Properties": {"Stage": {"Ref": "Stage"}}},
+                "Function2": {"Type": "AWS::Serverless::Function", "Properties": {"Stage": {"Ref": "Stage"}}},
+                "Function3": {"Type": "AWS::Serverless::Function", "Properties": {"Handler": "app.handler"}},
+            },
+        }
+        self.symbol_resolver = IntrinsicsSymbolTable(template=self.template, logical_id_translator={})
+        self.resolver = IntrinsicResolver(template=self.template, symbol_resolver=self.symbol_resolver)
+
+    def test_must_resolve_identical_intrinsics_once(self):
+        with patch.object(
+            self.symbol_resolver, "resolve_symbols", wraps=self.symbol_resolver.resolve_symbols
+        ) as resolve_symbols_mock:
+            processed_template = self.resolver.resolve_template()
+
+        resolve_symbols_mock.assert_called_once_with("Stage", IntrinsicResolver.REF)
+        self.assertEqual(processed_template["Resources"]["Function1"]["Properties"], {"Stage": "prod"})
+        self.assertEqual(processed_template["Resources"]["Function2"]["Properties"], {"Stage": "prod"})
+
+    def test_must_not_copy_properties_without_intrinsics(self):
+        properties = self.resolver._resources["Function3"]
+
+        processed_template = self.resolver.resolve_template()
+
+        self.assertIs(processed_template["Resources"]["Function3"], properties)
+
+    def test_must_not_share_mutable_results(self):
+        value = {"Fn::Split": [",", "a,b"]}
+
+        first_result = self.resolver.intrinsic_property_resolver(value, True)
+        first_result.append("c")
+
+        self.assertEqual(self.resolver.intrinsic_property_resolver(value, True), ["a", "b"])
+
+
 class TestIntrinsicResolverInitialization(TestCase):
     def test_conditional_key_function_map(self):
         resolver = IntrinsicResolver(None, None)
@@ -440,3 +440,139 @@ class TestECRUploader(TestCase):
             result = ECRUploader.parse_image_url(image_uri=config["url"])
 
             self.assertEqual(result, config["result"])
+
+    def test_upload_skips_push_if_image_exists_in_repository(self):
+        ecr_repo = "123456789012.dkr.ecr.us-east-1.amazonaws.com/mock-image-repo"
+        self.docker_client.images.get.return_value.id = "sha256:" + "a" * 64
+        self.ecr_client.describe_images.return_value = {"imageDetails": [{"imageTags": ["mock-tag"]}]}
+        ecr_uploader = ECRUploader(
+            docker_client=self.docker_client,
+            ecr_client=self.ecr_client,
+            ecr_repo=ecr_repo,
+            ecr_repo_multi=None,
+            tag=self.tag,
+        )
+        ecr_uploader.login = MagicMock()
+
+        image_uri = ecr_uploader.upload("myimage:v1", resource_name="HelloWorldFunction")
+
+        _, tag = image_uri.rsplit(":", 1)
+        self.ecr_client.describe_images.assert_called_once_with(
+            repositoryName="mock-image-repo", imageIds=[{"imageTag": tag}], registryId="123456789012"
+        )
+        self.docker_client.api.push.assert_not_called()
+
+    def test_upload_pushes_if_image_does_not_exist_in_repository(self):
+        ecr_repo = "123456789012.dkr.ecr.us-east-1.amazonaws.com/mock-image-repo"
+        self.docker_client.images.get.return_value.id = "sha256:" + "a" * 64
+        self.ecr_client.describe_images.side_effect = ClientError(
+            error_response={"Error": {"Code": "ImageNotFoundException"}}, operation_name="describe_images"
+        )
+        ecr_uploader = ECRUploader(
+            docker_client=self.docker_client,
+            ecr_client=self.ecr_client,
+            ecr_repo=ecr_repo,
+            ecr_repo_multi=None,
+            tag=self.tag,
+        )
+        ecr_uploader.login = MagicMock()
+
+        ecr_uploader.upload("myimage:v1", resource_name="HelloWorldFunction")
+
+        self.docker_client.api.push.assert_called_once()
+
+    def test_upload_pushes_same_image_only_once(self):
+        self.docker_client.images.get.return_value.id = "sha256:" + "a" * 64
+        ecr_uploader = ECRUploader(
+            docker_client=self.docker_client,
+            ecr_client=self.ecr_client,
+            ecr_repo=self.ecr_repo,
+            ecr_repo_multi=None,
+            tag=self.tag,
+            no_progressbar=True,
+        )
+        ecr_uploader.login = MagicMock()
+
+        first_uri = ecr_uploader.upload("myimage:v1", resource_name="HelloWorldFunction")
+        second_uri = ecr_uploader.upload("myimage:v1", resource_name="HelloWorldFunction")
+
+        self.assertEqual(first_uri, second_uri)
+        self.docker_client.api.push.assert_called_once()
+        ecr_uploader.login.assert_called_once()
+
+    def test_upload_pushes_again_if_previous_push_failed(self):
+        self.docker_client.images.get.return_value.id = "sha256:" + "a" * 64
+        self.docker_client.api.push.side_effect = [APIError(message="mock error"), iter([])]
+        ecr_uploader = ECRUploader(
+            docker_client=self.docker_client,
+            ecr_client=self.ecr_client,
+            ecr_repo=self.ecr_repo,
+            ecr_repo_multi=None,
+            tag=self.tag,
+            no_progressbar=True,
+        )
+        ecr_uploader.login = MagicMock()
+
+        with self.assertRaises(DockerPushFailedError):
+            ecr_uploader.upload("myimage:v1", resource_name="HelloWorldFunction")
+        ecr_uploader.upload("myimage:v1", resource_name="HelloWorldFunction")
+
+        self.assertEqual(self.docker_client.api.push.call_count, 2)
+
+    @patch("samcli.lib.package.ecr_uploader.Path.is_file")
+    def test_upload_loads_same_image_archive_only_once(self, mock_is_file):
+        mock_is_file.return_value = True
+        image = Mock(id="sha256:" + "a" * 64)
+        self.docker_client.images.load.return_value = [image]
+        ecr_uploader = ECRUploader(
+            docker_client=self.docker_client,
+            ecr_client=self.ecr_client,
+            ecr_repo=self.ecr_repo,
+            ecr_repo_multi=None,
+            tag=self.tag,
+            no_progressbar=True,
+        )
+        ecr_uploader.login = MagicMock()
+
+        with patch("samcli.lib.package.ecr_uploader.open", mock_open(read_data="data")):
+            ecr_uploader.upload("archive.tar.gz", resource_name="HelloWorldFunction")
+            ecr_uploader.upload("archive.tar.gz", resource_name="HelloWorldFunction")
+
+        self.docker_client.images.load.assert_called_once()
+
+    def test_parallel_pushes(self):
+        images = {"myimage:v1": Mock(id="sha256:" + "a" * 64), "myimage:v2": Mock(id="sha256:" + "b" * 64)}
+        self.docker_client.images.get.side_effect = lambda image: images[image]
+        ecr_uploader = ECRUploader(
+            docker_client=self.docker_client,
+            ecr_client=self.ecr_client,
+            ecr_repo=self.ecr_repo,
+            ecr_repo_multi=None,
+            tag=self.tag,
+        )
+        ecr_uploader.login = MagicMock()
+
+        with ecr_uploader.parallel_pushes():
+            first_uri = ecr_uploader.upload("myimage:v1", resource_name="FirstFunction")
+            second_uri = ecr_uploader.upload("myimage:v2", resource_name="SecondFunction")
+            ecr_uploader.upload("myimage:v1", resource_name="FirstFunction")
+
+        self.assertNotEqual(first_uri, second_uri)
+        self.assertEqual(self.docker_client.api.push.call_count, 2)
+        ecr_uploader.login.assert_called_once()
+
+    def test_parallel_pushes_failure(self):
+        self.docker_client.images.get.return_value.id = "sha256:" + "a" * 64
+        self.docker_client.api.push.side_effect = APIError(message="mock error")
+        ecr_uploader = ECRUploader(
+            docker_client=self.docker_client,
+            ecr_client=self.ecr_client,
+            ecr_repo=self.ecr_repo,
+            ecr_repo_multi=None,
+            tag=self.tag,
+        )
+        ecr_uploader.login = MagicMock()
+
+        with self.assertRaises(DockerPushFailedError):
+            with ecr_uploader.parallel_pushes():
+                ecr_uploader.upload("myimage:v1", resource_name="HelloWorldFunction")
@@ -26,7 +26,11 @@ from samcli.lib.remote_invoke.lambda_invoke_executors import (
     RemoteInvokeOutputFormat,
     _is_function_invoke_mode_response_stream,
 )
-from samcli.lib.remote_invoke.remote_invoke_executors import RemoteInvokeExecutionInfo, RemoteInvokeResponse
+from samcli.lib.remote_invoke.remote_invoke_executors import (
+    RemoteInvokeExecutionInfo,
+    RemoteInvokeLogOutput,
+    RemoteInvokeResponse,
+)
 
 
 class CommonTestsLambdaInvokeExecutor:
@@ -111,6 +115,57 @@ class TestLambdaInvokeExecutor(CommonTestsLambdaInvokeExecutor.AbstractLambdaInv
             FunctionName=self.function_name, Payload=given_payload, InvocationType="RequestResponse", LogType="Tail"
         )
 
+    def test_execute_action_text_output_streams_payload(self):
+        self.lambda_invoke_executor._remote_output_format = RemoteInvokeOutputFormat.TEXT
+        given_streaming_body = Mock()
+        # "é" is split across the chunks
+        given_streaming_body.iter_chunks.return_value = iter([b"caf\xc3", b"\xa9 ", b"au lait"])
+        self.lambda_client.invoke.return_value = {
+            PAYLOAD: given_streaming_body,
+            LOG_RESULT: base64.b64encode(b"log output"),
+        }
+
+        result = list(self.lambda_invoke_executor._execute_action("payload"))
+
+        self.assertEqual(
+            result,
+            [
+                RemoteInvokeLogOutput("log output"),
+                RemoteInvokeResponse("caf"),
+                RemoteInvokeResponse("é "),
+                RemoteInvokeResponse("au lait"),
+            ],
+        )
+
+    def test_execute_action_file_streams_file(self):
+        given_payload_file = Mock()
+        given_payload_file.seekable.return_value = True
+        self.lambda_client.invoke.return_value = Mock()
+
+        list(self.lambda_invoke_executor._execute_action_file(given_payload_file))
+
+        given_payload_file.read.assert_not_called()
+        self.lambda_client.invoke.assert_called_with(
+            FunctionName=self.function_name,
+            Payload=given_payload_file.buffer,
+            InvocationType="RequestResponse",
+            LogType="Tail",
+        )
+
+    def test_execute_action_file_reads_non_seekable_file(self):
+        given_payload_file = Mock()
+        given_payload_file.seekable.return_value = False
+        self.lambda_client.invoke.return_value = Mock()
+
+        list(self.lambda_invoke_executor._execute_action_file(given_payload_file))
+
+        self.lambda_client.invoke.assert_called_with(
+            FunctionName=self.function_name,
+            Payload=given_payload_file.read.return_value,
+            InvocationType="RequestResponse",
+            LogType="Tail",
+        )
+
     def _get_boto3_method(self):
         return self.lambda_client.invoke
 
@@ -135,6 +190,23 @@ class TestLambdaInvokeWithResponseStreamExecutor(CommonTestsLambdaInvokeExecutor
             FunctionName=self.function_name, Payload=given_payload, InvocationType="RequestResponse", LogType="Tail"
         )
 
+    def test_execute_action_text_output_decodes_split_characters(self):
+        self.lambda_invoke_executor._remote_output_format = RemoteInvokeOutputFormat.TEXT
+        self.lambda_client.invoke_with_response_stream.return_value = {
+            EVENT_STREAM: [
+                {PAYLOAD_CHUNK: {PAYLOAD: b"caf\xc3"}},
+                {PAYLOAD_CHUNK: {PAYLOAD: b"\xa9"}},
+                {INVOKE_COMPLETE: {LOG_RESULT: base64.b64encode(b"log output")}},
+            ]
+        }
+
+        result = list(self.lambda_invoke_executor._execute_action("payload"))
+
+        self.assertEqual(
+            result,
+            [RemoteInvokeResponse("caf"), RemoteInvokeResponse("é"), RemoteInvokeLogOutput("log output")],
+        )
+
     def _get_boto3_method(self):
         return self.lambda_client.invoke_with_response_stream
 
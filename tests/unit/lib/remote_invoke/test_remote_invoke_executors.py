@@ -1,6 +1,8 @@
 import json
+import threading
+import time
 from pathlib import Path
-from typing import List
+from typing import List, Union
 from unittest import TestCase
 from unittest.mock import Mock, patch
 
@@ -12,6 +14,7 @@ from samcli.lib.remote_invoke.remote_invoke_executors import (
     RemoteInvokeRequestResponseMapper,
     RemoteInvokeOutputFormat,
     RemoteInvokeResponse,
+    RemoteInvokeLogOutput,
 )
 
 
@@ -184,6 +187,87 @@ class TestRemoteInvokeExecutor(TestCase):
             response_mapper.map.assert_not_called()
 
 
+class EchoBotoActionExecutor(BotoActionExecutor):
+    """
+    Echoes the payload after a delay given by the payload, and fails for negative delays
+    """
+
+    def __init__(self):
+        self.request_parameters = {}
+        # shared by the copies of the executor
+        self.calls = {"concurrent": 0, "max_concurrent": 0}
+        self._lock = threading.Lock()
+
+    def _execute_action(self, payload: str):
+        with self._lock:
+            self.calls["concurrent"] += 1
+            self.calls["max_concurrent"] = max(self.calls["max_concurrent"], self.calls["concurrent"])
+        try:
+            delay = float(payload)
+            if delay < 0:
+                raise ValueError(f"invalid delay {payload}")
+            time.sleep(delay)
+            yield RemoteInvokeLogOutput(f"log {payload} {self.request_parameters['name']}")
+            yield RemoteInvokeResponse(payload)
+        finally:
+            with self._lock:
+                self.calls["concurrent"] -= 1
+
+    def validate_action_parameters(self, parameters: dict):
+        self.request_parameters.update(parameters)
+
+    def get_batch_parameters(self, parameters: dict, batch_index: int) -> dict:
+        return {**parameters, "name": f"{parameters['name']}_{batch_index}"}
+
+
+class TestRemoteInvokeExecutor_execute_batch(TestCase):
+    def setUp(self) -> None:
+        self.boto_action_executor = EchoBotoActionExecutor()
+        self.outputs: List[Union[str, dict]] = []
+        response_consumer = Mock()
+        response_consumer.consume.side_effect = lambda output: self.outputs.append(output.response)
+        log_consumer = Mock()
+        log_consumer.consume.side_effect = lambda output: self.outputs.append(output.log_output)
+        self.test_executor = RemoteInvokeExecutor([], [], self.boto_action_executor, response_consumer, log_consumer)
+
+    def _get_inputs(self, payloads):
+        for payload in payloads:
+            yield RemoteInvokeExecutionInfo(payload, None, {"name": "run"}, RemoteInvokeOutputFormat.TEXT)
+
+    def test_must_write_outputs_in_order_of_inputs(self):
+        self.test_executor.execute_batch(self._get_inputs(["0.05", "0", "0.02"]), max_concurrency=3)
+
+        self.assertEqual(
+            self.outputs,
+            ["log 0.05 run_0", "0.05", "\n", "log 0 run_1", "0", "\n", "log 0.02 run_2", "0.02", "\n"],
+        )
+        # the original executor is never used for the calls
+        self.assertEqual(self.boto_action_executor.request_parameters, {})
+
+    def test_must_limit_concurrency(self):
+        self.test_executor.execute_batch(self._get_inputs(["0.01"] * 10), max_concurrency=2)
+
+        self.assertEqual(self.boto_action_executor.calls["max_concurrent"], 2)
+        self.assertEqual(self.outputs.count("0.01"), 10)
+
+    def test_must_limit_rate(self):
+        start = time.monotonic()
+        self.test_executor.execute_batch(self._get_inputs(["0"] * 5), max_concurrency=5, max_rate=50)
+
+        # 5 calls at 50 per second, the last one starts 80ms after the first one
+        self.assertGreaterEqual(time.monotonic() - start, 0.08)
+
+    def test_must_complete_batch_and_raise_first_failure(self):
+        with self.assertRaises(ValueError) as ex:
+            self.test_executor.execute_batch(self._get_inputs(["-1", "0", "-2"]))
+
+        self.assertEqual(str(ex.exception), "invalid delay -1")
+        self.assertEqual(
+            self.outputs,
+            ["Event 1 failed: invalid delay -1\n", "log 0 run_1", "0", "\n", "Event 3 failed: invalid delay -2\n"],
+        )
+
+
 class TestResponseObjectToJsonStringMapper(TestCase):
     def test_mapper(self):
         output_format = RemoteInvokeOutputFormat.TEXT
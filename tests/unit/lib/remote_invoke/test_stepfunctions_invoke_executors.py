@@ -107,6 +107,20 @@ class TestStepFunctionsStartExecutionExecutor(TestCase):
         self.stepfunctions_invoke_executor.validate_action_parameters(parameters)
         self.assertEqual(self.stepfunctions_invoke_executor.request_parameters, expected_boto_parameters)
 
+    @parameterized.expand(
+        [
+            ({}, {"name": "sam_remote_invoke_20230710T072625_3"}),
+            (
+                {"name": "custom_execution_name", "traceHeader": "header"},
+                {"name": "custom_execution_name_3", "traceHeader": "header"},
+            ),
+        ]
+    )
+    @patch("samcli.lib.remote_invoke.stepfunctions_invoke_executors.datetime")
+    def test_get_batch_parameters(self, parameters, expected_parameters, patched_datetime):
+        patched_datetime.now.return_value = datetime(2023, 7, 10, 7, 26, 25)
+        self.assertEqual(self.stepfunctions_invoke_executor.get_batch_parameters(parameters, 3), expected_parameters)
+
     def test_execute_action_invalid_parameter_key_throws_parameter_validation_exception(self):
         given_input = "input"
         error = ParamValidationError(report="Invalid parameters")
@@ -22,14 +22,14 @@ class TestAliasVersionSyncFlow(TestCase):
         )
         return sync_flow
 
-    @patch("samcli.lib.sync.sync_flow.get_boto_client_provider_from_session_with_config")
-    @patch("samcli.lib.sync.sync_flow.Session")
+    @patch("samcli.lib.sync.sync_flow.get_boto_client_provider_with_config")
+    @patch("samcli.lib.utils.boto_utils.BOTO_CLIENT_CACHE")
     def test_set_up(self, session_mock, client_provider_mock):
         sync_flow = self.create_sync_flow()
         sync_flow.set_up()
         client_provider_mock.return_value.assert_any_call("lambda")
 
-    @patch("samcli.lib.sync.sync_flow.Session")
+    @patch("samcli.lib.utils.boto_utils.BOTO_CLIENT_CACHE")
     def test_sync_direct(self, session_mock):
         sync_flow = self.create_sync_flow()
 
@@ -63,7 +63,7 @@ class TestAliasVersionSyncFlow(TestCase):
         sync_flow = self.create_sync_flow()
         self.assertFalse(sync_flow.compare_remote())
 
-    @patch("samcli.lib.sync.sync_flow.Session")
+    @patch("samcli.lib.utils.boto_utils.BOTO_CLIENT_CACHE")
     def test_local_sha(self, session_mock):
         sync_flow = self.create_sync_flow()
 
@@ -63,7 +63,7 @@ class TestImageFunctionSyncFlow(TestCase):
         patched_boto_client.assert_not_called()
 
     @patch("samcli.lib.sync.flows.image_function_sync_flow.ApplicationBuilder")
-    @patch("samcli.lib.sync.sync_flow.Session")
+    @patch("samcli.lib.utils.boto_utils.BOTO_CLIENT_CACHE")
     def test_gather_resources(self, session_mock, builder_mock):
         get_mock = MagicMock()
         get_mock.return_value = "ImageName1"
@@ -88,7 +88,7 @@ class TestImageFunctionSyncFlow(TestCase):
 
     @patch("samcli.lib.sync.flows.image_function_sync_flow.wait_for_function_update_complete")
     @patch("samcli.lib.sync.flows.image_function_sync_flow.ECRUploader")
-    @patch("samcli.lib.sync.sync_flow.Session")
+    @patch("samcli.lib.utils.boto_utils.BOTO_CLIENT_CACHE")
     def test_sync_context_image_repo(self, session_mock, uploader_mock, wait_mock):
         sync_flow = self.create_function_sync_flow()
         sync_flow._image_name = "ImageName1"
@@ -118,7 +118,7 @@ class TestImageFunctionSyncFlow(TestCase):
 
     @patch("samcli.lib.sync.flows.image_function_sync_flow.wait_for_function_update_complete")
     @patch("samcli.lib.sync.flows.image_function_sync_flow.ECRUploader")
-    @patch("samcli.lib.sync.sync_flow.Session")
+    @patch("samcli.lib.utils.boto_utils.BOTO_CLIENT_CACHE")
     def test_sync_context_image_repos(self, session_mock, uploader_mock, wait_mock):
         sync_flow = self.create_function_sync_flow()
         sync_flow._image_name = "ImageName1"
@@ -149,7 +149,7 @@ class TestImageFunctionSyncFlow(TestCase):
 
     @patch("samcli.lib.sync.flows.image_function_sync_flow.wait_for_function_update_complete")
     @patch("samcli.lib.sync.flows.image_function_sync_flow.ECRUploader")
-    @patch("samcli.lib.sync.sync_flow.Session")
+    @patch("samcli.lib.utils.boto_utils.BOTO_CLIENT_CACHE")
     def test_sync_remote_image_repo(self, session_mock, uploader_mock, wait_mock):
         sync_flow = self.create_function_sync_flow()
         sync_flow._image_name = "ImageName1"
@@ -183,7 +183,7 @@ class TestImageFunctionSyncFlow(TestCase):
         sync_flow._get_lock_chain.return_value.__exit__.assert_called_once()
 
     @patch("samcli.lib.sync.flows.image_function_sync_flow.ECRUploader")
-    @patch("samcli.lib.sync.sync_flow.Session")
+    @patch("samcli.lib.utils.boto_utils.BOTO_CLIENT_CACHE")
     def test_sync_with_no_image(self, session_mock, uploader_mock):
         sync_flow = self.create_function_sync_flow()
         sync_flow._image_name = None
@@ -43,22 +43,22 @@ class TestLayerSyncFlow(TestCase):
             self.build_artifacts,
         )
 
-    @patch("samcli.lib.sync.sync_flow.get_boto_client_provider_from_session_with_config")
+    @patch("samcli.lib.sync.sync_flow.get_boto_client_provider_with_config")
     def test_setup(self, client_provider_mock):
-        with patch.object(self.layer_sync_flow, "_session") as patched_session:
+        with patch("samcli.lib.utils.boto_utils.BOTO_CLIENT_CACHE"):
             with patch.object(SyncFlow, "set_up") as patched_super_setup:
                 self.layer_sync_flow.set_up()
 
                 patched_super_setup.assert_called_once()
                 client_provider_mock.return_value.assert_called_with("lambda")
 
-    @patch("samcli.lib.sync.sync_flow.get_boto_client_provider_from_session_with_config")
+    @patch("samcli.lib.sync.sync_flow.get_boto_client_provider_with_config")
     @patch("samcli.lib.sync.flows.layer_sync_flow.get_resource_by_id")
     def test_setup_with_serverless_layer(self, get_resource_by_id_mock, client_provider_mock):
         given_layer_name_with_hashes = f"{self.layer_identifier}abcdefghij"
         self.layer_sync_flow._physical_id_mapping = {given_layer_name_with_hashes: "layer_version_arn"}
         get_resource_by_id_mock.return_value = False
-        with patch.object(self.layer_sync_flow, "_session") as patched_session:
+        with patch("samcli.lib.utils.boto_utils.BOTO_CLIENT_CACHE"):
             with patch.object(SyncFlow, "set_up") as patched_super_setup:
                 self.layer_sync_flow.set_up()
 
@@ -70,7 +70,7 @@ class TestLayerSyncFlow(TestCase):
     def test_setup_with_unknown_layer(self):
         given_layer_name_with_hashes = f"SomeOtherLayerabcdefghij"
         self.layer_sync_flow._physical_id_mapping = {given_layer_name_with_hashes: "layer_version_arn"}
-        with patch.object(self.layer_sync_flow, "_session") as _:
+        with patch("samcli.lib.utils.boto_utils.BOTO_CLIENT_CACHE"):
             with patch.object(SyncFlow, "set_up") as _:
                 with self.assertRaises(MissingPhysicalResourceError):
                     self.layer_sync_flow.set_up()
@@ -150,6 +150,24 @@ class TestLayerSyncFlow(TestCase):
         self.assertEqual(self.layer_sync_flow._zip_file, given_zip_location)
         self.assertEqual(self.layer_sync_flow._local_sha, given_file_checksum)
 
+    @patch("samcli.lib.sync.flows.layer_sync_flow.get_build_fingerprint")
+    def test_get_local_fingerprint(self, get_build_fingerprint_mock):
+        self.layer_sync_flow._layer = Mock(codeuri="layer/")
+        self.layer_sync_flow._get_resource = Mock(return_value={"Type": "AWS::Serverless::LayerVersion"})
+
+        fingerprint = self.layer_sync_flow._get_local_fingerprint()
+
+        if self.build_artifacts:
+            self.assertIsNone(fingerprint)
+            get_build_fingerprint_mock.assert_not_called()
+        else:
+            self.assertEqual(fingerprint, get_build_fingerprint_mock.return_value)
+            get_build_fingerprint_mock.assert_called_once_with(
+                self.build_context_mock,
+                self.layer_sync_flow._layer,
+                {"resource": {"Type": "AWS::Serverless::LayerVersion"}},
+            )
+
     @patch("samcli.lib.sync.flows.layer_sync_flow.get_latest_layer_version")
     def test_compare_remote(self, patched_get_latest_layer_version):
         given_lambda_client = Mock()
@@ -389,9 +407,9 @@ class TestFunctionLayerReferenceSync(TestCase):
             [],
         )
 
-    @patch("samcli.lib.sync.sync_flow.get_boto_client_provider_from_session_with_config")
+    @patch("samcli.lib.sync.sync_flow.get_boto_client_provider_with_config")
     def test_setup(self, client_provider_mock):
-        with patch.object(self.function_layer_sync, "_session") as patched_session:
+        with patch("samcli.lib.utils.boto_utils.BOTO_CLIENT_CACHE"):
             with patch.object(SyncFlow, "set_up") as patched_super_setup:
                 self.function_layer_sync.set_up()
 
@@ -24,8 +24,8 @@ class TestRestApiSyncFlow(TestCase):
         )
         return sync_flow
 
-    @patch("samcli.lib.sync.sync_flow.get_boto_client_provider_from_session_with_config")
-    @patch("samcli.lib.sync.sync_flow.Session")
+    @patch("samcli.lib.sync.sync_flow.get_boto_client_provider_with_config")
+    @patch("samcli.lib.utils.boto_utils.BOTO_CLIENT_CACHE")
     def test_set_up(self, session_mock, client_provider_mock):
         sync_flow = self.create_sync_flow()
         sync_flow.get_physical_id = MagicMock()
@@ -34,7 +34,7 @@ class TestRestApiSyncFlow(TestCase):
         client_provider_mock.return_value.assert_any_call("apigateway")
         self.assertEqual(sync_flow._api_physical_id, "PhysicalId")
 
-    @patch("samcli.lib.sync.sync_flow.Session")
+    @patch("samcli.lib.utils.boto_utils.BOTO_CLIENT_CACHE")
     @patch("samcli.lib.sync.flows.rest_api_sync_flow.RestApiSyncFlow._update_api")
     @patch("samcli.lib.sync.flows.rest_api_sync_flow.RestApiSyncFlow._create_deployment")
     @patch("samcli.lib.sync.flows.rest_api_sync_flow.RestApiSyncFlow._collect_stages")
@@ -66,7 +66,7 @@ class TestRestApiSyncFlow(TestCase):
         sync_flow._update_stages.assert_called_once_with({"beta", "prod", "Stage"}, "abc")
         sync_flow._delete_deployments.assert_called_once_with({"def"})
 
-    @patch("samcli.lib.sync.sync_flow.Session")
+    @patch("samcli.lib.utils.boto_utils.BOTO_CLIENT_CACHE")
     def test_update_api(self, session_mock):
         sync_flow = self.create_sync_flow()
 
@@ -87,7 +87,7 @@ class TestRestApiSyncFlow(TestCase):
             restApiId="PhysicalApi1", mode="overwrite", body='{"key": "value"}'.encode("utf-8")
         )
 
-    @patch("samcli.lib.sync.sync_flow.Session")
+    @patch("samcli.lib.utils.boto_utils.BOTO_CLIENT_CACHE")
     def test_create_deployment(self, session_mock):
         sync_flow = self.create_sync_flow()
 
@@ -111,7 +111,7 @@ class TestRestApiSyncFlow(TestCase):
 
     @patch("samcli.lib.sync.flows.rest_api_sync_flow.get_resource_by_id")
     @patch("samcli.lib.sync.flows.rest_api_sync_flow.get_resource_ids_by_type")
-    @patch("samcli.lib.sync.sync_flow.Session")
+    @patch("samcli.lib.utils.boto_utils.BOTO_CLIENT_CACHE")
     def test_collect_stages_sam_api(self, session_mock, get_id_mock, get_resource_mock):
         sync_flow = self.create_sync_flow()
 
@@ -143,7 +143,7 @@ class TestRestApiSyncFlow(TestCase):
 
     @patch("samcli.lib.sync.flows.rest_api_sync_flow.get_resource_by_id")
     @patch("samcli.lib.sync.flows.rest_api_sync_flow.get_resource_ids_by_type")
-    @patch("samcli.lib.sync.sync_flow.Session")
+    @patch("samcli.lib.utils.boto_utils.BOTO_CLIENT_CACHE")
     def test_collect_stages_apigateway_api(self, session_mock, get_id_mock, get_resource_mock):
         sync_flow = self.create_sync_flow()
 
@@ -168,7 +168,7 @@ class TestRestApiSyncFlow(TestCase):
         sync_flow._api_client.get_stages.assert_not_called()
         self.assertEqual(stages, {"beta"})
 
-    @patch("samcli.lib.sync.sync_flow.Session")
+    @patch("samcli.lib.utils.boto_utils.BOTO_CLIENT_CACHE")
     def test_update_stage(self, session_mock):
         sync_flow = self.create_sync_flow()
 
@@ -215,7 +215,7 @@ class TestRestApiSyncFlow(TestCase):
 
         self.assertEqual(prev_ids, {"abc"})
 
-    @patch("samcli.lib.sync.sync_flow.Session")
+    @patch("samcli.lib.utils.boto_utils.BOTO_CLIENT_CACHE")
     def test_delete_deployment(self, session_mock):
         sync_flow = self.create_sync_flow()
 
@@ -237,7 +237,7 @@ class TestRestApiSyncFlow(TestCase):
             [call(restApiId="PhysicalApi1", deploymentId="abc"), call(restApiId="PhysicalApi1", deploymentId="def")]
         )
 
-    @patch("samcli.lib.sync.sync_flow.Session")
+    @patch("samcli.lib.utils.boto_utils.BOTO_CLIENT_CACHE")
     def test_delete_deployment_failure(self, session_mock):
         sync_flow = self.create_sync_flow()
 
@@ -319,7 +319,7 @@ please check the console to see if you have other stages that needs to be update
             data = sync_flow._process_definition_file()
             self.assertEqual(data, '{"key": "value"}'.encode("utf-8"))
 
-    @patch("samcli.lib.sync.sync_flow.Session")
+    @patch("samcli.lib.utils.boto_utils.BOTO_CLIENT_CACHE")
     def test_gather_resources_generate_local_sha(self, session_mock):
         sync_flow = self.create_sync_flow()
 
@@ -340,7 +340,7 @@ please check the console to see if you have other stages that needs to be update
 
         self.assertEqual(sync_flow._local_sha, str_checksum('{"key": "value"}', hashlib.sha256()))
 
-    @patch("samcli.lib.sync.sync_flow.Session")
+    @patch("samcli.lib.utils.boto_utils.BOTO_CLIENT_CACHE")
     def test_failed_gather_resources(self, session_mock):
         sync_flow = self.create_sync_flow()
 
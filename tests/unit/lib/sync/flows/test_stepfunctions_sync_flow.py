@@ -29,14 +29,14 @@ class TestStepFunctionsSyncFlow(TestCase):
         )
         return sync_flow
 
-    @patch("samcli.lib.sync.sync_flow.get_boto_client_provider_from_session_with_config")
-    @patch("samcli.lib.sync.sync_flow.Session")
+    @patch("samcli.lib.sync.sync_flow.get_boto_client_provider_with_config")
+    @patch("samcli.lib.utils.boto_utils.BOTO_CLIENT_CACHE")
     def test_set_up(self, session_mock, client_provider_mock):
         sync_flow = self.create_sync_flow()
         sync_flow.set_up()
         client_provider_mock.return_value.assert_any_call("stepfunctions")
 
-    @patch("samcli.lib.sync.sync_flow.Session")
+    @patch("samcli.lib.utils.boto_utils.BOTO_CLIENT_CACHE")
     def test_sync_direct(self, session_mock):
         sync_flow = self.create_sync_flow()
 
@@ -110,7 +110,7 @@ class TestStepFunctionsSyncFlow(TestCase):
             data = sync_flow._process_definition_file()
             self.assertEqual(data, '{"key": "value"}')
 
-    @patch("samcli.lib.sync.sync_flow.Session")
+    @patch("samcli.lib.utils.boto_utils.BOTO_CLIENT_CACHE")
     def test_gather_resources_generate_local_sha(self, session_mock):
         sync_flow = self.create_sync_flow()
 
@@ -131,7 +131,7 @@ class TestStepFunctionsSyncFlow(TestCase):
 
         self.assertEqual(sync_flow._local_sha, str_checksum('{"key": "value"}', hashlib.sha256()))
 
-    @patch("samcli.lib.sync.sync_flow.Session")
+    @patch("samcli.lib.utils.boto_utils.BOTO_CLIENT_CACHE")
     def test_failed_gather_resources_definition_substitution(self, session_mock):
         self.get_resource_mock.return_value = {"Properties": {"DefinitionSubstitutions": {"a": "b"}}}
         sync_flow = self.create_sync_flow()
@@ -149,7 +149,7 @@ class TestStepFunctionsSyncFlow(TestCase):
             with self.assertRaises(InfraSyncRequiredError):
                 sync_flow.gather_resources()
 
-    @patch("samcli.lib.sync.sync_flow.Session")
+    @patch("samcli.lib.utils.boto_utils.BOTO_CLIENT_CACHE")
     def test_failed_gather_resources(self, session_mock):
         sync_flow = self.create_sync_flow()
 
@@ -36,8 +36,8 @@ class TestZipFunctionSyncFlow(TestCase):
         sync_flow._get_resource_api_calls = MagicMock()
         return sync_flow
 
-    @patch("samcli.lib.sync.sync_flow.get_boto_client_provider_from_session_with_config")
-    @patch("samcli.lib.sync.sync_flow.Session")
+    @patch("samcli.lib.sync.sync_flow.get_boto_client_provider_with_config")
+    @patch("samcli.lib.utils.boto_utils.BOTO_CLIENT_CACHE")
     def test_set_up(self, session_mock, client_provider_mock):
         sync_flow = self.create_function_sync_flow()
         sync_flow.set_up()
@@ -51,7 +51,7 @@ class TestZipFunctionSyncFlow(TestCase):
     @patch("samcli.lib.sync.flows.zip_function_sync_flow.tempfile.gettempdir")
     @patch("samcli.lib.sync.flows.zip_function_sync_flow.ApplicationBuilder")
     @patch("samcli.lib.sync.flows.zip_function_sync_flow.rmtree_if_exists")
-    @patch("samcli.lib.sync.sync_flow.Session")
+    @patch("samcli.lib.utils.boto_utils.BOTO_CLIENT_CACHE")
     def test_gather_resources(
         self,
         session_mock,
@@ -104,7 +104,7 @@ class TestZipFunctionSyncFlow(TestCase):
         self.assertEqual("sha256_value", sync_flow._local_sha)
 
     @patch("samcli.lib.sync.flows.zip_function_sync_flow.base64.b64decode")
-    @patch("samcli.lib.sync.sync_flow.Session")
+    @patch("samcli.lib.utils.boto_utils.BOTO_CLIENT_CACHE")
     def test_compare_remote_true(self, session_mock, b64decode_mock):
         b64decode_mock.return_value.hex.return_value = "sha256_value"
         sync_flow = self.create_function_sync_flow()
@@ -124,7 +124,7 @@ class TestZipFunctionSyncFlow(TestCase):
         self.assertTrue(result)
 
     @patch("samcli.lib.sync.flows.zip_function_sync_flow.base64.b64decode")
-    @patch("samcli.lib.sync.sync_flow.Session")
+    @patch("samcli.lib.utils.boto_utils.BOTO_CLIENT_CACHE")
     def test_compare_remote_false(self, session_mock, b64decode_mock):
         b64decode_mock.return_value.hex.return_value = "sha256_value_2"
         sync_flow = self.create_function_sync_flow()
@@ -149,7 +149,7 @@ class TestZipFunctionSyncFlow(TestCase):
     @patch("samcli.lib.sync.flows.zip_function_sync_flow.os.path.exists")
     @patch("samcli.lib.sync.flows.zip_function_sync_flow.S3Uploader")
     @patch("samcli.lib.sync.flows.zip_function_sync_flow.os.path.getsize")
-    @patch("samcli.lib.sync.sync_flow.Session")
+    @patch("samcli.lib.utils.boto_utils.BOTO_CLIENT_CACHE")
     def test_sync_direct(self, session_mock, getsize_mock, uploader_mock, exists_mock, remove_mock, wait_mock):
         getsize_mock.return_value = 49 * 1024 * 1024
         exists_mock.return_value = True
@@ -180,7 +180,7 @@ class TestZipFunctionSyncFlow(TestCase):
     @patch("samcli.lib.sync.flows.zip_function_sync_flow.os.path.exists")
     @patch("samcli.lib.sync.flows.zip_function_sync_flow.S3Uploader")
     @patch("samcli.lib.sync.flows.zip_function_sync_flow.os.path.getsize")
-    @patch("samcli.lib.sync.sync_flow.Session")
+    @patch("samcli.lib.utils.boto_utils.BOTO_CLIENT_CACHE")
     def test_sync_s3(self, session_mock, getsize_mock, uploader_mock, exists_mock, remove_mock, wait_mock):
         getsize_mock.return_value = 51 * 1024 * 1024
         exists_mock.return_value = True
@@ -243,6 +243,25 @@ class TestZipFunctionSyncFlow(TestCase):
         sync_flow = self.create_function_sync_flow()
         self.assertTrue(sync_flow._combine_dependencies())
 
+    @patch("samcli.lib.sync.flows.zip_function_sync_flow.get_build_fingerprint")
+    def test_get_local_fingerprint(self, get_build_fingerprint_mock):
+        sync_flow = self.create_function_sync_flow()
+        sync_flow._function = MagicMock(codeuri="CodeUri/")
+        sync_flow._get_resource = MagicMock(return_value={"Type": "AWS::Serverless::Function"})
+
+        fingerprint = sync_flow._get_local_fingerprint()
+
+        if self.build_artifacts:
+            self.assertIsNone(fingerprint)
+            get_build_fingerprint_mock.assert_not_called()
+        else:
+            self.assertEqual(fingerprint, get_build_fingerprint_mock.return_value)
+            get_build_fingerprint_mock.assert_called_once_with(
+                self.build_context_mock,
+                sync_flow._function,
+                {"resource": {"Type": "AWS::Serverless::Function"}, "combine_dependencies": True},
+            )
+
     @patch("time.sleep", return_value=None)
     def test_verify_function_status_recursion(self, patched_time):
         given_lambda_client = MagicMock()
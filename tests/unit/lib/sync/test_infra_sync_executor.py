@@ -1,3 +1,6 @@
+import json
+import os
+import tempfile
 from pathlib import Path
 from unittest import TestCase
 from unittest.mock import MagicMock, patch, call
@@ -6,6 +9,7 @@ from samcli.lib.sync.infra_sync_executor import datetime, InfraSyncExecutor
 from botocore.exceptions import ClientError
 from parameterized import parameterized
 from samcli.lib.telemetry.event import Event, EventTracker
+from samcli.lib.utils.hash import str_checksum
 
 
 class TestInfraSyncExecutor(TestCase):
@@ -83,6 +87,176 @@ class TestInfraSyncExecutor(TestCase):
         self.assertIn(Event("SyncFlowStart", "InfraSyncExecute"), EventTracker.get_tracked_events())
         self.assertIn(Event("SyncFlowEnd", "InfraSyncExecute"), EventTracker.get_tracked_events())
 
+    @patch("samcli.lib.sync.infra_sync_executor.InfraSyncExecutor._auto_skip_infra_sync")
+    @patch("samcli.lib.sync.infra_sync_executor.InfraSyncExecutor._get_local_fingerprint")
+    @patch("samcli.lib.sync.infra_sync_executor.Session")
+    @patch("samcli.lib.sync.infra_sync_executor.datetime")
+    def test_execute_infra_sync_skips_build_if_fingerprint_unchanged(
+        self, datetime_mock, session_mock, get_local_fingerprint_mock, auto_skip_infra_sync_mock
+    ):
+        datetime_mock.utcnow.return_value = datetime(2023, 2, 8, 12, 12, 12)
+        self.sync_context.skip_deploy_sync = True
+        self.sync_context.get_latest_infra_sync_time.return_value = datetime(2023, 2, 4, 12, 12, 12)
+        infra_sync_executor = InfraSyncExecutor(
+            self.build_context, self.package_context, self.deploy_context, self.sync_context
+        )
+        infra_sync_executor._cfn_client.describe_stacks.return_value = {
+            "Stacks": [{"StackStatus": "UPDATE_COMPLETE", "LastUpdatedTime": "2023-02-04T12:12:12"}]
+        }
+        get_local_fingerprint_mock.return_value = "local"
+        self.sync_context.get_infra_sync_fingerprint.return_value = infra_sync_executor._get_infra_sync_fingerprint(
+            "local"
+        )
+
+        infra_sync_result = infra_sync_executor.execute_infra_sync(True)
+
+        self.assertFalse(infra_sync_result.infra_sync_executed)
+        self.assertEqual(infra_sync_result.code_sync_resources, set())
+        self.build_context.set_up.assert_called_once()
+        self.build_context.run.assert_not_called()
+        self.package_context.run.assert_not_called()
+        self.deploy_context.run.assert_not_called()
+        auto_skip_infra_sync_mock.assert_not_called()
+
+    @parameterized.expand(
+        [
+            ("other", "UPDATE_COMPLETE", "2023-02-04T12:12:12"),
+            ("local", "UPDATE_COMPLETE", "2023-02-06T12:12:12"),
+            ("local", "UPDATE_IN_PROGRESS", "2023-02-04T12:12:12"),
+        ]
+    )
+    @patch("samcli.lib.sync.infra_sync_executor.InfraSyncExecutor._get_local_fingerprint")
+    @patch("samcli.lib.sync.infra_sync_executor.Session")
+    @patch("samcli.lib.sync.infra_sync_executor.datetime")
+    def test_execute_infra_sync_deploys_and_stores_fingerprint_if_changed(
+        self,
+        local_fingerprint,
+        stack_status,
+        last_updated_time,
+        datetime_mock,
+        session_mock,
+        get_local_fingerprint_mock,
+    ):
+        datetime_mock.utcnow.return_value = datetime(2023, 2, 8, 12, 12, 12)
+        self.sync_context.skip_deploy_sync = True
+        self.sync_context.get_latest_infra_sync_time.return_value = datetime(2023, 2, 4, 12, 12, 12)
+        infra_sync_executor = InfraSyncExecutor(
+            self.build_context, self.package_context, self.deploy_context, self.sync_context
+        )
+        self.sync_context.get_infra_sync_fingerprint.return_value = str_checksum("local:2023-02-04T12:12:12")
+        infra_sync_executor._cfn_client.describe_stacks.side_effect = [
+            {"Stacks": [{"StackStatus": stack_status, "LastUpdatedTime": last_updated_time}]},
+            {"Stacks": [{"StackStatus": "UPDATE_COMPLETE", "LastUpdatedTime": "2023-02-08T12:12:12"}]},
+        ]
+        get_local_fingerprint_mock.return_value = local_fingerprint
+        infra_sync_executor._auto_skip_infra_sync = MagicMock(return_value=False)
+
+        infra_sync_result = infra_sync_executor.execute_infra_sync(True)
+
+        self.assertTrue(infra_sync_result.infra_sync_executed)
+        self.build_context.run.assert_called_once()
+        self.package_context.run.assert_called_once()
+        self.deploy_context.run.assert_called_once()
+        self.sync_context.update_infra_sync_fingerprint.assert_called_once_with(
+            str_checksum(f"{local_fingerprint}:2023-02-08T12:12:12")
+        )
+
+    @patch("samcli.lib.sync.infra_sync_executor.Session")
+    def test_get_local_fingerprint_changes_with_code(self, session_mock):
+        with tempfile.TemporaryDirectory() as project_dir:
+            template_path = os.path.join(project_dir, "template.yaml")
+            Path(template_path).write_text("Resources: {}")
+            code_dir = os.path.join(project_dir, "function")
+            os.makedirs(code_dir)
+            Path(code_dir, "app.py").write_text("v1")
+
+            stack = MagicMock(location=template_path, stack_path="")
+            stack.resources = {
+                "Function": {"Type": "AWS::Serverless::Function", "Properties": {"CodeUri": "function"}},
+                "RemoteFunction": {"Type": "AWS::Serverless::Function", "Properties": {"CodeUri": "s3://bucket/key"}},
+            }
+            self.build_context.stacks = [stack]
+            self.build_context.use_base_dir = False
+            self._set_build_settings(parameter_overrides={"Key": "Value"})
+            infra_sync_executor = InfraSyncExecutor(
+                self.build_context, self.package_context, self.deploy_context, self.sync_context
+            )
+
+            fingerprint = infra_sync_executor._get_local_fingerprint()
+            self.assertIsNotNone(fingerprint)
+            self.assertEqual(infra_sync_executor._get_local_fingerprint(), fingerprint)
+
+            Path(code_dir, "app.py").write_text("v2")
+            self.assertNotEqual(infra_sync_executor._get_local_fingerprint(), fingerprint)
+
+    def _set_build_settings(self, **build_settings):
+        settings = {
+            "parameter_overrides": {},
+            "use_container": False,
+            "build_images": None,
+            "container_env_var": None,
+            "container_env_var_file": None,
+            "build_in_source": None,
+            "mode": None,
+            "create_auto_dependency_layer": False,
+            "manifest_path_override": None,
+        }
+        settings.update(build_settings)
+        for name, value in settings.items():
+            setattr(self.build_context, name, value)
+
+    @parameterized.expand(
+        [
+            ({"use_container": True},),
+            ({"build_images": {"Function": "image"}},),
+            ({"container_env_var": {"Function": {"KEY": "value"}}},),
+            ({"build_in_source": True},),
+            ({"create_auto_dependency_layer": True},),
+        ]
+    )
+    @patch("samcli.lib.sync.infra_sync_executor.Session")
+    def test_get_local_fingerprint_changes_with_build_settings(self, build_settings, session_mock):
+        with tempfile.TemporaryDirectory() as project_dir:
+            template_path = os.path.join(project_dir, "template.yaml")
+            Path(template_path).write_text("Resources: {}")
+            self.build_context.stacks = [MagicMock(location=template_path, stack_path="", resources={})]
+            self._set_build_settings()
+            infra_sync_executor = InfraSyncExecutor(
+                self.build_context, self.package_context, self.deploy_context, self.sync_context
+            )
+            fingerprint = infra_sync_executor._get_local_fingerprint()
+
+            self._set_build_settings(**build_settings)
+
+            self.assertNotEqual(infra_sync_executor._get_local_fingerprint(), fingerprint)
+
+    @patch("samcli.lib.sync.infra_sync_executor.Session")
+    def test_get_local_fingerprint_changes_with_container_env_var_file(self, session_mock):
+        with tempfile.TemporaryDirectory() as project_dir:
+            template_path = os.path.join(project_dir, "template.yaml")
+            Path(template_path).write_text("Resources: {}")
+            env_var_file = os.path.join(project_dir, "env.json")
+            Path(env_var_file).write_text('{"Parameters": {"KEY": "v1"}}')
+            self.build_context.stacks = [MagicMock(location=template_path, stack_path="", resources={})]
+            self._set_build_settings(container_env_var_file=env_var_file)
+            infra_sync_executor = InfraSyncExecutor(
+                self.build_context, self.package_context, self.deploy_context, self.sync_context
+            )
+            fingerprint = infra_sync_executor._get_local_fingerprint()
+
+            Path(env_var_file).write_text('{"Parameters": {"KEY": "v2"}}')
+
+            self.assertNotEqual(infra_sync_executor._get_local_fingerprint(), fingerprint)
+
+    @patch("samcli.lib.sync.infra_sync_executor.Session")
+    def test_get_local_fingerprint_returns_none_on_error(self, session_mock):
+        self.build_context.stacks = [MagicMock(location="missing-template.yaml")]
+        infra_sync_executor = InfraSyncExecutor(
+            self.build_context, self.package_context, self.deploy_context, self.sync_context
+        )
+
+        self.assertIsNone(infra_sync_executor._get_local_fingerprint())
+
     @patch("samcli.lib.sync.infra_sync_executor.SYNC_FLOW_THRESHOLD", 1)
     @patch("samcli.lib.sync.infra_sync_executor.InfraSyncExecutor._auto_skip_infra_sync")
     @patch("samcli.lib.sync.infra_sync_executor.Session")
@@ -382,6 +556,50 @@ class TestInfraSyncExecutor(TestCase):
                 {ResourceIdentifier("ServerlessApplication/ServerlessFunction")},
             )
 
+    @parameterized.expand([([True, True], True), ([True, False], False), ([False, False], False)])
+    @patch("samcli.lib.sync.infra_sync_executor.get_template_data")
+    @patch("samcli.lib.sync.infra_sync_executor.Session")
+    def test_auto_skip_infra_sync_multiple_nested_stacks(
+        self, nested_stack_results, expected_result, session_mock, get_template_mock
+    ):
+        template_dict = {
+            "Resources": {
+                "NestedStack1": {
+                    "Type": "AWS::CloudFormation::Stack",
+                    "Properties": {"TemplateURL": "https://s3.com/bucket/key1"},
+                },
+                "NestedStack2": {
+                    "Type": "AWS::CloudFormation::Stack",
+                    "Properties": {"TemplateURL": "https://s3.com/bucket/key2"},
+                },
+            }
+        }
+        get_template_mock.return_value = template_dict
+
+        infra_sync_executor = InfraSyncExecutor(
+            self.build_context, self.package_context, self.deploy_context, self.sync_context
+        )
+        infra_sync_executor._cfn_client.get_template.return_value = {"TemplateBody": json.dumps(template_dict)}
+        nested_results = dict(zip(["NestedStack1", "NestedStack2"], nested_stack_results))
+
+        with patch.object(
+            infra_sync_executor,
+            "_auto_skip_nested_stack_infra_sync",
+            side_effect=lambda resource_logical_id, *_: nested_results[resource_logical_id],
+        ) as nested_stack_mock:
+            self.assertEqual(
+                infra_sync_executor._auto_skip_infra_sync(
+                    "packaged-template.yaml", "built-template.yaml", "stack_name"
+                ),
+                expected_result,
+            )
+
+        # every nested stack is compared, even if another one already differs
+        self.assertCountEqual(
+            [nested_call.args[0] for nested_call in nested_stack_mock.call_args_list],
+            ["NestedStack1", "NestedStack2"],
+        )
+
     @parameterized.expand([(True, "sar_id"), (False, "sar_id_2")])
     @patch("samcli.lib.sync.infra_sync_executor.is_local_path")
     @patch("samcli.lib.sync.infra_sync_executor.get_template_data")
@@ -1,6 +1,9 @@
+import os
+import shutil
+import tempfile
 from pathlib import Path
 
-from samcli.lib.providers.provider import Stack
+from samcli.lib.providers.provider import LayerVersion, Stack
 from unittest import TestCase
 from unittest.mock import MagicMock, patch, Mock, PropertyMock
 
@@ -8,6 +11,7 @@ from samcli.lib.sync.sync_flow import (
     SyncFlow,
     ResourceAPICall,
     ApiCallTypes,
+    get_build_fingerprint,
     get_definition_path,
     get_default_retry_config,
 )
@@ -45,7 +49,7 @@ class TestSyncFlow(TestCase):
 
     @parameterized.expand([(None,), ("local_sha",)])
     @patch("samcli.lib.sync.sync_flow.SyncFlow.sync_state_identifier", new_callable=PropertyMock)
-    @patch("samcli.lib.sync.sync_flow.Session")
+    @patch("samcli.lib.utils.boto_utils.BOTO_CLIENT_CACHE")
     @patch.multiple(SyncFlow, __abstractmethods__=set())
     def test_update_local_hash(self, local_sha, session_mock, patched_sync_state_identifier):
         sync_flow = self.create_sync_flow(False)
@@ -57,12 +61,12 @@ class TestSyncFlow(TestCase):
             if local_sha:
                 patched_sync_state_identifier.assert_called_once()
                 patched_sync_context.update_resource_sync_state.assert_called_with(
-                    sync_flow.sync_state_identifier, sync_flow._local_sha
+                    sync_flow.sync_state_identifier, sync_flow._local_sha, None
                 )
             else:
                 patched_sync_context.update_resource_sync_state.assert_not_called()
 
-    @patch("samcli.lib.sync.sync_flow.Session")
+    @patch("samcli.lib.utils.boto_utils.BOTO_CLIENT_CACHE")
     @patch.multiple(SyncFlow, __abstractmethods__=set())
     def test_execute_all_steps(self, session_mock):
         sync_flow = self.create_sync_flow()
@@ -79,7 +83,7 @@ class TestSyncFlow(TestCase):
         sync_flow.gather_dependencies.assert_called_once()
         self.assertEqual(result, ["A"])
 
-    @patch("samcli.lib.sync.sync_flow.Session")
+    @patch("samcli.lib.utils.boto_utils.BOTO_CLIENT_CACHE")
     @patch.multiple(SyncFlow, __abstractmethods__=set())
     def test_execute_skip_after_compare_local(self, session_mock):
         sync_flow = self.create_sync_flow()
@@ -96,7 +100,62 @@ class TestSyncFlow(TestCase):
         sync_flow.gather_dependencies.assert_not_called()
         self.assertEqual(result, [])
 
-    @patch("samcli.lib.sync.sync_flow.Session")
+    @patch("samcli.lib.sync.sync_flow.SyncFlow.sync_state_identifier", new_callable=PropertyMock)
+    @patch("samcli.lib.utils.boto_utils.BOTO_CLIENT_CACHE")
+    @patch.multiple(SyncFlow, __abstractmethods__=set())
+    def test_execute_skip_after_compare_local_stores_fingerprint(self, session_mock, sync_state_identifier_mock):
+        sync_flow = self.create_sync_flow()
+        sync_flow._get_local_fingerprint = MagicMock(return_value="fingerprint")
+        sync_flow._sync_context.get_resource_latest_sync_fingerprint.return_value = "old-fingerprint"
+        sync_flow.compare_local.return_value = True
+        result = sync_flow.execute()
+
+        sync_flow.gather_resources.assert_called_once()
+        sync_flow.compare_remote.assert_not_called()
+        sync_flow._sync_context.update_resource_sync_fingerprint.assert_called_once_with(
+            sync_state_identifier_mock.return_value, "fingerprint"
+        )
+        self.assertEqual(result, [])
+
+    @patch("samcli.lib.sync.sync_flow.SyncFlow.sync_state_identifier", new_callable=PropertyMock)
+    @patch("samcli.lib.utils.boto_utils.BOTO_CLIENT_CACHE")
+    @patch.multiple(SyncFlow, __abstractmethods__=set())
+    def test_execute_skip_before_gather_resources_if_fingerprint_is_same(
+        self, session_mock, sync_state_identifier_mock
+    ):
+        sync_flow = self.create_sync_flow()
+        sync_flow._get_local_fingerprint = MagicMock(return_value="fingerprint")
+        sync_flow._sync_context.get_resource_latest_sync_fingerprint.return_value = "fingerprint"
+        result = sync_flow.execute()
+
+        sync_flow.gather_resources.assert_not_called()
+        sync_flow.compare_local.assert_not_called()
+        sync_flow.compare_remote.assert_not_called()
+        sync_flow.sync.assert_not_called()
+        self.assertEqual(result, [])
+
+    @patch("samcli.lib.utils.boto_utils.BOTO_CLIENT_CACHE")
+    @patch.multiple(SyncFlow, __abstractmethods__=set())
+    def test_execute_all_steps_stores_fingerprint_with_hash(self, session_mock):
+        sync_flow = self.create_sync_flow(False)
+        sync_flow._get_local_fingerprint = MagicMock(return_value="fingerprint")
+        sync_flow._sync_context.get_resource_latest_sync_fingerprint.return_value = None
+        sync_flow.compare_local.return_value = False
+        sync_flow.compare_remote.return_value = False
+
+        def gather_resources():
+            sync_flow._local_sha = "local_sha"
+
+        sync_flow.gather_resources.side_effect = gather_resources
+        with patch.object(SyncFlow, "sync_state_identifier", new_callable=PropertyMock) as sync_state_identifier:
+            sync_flow.execute()
+
+        sync_flow.sync.assert_called_once()
+        sync_flow._sync_context.update_resource_sync_state.assert_called_once_with(
+            sync_state_identifier.return_value, "local_sha", "fingerprint"
+        )
+
+    @patch("samcli.lib.utils.boto_utils.BOTO_CLIENT_CACHE")
     @patch.multiple(SyncFlow, __abstractmethods__=set())
     def test_execute_skip_after_compare_remote(self, session_mock):
         sync_flow = self.create_sync_flow()
@@ -113,28 +172,8 @@ class TestSyncFlow(TestCase):
         sync_flow.gather_dependencies.assert_not_called()
         self.assertEqual(result, [])
 
-    @patch("samcli.lib.sync.sync_flow.Session")
-    @patch.multiple(SyncFlow, __abstractmethods__=set())
-    def test_get_sync_flow(self, session_mock):
-        sync_flow = self.create_sync_flow()
-
-        # get first session object to instantiate it
-        session_object = sync_flow._get_session()
-        session_mock.assert_called_once()
-        self.assertIsNotNone(sync_flow._session)
-        self.assertIsNotNone(session_object)
-
-        # reset mock between tests
-        session_mock.reset_mock()
-
-        # get session object again which should return previously instantiated one
-        session_object = sync_flow._get_session()
-        session_mock.assert_not_called()
-        self.assertIsNotNone(sync_flow._session)
-        self.assertIsNotNone(session_object)
-
     @parameterized.expand([(None,), (20,)])
-    @patch("samcli.lib.sync.sync_flow.get_boto_client_provider_from_session_with_config")
+    @patch("samcli.lib.sync.sync_flow.get_boto_client_provider_with_config")
     @patch("samcli.lib.sync.sync_flow.environ")
     @patch.multiple(SyncFlow, __abstractmethods__=set())
     def test_boto_client(self, environ_param, patched_environ, patched_get_client):
@@ -146,17 +185,18 @@ class TestSyncFlow(TestCase):
         patched_environ.get.return_value = environ_param
 
         sync_flow = self.create_sync_flow()
-        with patch.object(sync_flow, "_session") as patched_session:
-            client = sync_flow._boto_client(client_name)
-
-            if environ_param:
-                patched_get_client.assert_called_with(patched_session)
-            else:
-                patched_get_client.assert_called_with(patched_session, retries=get_default_retry_config())
-            given_client_generator.assert_called_with(client_name)
-            self.assertEqual(client, given_client)
-
-    @patch("samcli.lib.sync.sync_flow.Session")
+        region = sync_flow._deploy_context.region
+        profile = sync_flow._deploy_context.profile
+        client = sync_flow._boto_client(client_name)
+
+        if environ_param:
+            patched_get_client.assert_called_with(region=region, profile=profile)
+        else:
+            patched_get_client.assert_called_with(region=region, profile=profile, retries=get_default_retry_config())
+        given_client_generator.assert_called_with(client_name)
+        self.assertEqual(client, given_client)
+
+    @patch("samcli.lib.utils.boto_utils.BOTO_CLIENT_CACHE")
     @patch.multiple(SyncFlow, __abstractmethods__=set())
     def test_set_locks_with_distributor(self, session_mock):
         sync_flow = self.create_sync_flow()
@@ -187,7 +227,7 @@ class TestSyncFlow(TestCase):
         self.assertEqual(sorted(result), sorted(["A_Build", "B_UpdateFunctionConfiguration"]))
 
     @patch("samcli.lib.sync.sync_flow.LockChain")
-    @patch("samcli.lib.sync.sync_flow.Session")
+    @patch("samcli.lib.utils.boto_utils.BOTO_CLIENT_CACHE")
     @patch.multiple(SyncFlow, __abstractmethods__=set())
     def test_get_lock_chain(self, session_mock, lock_chain_mock):
         sync_flow = self.create_sync_flow()
@@ -267,7 +307,7 @@ class TestSyncFlow(TestCase):
         definition_path = get_definition_path(resource, "identifier", True, "base_dir", [])
         self.assertEqual(definition_path, Path("base_dir").joinpath("test_uri"))
 
-    @patch("samcli.lib.sync.sync_flow.Session")
+    @patch("samcli.lib.utils.boto_utils.BOTO_CLIENT_CACHE")
     @patch("samcli.lib.sync.sync_flow.SyncFlow.sync_state_identifier", new_callable=PropertyMock)
     @patch.multiple(SyncFlow, __abstractmethods__=set())
     def test_compare_local(self, patched_session, patched_sync_state_identifier):
@@ -295,3 +335,109 @@ class TestSyncFlow(TestCase):
 
         sync_flow._sync_context.get_resource_latest_sync_hash.return_value = "hash"
         self.assertEqual(sync_flow.compare_local(), True)
+
+
+class TestGetBuildFingerprint(TestCase):
+    def setUp(self):
+        self.base_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.base_dir, True)
+        self.source_dir = os.path.join(self.base_dir, "function")
+        os.makedirs(self.source_dir)
+        self._write("function/app.py", "handler")
+        self._write("function/requirements.txt", "requests")
+        self.build_context = Mock(
+            base_dir=self.base_dir,
+            build_dir=os.path.join(self.base_dir, ".aws-sam", "build"),
+            cache_dir=os.path.join(self.base_dir, ".aws-sam", "cache"),
+            manifest_path_override=None,
+            mode=None,
+            use_container=False,
+            build_in_source=None,
+            build_images={},
+            container_env_var=None,
+            container_env_var_file=None,
+        )
+
+    def _write(self, path, content):
+        with open(os.path.join(self.base_dir, path), "w") as file:
+            file.write(content)
+
+    def _get_fingerprint(self, source_uri="function", build_parameters=None, metadata=None):
+        function = Mock(codeuri=source_uri, metadata=metadata, full_path="Function")
+        function.name = "Function"
+        return get_build_fingerprint(self.build_context, function, build_parameters or {"Runtime": "python3.11"})
+
+    def test_must_be_stable_for_unchanged_inputs(self):
+        fingerprint = self._get_fingerprint()
+
+        # only the modification time changes
+        self._write("function/app.py", "handler")
+
+        self.assertIsNotNone(fingerprint)
+        self.assertEqual(self._get_fingerprint(), fingerprint)
+
+    def test_must_change_with_inputs(self):
+        fingerprint = self._get_fingerprint()
+        self.assertNotEqual(self._get_fingerprint(build_parameters={"Runtime": "python3.12"}), fingerprint)
+
+        self.build_context.use_container = True
+        self.assertNotEqual(self._get_fingerprint(), fingerprint)
+        self.build_context.use_container = False
+
+        self._write("manifest.txt", "requests")
+        self.build_context.manifest_path_override = os.path.join(self.base_dir, "manifest.txt")
+        self.assertNotEqual(self._get_fingerprint(), fingerprint)
+        self.build_context.manifest_path_override = None
+
+        self._write("function/requirements.txt", "requests\nboto3")
+        self.assertNotEqual(self._get_fingerprint(), fingerprint)
+
+    def test_must_ignore_build_outputs_inside_source(self):
+        fingerprint = self._get_fingerprint(".")
+
+        os.makedirs(self.build_context.build_dir)
+        self._write(".aws-sam/build/app.py", "built handler")
+
+        self.assertEqual(self._get_fingerprint("."), fingerprint)
+
+    def test_must_change_with_container_settings(self):
+        self.build_context.use_container = True
+        fingerprint = self._get_fingerprint()
+
+        self.build_context.build_images = {None: "global-image"}
+        image_fingerprint = self._get_fingerprint()
+        self.assertNotEqual(image_fingerprint, fingerprint)
+        self.build_context.build_images = {None: "global-image", "Function": "function-image"}
+        self.assertNotEqual(self._get_fingerprint(), image_fingerprint)
+
+        self.build_context.container_env_var = {"Function": {"KEY": "value"}}
+        env_vars_fingerprint = self._get_fingerprint()
+        self.assertNotEqual(env_vars_fingerprint, image_fingerprint)
+
+        self._write("env.json", '{"Parameters": {"OTHER_KEY": "value"}}')
+        self.build_context.container_env_var_file = os.path.join(self.base_dir, "env.json")
+        self.assertNotEqual(self._get_fingerprint(), env_vars_fingerprint)
+
+    @parameterized.expand(["makefile", "esbuild"])
+    def test_must_return_none_for_build_methods_using_files_outside_source(self, build_method):
+        self.assertIsNone(self._get_fingerprint(metadata={"BuildMethod": build_method}))
+
+        layer = LayerVersion("Layer", "function", metadata={"BuildMethod": build_method})
+        self.assertIsNone(get_build_fingerprint(self.build_context, layer, {}))
+
+    @parameterized.expand(["-e ../lib", "shared @ file:..\\shared"])
+    def test_must_not_skip_changes_outside_source(self, requirement):
+        os.makedirs(os.path.join(self.base_dir, "lib"))
+        self._write("lib/setup.py", "version 1")
+        self._write("function/requirements.txt", requirement)
+        fingerprint = self._get_fingerprint()
+
+        self._write("lib/setup.py", "version 2")
+
+        # changes of the referenced dir wouldn't change the fingerprint, so there must be none
+        self.assertIsNone(fingerprint)
+        self.assertIsNone(self._get_fingerprint())
+
+    def test_must_return_none_for_missing_source(self):
+        self.assertIsNone(self._get_fingerprint(None))
+        self.assertIsNone(self._get_fingerprint("missing"))
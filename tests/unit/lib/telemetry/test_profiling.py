@@ -0,0 +1,139 @@
+import os
+import pstats
+import shutil
+import tempfile
+import threading
+from unittest import TestCase
+
+import click
+from click.testing import CliRunner
+
+from samcli.cli.options import profile_output_option
+from samcli.lib.telemetry.profiling import COLLAPSED_STACKS_EXTENSION, CommandProfiler, StackSampler
+
+
+def _profiled_work():
+    return sum(index * index for index in range(10000))
+
+
+def _profiled_thread_work():
+    return sum(index * index for index in range(10000))
+
+
+def _get_function_names(stats):
+    return {function_name for _, _, function_name in stats.stats}
+
+
+class TestStackSampler(TestCase):
+    def test_must_sample_stacks_of_other_threads(self):
+        sampler = StackSampler()
+
+        thread = threading.Thread(target=sampler.sample)
+        thread.start()
+        thread.join()
+
+        # other tests may have left threads running
+        stacks = [stack.split(";") for stack in sampler.stack_counts]
+        frames = next(frames for frames in stacks if frames[0] == threading.current_thread().name)
+        self.assertTrue(any(frame.startswith("test_must_sample_stacks_of_other_threads (") for frame in frames))
+        self.assertEqual(set(sampler.stack_counts.values()), {1})
+
+    def test_must_write_collapsed_stacks(self):
+        temp_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, temp_dir, True)
+        path = os.path.join(temp_dir, "stacks.collapsed")
+        sampler = StackSampler()
+        sampler.stack_counts = {"MainThread;main (a.py:1);run (b.py:2)": 3, "MainThread;main (a.py:1)": 1}
+
+        sampler.write_collapsed_stacks(path)
+
+        with open(path) as collapsed_file:
+            self.assertEqual(
+                collapsed_file.read(), "MainThread;main (a.py:1) 1\nMainThread;main (a.py:1);run (b.py:2) 3\n"
+            )
+
+
+class TestCommandProfiler(TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+        self.path = os.path.join(self.temp_dir, "command.pstats")
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def test_must_profile_started_threads(self):
+        profiler = CommandProfiler()
+        profiler.start()
+        try:
+            _profiled_work()
+            thread = threading.Thread(target=_profiled_thread_work)
+            thread.start()
+            thread.join()
+        finally:
+            profiler.stop()
+
+        function_names = _get_function_names(profiler.get_stats())
+        self.assertIn("_profiled_work", function_names)
+        self.assertIn("_profiled_thread_work", function_names)
+
+    def test_must_not_profile_threads_started_after_stop(self):
+        profiler = CommandProfiler()
+        profiler.start()
+        profiler.stop()
+
+        thread = threading.Thread(target=_profiled_thread_work)
+        thread.start()
+        thread.join()
+
+        self.assertNotIn("_profiled_thread_work", _get_function_names(profiler.get_stats()))
+
+    def test_must_write_stats_and_collapsed_stacks(self):
+        profiler = CommandProfiler(sampling_interval=0.001)
+        profiler.start()
+        try:
+            threading.Event().wait(0.05)
+            _profiled_work()
+        finally:
+            profiler.stop()
+
+        report = profiler.write(self.path, top_count=5)
+
+        self.assertIn("_profiled_work", _get_function_names(pstats.Stats(self.path)))
+        self.assertIn("tottime", report)
+        with open(self.path + COLLAPSED_STACKS_EXTENSION) as collapsed_file:
+            lines = collapsed_file.read().splitlines()
+        self.assertTrue(lines)
+        self.assertTrue(all(line.rsplit(" ", 1)[1].isdigit() for line in lines))
+
+
+class TestProfileOutputOption(TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+        self.path = os.path.join(self.temp_dir, "command.pstats")
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    @staticmethod
+    def _command():
+        @click.command()
+        @profile_output_option
+        def command():
+            _profiled_work()
+
+        return command
+
+    def test_must_write_profile(self):
+        result = CliRunner().invoke(self._command(), ["--profile-output", self.path])
+
+        self.assertEqual(result.exit_code, 0, result.output)
+        self.assertIn(f"Profile of the command written to {self.path}", result.output)
+        self.assertIn("_profiled_work", _get_function_names(pstats.Stats(self.path)))
+        self.assertTrue(os.path.exists(self.path + COLLAPSED_STACKS_EXTENSION))
+
+    def test_must_not_profile_without_option(self):
+        result = CliRunner().invoke(self._command(), [])
+
+        self.assertEqual(result.exit_code, 0, result.output)
+        self.assertEqual(result.output, "")
+        self.assertFalse(os.path.exists(self.path))
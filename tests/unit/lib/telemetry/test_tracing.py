@@ -0,0 +1,153 @@
+import json
+import os
+import shutil
+import tempfile
+import threading
+from unittest import TestCase
+
+import click
+from click.testing import CliRunner
+
+from samcli.cli.options import trace_file_option
+from samcli.lib.telemetry.tracing import (
+    is_tracing_enabled,
+    span,
+    start_tracing,
+    stop_tracing,
+    traced,
+)
+
+
+class TestTracing(TestCase):
+    def tearDown(self):
+        stop_tracing()
+
+    def test_must_not_record_spans_when_disabled(self):
+        @traced()
+        def add(a, b):
+            return a + b
+
+        with span("disabled"):
+            self.assertEqual(add(1, 2), 3)
+
+        self.assertFalse(is_tracing_enabled())
+        self.assertIsNone(stop_tracing())
+
+    def test_must_nest_spans_of_the_same_thread(self):
+        tracer = start_tracing()
+
+        with span("outer", key="value"):
+            with span("inner"):
+                pass
+            thread = threading.Thread(target=self._open_span, args=("other_thread",), name="Worker")
+            thread.start()
+            thread.join()
+
+        spans = {record.name: record for record in tracer.spans}
+        self.assertIsNone(spans["outer"].parent_id)
+        self.assertEqual(spans["inner"].parent_id, spans["outer"].span_id)
+        self.assertIsNone(spans["other_thread"].parent_id)
+        self.assertEqual(spans["other_thread"].thread_name, "Worker")
+        self.assertEqual(spans["outer"].attributes, {"key": "value"})
+        self.assertGreaterEqual(spans["outer"].duration, spans["inner"].duration)
+
+    def test_must_record_errors(self):
+        tracer = start_tracing()
+
+        @traced("failing")
+        def fail():
+            raise ValueError("failed")
+
+        with self.assertRaises(ValueError):
+            fail()
+
+        self.assertEqual(
+            [(record.name, record.attributes) for record in tracer.spans], [("failing", {"error": "ValueError"})]
+        )
+
+    def test_must_name_spans_after_decorated_functions(self):
+        tracer = start_tracing()
+
+        @traced()
+        def build():
+            return "built"
+
+        self.assertEqual(build(), "built")
+        self.assertEqual(
+            tracer.spans[0].name, "TestTracing.test_must_name_spans_after_decorated_functions.<locals>.build"
+        )
+
+    def test_must_convert_spans_to_chrome_trace(self):
+        tracer = start_tracing()
+
+        with span("outer", path=os.path.join("a", "b"), count=2, other=object):
+            with span("inner"):
+                pass
+
+        trace = tracer.to_chrome_trace()
+
+        complete_events = [event for event in trace["traceEvents"] if event["ph"] == "X"]
+        metadata_events = [event for event in trace["traceEvents"] if event["ph"] == "M"]
+        self.assertEqual([event["name"] for event in complete_events], ["outer", "inner"])
+        outer, inner = complete_events
+        self.assertEqual(outer["args"]["count"], 2)
+        self.assertEqual(outer["args"]["other"], str(object))
+        self.assertEqual(inner["args"]["parent_id"], outer["args"]["span_id"])
+        self.assertLessEqual(outer["ts"], inner["ts"])
+        self.assertEqual(outer["tid"], threading.get_ident())
+        self.assertEqual(
+            metadata_events,
+            [
+                {
+                    "name": "thread_name",
+                    "ph": "M",
+                    "pid": os.getpid(),
+                    "tid": threading.get_ident(),
+                    "args": {"name": threading.current_thread().name},
+                }
+            ],
+        )
+        # the trace must be serializable
+        json.dumps(trace)
+
+    @staticmethod
+    def _open_span(name):
+        with span(name):
+            pass
+
+
+class TestTraceFileOption(TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+        self.trace_file = os.path.join(self.temp_dir, "trace.json")
+
+    def tearDown(self):
+        stop_tracing()
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    @staticmethod
+    def _command():
+        @click.command()
+        @trace_file_option
+        def command():
+            with span("command"):
+                click.echo(str(is_tracing_enabled()))
+
+        return command
+
+    def test_must_write_trace_file(self):
+        result = CliRunner().invoke(self._command(), ["--trace-file", self.trace_file])
+
+        self.assertEqual(result.exit_code, 0, result.output)
+        self.assertEqual(result.output.strip(), "True")
+        self.assertFalse(is_tracing_enabled())
+        with open(self.trace_file) as trace_file:
+            trace = json.load(trace_file)
+        self.assertEqual([event["name"] for event in trace["traceEvents"] if event["ph"] == "X"], ["command"])
+
+    def test_must_not_trace_without_option(self):
+        result = CliRunner().invoke(self._command(), [])
+
+        self.assertEqual(result.exit_code, 0, result.output)
+        self.assertEqual(result.output.strip(), "False")
+        self.assertFalse(os.path.exists(self.trace_file))
@@ -0,0 +1,121 @@
+import json
+import shutil
+import tempfile
+import time
+from pathlib import Path
+from unittest import TestCase
+from unittest.mock import Mock, patch
+
+from botocore.exceptions import NoCredentialsError
+from parameterized import parameterized
+
+from samcli.lib.translate.managed_policy_loader import CachedManagedPolicyLoader, get_bundled_managed_policy_map
+
+
+class TestCachedManagedPolicyLoader(TestCase):
+    def setUp(self):
+        self.cache_dir = Path(tempfile.mkdtemp())
+        self.addCleanup(shutil.rmtree, self.cache_dir, True)
+
+        self.iam_client = Mock()
+        self.iam_client.meta.region_name = "us-east-1"
+        self.iam_client.get_paginator.return_value.paginate.return_value = [
+            {"Policies": [{"PolicyName": "Policy1", "Arn": "arn:aws:iam::aws:policy/Policy1"}]},
+            {"Policies": [{"PolicyName": "Policy2", "Arn": "arn:aws:iam::aws:policy/Policy2"}]},
+        ]
+        self.iam_policy_map = {
+            "Policy1": "arn:aws:iam::aws:policy/Policy1",
+            "Policy2": "arn:aws:iam::aws:policy/Policy2",
+        }
+
+    def _write_cache(self, partition, policy_map, created_at):
+        self.cache_dir.joinpath(f"{partition}.json").write_text(
+            json.dumps({"partition": partition, "created_at": created_at, "policies": policy_map})
+        )
+
+    def test_must_load_from_iam_and_cache_policies(self):
+        policy_map = CachedManagedPolicyLoader(self.iam_client, cache_dir=self.cache_dir).load()
+
+        self.assertEqual(policy_map, self.iam_policy_map)
+        cache_entry = json.loads(self.cache_dir.joinpath("aws.json").read_text())
+        self.assertEqual(cache_entry["policies"], self.iam_policy_map)
+
+        # next loader uses the cache without calling IAM
+        other_iam_client = Mock()
+        other_iam_client.meta.region_name = "us-west-2"
+        self.assertEqual(
+            CachedManagedPolicyLoader(other_iam_client, cache_dir=self.cache_dir).load(), self.iam_policy_map
+        )
+        other_iam_client.get_paginator.assert_not_called()
+
+    def test_must_load_only_once(self):
+        loader = CachedManagedPolicyLoader(self.iam_client, cache_dir=self.cache_dir)
+
+        loader.load()
+        loader.load()
+
+        self.iam_client.get_paginator.assert_called_once_with("list_policies")
+
+    def test_must_cache_policies_per_partition(self):
+        self._write_cache("aws", {"Policy": "arn:aws:iam::aws:policy/Policy"}, time.time())
+        self.iam_client.meta.region_name = "cn-north-1"
+
+        policy_map = CachedManagedPolicyLoader(self.iam_client, cache_dir=self.cache_dir).load()
+
+        self.assertEqual(policy_map, self.iam_policy_map)
+        self.assertTrue(self.cache_dir.joinpath("aws-cn.json").exists())
+
+    def test_must_use_expired_policies_and_refresh_them_in_background(self):
+        cached_policy_map = {"Policy": "arn:aws:iam::aws:policy/Policy"}
+        self._write_cache("aws", cached_policy_map, time.time() - 10)
+        loader = CachedManagedPolicyLoader(self.iam_client, cache_dir=self.cache_dir, ttl=5)
+
+        policy_map = loader.load()
+        loader._refresh_thread.join()
+
+        self.assertEqual(policy_map, cached_policy_map)
+        self.assertTrue(loader._refresh_thread.daemon)
+        cache_entry = json.loads(self.cache_dir.joinpath("aws.json").read_text())
+        self.assertEqual(cache_entry["policies"], self.iam_policy_map)
+
+    def test_must_keep_expired_policies_if_refresh_fails(self):
+        cached_policy_map = {"Policy": "arn:aws:iam::aws:policy/Policy"}
+        self._write_cache("aws", cached_policy_map, time.time() - 10)
+        self.iam_client.get_paginator.side_effect = NoCredentialsError()
+        loader = CachedManagedPolicyLoader(self.iam_client, cache_dir=self.cache_dir, ttl=5)
+
+        policy_map = loader.load()
+        loader._refresh_thread.join()
+
+        self.assertEqual(policy_map, cached_policy_map)
+        cache_entry = json.loads(self.cache_dir.joinpath("aws.json").read_text())
+        self.assertEqual(cache_entry["policies"], cached_policy_map)
+
+    @parameterized.expand([("not json",), (json.dumps({"created_at": 0}),)])
+    def test_must_ignore_invalid_cache(self, cache_content):
+        self.cache_dir.joinpath("aws.json").write_text(cache_content)
+
+        policy_map = CachedManagedPolicyLoader(self.iam_client, cache_dir=self.cache_dir).load()
+
+        self.assertEqual(policy_map, self.iam_policy_map)
+
+    @patch("samcli.lib.translate.managed_policy_loader.get_bundled_managed_policy_map")
+    def test_must_use_bundled_policies_if_iam_is_not_reachable(self, get_bundled_managed_policy_map_mock):
+        get_bundled_managed_policy_map_mock.return_value = {"Bundled": "arn:aws:iam::aws:policy/Bundled"}
+        self.iam_client.get_paginator.side_effect = NoCredentialsError()
+
+        policy_map = CachedManagedPolicyLoader(self.iam_client, cache_dir=self.cache_dir).load()
+
+        self.assertEqual(policy_map, {"Bundled": "arn:aws:iam::aws:policy/Bundled"})
+        get_bundled_managed_policy_map_mock.assert_called_once_with("aws")
+        self.assertFalse(self.cache_dir.joinpath("aws.json").exists())
+
+
+class TestGetBundledManagedPolicyMap(TestCase):
+    def test_must_return_bundled_policies_of_partition(self):
+        policy_map = get_bundled_managed_policy_map("aws")
+
+        self.assertEqual(policy_map.get("AWSLambdaExecute"), "arn:aws:iam::aws:policy/AWSLambdaExecute")
+
+    def test_must_return_empty_map_for_unknown_partition(self):
+        self.assertEqual(get_bundled_managed_policy_map("unknown"), {})
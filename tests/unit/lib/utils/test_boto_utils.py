@@ -1,9 +1,12 @@
 from unittest import TestCase
-from unittest.mock import patch, Mock
+from unittest.mock import call, patch, Mock
 
+from botocore.exceptions import ProfileNotFound
 from parameterized import parameterized
 
 from samcli.lib.utils.boto_utils import (
+    BOTO_CLIENT_CACHE,
+    BotoClientCache,
     get_boto_config_with_user_agent,
     get_boto_client_provider_with_config,
     get_boto_resource_provider_with_config,
@@ -58,17 +61,10 @@ class TestBotoUtils(TestCase):
 
         self.assertEqual(client, given_client)
         patched_get_config.assert_called_with(param=given_config_param)
-        given_session.client.assert_called_with(given_client_name, config=given_config)
-
-    @patch("samcli.lib.utils.boto_utils.get_boto_client_provider_from_session_with_config")
-    @patch("samcli.lib.utils.boto_utils.Session")
-    def test_get_boto_client_provider_with_config(self, patched_session, patched_get_client):
-        given_session = Mock()
-        patched_session.return_value = given_session
-
-        given_client_generator = Mock()
-        patched_get_client.return_value = given_client_generator
+        given_session.client.assert_called_with(given_client_name, config=given_config, endpoint_url=None)
 
+    @patch("samcli.lib.utils.boto_utils.BOTO_CLIENT_CACHE")
+    def test_get_boto_client_provider_with_config(self, patched_cache):
         given_config_param = Mock()
         given_profile = Mock()
         given_region = Mock()
@@ -76,31 +72,39 @@ class TestBotoUtils(TestCase):
         client_generator = get_boto_client_provider_with_config(
             region=given_region, profile=given_profile, param=given_config_param
         )
+        client = client_generator("lambda")
 
-        patched_session.assert_called_with(region_name=given_region, profile_name=given_profile)
-        patched_get_client.assert_called_with(given_session, param=given_config_param)
-        self.assertEqual(given_client_generator, client_generator)
-
-    @patch("samcli.lib.utils.boto_utils.get_boto_resource_provider_from_session_with_config")
-    @patch("samcli.lib.utils.boto_utils.Session")
-    def test_get_boto_resource_provider_with_config(self, patched_session, patched_get_resource):
-        given_session = Mock()
-        patched_session.return_value = given_session
-
-        given_resource_generator = Mock()
-        patched_get_resource.return_value = given_resource_generator
+        patched_cache.load_session.assert_called_once_with(given_region, given_profile)
+        patched_cache.get_profile_client.assert_called_with(
+            given_region, given_profile, "lambda", None, param=given_config_param
+        )
+        self.assertEqual(client, patched_cache.get_profile_client.return_value)
 
+    @patch("samcli.lib.utils.boto_utils.BOTO_CLIENT_CACHE")
+    def test_get_boto_resource_provider_with_config(self, patched_cache):
         given_config_param = Mock()
         given_profile = Mock()
         given_region = Mock()
 
-        client_generator = get_boto_resource_provider_with_config(
+        resource_generator = get_boto_resource_provider_with_config(
             region=given_region, profile=given_profile, param=given_config_param
         )
+        resource = resource_generator("cloudformation")
 
-        patched_session.assert_called_with(region_name=given_region, profile_name=given_profile)
-        patched_get_resource.assert_called_with(given_session, param=given_config_param)
-        self.assertEqual(given_resource_generator, client_generator)
+        patched_cache.load_session.assert_called_once_with(given_region, given_profile)
+        patched_cache.get_profile_resource.assert_called_with(
+            given_region, given_profile, "cloudformation", param=given_config_param
+        )
+        self.assertEqual(resource, patched_cache.get_profile_resource.return_value)
+
+    @patch("samcli.lib.utils.boto_utils.Session")
+    def test_get_boto_providers_with_config_raise_for_unknown_profile(self, patched_session):
+        patched_session.side_effect = ProfileNotFound(profile="unknown-profile")
+
+        with self.assertRaises(ProfileNotFound):
+            get_boto_client_provider_with_config(region="us-east-1", profile="unknown-profile")
+        with self.assertRaises(ProfileNotFound):
+            get_boto_resource_provider_with_config(region="us-east-1", profile="unknown-profile")
 
     @patch("samcli.lib.utils.boto_utils.get_boto_config_with_user_agent")
     def test_get_boto_resource_provider_from_session_with_config(self, patched_get_config):
@@ -123,6 +127,122 @@ class TestBotoUtils(TestCase):
         patched_get_config.assert_called_with(param=given_config_param)
         given_session.resource.assert_called_with(given_resource_name, config=given_config)
 
+    @patch("samcli.lib.utils.boto_utils.get_boto_config_with_user_agent")
+    def test_get_boto_client_provider_from_session_with_endpoint_url(self, patched_get_config):
+        given_session = Mock()
+
+        client_generator = get_boto_client_provider_from_session_with_config(
+            given_session, endpoint_url="http://127.0.0.1:3001"
+        )
+        client = client_generator("lambda")
+
+        self.assertEqual(client, given_session.client.return_value)
+        given_session.client.assert_called_with(
+            "lambda", config=patched_get_config.return_value, endpoint_url="http://127.0.0.1:3001"
+        )
+
+    @patch("samcli.lib.utils.boto_utils.get_boto_config_with_user_agent")
+    def test_get_boto_client_provider_from_session_returns_cached_client(self, patched_get_config):
+        given_session = Mock()
+        given_session.client.side_effect = lambda *args, **kwargs: Mock()
+
+        first_client = get_boto_client_provider_from_session_with_config(given_session, param="value")("lambda")
+        second_client = get_boto_client_provider_from_session_with_config(given_session, param="value")("lambda")
+
+        self.assertIs(first_client, second_client)
+        given_session.client.assert_called_once()
+
     @parameterized.expand([({}, None), ({"Error": {}}, None), ({"Error": {"Code": "ErrorCode"}}, "ErrorCode")])
     def test_get_client_error_code(self, response, expected):
         self.assertEqual(expected, get_client_error_code(Mock(response=response)))
+
+
+@patch("samcli.lib.utils.boto_utils.get_boto_config_with_user_agent")
+class TestBotoClientCache(TestCase):
+    def setUp(self):
+        self.cache = BotoClientCache()
+        self.session = Mock()
+        self.session.client.side_effect = lambda *args, **kwargs: Mock()
+
+    def test_must_create_client_once(self, patched_get_config):
+        first_client = self.cache.get_client(self.session, "lambda", retries={"max_attempts": 5})
+        second_client = self.cache.get_client(self.session, "lambda", retries={"max_attempts": 5})
+
+        self.assertIs(first_client, second_client)
+        self.assertEqual(self.cache.created_clients, 1)
+        patched_get_config.assert_called_once_with(retries={"max_attempts": 5})
+
+    @parameterized.expand(
+        [
+            ("s3", None, {}),
+            ("lambda", "http://127.0.0.1:3001", {}),
+            ("lambda", None, {"region_name": "us-west-2"}),
+        ]
+    )
+    def test_must_create_client_per_service_endpoint_and_config(
+        self, patched_get_config, service_name, endpoint_url, config_kwargs
+    ):
+        first_client = self.cache.get_client(self.session, "lambda")
+        second_client = self.cache.get_client(self.session, service_name, endpoint_url, **config_kwargs)
+
+        self.assertIsNot(first_client, second_client)
+        self.assertEqual(self.cache.created_clients, 2)
+
+    def test_must_create_client_per_session(self, patched_get_config):
+        other_session = Mock()
+        other_session.client.side_effect = lambda *args, **kwargs: Mock()
+
+        first_client = self.cache.get_client(self.session, "lambda")
+        second_client = self.cache.get_client(other_session, "lambda")
+
+        self.assertIsNot(first_client, second_client)
+        self.assertEqual(self.cache.created_clients, 2)
+
+    @patch("samcli.lib.utils.boto_utils.Session")
+    def test_must_create_profile_clients_from_one_session(self, patched_session, patched_get_config):
+        patched_session.side_effect = lambda **kwargs: self.session
+
+        first_client = self.cache.get_profile_client("us-east-1", "profile", "lambda")
+        second_client = self.cache.get_profile_client("us-east-1", "profile", "lambda")
+        self.cache.get_profile_client("us-west-2", "profile", "lambda")
+
+        self.assertIs(first_client, second_client)
+        self.assertEqual(
+            patched_session.call_args_list,
+            [
+                call(region_name="us-east-1", profile_name="profile"),
+                call(region_name="us-west-2", profile_name="profile"),
+            ],
+        )
+
+    @patch("samcli.lib.utils.boto_utils.Session")
+    def test_must_load_session_once(self, patched_session, patched_get_config):
+        self.cache.load_session("us-east-1", "profile")
+        self.cache.get_profile_client("us-east-1", "profile", "lambda")
+
+        patched_session.assert_called_once_with(region_name="us-east-1", profile_name="profile")
+
+    @patch("samcli.lib.utils.boto_utils.Session")
+    def test_must_create_resources_while_holding_lock(self, patched_session, patched_get_config):
+        patched_session.return_value = self.session
+        self.session.resource.side_effect = lambda *args, **kwargs: Mock(locked=self.cache._lock.locked())
+
+        first_resource = self.cache.get_profile_resource("us-east-1", "profile", "cloudformation")
+        second_resource = self.cache.get_resource(self.session, "cloudformation")
+
+        # resources are not thread-safe, each call gets its own
+        self.assertIsNot(first_resource, second_resource)
+        self.assertTrue(first_resource.locked)
+        self.assertTrue(second_resource.locked)
+        patched_session.assert_called_once_with(region_name="us-east-1", profile_name="profile")
+
+    def test_clear(self, patched_get_config):
+        first_client = self.cache.get_client(self.session, "lambda")
+        self.cache.clear()
+        second_client = self.cache.get_client(self.session, "lambda")
+
+        self.assertIsNot(first_client, second_client)
+        self.assertEqual(self.cache.created_clients, 1)
+
+    def test_process_wide_cache(self, patched_get_config):
+        self.assertIsInstance(BOTO_CLIENT_CACHE, BotoClientCache)
@@ -1,3 +1,7 @@
+import shutil
+import tempfile
+from datetime import datetime
+from pathlib import Path
 from unittest import TestCase
 from unittest.mock import patch, Mock, ANY, call
 
@@ -9,6 +13,7 @@ from samcli.lib.utils.cloudformation import (
     get_resource_summary,
     list_active_stack_names,
     get_resource_summary_from_physical_id,
+    clear_stack_resources_cache,
 )
 from samcli.lib.utils.resources import AWS_CLOUDFORMATION_STACK, AWS_LAMBDA_FUNCTION
 
@@ -215,3 +220,131 @@ class TestCloudformationUtils(TestCase):
         resource_summary = get_resource_summary_from_physical_id(patched_cfn_client_provider, "invalid_physical_id")
         self.assertIsNone(resource_summary)
         patched_log.debug.assert_called_once()
+
+
+class TestGetResourceSummariesNestedStacks(TestCase):
+    def setUp(self):
+        self.cache_dir = Path(tempfile.mkdtemp())
+        cache_dir_patch = patch(
+            "samcli.lib.utils.cloudformation.get_stack_resources_cache_dir", return_value=self.cache_dir
+        )
+        cache_dir_patch.start()
+        self.addCleanup(cache_dir_patch.stop)
+        self.addCleanup(shutil.rmtree, self.cache_dir, True)
+
+        self.updated_at = datetime(2024, 1, 1)
+        # stack name -> resources of the stack
+        self.stacks = {
+            "root": [
+                self._resource("Function", "Function", "root-function"),
+                self._resource(AWS_CLOUDFORMATION_STACK, "ChildA", "child-a"),
+                self._resource(AWS_CLOUDFORMATION_STACK, "ChildB", "child-b"),
+            ],
+            "child-a": [
+                self._resource("Function", "Function", "child-a-function"),
+                self._resource(AWS_CLOUDFORMATION_STACK, "GrandChild", "grand-child"),
+            ],
+            "child-b": [self._resource("Function", "Function", "child-b-function")],
+            "grand-child": [self._resource("Function", "Function", "grand-child-function")],
+        }
+        self.fetched_stacks = []
+
+        def stack(stack_name):
+            stack_mock = Mock(
+                stack_id=f"id-{stack_name}",
+                stack_status="UPDATE_COMPLETE",
+                last_updated_time=self.updated_at,
+            )
+
+            def all_resources():
+                self.fetched_stacks.append(stack_name)
+                return self.stacks[stack_name]
+
+            stack_mock.resource_summaries.all.side_effect = all_resources
+            return stack_mock
+
+        self.resource_provider = Mock()
+        self.resource_provider.return_value.Stack.side_effect = stack
+
+    def _resource(self, resource_type, logical_id, physical_id, status="UPDATE_COMPLETE"):
+        return Mock(
+            resource_type=resource_type,
+            logical_resource_id=logical_id,
+            physical_resource_id=physical_id,
+            resource_status=status,
+            last_updated_timestamp=self.updated_at,
+        )
+
+    def test_must_fetch_all_nested_stacks(self):
+        resource_summaries = get_resource_summaries(self.resource_provider, Mock(), "root", {"Function"})
+
+        self.assertEqual(
+            resource_summaries,
+            {
+                "Function": CloudFormationResourceSummary("Function", "Function", "root-function"),
+                "ChildA/Function": CloudFormationResourceSummary("Function", "Function", "child-a-function"),
+                "ChildB/Function": CloudFormationResourceSummary("Function", "Function", "child-b-function"),
+                "ChildA/GrandChild/Function": CloudFormationResourceSummary(
+                    "Function", "Function", "grand-child-function"
+                ),
+            },
+        )
+        self.assertCountEqual(self.fetched_stacks, ["root", "child-a", "child-b", "grand-child"])
+
+    def test_must_not_use_cache_by_default(self):
+        get_resource_summaries(self.resource_provider, Mock(), "root")
+        get_resource_summaries(self.resource_provider, Mock(), "root")
+
+        self.assertEqual(len(self.fetched_stacks), 8)
+        self.assertEqual(list(self.cache_dir.iterdir()), [])
+
+    def test_must_use_cached_resources_of_unchanged_stacks(self):
+        first_summaries = get_resource_summaries(self.resource_provider, Mock(), "root", use_cache=True)
+        self.fetched_stacks.clear()
+
+        second_summaries = get_resource_summaries(self.resource_provider, Mock(), "root", use_cache=True)
+
+        self.assertEqual(first_summaries, second_summaries)
+        self.assertEqual(self.fetched_stacks, [])
+
+    def test_must_fetch_only_changed_stacks(self):
+        get_resource_summaries(self.resource_provider, Mock(), "root", use_cache=True)
+        self.fetched_stacks.clear()
+
+        # root and child-b are updated
+        self.updated_at = datetime(2024, 2, 1)
+        self.stacks["root"][0] = self._resource("Function", "Function", "root-function")
+        self.stacks["root"][2] = self._resource(AWS_CLOUDFORMATION_STACK, "ChildB", "child-b")
+        self.stacks["child-b"] = [self._resource("Function", "Function", "new-child-b-function")]
+
+        resource_summaries = get_resource_summaries(self.resource_provider, Mock(), "root", use_cache=True)
+
+        self.assertCountEqual(self.fetched_stacks, ["root", "child-b"])
+        self.assertEqual(resource_summaries["ChildB/Function"].physical_resource_id, "new-child-b-function")
+        self.assertEqual(resource_summaries["ChildA/GrandChild/Function"].physical_resource_id, "grand-child-function")
+
+    def test_must_not_cache_stacks_in_progress(self):
+        self.stacks["root"][2] = self._resource(AWS_CLOUDFORMATION_STACK, "ChildB", "child-b", "UPDATE_IN_PROGRESS")
+
+        get_resource_summaries(self.resource_provider, Mock(), "root", use_cache=True)
+        self.fetched_stacks.clear()
+        get_resource_summaries(self.resource_provider, Mock(), "root", use_cache=True)
+
+        self.assertEqual(self.fetched_stacks, ["child-b"])
+
+    @patch("samcli.lib.utils.cloudformation.STACK_RESOURCES_CACHE_TTL", -1)
+    def test_must_not_use_expired_cache(self):
+        get_resource_summaries(self.resource_provider, Mock(), "root", use_cache=True)
+        self.fetched_stacks.clear()
+        get_resource_summaries(self.resource_provider, Mock(), "root", use_cache=True)
+
+        self.assertEqual(len(self.fetched_stacks), 4)
+
+    def test_clear_stack_resources_cache(self):
+        get_resource_summaries(self.resource_provider, Mock(), "root", use_cache=True)
+        self.fetched_stacks.clear()
+
+        clear_stack_resources_cache()
+        get_resource_summaries(self.resource_provider, Mock(), "root", use_cache=True)
+
+        self.assertEqual(len(self.fetched_stacks), 4)
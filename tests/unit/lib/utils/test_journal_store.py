@@ -0,0 +1,122 @@
+import json
+import shutil
+import tempfile
+from pathlib import Path
+from unittest import TestCase
+from unittest.mock import patch
+
+from samcli.lib.utils.journal_store import JOURNAL_FORMAT_VERSION, JournalStore
+
+
+class TestJournalStore(TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+        self.path = Path(self.temp_dir, "state.json")
+        self.store = JournalStore(self.path, "state")
+        self.tables = {"functions": {"a": {"hash": "1"}, "b": {"hash": "2"}}, "layers": {"c": {"hash": "3"}}}
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def _lines(self):
+        return self.path.read_text().splitlines()
+
+    def test_load_missing_file_returns_empty_tables(self):
+        self.assertEqual(self.store.load(), {})
+        self.assertFalse(self.store.exists())
+
+    def test_save_and_load(self):
+        self.store.save(self.tables)
+
+        self.assertEqual(json.loads(self._lines()[0]), {"kind": "state", "version": JOURNAL_FORMAT_VERSION})
+        self.assertEqual(len(self._lines()), 4)
+        self.assertEqual(JournalStore(self.path, "state").load(), self.tables)
+
+    def test_save_appends_changed_records_only(self):
+        self.store.save(self.tables)
+        self.tables["functions"]["a"] = {"hash": "updated"}
+        del self.tables["functions"]["b"]
+
+        self.store.save(self.tables)
+
+        lines = self._lines()
+        self.assertEqual(len(lines), 6)
+        self.assertEqual(
+            sorted(json.loads(line) for line in lines[4:]),
+            [["functions", "a", {"hash": "updated"}], ["functions", "b", None]],
+        )
+        self.assertEqual(JournalStore(self.path, "state").load(), self.tables)
+
+    def test_save_unchanged_tables_doesnt_write(self):
+        self.store.save(self.tables)
+        content = self.path.read_text()
+
+        JournalStore(self.path, "state").save(self.tables)
+
+        self.assertEqual(self.path.read_text(), content)
+
+    def test_stored_tables_are_not_changed_by_callers(self):
+        self.store.save(self.tables)
+        self.tables["functions"]["a"]["hash"] = "updated"
+
+        self.store.save(self.tables)
+
+        self.assertEqual(JournalStore(self.path, "state").load()["functions"]["a"], {"hash": "updated"})
+
+    def test_update_records(self):
+        self.store.save(self.tables)
+
+        self.store.update("layers", {"c": None, "d": {"hash": "4"}})
+
+        self.assertEqual(
+            JournalStore(self.path, "state").load(),
+            {"functions": self.tables["functions"], "layers": {"d": {"hash": "4"}}},
+        )
+
+    def test_update_creates_file(self):
+        self.store.update("layers", {"c": {"hash": "3"}})
+
+        self.assertEqual(JournalStore(self.path, "state").load(), {"layers": {"c": {"hash": "3"}}})
+
+    def test_reloads_file_changed_by_another_store(self):
+        self.store.save(self.tables)
+        JournalStore(self.path, "state").update("functions", {"a": {"hash": "other"}})
+
+        self.store.update("layers", {"c": {"hash": "updated"}})
+
+        tables = JournalStore(self.path, "state").load()
+        self.assertEqual(tables["functions"]["a"], {"hash": "other"})
+        self.assertEqual(tables["layers"]["c"], {"hash": "updated"})
+
+    @patch("samcli.lib.utils.journal_store.COMPACTION_MIN_SUPERSEDED_LINES", 2)
+    def test_compacts_superseded_lines(self):
+        self.store.save(self.tables)
+        for index in range(10):
+            self.store.update("functions", {"a": {"hash": str(index)}})
+
+        self.assertLessEqual(len(self._lines()), 1 + 2 * 3 + 2)
+        self.assertEqual(JournalStore(self.path, "state").load()["functions"]["a"], {"hash": "9"})
+
+    def test_ignores_partial_lines(self):
+        self.store.save(self.tables)
+        with open(self.path, "a") as file:
+            file.write('["functions","a",{"ha')
+
+        self.assertEqual(JournalStore(self.path, "state").load(), self.tables)
+
+    def test_ignores_file_of_other_kind_or_version(self):
+        self.path.write_text(json.dumps({"kind": "other", "version": JOURNAL_FORMAT_VERSION}) + "\n")
+        self.assertEqual(self.store.load(), {})
+
+        self.path.write_text(json.dumps({"kind": "state", "version": JOURNAL_FORMAT_VERSION + 1}) + "\n")
+        self.assertEqual(self.store.load(), {})
+
+        self.path.write_text("[function_build_definitions]\n")
+        self.assertEqual(self.store.load(), {})
+
+    def test_rewrites_file_of_other_format(self):
+        self.path.write_text("[function_build_definitions]\n")
+
+        self.store.save(self.tables)
+
+        self.assertEqual(JournalStore(self.path, "state").load(), self.tables)
@@ -0,0 +1,64 @@
+import threading
+from unittest import TestCase
+
+from samcli.lib.utils.phase_timer import PhaseRecorder, get_active_recorder, record_phase
+
+
+class TestPhaseRecorder(TestCase):
+    def test_must_not_record_without_active_recorder(self):
+        recorder = PhaseRecorder()
+
+        with record_phase("routing"):
+            pass
+
+        self.assertIsNone(get_active_recorder())
+        self.assertEqual(recorder.records, [])
+
+    def test_must_record_phases_of_active_recorder(self):
+        recorder = PhaseRecorder()
+
+        with recorder.activate():
+            with record_phase("routing"):
+                pass
+            with record_phase("rie_round_trip", resource="container1"):
+                pass
+            with record_phase("rie_round_trip", resource="container2"):
+                pass
+        with record_phase("routing"):
+            pass
+
+        self.assertEqual([record.phase for record in recorder.records], ["routing", "rie_round_trip", "rie_round_trip"])
+        self.assertEqual(set(recorder.get_durations()), {"routing", "rie_round_trip"})
+        self.assertEqual(set(recorder.get_busy_times("rie_round_trip")), {"container1", "container2"})
+        self.assertEqual(recorder.get_busy_times("routing"), {})
+
+    def test_must_record_failed_phases(self):
+        recorder = PhaseRecorder()
+
+        with recorder.activate():
+            with self.assertRaises(ValueError):
+                with record_phase("response_parsing"):
+                    raise ValueError()
+
+        self.assertEqual(list(recorder.get_durations()), ["response_parsing"])
+
+    def test_recorder_is_active_in_its_thread_only(self):
+        recorder = PhaseRecorder()
+        other_thread_recorders = []
+
+        with recorder.activate():
+            thread = threading.Thread(target=lambda: other_thread_recorders.append(get_active_recorder()))
+            thread.start()
+            thread.join()
+            self.assertIs(get_active_recorder(), recorder)
+
+        self.assertEqual(other_thread_recorders, [None])
+
+    def test_must_restore_previous_recorder(self):
+        outer_recorder = PhaseRecorder()
+        inner_recorder = PhaseRecorder()
+
+        with outer_recorder.activate():
+            with inner_recorder.activate():
+                self.assertIs(get_active_recorder(), inner_recorder)
+            self.assertIs(get_active_recorder(), outer_recorder)
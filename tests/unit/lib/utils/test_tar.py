@@ -1,10 +1,22 @@
 import io
-from unittest import TestCase
+import os
+import shutil
+import stat
+import tempfile
+from unittest import TestCase, skipIf
 import tarfile
 from unittest.mock import MagicMock, Mock, patch, call
 from parameterized import parameterized
 
-from samcli.lib.utils.tar import _validate_destinations_exists, extract_tarfile, create_tarball, _is_within_directory
+from tests.testing_utils import IS_WINDOWS
+
+from samcli.lib.utils.tar import (
+    _validate_destinations_exists,
+    extract_tarfile,
+    extract_tarfile_stream,
+    create_tarball,
+    _is_within_directory,
+)
 
 
 class TestTar(TestCase):
@@ -231,3 +243,128 @@ class TestTar(TestCase):
         result = _validate_destinations_exists(["mock_folder"])
 
         self.assertEqual(result, file_exists)
+
+
+class TestExtractTarfileStream(TestCase):
+    def setUp(self):
+        self.unpack_dir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        for root, dirs, _ in os.walk(self.unpack_dir):
+            for directory in dirs:
+                os.chmod(os.path.join(root, directory), stat.S_IRWXU)
+        shutil.rmtree(self.unpack_dir, ignore_errors=True)
+
+    @staticmethod
+    def _make_tarball(members):
+        tarball = io.BytesIO()
+        with tarfile.open(fileobj=tarball, mode="w") as tar:
+            for name, content, mode in members:
+                info = tarfile.TarInfo(name)
+                info.mode = mode
+                if content is None:
+                    info.type = tarfile.DIRTYPE
+                    tar.addfile(info)
+                else:
+                    info.size = len(content)
+                    tar.addfile(info, io.BytesIO(content))
+        return tarball.getvalue()
+
+    @staticmethod
+    def _chunks(data, chunk_size):
+        return (data[index : index + chunk_size] for index in range(0, len(data), chunk_size))
+
+    @parameterized.expand([(1,), (100,), (64 * 1024,)])
+    def test_extracts_tarfile_from_chunks(self, chunk_size):
+        tarball = self._make_tarball(
+            [("dir", None, 0o755), ("dir/file.txt", b"hello" * 1000, 0o644), ("other.txt", b"world", 0o644)]
+        )
+
+        extract_tarfile_stream(self._chunks(tarball, chunk_size), self.unpack_dir)
+
+        with open(os.path.join(self.unpack_dir, "dir", "file.txt"), "rb") as file:
+            self.assertEqual(file.read(), b"hello" * 1000)
+        with open(os.path.join(self.unpack_dir, "other.txt"), "rb") as file:
+            self.assertEqual(file.read(), b"world")
+
+    def test_extracts_into_read_only_directory(self):
+        tarball = self._make_tarball([("dir", None, 0o555), ("dir/file.txt", b"hello", 0o644)])
+
+        extract_tarfile_stream([tarball], self.unpack_dir)
+
+        directory = os.path.join(self.unpack_dir, "dir")
+        self.assertTrue(os.path.isfile(os.path.join(directory, "file.txt")))
+        self.assertEqual(stat.S_IMODE(os.stat(directory).st_mode), 0o555)
+
+    def test_raises_on_path_traversal(self):
+        tarball = self._make_tarball([("../outside.txt", b"hello", 0o644)])
+
+        with self.assertRaises(tarfile.ExtractError):
+            extract_tarfile_stream([tarball], self.unpack_dir)
+
+        self.assertFalse(os.path.exists(os.path.join(os.path.dirname(self.unpack_dir), "outside.txt")))
+
+    @staticmethod
+    def _make_tarball_with_links():
+        tarball = io.BytesIO()
+        with tarfile.open(fileobj=tarball, mode="w") as tar:
+            info = tarfile.TarInfo("node_modules/tool/cli.js")
+            info.size = len(b"cli")
+            tar.addfile(info, io.BytesIO(b"cli"))
+            info = tarfile.TarInfo("node_modules/.bin/tool")
+            info.type = tarfile.SYMTYPE
+            info.linkname = "../tool/cli.js"
+            tar.addfile(info)
+            info = tarfile.TarInfo("node_modules/tool/hardlink.js")
+            info.type = tarfile.LNKTYPE
+            info.linkname = "node_modules/tool/cli.js"
+            tar.addfile(info)
+            # symlink to a member which comes later in the archive
+            info = tarfile.TarInfo("later")
+            info.type = tarfile.SYMTYPE
+            info.linkname = "lib/later.js"
+            tar.addfile(info)
+            info = tarfile.TarInfo("lib/later.js")
+            info.size = len(b"later")
+            tar.addfile(info, io.BytesIO(b"later"))
+        return tarball.getvalue()
+
+    def _read(self, *path):
+        with open(os.path.join(self.unpack_dir, *path), "rb") as file:
+            return file.read()
+
+    @skipIf(IS_WINDOWS, "Creating symlinks needs a privilege on Windows")
+    def test_extracts_links(self):
+        extract_tarfile_stream(self._chunks(self._make_tarball_with_links(), 100), self.unpack_dir)
+
+        self.assertTrue(os.path.islink(os.path.join(self.unpack_dir, "node_modules", ".bin", "tool")))
+        self.assertEqual(self._read("node_modules", ".bin", "tool"), b"cli")
+        self.assertEqual(self._read("node_modules", "tool", "hardlink.js"), b"cli")
+        self.assertEqual(self._read("later"), b"later")
+
+    @patch("samcli.lib.utils.tar.os.link")
+    @patch("samcli.lib.utils.tar.os.symlink")
+    def test_copies_link_targets_if_links_cannot_be_created(self, symlink_mock, link_mock):
+        symlink_mock.side_effect = OSError("A required privilege is not held by the client")
+        link_mock.side_effect = OSError("Operation not permitted")
+
+        extract_tarfile_stream(self._chunks(self._make_tarball_with_links(), 100), self.unpack_dir)
+
+        self.assertFalse(os.path.islink(os.path.join(self.unpack_dir, "node_modules", ".bin", "tool")))
+        self.assertEqual(self._read("node_modules", ".bin", "tool"), b"cli")
+        self.assertEqual(self._read("node_modules", "tool", "hardlink.js"), b"cli")
+        self.assertEqual(self._read("later"), b"later")
+
+    @patch("samcli.lib.utils.tar.os.symlink")
+    def test_skips_links_to_targets_outside_of_the_archive(self, symlink_mock):
+        symlink_mock.side_effect = OSError("A required privilege is not held by the client")
+        tarball = io.BytesIO()
+        with tarfile.open(fileobj=tarball, mode="w") as tar:
+            info = tarfile.TarInfo("link")
+            info.type = tarfile.SYMTYPE
+            info.linkname = "../outside.txt"
+            tar.addfile(info)
+
+        extract_tarfile_stream([tarball.getvalue()], self.unpack_dir)
+
+        self.assertFalse(os.path.lexists(os.path.join(self.unpack_dir, "link")))
@@ -0,0 +1,166 @@
+import errno
+import os
+import shutil
+import tempfile
+from unittest import TestCase
+from unittest.mock import patch
+
+from samcli.lib.utils.tree_materializer import (
+    TREE_SNAPSHOT_FILE_NAME,
+    MaterializeMethod,
+    is_tree_snapshot_valid,
+    materialize_tree,
+    write_tree_snapshot,
+)
+
+
+class TestMaterializeTree(TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+        self.source = os.path.join(self.temp_dir, "source")
+        os.makedirs(os.path.join(self.source, "sub", "dir"))
+        self._write(os.path.join(self.source, "file.txt"), "content")
+        self._write(os.path.join(self.source, "sub", "dir", "nested.txt"), "nested")
+        self.destination = os.path.join(self.temp_dir, "destination")
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    @staticmethod
+    def _write(path, content):
+        with open(path, "w") as file:
+            file.write(content)
+
+    @staticmethod
+    def _read(path):
+        with open(path, "r") as file:
+            return file.read()
+
+    def _assert_materialized(self):
+        self.assertEqual(self._read(os.path.join(self.destination, "file.txt")), "content")
+        self.assertEqual(self._read(os.path.join(self.destination, "sub", "dir", "nested.txt")), "nested")
+        self.assertEqual(sorted(os.listdir(self.destination)), ["file.txt", "sub"])
+
+    @patch("samcli.lib.utils.tree_materializer._reflink", None)
+    def test_must_hardlink_files(self):
+        method = materialize_tree(self.source, self.destination)
+
+        self.assertEqual(method, MaterializeMethod.HARDLINK)
+        self._assert_materialized()
+        self.assertTrue(
+            os.path.samefile(os.path.join(self.source, "file.txt"), os.path.join(self.destination, "file.txt"))
+        )
+
+    @patch("samcli.lib.utils.tree_materializer._reflink", None)
+    def test_must_copy_files_if_hardlinks_are_not_allowed(self):
+        method = materialize_tree(self.source, self.destination, allow_hardlinks=False)
+
+        self.assertEqual(method, MaterializeMethod.COPY)
+        self._assert_materialized()
+        self.assertFalse(
+            os.path.samefile(os.path.join(self.source, "file.txt"), os.path.join(self.destination, "file.txt"))
+        )
+
+    @patch("samcli.lib.utils.tree_materializer._reflink")
+    @patch("samcli.lib.utils.tree_materializer.os.link")
+    def test_must_fall_back_to_copy_if_files_cant_be_cloned_or_linked(self, link_mock, reflink_mock):
+        reflink_mock.side_effect = OSError(errno.EOPNOTSUPP, "not supported")
+        link_mock.side_effect = OSError(errno.EXDEV, "cross device")
+
+        method = materialize_tree(self.source, self.destination)
+
+        self.assertEqual(method, MaterializeMethod.COPY)
+        self._assert_materialized()
+        # unsupported methods are tried once per tree
+        reflink_mock.assert_called_once()
+        link_mock.assert_called_once()
+
+    @patch("samcli.lib.utils.tree_materializer._reflink")
+    def test_must_clone_files(self, reflink_mock):
+        reflink_mock.side_effect = shutil.copyfile
+
+        method = materialize_tree(self.source, self.destination)
+
+        self.assertEqual(method, MaterializeMethod.REFLINK)
+        self._assert_materialized()
+        self.assertEqual(reflink_mock.call_count, 2)
+
+    def test_must_replace_destination_content(self):
+        os.makedirs(self.destination)
+        self._write(os.path.join(self.destination, "stale.txt"), "stale")
+
+        materialize_tree(self.source, self.destination)
+
+        self._assert_materialized()
+        self.assertEqual(sorted(os.listdir(self.temp_dir)), ["destination", "source"])
+
+    def test_must_replace_destination_symlink(self):
+        other_dir = os.path.join(self.temp_dir, "other")
+        os.makedirs(other_dir)
+        os.symlink(other_dir, self.destination)
+
+        materialize_tree(self.source, self.destination)
+
+        self.assertFalse(os.path.islink(self.destination))
+        self._assert_materialized()
+        self.assertEqual(os.listdir(other_dir), [])
+
+    def test_must_not_materialize_snapshot(self):
+        write_tree_snapshot(self.source)
+
+        materialize_tree(self.source, self.destination)
+
+        self._assert_materialized()
+
+    @patch("samcli.lib.utils.tree_materializer.shutil.copy2")
+    @patch("samcli.lib.utils.tree_materializer._reflink", None)
+    def test_must_keep_destination_if_copy_fails(self, copy_mock):
+        copy_mock.side_effect = OSError(errno.ENOSPC, "no space left")
+        os.makedirs(self.destination)
+        self._write(os.path.join(self.destination, "previous.txt"), "previous")
+
+        with self.assertRaises(OSError):
+            materialize_tree(self.source, self.destination, allow_hardlinks=False)
+
+        self.assertEqual(os.listdir(self.destination), ["previous.txt"])
+        self.assertEqual(sorted(os.listdir(self.temp_dir)), ["destination", "source"])
+
+
+class TestTreeSnapshot(TestCase):
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        os.makedirs(os.path.join(self.directory, "sub"))
+        self.file_path = os.path.join(self.directory, "sub", "file.txt")
+        with open(self.file_path, "w") as file:
+            file.write("content")
+
+    def tearDown(self):
+        shutil.rmtree(self.directory, ignore_errors=True)
+
+    def test_directory_without_snapshot_is_valid(self):
+        self.assertTrue(is_tree_snapshot_valid(self.directory))
+
+    def test_unmodified_directory_is_valid(self):
+        write_tree_snapshot(self.directory)
+
+        self.assertTrue(os.path.isfile(os.path.join(self.directory, TREE_SNAPSHOT_FILE_NAME)))
+        self.assertTrue(is_tree_snapshot_valid(self.directory))
+
+    def test_directory_with_file_modified_in_place_is_invalid(self):
+        write_tree_snapshot(self.directory)
+        with open(self.file_path, "a") as file:
+            file.write(" modified")
+
+        self.assertFalse(is_tree_snapshot_valid(self.directory))
+
+    def test_directory_with_deleted_file_is_invalid(self):
+        write_tree_snapshot(self.directory)
+        os.remove(self.file_path)
+
+        self.assertFalse(is_tree_snapshot_valid(self.directory))
+
+    def test_directory_with_corrupted_snapshot_is_invalid(self):
+        with open(os.path.join(self.directory, TREE_SNAPSHOT_FILE_NAME), "w") as snapshot_file:
+            snapshot_file.write("{")
+
+        self.assertFalse(is_tree_snapshot_valid(self.directory))
@@ -377,7 +377,7 @@ class TestApiGatewayService(TestCase):
         self.assertEqual(service._dict_of_routes["/<path:any_path>:OPTIONS"].function_name, function_name_3)
         self.assertEqual(service._dict_of_routes["/<path:any_path>:PATCH"].function_name, function_name_3)
 
-    @patch("samcli.local.apigw.local_apigw_service.Flask")
+    @patch("samcli.local.apigw.local_apigw_service.RouteIndexFlask")
     def test_create_creates_flask_app_with_url_rules(self, flask):
         app_mock = MagicMock()
         app_mock.config = {}
@@ -387,13 +387,128 @@ class TestApiGatewayService(TestCase):
 
         self.api_service.create()
 
-        app_mock.add_url_rule.assert_called_once_with(
-            "/",
-            endpoint="/",
-            view_func=self.api_service._request_handler,
-            methods=["GET"],
-            provide_automatic_options=False,
+        app_mock.add_url_rule.assert_not_called()
+        self.assertEqual(app_mock.view_functions.__setitem__.call_args[0], ("/", self.api_service._request_handler))
+        self.assertEqual(self.api_service._route_index.match("GET", "/").route, self.api_gateway_route)
+
+    @patch("samcli.local.apigw.local_apigw_service.RouteIndexFlask")
+    def test_create_adds_url_rule_for_unsupported_paths(self, flask):
+        app_mock = MagicMock()
+        app_mock.config = {}
+        flask.return_value = app_mock
+        route = Route(methods=["GET"], function_name=self.function_name, path="/file.{ext}")
+        service = LocalApigwService(Api(routes=[route]), self.lambda_runner)
+
+        service.create()
+
+        rule = app_mock.url_map.add.call_args[0][0]
+        self.assertEqual((rule.rule, rule.endpoint, rule.methods), ("/file.<ext>", "/file.<ext>", {"GET", "HEAD"}))
+        app_mock.view_functions.__setitem__.assert_called_once_with("/file.<ext>", service._request_handler)
+        self.assertIsNone(service._route_index.match("GET", "/file.txt"))
+
+    def test_create_dispatches_requests_with_route_index(self):
+        routes = [
+            Route(methods=["GET"], function_name="static", path="/users/me"),
+            Route(methods=["GET"], function_name="parameter", path="/users/{id}"),
+            Route(methods=["ANY"], function_name="proxy", path="/users/{proxy+}"),
+        ]
+        service = LocalApigwService(Api(routes=routes), self.lambda_runner)
+        service._request_handler = Mock(
+            side_effect=lambda **kwargs: json.dumps(
+                {
+                    "endpoint": flask.request.endpoint,
+                    "view_args": kwargs,
+                    "route": service._get_current_route(flask.request).function_name,
+                }
+            )
         )
+        service.create()
+        client = service._app.test_client()
+
+        self.assertEqual(
+            json.loads(client.get("/users/me").data),
+            {"endpoint": "/users/me", "view_args": {}, "route": "static"},
+        )
+        self.assertEqual(
+            json.loads(client.get("/users/42/").data),
+            {"endpoint": "/users/<id>", "view_args": {"id": "42"}, "route": "parameter"},
+        )
+        self.assertEqual(
+            json.loads(client.post("/users/42").data),
+            {"endpoint": "/users/<path:proxy>", "view_args": {"proxy": "42"}, "route": "proxy"},
+        )
+        # API Gateway responds to unknown routes with 403
+        self.assertEqual(client.get("/groups").status_code, 403)
+
+    def test_head_requests_are_handled_by_get_routes(self):
+        routes = [
+            Route(methods=["GET"], function_name="static", path="/users/me"),
+            Route(methods=["GET"], function_name="file", path="/file.{ext}"),
+        ]
+        service = LocalApigwService(Api(routes=routes), self.lambda_runner)
+        handled_routes = []
+
+        def request_handler(**kwargs):
+            handled_routes.append(service._get_current_route(flask.request).function_name)
+            return ""
+
+        service._request_handler = Mock(side_effect=request_handler)
+        service.create()
+        client = service._app.test_client()
+
+        self.assertEqual(client.head("/users/me").status_code, 200)
+        self.assertEqual(client.head("/file.txt").status_code, 200)
+        self.assertEqual(handled_routes, ["static", "file"])
+
+    def test_update_api_updates_routes_of_running_service(self):
+        static_route = Route(methods=["GET"], function_name="static", path="/users/me")
+        parameter_route = Route(methods=["GET"], function_name="parameter", path="/users/{id}")
+        file_route = Route(methods=["GET"], function_name="file", path="/file.{ext}")
+        service = LocalApigwService(Api(routes=[static_route, parameter_route, file_route]), self.lambda_runner)
+
+        def request_handler(**kwargs):
+            try:
+                return service._get_current_route(flask.request).function_name
+            except KeyError:
+                # the Flask rules of the removed routes are kept, but their routes are not found anymore
+                return "", 403
+
+        service._request_handler = Mock(side_effect=request_handler)
+        service.create()
+        client = service._app.test_client()
+        self.assertEqual(client.get("/users/me").data, b"static")
+
+        updated_route = Route(methods=["GET"], function_name="updated", path="/users/me")
+        added_route = Route(methods=["POST"], function_name="added", path="/orders/{id}/{proxy+}")
+        added_file_route = Route(methods=["GET"], function_name="added_file", path="/image.{ext}")
+        default_route = Route(methods=["ANY"], function_name="default", path="$default", event_type=Route.HTTP)
+        service.update_api(
+            Api(
+                routes=[
+                    updated_route,
+                    Route(methods=["GET"], function_name="parameter", path="/users/{id}"),
+                    added_route,
+                    added_file_route,
+                    default_route,
+                ]
+            )
+        )
+
+        self.assertEqual(client.get("/users/me").data, b"updated")
+        self.assertEqual(client.get("/users/42").data, b"parameter")
+        self.assertEqual(client.post("/orders/1/items/2").data, b"added")
+        self.assertEqual(client.get("/image.png").data, b"added_file")
+        self.assertEqual(client.get("/file.txt").data, b"default")
+        self.assertEqual(client.delete("/").data, b"default")
+        self.assertIs(service._dict_of_routes["/users/<id>:GET"], parameter_route)
+
+        service.update_api(Api(routes=[updated_route]))
+
+        self.assertEqual(client.get("/users/me").data, b"updated")
+        self.assertEqual(client.get("/users/42").status_code, 403)
+        self.assertEqual(client.get("/image.png").status_code, 403)
+        self.assertEqual(client.delete("/").status_code, 403)
+        self.assertEqual(service._catch_all_routes, [])
 
     def test_api_initalize_creates_default_values(self):
         self.assertEqual(self.api_service.port, 3000)
@@ -516,13 +631,14 @@ class TestApiGatewayService(TestCase):
         self.assertEqual(result, failure_response_mock)
 
     @patch("samcli.local.apigw.local_apigw_service.ServiceErrorResponses")
-    def test_request_handler_errors_when_get_current_route_fails(self, service_error_responses_patch):
+    def test_request_handler_returns_not_found_when_get_current_route_fails(self, service_error_responses_patch):
         get_current_route = Mock()
         get_current_route.side_effect = KeyError()
         self.api_service._get_current_route = get_current_route
 
-        with self.assertRaises(KeyError):
-            self.api_service._request_handler()
+        result = self.api_service._request_handler()
+
+        self.assertEqual(result, service_error_responses_patch.route_not_found.return_value)
 
     @patch.object(LocalApigwService, "get_request_methods_endpoints")
     @patch("samcli.local.apigw.local_apigw_service.ServiceErrorResponses")
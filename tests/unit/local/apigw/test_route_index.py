@@ -0,0 +1,129 @@
+from unittest import TestCase
+
+from parameterized import parameterized
+
+from samcli.local.apigw.route import Route
+from samcli.local.apigw.route_index import RouteIndex
+
+
+class TestRouteIndex(TestCase):
+    def setUp(self):
+        self.routes = {
+            path: Route(function_name=path, path=path, methods=["GET"])
+            for path in [
+                "/",
+                "/users",
+                "/users/me",
+                "/users/{id}",
+                "/users/{id}/orders/{order_id}",
+                "/users/{proxy+}",
+                "/{proxy+}",
+            ]
+        }
+        self.route_index = RouteIndex()
+        for path, route in self.routes.items():
+            self.route_index.add(path, route.methods, route)
+
+    @parameterized.expand(
+        [
+            ("/", "/", "/", {}),
+            ("/users", "/users", "/users", {}),
+            ("/users/", "/users", "/users", {}),
+            ("/users/me", "/users/me", "/users/me", {}),
+            ("/users/42", "/users/{id}", "/users/<id>", {"id": "42"}),
+            (
+                "/users/42/orders/7",
+                "/users/{id}/orders/{order_id}",
+                "/users/<id>/orders/<order_id>",
+                {"id": "42", "order_id": "7"},
+            ),
+            ("/users/42/orders", "/users/{proxy+}", "/users/<path:proxy>", {"proxy": "42/orders"}),
+            ("/users/42/orders/7/items", "/users/{proxy+}", "/users/<path:proxy>", {"proxy": "42/orders/7/items"}),
+            ("/groups/1", "/{proxy+}", "/<path:proxy>", {"proxy": "groups/1"}),
+        ]
+    )
+    def test_must_match_in_precedence_order(self, request_path, route_path, endpoint, path_parameters):
+        route_match = self.route_index.match("GET", request_path)
+
+        self.assertIs(route_match.route, self.routes[route_path])
+        self.assertEqual(route_match.endpoint, endpoint)
+        self.assertEqual(route_match.path_parameters, path_parameters)
+
+    def test_must_fall_back_to_less_specific_route_of_the_method(self):
+        post_route = Route(function_name="post", path="/users/{proxy+}", methods=["POST"])
+        self.route_index.add("/users/{proxy+}", post_route.methods, post_route)
+
+        self.assertIs(self.route_index.match("POST", "/users/me").route, post_route)
+        self.assertIs(self.route_index.match("GET", "/users/me").route, self.routes["/users/me"])
+
+    def test_must_not_match_unknown_method(self):
+        self.assertIsNone(self.route_index.match("DELETE", "/users/me"))
+
+    def test_head_must_fall_back_to_get_route(self):
+        self.assertIs(self.route_index.match("HEAD", "/users/me").route, self.routes["/users/me"])
+        self.assertIs(self.route_index.match("HEAD", "/users/42/orders").route, self.routes["/users/{proxy+}"])
+
+        head_route = Route(function_name="head", path="/users/me", methods=["HEAD"])
+        self.route_index.add("/users/me", head_route.methods, head_route)
+
+        self.assertIs(self.route_index.match("HEAD", "/users/me").route, head_route)
+
+    def test_greedy_parameter_requires_a_segment(self):
+        route_index = RouteIndex()
+        route = Route(function_name="proxy", path="/users/{proxy+}", methods=["GET"])
+        route_index.add(route.path, route.methods, route)
+
+        self.assertIsNone(route_index.match("GET", "/users"))
+        self.assertIsNone(route_index.match("GET", "/"))
+
+    def test_later_route_replaces_previous_one(self):
+        route = Route(function_name="other", path="/users", methods=["GET"])
+        self.route_index.add("/users", route.methods, route)
+
+        self.assertIs(self.route_index.match("GET", "/users").route, route)
+
+    def test_must_remove_routes_of_methods(self):
+        self.route_index.remove("/users/me", ["GET"])
+        self.route_index.remove("/users/{proxy+}", ["GET"])
+        self.route_index.remove("/unknown/{id}", ["GET"])
+
+        self.assertIs(self.route_index.match("GET", "/users/me").route, self.routes["/users/{id}"])
+        self.assertIs(self.route_index.match("GET", "/users/42/orders").route, self.routes["/{proxy+}"])
+
+    @parameterized.expand(
+        [
+            ("/users/{id}", True),
+            ("/users/{proxy+}", True),
+            ("/", True),
+            ("/file.{ext}", False),
+            ("/users/{proxy+}/orders", False),
+        ]
+    )
+    def test_is_supported_path(self, path, is_supported):
+        self.assertEqual(RouteIndex.is_supported_path(path), is_supported)
+
+
+class TestRouteIndexManyRoutes(TestCase):
+    ROUTE_COUNT = 10000
+
+    def test_must_build_and_match_ten_thousand_routes(self):
+        routes = []
+        for service in range(self.ROUTE_COUNT // 4):
+            routes += [
+                Route(function_name=f"list{service}", path=f"/svc{service}/items", methods=["GET"]),
+                Route(function_name=f"item{service}", path=f"/svc{service}/items/{{id}}", methods=["GET", "PUT"]),
+                Route(
+                    function_name=f"sub{service}", path=f"/svc{service}/items/{{id}}/sub/{{sub_id}}", methods=["GET"]
+                ),
+                Route(function_name=f"proxy{service}", path=f"/svc{service}/{{proxy+}}", methods=["POST"]),
+            ]
+
+        route_index = RouteIndex()
+        for route in routes:
+            route_index.add(route.path, route.methods, route)
+
+        for service in range(self.ROUTE_COUNT // 4):
+            route_match = route_index.match("GET", f"/svc{service}/items/42/sub/7")
+            self.assertEqual(route_match.route.function_name, f"sub{service}")
+            route_match = route_index.match("POST", f"/svc{service}/items/42")
+            self.assertEqual(route_match.route.function_name, f"proxy{service}")
@@ -903,6 +903,42 @@ class TestContainer_write_container_output(TestCase):
 
         self.stderr_mock.write_str.assert_not_called()  # stderr must never be called
 
+    def test_must_set_event_on_end_of_invoke_marker(self):
+        event = Mock()
+        output_itr = [
+            (None, b"START RequestId: 1 Version: $LATEST\nsome log\nEND RequestId: 1\n"),
+            (None, b"REPORT RequestId: 1 Init Duration: 0.1 ms Duration: 1.2 ms Billed Duration: 2 ms "),
+            (None, b"Memory Size: 128 MB Max Memory Used: 128 MB\n"),
+        ]
+
+        Container._write_container_output(output_itr, stderr=self.stderr_mock, event=event)
+
+        event.set.assert_called_once_with()
+
+    def test_must_set_event_on_marker_after_other_log_lines(self):
+        event = Mock()
+        output_itr = [
+            (
+                None,
+                b"log1\nlog2\nEND RequestId: 1\n"
+                b"REPORT RequestId: 1 Duration: 1.2 ms Billed Duration: 2 ms Memory Size: 128 MB "
+                b"Max Memory Used: 128 MB\n",
+            ),
+        ]
+
+        Container._write_container_output(output_itr, stderr=self.stderr_mock, event=event)
+
+        event.set.assert_called_once_with()
+
+    def test_must_not_set_event_without_marker(self):
+        event = Mock()
+
+        Container._write_container_output(
+            self.output_itr, stdout=self.stdout_mock, stderr=self.stderr_mock, event=event
+        )
+
+        event.set.assert_not_called()
+
 
 class TestContainer_wait_for_socket_connection(TestCase):
     def setUp(self):
@@ -960,9 +996,8 @@ class TestContainer_copy(TestCase):
         self.container = Container(IMAGE, "cmd", "dir", "dir", docker_client=self.mock_client)
         self.container.id = "containerid"
 
-    @patch("samcli.local.docker.container.tempfile")
-    @patch("samcli.local.docker.container.extract_tarfile")
-    def test_must_copy_files_from_container(self, extract_tarfile_mock, tempfile_mock):
+    @patch("samcli.local.docker.container.extract_tarfile_stream")
+    def test_must_copy_files_from_container(self, extract_tarfile_stream_mock):
         source = "source"
         dest = "dest"
 
@@ -970,17 +1005,11 @@ class TestContainer_copy(TestCase):
         real_container_mock = self.mock_client.containers.get.return_value = Mock()
         real_container_mock.get_archive.return_value = (tar_stream, "ignored")
 
-        tempfile_ctxmgr = tempfile_mock.NamedTemporaryFile.return_value = Mock()
-        fp_mock = Mock()
-        tempfile_ctxmgr.__enter__ = Mock(return_value=fp_mock)
-        tempfile_ctxmgr.__exit__ = Mock()
-
         self.container.copy(source, dest)
 
-        extract_tarfile_mock.assert_called_with(file_obj=fp_mock, unpack_dir=dest)
-
-        # Make sure archive data is written to the file
-        fp_mock.write.assert_has_calls([call(x) for x in tar_stream], any_order=False)
+        real_container_mock.get_archive.assert_called_once_with(source)
+        # Make sure archive data is extracted while it is streamed, without a temporary file
+        extract_tarfile_stream_mock.assert_called_once_with(tar_stream, unpack_dir=dest)
 
         # Make sure we open the tarfile right and extract to right location
 
@@ -0,0 +1,175 @@
+import os
+import shutil
+import tempfile
+from unittest import TestCase
+from unittest.mock import Mock, patch
+
+from samcli.local.docker.lambda_build_container_pool import (
+    BUILD_CACHE_DIR,
+    BUILD_CACHE_VOLUME_NAME,
+    LambdaBuildContainerPool,
+    PersistentBuildContainer,
+)
+
+
+class TestPersistentBuildContainer_get_container_dirs(TestCase):
+    def setUp(self):
+        self.project_dir = tempfile.mkdtemp()
+        self.source_dir = os.path.join(self.project_dir, "src", "function")
+        os.makedirs(self.source_dir)
+
+    def tearDown(self):
+        shutil.rmtree(self.project_dir, ignore_errors=True)
+
+    def test_must_map_dirs_inside_project(self):
+        result = PersistentBuildContainer.get_container_dirs(self.source_dir, self.project_dir, self.project_dir)
+
+        self.assertEqual(result["source_dir"], "/tmp/samcli/project/src/function")
+        self.assertEqual(result["manifest_dir"], "/tmp/samcli/project")
+        self.assertTrue(result["base_dir"].startswith("/tmp/samcli/builds/"))
+        self.assertEqual(result["artifacts_dir"], result["base_dir"] + "/artifacts")
+        self.assertEqual(result["scratch_dir"], result["base_dir"] + "/scratch")
+
+    def test_must_use_different_build_dirs_per_build(self):
+        first = PersistentBuildContainer.get_container_dirs(self.source_dir, self.source_dir, self.project_dir)
+        second = PersistentBuildContainer.get_container_dirs(self.source_dir, self.source_dir, self.project_dir)
+
+        self.assertNotEqual(first["base_dir"], second["base_dir"])
+
+    def test_must_return_none_for_dirs_outside_project(self):
+        other_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, other_dir, True)
+
+        self.assertIsNone(PersistentBuildContainer.get_container_dirs(other_dir, self.source_dir, self.project_dir))
+        self.assertIsNone(PersistentBuildContainer.get_container_dirs(self.source_dir, other_dir, self.project_dir))
+
+    def test_must_return_none_if_source_contains_symlinks(self):
+        other_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, other_dir, True)
+        os.symlink(other_dir, os.path.join(self.source_dir, "shared"))
+
+        self.assertIsNone(
+            PersistentBuildContainer.get_container_dirs(self.source_dir, self.source_dir, self.project_dir)
+        )
+
+
+class TestPersistentBuildContainer(TestCase):
+    @patch("samcli.local.docker.container.find_free_port", Mock(return_value=5000))
+    def setUp(self):
+        self.docker_client = Mock()
+        self.container = PersistentBuildContainer("image", "/project", docker_client=self.docker_client)
+        self.container.id = "container_id"
+
+    def test_must_mount_build_cache_volume(self):
+        self.assertEqual(
+            self.container._additional_volumes, {BUILD_CACHE_VOLUME_NAME: {"bind": BUILD_CACHE_DIR, "mode": "rw"}}
+        )
+        self.assertEqual(self.container._env_vars["PIP_CACHE_DIR"], f"{BUILD_CACHE_DIR}/pip")
+
+    def test_must_exec_build(self):
+        build_container = Mock(entrypoint=["lambda-builders", "request"], env_vars={"key": "value"})
+        self.docker_client.api.exec_create.return_value = {"Id": "exec_id"}
+        self.docker_client.api.exec_start.return_value = iter([(b"response", None), (None, b"logs")])
+        self.docker_client.api.exec_inspect.return_value = {"ExitCode": 0}
+        stdout = Mock()
+        stderr = Mock()
+
+        with patch.object(PersistentBuildContainer, "_write_container_output") as write_container_output_mock:
+            exit_code = self.container.exec_build(build_container, stdout, stderr)
+
+        self.assertEqual(exit_code, 0)
+        self.docker_client.api.exec_create.assert_called_once_with(
+            "container_id", ["lambda-builders", "request"], environment={"key": "value"}, workdir="/tmp/samcli/project"
+        )
+        self.docker_client.api.exec_start.assert_called_once_with({"Id": "exec_id"}, stream=True, demux=True)
+        write_container_output_mock.assert_called_once_with(
+            self.docker_client.api.exec_start.return_value, stdout=stdout, stderr=stderr
+        )
+
+    def test_must_clean_build_dirs(self):
+        self.docker_client.api.exec_start.return_value = iter([])
+
+        self.container.clean({"base_dir": "/tmp/samcli/builds/id"})
+
+        self.docker_client.api.exec_create.assert_called_once_with(
+            "container_id", ["rm", "-rf", "/tmp/samcli/builds/id"], environment=None, workdir="/tmp/samcli/project"
+        )
+
+
+@patch("samcli.local.docker.lambda_build_container_pool.PersistentBuildContainer")
+class TestLambdaBuildContainerPool(TestCase):
+    def setUp(self):
+        self.container_manager = Mock()
+        self.pool = LambdaBuildContainerPool(self.container_manager, "/project")
+
+    def test_must_reuse_idle_container(self, PersistentBuildContainerMock):
+        with self.pool.acquire("image") as first_container:
+            pass
+        with self.pool.acquire("image") as second_container:
+            pass
+
+        self.assertIs(first_container, second_container)
+        PersistentBuildContainerMock.assert_called_once_with("image", "/project")
+        self.container_manager.run.assert_called_once_with(first_container)
+
+    def test_must_start_new_container_if_all_are_busy(self, PersistentBuildContainerMock):
+        PersistentBuildContainerMock.side_effect = [Mock(), Mock()]
+
+        with self.pool.acquire("image") as first_container:
+            with self.pool.acquire("image") as second_container:
+                pass
+
+        self.assertIsNot(first_container, second_container)
+        self.assertEqual(self.container_manager.run.call_count, 2)
+
+    def test_must_use_different_containers_per_image(self, PersistentBuildContainerMock):
+        PersistentBuildContainerMock.side_effect = [Mock(), Mock()]
+
+        with self.pool.acquire("image1") as first_container:
+            pass
+        with self.pool.acquire("image2") as second_container:
+            pass
+
+        self.assertIsNot(first_container, second_container)
+
+    def test_must_keep_running_container_after_failed_build(self, PersistentBuildContainerMock):
+        container = PersistentBuildContainerMock.return_value
+        container.is_running.return_value = True
+
+        with self.assertRaises(ValueError):
+            with self.pool.acquire("image"):
+                raise ValueError()
+        with self.pool.acquire("image") as next_container:
+            pass
+
+        self.assertIs(container, next_container)
+        self.container_manager.stop.assert_not_called()
+
+    def test_must_drop_stopped_container(self, PersistentBuildContainerMock):
+        stopped_container = Mock()
+        stopped_container.is_running.return_value = False
+        PersistentBuildContainerMock.side_effect = [stopped_container, Mock()]
+
+        with self.assertRaises(ValueError):
+            with self.pool.acquire("image"):
+                raise ValueError()
+        with self.pool.acquire("image") as next_container:
+            pass
+
+        self.assertIsNot(stopped_container, next_container)
+        self.container_manager.stop.assert_called_once_with(stopped_container)
+
+    def test_must_stop_all_containers_on_shutdown(self, PersistentBuildContainerMock):
+        first_container = Mock()
+        second_container = Mock()
+        PersistentBuildContainerMock.side_effect = [first_container, second_container]
+        self.container_manager.stop.side_effect = [Exception("failed"), None]
+
+        with self.pool.acquire("image1"):
+            pass
+        with self.pool.acquire("image2"):
+            pass
+        self.pool.shutdown()
+
+        self.container_manager.stop.assert_any_call(first_container)
+        self.container_manager.stop.assert_any_call(second_container)
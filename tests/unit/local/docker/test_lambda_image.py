@@ -289,6 +289,37 @@ class TestLambdaImage(TestCase):
             stream=stream,
         )
 
+    @patch("samcli.local.docker.lambda_image.LambdaImage._build_image")
+    @patch("samcli.local.docker.lambda_image.LambdaImage._check_base_image_is_current")
+    def test_force_building_same_image_only_once(self, check_base_image_patch, build_image_patch):
+        docker_client_mock = Mock()
+        stream = Mock()
+
+        lambda_image = LambdaImage(Mock(), False, True, docker_client=docker_client_mock)
+        for _ in range(3):
+            lambda_image.build("python3.12", ZIP, None, [], X86_64, stream=stream, function_name="function")
+        lambda_image.build("python3.12", ZIP, None, [], ARM64, stream=stream, function_name="function")
+
+        build_image_patch.assert_has_calls(
+            [
+                call(
+                    "public.ecr.aws/lambda/python:3.12-x86_64",
+                    "public.ecr.aws/lambda/python:3.12-rapid-x86_64",
+                    [],
+                    X86_64,
+                    stream=stream,
+                ),
+                call(
+                    "public.ecr.aws/lambda/python:3.12-arm64",
+                    "public.ecr.aws/lambda/python:3.12-rapid-arm64",
+                    [],
+                    ARM64,
+                    stream=stream,
+                ),
+            ]
+        )
+        self.assertEqual(build_image_patch.call_count, 2)
+
     @parameterized.expand(
         [
             ("python3.12", "python:3.12-x86_64", "public.ecr.aws/lambda/python:3.12-x86_64"),
@@ -279,6 +279,30 @@ class TestContainerManager_pull_image(TestCase):
         # assert that general lock have been used three times for all the image pulls
         mock_lock.assert_has_calls(3 * [call.__enter__(), call.__exit__(ANY, ANY, ANY)], any_order=True)
 
+    def test_must_pull_same_image_only_once(self):
+        self.mock_docker_client.api.pull.return_value = [1, 2, 3]
+
+        self.manager.pull_image("image1", stream=Mock())
+        self.manager.pull_image("image1:latest", stream=Mock())
+        self.manager.pull_image("image1:other", stream=Mock())
+
+        self.mock_docker_client.api.pull.assert_has_calls(
+            [
+                call("image1", tag="latest", stream=True, decode=True),
+                call("image1", tag="other", stream=True, decode=True),
+            ]
+        )
+        self.assertEqual(self.mock_docker_client.api.pull.call_count, 2)
+
+    def test_must_pull_again_if_previous_pull_failed(self):
+        self.mock_docker_client.api.pull.side_effect = [APIError("error"), [1]]
+
+        with self.assertRaises(DockerImagePullFailedException):
+            self.manager.pull_image("image1", stream=Mock())
+        self.manager.pull_image("image1", stream=Mock())
+
+        self.assertEqual(self.mock_docker_client.api.pull.call_count, 2)
+
 
 class TestContainerManager_is_docker_reachable(TestCase):
 
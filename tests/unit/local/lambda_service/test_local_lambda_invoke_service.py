@@ -1,9 +1,18 @@
+import json
+import threading
+import time
 from unittest import TestCase
 from unittest.mock import Mock, patch, ANY, call
 
+import flask
+
 from samcli.local.docker.exceptions import DockerContainerCreationFailedException
 from samcli.local.lambda_service import local_lambda_invoke_service
-from samcli.local.lambda_service.local_lambda_invoke_service import LocalLambdaInvokeService, FunctionNamePathConverter
+from samcli.local.lambda_service.local_lambda_invoke_service import (
+    LocalLambdaInvokeService,
+    FunctionNamePathConverter,
+    _read_batch_events,
+)
 from samcli.local.lambdafn.exceptions import FunctionNotFound
 from samcli.commands.local.lib.exceptions import UnsupportedInlineCodeError
 
@@ -40,12 +49,23 @@ class TestLocalLambdaService(TestCase):
 
         service.create()
 
-        app_mock.add_url_rule.assert_called_once_with(
-            "/2015-03-31/functions/<function_path:function_name>/invocations",
-            endpoint="/2015-03-31/functions/<function_path:function_name>/invocations",
-            view_func=service._invoke_request_handler,
-            methods=["POST"],
-            provide_automatic_options=False,
+        app_mock.add_url_rule.assert_has_calls(
+            [
+                call(
+                    "/2015-03-31/functions/<function_path:function_name>/invocations",
+                    endpoint="/2015-03-31/functions/<function_path:function_name>/invocations",
+                    view_func=service._invoke_request_handler,
+                    methods=["POST"],
+                    provide_automatic_options=False,
+                ),
+                call(
+                    "/2015-03-31/batch-invocations",
+                    endpoint="/2015-03-31/batch-invocations",
+                    view_func=service._invoke_batch_request_handler,
+                    methods=["POST"],
+                    provide_automatic_options=False,
+                ),
+            ]
         )
         self.assertEqual({"function_path": FunctionNamePathConverter}, app_mock.url_map.converters)
 
@@ -309,6 +329,115 @@ class TestValidateRequestHandling(TestCase):
         self.assertIsNone(response)
 
 
+class TestBatchInvoke(TestCase):
+    def setUp(self):
+        self.invocations = []
+        self.lock = threading.Lock()
+        self.lambda_runner = Mock()
+        self.lambda_runner.is_debugging.return_value = False
+        self.lambda_runner.invoke.side_effect = self._invoke
+        self.service = LocalLambdaInvokeService(self.lambda_runner, port=3001, host="127.0.0.1", batch_concurrency=4)
+        self.service.create()
+        self.client = self.service._app.test_client()
+        # other tests replace the flask request of the module
+        request_patch = patch.object(local_lambda_invoke_service, "request", flask.request)
+        request_patch.start()
+        self.addCleanup(request_patch.stop)
+
+    def _invoke(self, function_name, event, stdout, stderr):
+        if function_name == "Missing":
+            raise FunctionNotFound()
+        event = json.loads(event)
+        # later events of the slow function complete after the ones of the other functions
+        time.sleep(event.get("delay", 0))
+        with self.lock:
+            self.invocations.append((function_name, event))
+        if event.get("fail"):
+            stdout.write_str(json.dumps({"errorMessage": "failed", "errorType": "Error"}))
+        else:
+            stdout.write_str(json.dumps({"function": function_name, "event": event}))
+
+    def _post(self, body):
+        response = self.client.post("/2015-03-31/batch-invocations", data=body)
+        return response, [json.loads(line) for line in response.get_data(as_text=True).splitlines()]
+
+    def test_must_invoke_json_lines_in_order(self):
+        events = [
+            {"FunctionName": "Slow", "Payload": {"index": 0, "delay": 0.2}},
+            {"FunctionName": "Fast", "Payload": {"index": 1}},
+            {"FunctionName": "Slow", "Payload": {"index": 2}},
+            {"FunctionName": "Other", "Payload": {"index": 3}},
+        ]
+
+        response, results = self._post("\n".join(json.dumps(event) for event in events) + "\n\n")
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.headers["Content-Type"], "application/x-ndjson")
+        self.assertEqual([result["FunctionName"] for result in results], ["Slow", "Fast", "Slow", "Other"])
+        self.assertEqual([result["StatusCode"] for result in results], [200] * 4)
+        self.assertEqual(
+            [json.loads(result["Payload"]) for result in results],
+            [{"function": event["FunctionName"], "event": event["Payload"]} for event in events],
+        )
+        # events of a function are invoked one after the other, in their order
+        slow_invocations = [event["index"] for function_name, event in self.invocations if function_name == "Slow"]
+        self.assertEqual(slow_invocations, [0, 2])
+        # other functions don't wait for the slow one
+        self.assertEqual(self.invocations[-1], ("Slow", {"index": 2}))
+
+    def test_must_invoke_json_array(self):
+        events = [{"FunctionName": "Function", "Payload": {"index": index}} for index in range(3)]
+
+        response, results = self._post(json.dumps(events))
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(
+            [json.loads(result["Payload"])["event"] for result in results], [{"index": i} for i in range(3)]
+        )
+
+    def test_must_return_error_of_each_failed_event(self):
+        body = "\n".join(
+            [
+                json.dumps({"FunctionName": "Missing"}),
+                "not json",
+                json.dumps({"Payload": {}}),
+                json.dumps({"FunctionName": "Function", "Payload": {"fail": True}}),
+                json.dumps({"FunctionName": "Function"}),
+            ]
+        )
+
+        response, results = self._post(body)
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual([result["StatusCode"] for result in results], [404, 400, 400, 200, 200])
+        self.assertEqual(results[0]["ErrorType"], "ResourceNotFound")
+        self.assertEqual(results[1]["ErrorType"], "InvalidRequestContent")
+        self.assertEqual(results[2]["ErrorType"], "InvalidRequestContent")
+        self.assertEqual(results[3]["FunctionError"], "Unhandled")
+        self.assertNotIn("FunctionError", results[4])
+        self.assertEqual(json.loads(results[4]["Payload"])["event"], {})
+
+    def test_must_reject_invalid_json_array(self):
+        response = self.client.post("/2015-03-31/batch-invocations", data="[{")
+
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(response.headers["x-amzn-errortype"], "InvalidRequestContent")
+        self.lambda_runner.invoke.assert_not_called()
+
+    def test_must_invoke_events_one_at_a_time_when_debugging(self):
+        self.lambda_runner.is_debugging.return_value = True
+
+        service = LocalLambdaInvokeService(self.lambda_runner, port=3001, host="127.0.0.1")
+
+        self.assertEqual(service.batch_concurrency, 1)
+
+    def test_read_batch_events_keeps_invalid_lines(self):
+        events = _read_batch_events('{"FunctionName": "a"}\n{\n')
+
+        self.assertEqual(events[0], {"FunctionName": "a"})
+        self.assertIsInstance(events[1], ValueError)
+
+
 class TestPathConverter(TestCase):
     def test_path_converter_to_url_accepts_function_full_path(self):
         map = Mock()
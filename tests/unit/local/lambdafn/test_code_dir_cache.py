@@ -0,0 +1,106 @@
+import os
+import tempfile
+from unittest import TestCase
+from unittest.mock import Mock
+
+from samcli.local.lambdafn.code_dir_cache import CodeDirCache
+
+
+class TestCodeDirCache(TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.archive1 = self._create_archive("archive1.zip", b"content1")
+        self.archive2 = self._create_archive("archive2.zip", b"content2")
+        self.decompress = Mock(side_effect=lambda path: tempfile.mkdtemp(dir=self.temp_dir.name))
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def _create_archive(self, name, content):
+        path = os.path.join(self.temp_dir.name, name)
+        with open(path, "wb") as archive:
+            archive.write(content)
+        return path
+
+    def test_must_decompress_same_archive_only_once(self):
+        cache = CodeDirCache()
+
+        first_dir = cache.acquire(self.archive1, self.decompress)
+        second_dir = cache.acquire(self.archive1, self.decompress)
+
+        self.assertEqual(first_dir, second_dir)
+        self.decompress.assert_called_once_with(self.archive1)
+
+    def test_must_share_directory_between_archives_with_same_content(self):
+        cache = CodeDirCache()
+        same_content_archive = self._create_archive("copy.zip", b"content1")
+
+        first_dir = cache.acquire(self.archive1, self.decompress)
+        second_dir = cache.acquire(same_content_archive, self.decompress)
+        other_dir = cache.acquire(self.archive2, self.decompress)
+
+        self.assertEqual(first_dir, second_dir)
+        self.assertNotEqual(first_dir, other_dir)
+        self.assertEqual(self.decompress.call_count, 2)
+
+    def test_must_decompress_again_if_archive_changed(self):
+        cache = CodeDirCache()
+
+        first_dir = cache.acquire(self.archive1, self.decompress)
+        self._create_archive("archive1.zip", b"updated content")
+        second_dir = cache.acquire(self.archive1, self.decompress)
+
+        self.assertNotEqual(first_dir, second_dir)
+        self.assertEqual(self.decompress.call_count, 2)
+
+    def test_must_keep_released_directory_to_be_reused(self):
+        cache = CodeDirCache()
+
+        first_dir = cache.acquire(self.archive1, self.decompress)
+        cache.release(first_dir)
+        second_dir = cache.acquire(self.archive1, self.decompress)
+
+        self.assertEqual(first_dir, second_dir)
+        self.assertTrue(os.path.isdir(first_dir))
+        self.decompress.assert_called_once_with(self.archive1)
+
+    def test_must_delete_least_recently_used_unused_directories(self):
+        cache = CodeDirCache(max_unused_dirs=1)
+
+        first_dir = cache.acquire(self.archive1, self.decompress)
+        second_dir = cache.acquire(self.archive2, self.decompress)
+        cache.release(first_dir)
+        self.assertTrue(os.path.isdir(first_dir))
+
+        cache.release(second_dir)
+
+        self.assertFalse(os.path.exists(first_dir))
+        self.assertTrue(os.path.isdir(second_dir))
+
+    def test_must_not_delete_directories_in_use(self):
+        cache = CodeDirCache(max_unused_dirs=0)
+
+        first_dir = cache.acquire(self.archive1, self.decompress)
+        cache.acquire(self.archive1, self.decompress)
+        cache.release(first_dir)
+        self.assertTrue(os.path.isdir(first_dir))
+
+        cache.release(first_dir)
+        self.assertFalse(os.path.exists(first_dir))
+
+    def test_must_ignore_unknown_directory_on_release(self):
+        cache = CodeDirCache(max_unused_dirs=0)
+        cache.release(self.temp_dir.name)
+        self.assertTrue(os.path.isdir(self.temp_dir.name))
+
+    def test_must_delete_all_directories_on_clear(self):
+        cache = CodeDirCache()
+
+        first_dir = cache.acquire(self.archive1, self.decompress)
+        second_dir = cache.acquire(self.archive2, self.decompress)
+        cache.clear()
+
+        self.assertFalse(os.path.exists(first_dir))
+        self.assertFalse(os.path.exists(second_dir))
+        cache.acquire(self.archive1, self.decompress)
+        self.assertEqual(self.decompress.call_count, 3)
@@ -2,12 +2,16 @@
 Unit tests for Lambda runtime
 """
 
+import os
+import tempfile
+import zipfile
 from unittest import TestCase
 from unittest.mock import Mock, patch, MagicMock, ANY, call
 from parameterized import parameterized
 
 from samcli.lib.utils.packagetype import ZIP, IMAGE
 from samcli.lib.providers.provider import LayerVersion
+from samcli.local.docker.exceptions import DockerContainerCreationFailedException
 from samcli.local.lambdafn.env_vars import EnvironmentVariables
 from samcli.local.lambdafn.runtime import LambdaRuntime, _unzip_file, WarmLambdaRuntime, _require_container_reloading
 from samcli.local.lambdafn.config import FunctionConfig
@@ -73,7 +77,7 @@ class LambdaRuntime_create(TestCase):
         self.env_vars.resolve.assert_called_with()
 
         # Make sure the context manager is called to return the code directory
-        self.runtime._get_code_dir.assert_called_with(self.code_path)
+        self.runtime._get_code_dir.assert_called_with(self.code_path, [])
 
         # Make sure the container is created with proper values
         LambdaContainerMock.assert_called_with(
@@ -93,6 +97,7 @@ class LambdaRuntime_create(TestCase):
             container_host_interface=None,
             extra_hosts=None,
             function_full_path=self.full_path,
+            mount_with_write=False,
         )
         # Run the container and get results
         self.manager_mock.create.assert_called_with(container)
@@ -144,7 +149,7 @@ class LambdaRuntime_create(TestCase):
         self.env_vars.resolve.assert_called_with()
 
         # Make sure the context manager is called to return the code directory
-        self.runtime._get_code_dir.assert_called_with(self.code_path)
+        self.runtime._get_code_dir.assert_called_with(self.code_path, [])
 
         # Make sure the container is created with proper values
         LambdaContainerMock.assert_called_with(
@@ -164,6 +169,7 @@ class LambdaRuntime_create(TestCase):
             container_host_interface=None,
             extra_hosts=None,
             function_full_path=self.full_path,
+            mount_with_write=False,
         )
         # Run the container and get results
         self.manager_mock.create.assert_called_with(container)
@@ -329,7 +335,7 @@ class LambdaRuntime_invoke(TestCase):
         self.env_vars.resolve.assert_called_with()
 
         # Make sure the context manager is called to return the code directory
-        self.runtime._get_code_dir.assert_called_with(self.code_path)
+        self.runtime._get_code_dir.assert_called_with(self.code_path, [])
 
         # Make sure the container is created with proper values
         LambdaContainerMock.assert_called_with(
@@ -349,6 +355,7 @@ class LambdaRuntime_invoke(TestCase):
             container_host_interface=None,
             extra_hosts=None,
             function_full_path=self.full_path,
+            mount_with_write=False,
         )
 
         # Run the container and get results
@@ -360,7 +367,7 @@ class LambdaRuntime_invoke(TestCase):
 
         # Finally block
         self.manager_mock.stop.assert_called_with(container)
-        self.runtime._clean_decompressed_paths.assert_called_with()
+        self.runtime._clean_decompressed_paths.assert_called_with(container)
 
     @patch("samcli.local.lambdafn.runtime.LambdaContainer")
     def test_exception_from_run_must_trigger_cleanup(self, LambdaContainerMock):
@@ -559,41 +566,133 @@ class TestLambdaRuntime_get_code_dir(TestCase):
 
     @parameterized.expand([(".zip"), (".ZIP"), (".JAR"), (".jar")])
     @patch("samcli.local.lambdafn.runtime.os")
-    @patch("samcli.local.lambdafn.runtime.shutil")
-    @patch("samcli.local.lambdafn.runtime._unzip_file")
-    def test_must_uncompress_zip_files(self, extension, unzip_file_mock, shutil_mock, os_mock):
+    def test_must_uncompress_zip_files(self, extension, os_mock):
         code_path = "foo" + extension
         decompressed_dir = "decompressed-dir"
 
-        unzip_file_mock.return_value = decompressed_dir
+        self.runtime._code_dir_cache = Mock()
+        self.runtime._code_dir_cache.acquire.return_value = decompressed_dir
         os_mock.path.isfile.return_value = True
 
-        result = self.runtime._get_code_dir(code_path)
+        decompressed_paths = []
+        result = self.runtime._get_code_dir(code_path, decompressed_paths)
         self.assertEqual(result, decompressed_dir)
 
-        unzip_file_mock.assert_called_with(code_path)
+        self.runtime._code_dir_cache.acquire.assert_called_with(code_path, _unzip_file)
         os_mock.path.isfile.assert_called_with(code_path)
+        self.assertEqual(decompressed_paths, [decompressed_dir])
 
-    @patch("samcli.local.lambdafn.runtime.os")
-    @patch("samcli.local.lambdafn.runtime.shutil")
     @patch("samcli.local.lambdafn.runtime._unzip_file")
-    def test_must_return_a_valid_file(self, unzip_file_mock, shutil_mock, os_mock):
+    @patch("samcli.local.lambdafn.runtime.os")
+    def test_must_not_share_decompressed_dir_if_mounted_with_write(self, os_mock, unzip_file_mock):
+        code_path = "foo.zip"
+        unzip_file_mock.side_effect = ["decompressed-dir1", "decompressed-dir2"]
+        os_mock.path.isfile.return_value = True
+
+        self.runtime = LambdaRuntime(self.manager_mock, self.layer_downloader, mount_with_write=True)
+        self.runtime._code_dir_cache = Mock()
+
+        first_paths = []
+        second_paths = []
+        self.assertEqual(self.runtime._get_code_dir(code_path, first_paths), "decompressed-dir1")
+        self.assertEqual(self.runtime._get_code_dir(code_path, second_paths), "decompressed-dir2")
+
+        self.runtime._code_dir_cache.acquire.assert_not_called()
+        self.assertEqual(first_paths, ["decompressed-dir1"])
+        self.assertEqual(second_paths, ["decompressed-dir2"])
+
+    @patch("samcli.local.lambdafn.runtime.os")
+    def test_must_return_a_valid_file(self, os_mock):
         """
         Input is a file that exists, but is not a zip/jar file
         """
         code_path = "foo.exe"
 
+        self.runtime._code_dir_cache = Mock()
         os_mock.path.isfile.return_value = True
 
-        result = self.runtime._get_code_dir(code_path)
+        decompressed_paths = []
+        result = self.runtime._get_code_dir(code_path, decompressed_paths)
         # code path must be returned. No decompression
         self.assertEqual(result, code_path)
+        self.assertEqual(decompressed_paths, [])
 
-        unzip_file_mock.assert_not_called()  # Unzip must not be called
+        self.runtime._code_dir_cache.acquire.assert_not_called()  # Unzip must not be called
         os_mock.path.isfile.assert_called_with(code_path)
 
-        # Because we never unzipped anything, we should never delete
-        shutil_mock.rmtree.assert_not_called()
+    def test_must_decompress_same_archive_only_once(self):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            code_path = os.path.join(temp_dir, "code.zip")
+            with zipfile.ZipFile(code_path, "w") as zip_file:
+                zip_file.writestr("app.py", "def handler(event, context): pass")
+
+            with patch("samcli.local.lambdafn.runtime._unzip_file", wraps=_unzip_file) as unzip_file_mock:
+                first_dir = self.runtime._get_code_dir(code_path, [])
+                second_dir = self.runtime._get_code_dir(code_path, [])
+
+            self.assertEqual(first_dir, second_dir)
+            self.assertTrue(os.path.isfile(os.path.join(second_dir, "app.py")))
+            unzip_file_mock.assert_called_once_with(code_path)
+
+            self.runtime.clean_decompressed_code_dirs()
+            self.assertFalse(os.path.exists(second_dir))
+
+    def test_must_delete_decompressed_dir_mounted_with_write_when_invoke_is_done(self):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            code_path = os.path.join(temp_dir, "code.zip")
+            with zipfile.ZipFile(code_path, "w") as zip_file:
+                zip_file.writestr("app.py", "def handler(event, context): pass")
+
+            self.runtime = LambdaRuntime(self.manager_mock, self.layer_downloader, mount_with_write=True)
+            container = Mock()
+            decompressed_paths = []
+            decompressed_dir = self.runtime._get_code_dir(code_path, decompressed_paths)
+            self.runtime._decompressed_paths_by_container[container] = decompressed_paths
+            self.runtime._check_exit_state = Mock()
+
+            self.runtime._on_invoke_done(container)
+
+            self.assertFalse(os.path.exists(decompressed_dir))
+
+
+class TestLambdaRuntime_clean_decompressed_paths(TestCase):
+    def setUp(self):
+        self.manager_mock = Mock()
+        self.runtime = LambdaRuntime(self.manager_mock, Mock())
+        self.runtime._code_dir_cache = Mock()
+        self.runtime._check_exit_state = Mock()
+
+    def test_must_release_only_the_dirs_of_the_done_invoke(self):
+        container1 = Mock()
+        container2 = Mock()
+        self.runtime._decompressed_paths_by_container = {
+            container1: ["code_dir", "layer_dir1"],
+            container2: ["code_dir", "layer_dir2"],
+        }
+
+        self.runtime._on_invoke_done(container1)
+
+        self.assertEqual(
+            self.runtime._code_dir_cache.release.call_args_list,
+            [call("code_dir"), call("layer_dir1")],
+        )
+        self.assertEqual(self.runtime._decompressed_paths_by_container, {container2: ["code_dir", "layer_dir2"]})
+
+    def test_must_release_the_dirs_if_container_creation_failed(self):
+        def get_code_dir(code_path, decompressed_paths):
+            decompressed_paths.append("code_dir")
+            return "code_dir"
+
+        self.runtime._get_code_dir = Mock(side_effect=get_code_dir)
+        self.manager_mock.create.side_effect = DockerContainerCreationFailedException("failed")
+        function_config = Mock(layers=[], runtime_management_config=None)
+
+        with patch("samcli.local.lambdafn.runtime.LambdaContainer"):
+            with self.assertRaises(DockerContainerCreationFailedException):
+                self.runtime.create(function_config)
+
+        self.runtime._code_dir_cache.release.assert_called_once_with("code_dir")
+        self.assertEqual(self.runtime._decompressed_paths_by_container, {})
 
 
 class TestLambdaRuntime_unarchived_layer(TestCase):
@@ -606,15 +705,15 @@ class TestLambdaRuntime_unarchived_layer(TestCase):
     @patch("samcli.local.lambdafn.runtime.LambdaRuntime._get_code_dir")
     def test_unarchived_layer(self, layer, get_code_dir_mock):
         new_url = get_code_dir_mock.return_value = Mock()
-        result = self.runtime._unarchived_layer(layer)
+        result = self.runtime._unarchived_layer(layer, [])
         self.assertNotEqual(layer, result)
         self.assertEqual(new_url, result.codeuri)
 
     @parameterized.expand([("arn",), (LayerVersion("arn", "folder"),), ({"Name": "hi", "Version": "x.y.z"},)])
     @patch("samcli.local.lambdafn.runtime.LambdaRuntime._get_code_dir")
     def test_unarchived_layer_not_local_archive_file(self, layer, get_code_dir_mock):
-        get_code_dir_mock.side_effect = lambda x: x  # directly return the input
-        result = self.runtime._unarchived_layer(layer)
+        get_code_dir_mock.side_effect = lambda x, _: x  # directly return the input
+        result = self.runtime._unarchived_layer(layer, [])
         self.assertEqual(layer, result)
 
 
@@ -690,7 +789,7 @@ class TestWarmLambdaRuntime_invoke(TestCase):
         self.env_vars.resolve.assert_called_with()
 
         # Make sure the context manager is called to return the code directory
-        self.runtime._get_code_dir.assert_called_with(self.code_path)
+        self.runtime._get_code_dir.assert_called_with(self.code_path, [])
 
         # Make sure the container is created with proper values
         LambdaContainerMock.assert_called_with(
@@ -710,6 +809,7 @@ class TestWarmLambdaRuntime_invoke(TestCase):
             container_host_interface=None,
             extra_hosts=None,
             function_full_path=self.full_path,
+            mount_with_write=False,
         )
 
         # Run the container and get results
@@ -812,6 +912,7 @@ class TestWarmLambdaRuntime_create(TestCase):
             container_host_interface=None,
             extra_hosts=None,
             function_full_path=self.full_path,
+            mount_with_write=False,
         )
 
         self.manager_mock.create.assert_called_with(container)
@@ -859,6 +960,7 @@ class TestWarmLambdaRuntime_create(TestCase):
                     container_host_interface=None,
                     extra_hosts=None,
                     function_full_path=self.full_path,
+                    mount_with_write=False,
                 ),
                 call(
                     self.lang,
@@ -877,6 +979,7 @@ class TestWarmLambdaRuntime_create(TestCase):
                     container_host_interface=None,
                     extra_hosts=None,
                     function_full_path=self.full_path,
+                    mount_with_write=False,
                 ),
             ]
         )
@@ -910,6 +1013,25 @@ class TestWarmLambdaRuntime_create(TestCase):
         self.manager_mock.create.assert_called_once_with(container)
         self.assertEqual(result, container)
 
+    @patch("samcli.local.lambdafn.runtime._require_container_reloading")
+    @patch("samcli.local.lambdafn.runtime.LambdaFunctionObserver")
+    @patch("samcli.local.lambdafn.runtime.LambdaContainer")
+    def test_must_skip_config_comparison_for_same_config_object(
+        self, LambdaContainerMock, LambdaFunctionObserverMock, require_container_reloading_mock
+    ):
+        container = Mock()
+        self.runtime = WarmLambdaRuntime(self.manager_mock, Mock())
+        self.runtime._get_code_dir = MagicMock()
+
+        LambdaContainerMock.return_value = container
+        self.runtime.create(self.func_config)
+        for _ in range(100):
+            result = self.runtime.create(self.func_config)
+
+        require_container_reloading_mock.assert_not_called()
+        self.manager_mock.create.assert_called_once_with(container)
+        self.assertEqual(result, container)
+
     @patch("samcli.local.lambdafn.runtime.LambdaFunctionObserver")
     @patch("samcli.local.lambdafn.runtime.LambdaContainer")
     def test_must_ignore_debug_options_if_function_name_is_not_debug_function(
@@ -949,6 +1071,7 @@ class TestWarmLambdaRuntime_create(TestCase):
             container_host_interface=None,
             extra_hosts=None,
             function_full_path=self.full_path,
+            mount_with_write=False,
         )
         self.manager_mock.create.assert_called_with(container)
         # validate that the created container got cached
@@ -967,23 +1090,25 @@ class TestWarmLambdaRuntime_get_code_dir(TestCase):
         code_path = "path"
 
         self.runtime = WarmLambdaRuntime(self.manager_mock, lambda_image_mock, observer_mock)
-        res = self.runtime._get_code_dir(code_path)
-        self.assertEqual(self.runtime._temp_uncompressed_paths_to_be_cleaned, [])
+        decompressed_paths = []
+        res = self.runtime._get_code_dir(code_path, decompressed_paths)
+        self.assertEqual(decompressed_paths, [])
         self.assertEqual(res, code_path)
 
-    @patch("samcli.local.lambdafn.runtime._unzip_file")
     @patch("samcli.local.lambdafn.runtime.os")
-    def test_must_cache_temp_uncompressed_dirs_to_be_cleared_later(self, os_mock, _unzip_file_mock):
+    def test_must_cache_temp_uncompressed_dirs_to_be_cleared_later(self, os_mock):
         lambda_image_mock = Mock()
         observer_mock = Mock()
         os_mock.path.isfile.return_value = True
         uncompressed_dir_mock = Mock()
-        _unzip_file_mock.return_value = uncompressed_dir_mock
         code_path = "path.zip"
 
         self.runtime = WarmLambdaRuntime(self.manager_mock, lambda_image_mock, observer_mock)
-        res = self.runtime._get_code_dir(code_path)
-        self.assertEqual(self.runtime._temp_uncompressed_paths_to_be_cleaned, [uncompressed_dir_mock])
+        self.runtime._code_dir_cache = Mock()
+        self.runtime._code_dir_cache.acquire.return_value = uncompressed_dir_mock
+        decompressed_paths = []
+        res = self.runtime._get_code_dir(code_path, decompressed_paths)
+        self.assertEqual(decompressed_paths, [uncompressed_dir_mock])
         self.assertEqual(res, uncompressed_dir_mock)
 
 
@@ -1001,11 +1126,14 @@ class TestWarmLambdaRuntime_clean_warm_containers_related_resources(TestCase):
             "func_name1": self.func1_container_mock,
             "func_name2": self.func2_container_mock,
         }
-        self.runtime._temp_uncompressed_paths_to_be_cleaned = ["path1", "path2"]
+        self.runtime._decompressed_paths_by_container = {
+            self.func1_container_mock: ["path1"],
+            self.func2_container_mock: ["path2"],
+        }
         self.runtime._lock = MagicMock()
+        self.runtime._code_dir_cache = Mock()
 
-    @patch("samcli.local.lambdafn.runtime.shutil")
-    def test_must_container_stopped_when_its_code_dir_got_changed(self, shutil_mock):
+    def test_must_container_stopped_when_its_code_dir_got_changed(self):
         self.runtime.clean_running_containers_and_related_resources()
         self.assertEqual(
             self.runtime._container_manager.stop.call_args_list,
@@ -1015,12 +1143,13 @@ class TestWarmLambdaRuntime_clean_warm_containers_related_resources(TestCase):
             ],
         )
         self.assertEqual(
-            shutil_mock.rmtree.call_args_list,
+            self.runtime._code_dir_cache.release.call_args_list,
             [
                 call("path1"),
                 call("path2"),
             ],
         )
+        self.runtime._code_dir_cache.clear.assert_called_once_with()
         self.runtime._observer.stop.assert_called_once_with()
 
 
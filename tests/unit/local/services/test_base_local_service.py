@@ -39,6 +39,15 @@ class TestLocalHostRunner(TestCase):
 
         app_run_mock.assert_called_once_with(threaded=False, host="127.0.0.1", port=3000, ssl_context=None)
 
+    def test_test_client_requires_created_app(self):
+        service = BaseLocalService(is_debugging=False, port=3000, host="127.0.0.1", ssl_context=None)
+
+        with self.assertRaises(RuntimeError):
+            service.test_client()
+
+        service._app = Mock()
+        self.assertEqual(service.test_client(), service._app.test_client.return_value)
+
     @patch("samcli.local.services.base_local_service.Response")
     def test_service_response(self, flask_response_patch):
         flask_response_mock = Mock()
@@ -89,6 +89,9 @@ class TestSchemaLogic(TestCase):
             ("string", "string"),
             ("integer", "integer"),
             ("number", "number"),
+            ("integer range", "integer"),
+            ("float", "number"),
+            ("float range", "number"),
             ("text", "string"),
             ("path", "string"),
             ("choice", "string"),